@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file './GUI/findDialog.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.9
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_FindDialog(object):
+    def setupUi(self, FindDialog):
+        FindDialog.setObjectName("FindDialog")
+        FindDialog.resize(420, 180)
+        self.gridLayout = QtWidgets.QGridLayout(FindDialog)
+        self.gridLayout.setObjectName("gridLayout")
+        self.findLabel = QtWidgets.QLabel(FindDialog)
+        self.findLabel.setObjectName("findLabel")
+        self.gridLayout.addWidget(self.findLabel, 0, 0, 1, 1)
+        self.findEdit = QtWidgets.QLineEdit(FindDialog)
+        self.findEdit.setObjectName("findEdit")
+        self.gridLayout.addWidget(self.findEdit, 0, 1, 1, 1)
+        self.findNextButton = QtWidgets.QPushButton(FindDialog)
+        self.findNextButton.setDefault(True)
+        self.findNextButton.setObjectName("findNextButton")
+        self.gridLayout.addWidget(self.findNextButton, 0, 2, 1, 1)
+        self.replaceLabel = QtWidgets.QLabel(FindDialog)
+        self.replaceLabel.setObjectName("replaceLabel")
+        self.gridLayout.addWidget(self.replaceLabel, 1, 0, 1, 1)
+        self.replaceEdit = QtWidgets.QLineEdit(FindDialog)
+        self.replaceEdit.setObjectName("replaceEdit")
+        self.gridLayout.addWidget(self.replaceEdit, 1, 1, 1, 1)
+        self.findPreviousButton = QtWidgets.QPushButton(FindDialog)
+        self.findPreviousButton.setObjectName("findPreviousButton")
+        self.gridLayout.addWidget(self.findPreviousButton, 1, 2, 1, 1)
+        self.optionsLayout = QtWidgets.QHBoxLayout()
+        self.optionsLayout.setObjectName("optionsLayout")
+        self.caseCheckBox = QtWidgets.QCheckBox(FindDialog)
+        self.caseCheckBox.setObjectName("caseCheckBox")
+        self.optionsLayout.addWidget(self.caseCheckBox)
+        self.wordsCheckBox = QtWidgets.QCheckBox(FindDialog)
+        self.wordsCheckBox.setObjectName("wordsCheckBox")
+        self.optionsLayout.addWidget(self.wordsCheckBox)
+        self.regexCheckBox = QtWidgets.QCheckBox(FindDialog)
+        self.regexCheckBox.setObjectName("regexCheckBox")
+        self.optionsLayout.addWidget(self.regexCheckBox)
+        self.gridLayout.addLayout(self.optionsLayout, 2, 1, 1, 1)
+        self.replaceButton = QtWidgets.QPushButton(FindDialog)
+        self.replaceButton.setObjectName("replaceButton")
+        self.gridLayout.addWidget(self.replaceButton, 2, 2, 1, 1)
+        self.statusLabel = QtWidgets.QLabel(FindDialog)
+        self.statusLabel.setText("")
+        self.statusLabel.setObjectName("statusLabel")
+        self.gridLayout.addWidget(self.statusLabel, 3, 1, 1, 1)
+        self.replaceAllButton = QtWidgets.QPushButton(FindDialog)
+        self.replaceAllButton.setObjectName("replaceAllButton")
+        self.gridLayout.addWidget(self.replaceAllButton, 3, 2, 1, 1)
+
+        self.retranslateUi(FindDialog)
+        QtCore.QMetaObject.connectSlotsByName(FindDialog)
+        FindDialog.setTabOrder(self.findEdit, self.replaceEdit)
+        FindDialog.setTabOrder(self.replaceEdit, self.caseCheckBox)
+        FindDialog.setTabOrder(self.caseCheckBox, self.wordsCheckBox)
+        FindDialog.setTabOrder(self.wordsCheckBox, self.regexCheckBox)
+        FindDialog.setTabOrder(self.regexCheckBox, self.findNextButton)
+        FindDialog.setTabOrder(self.findNextButton, self.findPreviousButton)
+        FindDialog.setTabOrder(self.findPreviousButton, self.replaceButton)
+        FindDialog.setTabOrder(self.replaceButton, self.replaceAllButton)
+
+    def retranslateUi(self, FindDialog):
+        _translate = QtCore.QCoreApplication.translate
+        FindDialog.setWindowTitle(_translate("FindDialog", "Find and Replace"))
+        self.findLabel.setText(_translate("FindDialog", "Find:"))
+        self.findNextButton.setText(_translate("FindDialog", "Find Next"))
+        self.replaceLabel.setText(_translate("FindDialog", "Replace:"))
+        self.findPreviousButton.setText(_translate("FindDialog", "Find Previous"))
+        self.caseCheckBox.setText(_translate("FindDialog", "Match case"))
+        self.wordsCheckBox.setText(_translate("FindDialog", "Whole words"))
+        self.regexCheckBox.setText(_translate("FindDialog", "Regular expression"))
+        self.replaceButton.setText(_translate("FindDialog", "Replace"))
+        self.replaceAllButton.setText(_translate("FindDialog", "Replace All"))
+
+
+if __name__ == "__main__":
+    import sys
+    app = QtWidgets.QApplication(sys.argv)
+    FindDialog = QtWidgets.QDialog()
+    ui = Ui_FindDialog()
+    ui.setupUi(FindDialog)
+    FindDialog.show()
+    sys.exit(app.exec_())
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file './GUI/findInFiles.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.9
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_FindInFilesPanel(object):
+    def setupUi(self, FindInFilesPanel):
+        FindInFilesPanel.setObjectName("FindInFilesPanel")
+        FindInFilesPanel.resize(360, 480)
+        self.dockWidgetContents = QtWidgets.QWidget()
+        self.dockWidgetContents.setObjectName("dockWidgetContents")
+        self.verticalLayout = QtWidgets.QVBoxLayout(self.dockWidgetContents)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.directoryLayout = QtWidgets.QHBoxLayout()
+        self.directoryLayout.setObjectName("directoryLayout")
+        self.directoryLabel = QtWidgets.QLabel(self.dockWidgetContents)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Ignored, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(1)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.directoryLabel.sizePolicy().hasHeightForWidth())
+        self.directoryLabel.setSizePolicy(sizePolicy)
+        self.directoryLabel.setObjectName("directoryLabel")
+        self.directoryLayout.addWidget(self.directoryLabel)
+        self.chooseButton = QtWidgets.QPushButton(self.dockWidgetContents)
+        self.chooseButton.setObjectName("chooseButton")
+        self.directoryLayout.addWidget(self.chooseButton)
+        self.refreshButton = QtWidgets.QPushButton(self.dockWidgetContents)
+        self.refreshButton.setObjectName("refreshButton")
+        self.directoryLayout.addWidget(self.refreshButton)
+        self.verticalLayout.addLayout(self.directoryLayout)
+        self.queryEdit = QtWidgets.QLineEdit(self.dockWidgetContents)
+        self.queryEdit.setClearButtonEnabled(True)
+        self.queryEdit.setObjectName("queryEdit")
+        self.verticalLayout.addWidget(self.queryEdit)
+        self.optionsLayout = QtWidgets.QHBoxLayout()
+        self.optionsLayout.setObjectName("optionsLayout")
+        self.caseCheckBox = QtWidgets.QCheckBox(self.dockWidgetContents)
+        self.caseCheckBox.setObjectName("caseCheckBox")
+        self.optionsLayout.addWidget(self.caseCheckBox)
+        self.wordsCheckBox = QtWidgets.QCheckBox(self.dockWidgetContents)
+        self.wordsCheckBox.setObjectName("wordsCheckBox")
+        self.optionsLayout.addWidget(self.wordsCheckBox)
+        self.verticalLayout.addLayout(self.optionsLayout)
+        self.resultsTree = QtWidgets.QTreeWidget(self.dockWidgetContents)
+        self.resultsTree.setHeaderHidden(True)
+        self.resultsTree.setUniformRowHeights(True)
+        self.resultsTree.setObjectName("resultsTree")
+        self.verticalLayout.addWidget(self.resultsTree)
+        self.statusLabel = QtWidgets.QLabel(self.dockWidgetContents)
+        self.statusLabel.setText("")
+        self.statusLabel.setObjectName("statusLabel")
+        self.verticalLayout.addWidget(self.statusLabel)
+        FindInFilesPanel.setWidget(self.dockWidgetContents)
+
+        self.retranslateUi(FindInFilesPanel)
+        QtCore.QMetaObject.connectSlotsByName(FindInFilesPanel)
+        FindInFilesPanel.setTabOrder(self.queryEdit, self.caseCheckBox)
+        FindInFilesPanel.setTabOrder(self.caseCheckBox, self.wordsCheckBox)
+        FindInFilesPanel.setTabOrder(self.wordsCheckBox, self.resultsTree)
+        FindInFilesPanel.setTabOrder(self.resultsTree, self.chooseButton)
+        FindInFilesPanel.setTabOrder(self.chooseButton, self.refreshButton)
+
+    def retranslateUi(self, FindInFilesPanel):
+        _translate = QtCore.QCoreApplication.translate
+        FindInFilesPanel.setWindowTitle(_translate("FindInFilesPanel", "Find in Files"))
+        self.directoryLabel.setText(_translate("FindInFilesPanel", "No folder chosen"))
+        self.chooseButton.setText(_translate("FindInFilesPanel", "Choose Folder..."))
+        self.refreshButton.setText(_translate("FindInFilesPanel", "Refresh"))
+        self.queryEdit.setPlaceholderText(_translate("FindInFilesPanel", "Find in the notes of the folder"))
+        self.caseCheckBox.setText(_translate("FindInFilesPanel", "Match case"))
+        self.wordsCheckBox.setText(_translate("FindInFilesPanel", "Whole words"))
+        self.resultsTree.headerItem().setText(0, _translate("FindInFilesPanel", "Match"))
+
+
+if __name__ == "__main__":
+    import sys
+    app = QtWidgets.QApplication(sys.argv)
+    FindInFilesPanel = QtWidgets.QDockWidget()
+    ui = Ui_FindInFilesPanel()
+    ui.setupUi(FindInFilesPanel)
+    FindInFilesPanel.show()
+    sys.exit(app.exec_())
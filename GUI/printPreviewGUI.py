@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file './GUI/printPreview.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.9
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_PrintPreviewDialog(object):
+    def setupUi(self, PrintPreviewDialog):
+        PrintPreviewDialog.setObjectName("PrintPreviewDialog")
+        PrintPreviewDialog.resize(800, 700)
+        self.verticalLayout = QtWidgets.QVBoxLayout(PrintPreviewDialog)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.toolsLayout = QtWidgets.QHBoxLayout()
+        self.toolsLayout.setObjectName("toolsLayout")
+        self.printButton = QtWidgets.QPushButton(PrintPreviewDialog)
+        self.printButton.setObjectName("printButton")
+        self.toolsLayout.addWidget(self.printButton)
+        self.pageSetupButton = QtWidgets.QPushButton(PrintPreviewDialog)
+        self.pageSetupButton.setObjectName("pageSetupButton")
+        self.toolsLayout.addWidget(self.pageSetupButton)
+        spacerItem = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.toolsLayout.addItem(spacerItem)
+        self.zoomOutButton = QtWidgets.QPushButton(PrintPreviewDialog)
+        self.zoomOutButton.setObjectName("zoomOutButton")
+        self.toolsLayout.addWidget(self.zoomOutButton)
+        self.zoomLabel = QtWidgets.QLabel(PrintPreviewDialog)
+        self.zoomLabel.setObjectName("zoomLabel")
+        self.toolsLayout.addWidget(self.zoomLabel)
+        self.zoomInButton = QtWidgets.QPushButton(PrintPreviewDialog)
+        self.zoomInButton.setObjectName("zoomInButton")
+        self.toolsLayout.addWidget(self.zoomInButton)
+        self.fitWidthButton = QtWidgets.QPushButton(PrintPreviewDialog)
+        self.fitWidthButton.setObjectName("fitWidthButton")
+        self.toolsLayout.addWidget(self.fitWidthButton)
+        self.pageLabel = QtWidgets.QLabel(PrintPreviewDialog)
+        self.pageLabel.setText("")
+        self.pageLabel.setObjectName("pageLabel")
+        self.toolsLayout.addWidget(self.pageLabel)
+        self.verticalLayout.addLayout(self.toolsLayout)
+        self.pageView = PageView(PrintPreviewDialog)
+        self.pageView.setObjectName("pageView")
+        self.verticalLayout.addWidget(self.pageView)
+
+        self.retranslateUi(PrintPreviewDialog)
+        QtCore.QMetaObject.connectSlotsByName(PrintPreviewDialog)
+
+    def retranslateUi(self, PrintPreviewDialog):
+        _translate = QtCore.QCoreApplication.translate
+        PrintPreviewDialog.setWindowTitle(_translate("PrintPreviewDialog", "Print Preview"))
+        self.printButton.setText(_translate("PrintPreviewDialog", "Print..."))
+        self.pageSetupButton.setText(_translate("PrintPreviewDialog", "Page Setup..."))
+        self.zoomOutButton.setText(_translate("PrintPreviewDialog", "Zoom Out"))
+        self.zoomOutButton.setShortcut(_translate("PrintPreviewDialog", "Ctrl+-"))
+        self.zoomLabel.setText(_translate("PrintPreviewDialog", "100%"))
+        self.zoomInButton.setText(_translate("PrintPreviewDialog", "Zoom In"))
+        self.zoomInButton.setShortcut(_translate("PrintPreviewDialog", "Ctrl++"))
+        self.fitWidthButton.setText(_translate("PrintPreviewDialog", "Fit Width"))
+from core.print_layout import PageView
+
+
+if __name__ == "__main__":
+    import sys
+    app = QtWidgets.QApplication(sys.argv)
+    PrintPreviewDialog = QtWidgets.QDialog()
+    ui = Ui_PrintPreviewDialog()
+    ui.setupUi(PrintPreviewDialog)
+    PrintPreviewDialog.show()
+    sys.exit(app.exec_())
@@ -17,11 +17,19 @@ class Ui_MainWindow(object):
         MainWindow.resize(700, 500)
         self.centralwidget = QtWidgets.QWidget(MainWindow)
         self.centralwidget.setObjectName("centralwidget")
-        self.horizontalLayout = QtWidgets.QHBoxLayout(self.centralwidget)
-        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.verticalLayout = QtWidgets.QVBoxLayout(self.centralwidget)
+        self.verticalLayout.setSpacing(0)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.tabBar = QTabBar(self.centralwidget)
+        self.tabBar.setExpanding(False)
+        self.tabBar.setTabsClosable(True)
+        self.tabBar.setMovable(True)
+        self.tabBar.setDocumentMode(True)
+        self.tabBar.setObjectName("tabBar")
+        self.verticalLayout.addWidget(self.tabBar)
         self.textEdit = QtWidgets.QTextEdit(self.centralwidget)
         self.textEdit.setObjectName("textEdit")
-        self.horizontalLayout.addWidget(self.textEdit)
+        self.verticalLayout.addWidget(self.textEdit)
         MainWindow.setCentralWidget(self.centralwidget)
         self.menubar = QtWidgets.QMenuBar(MainWindow)
         self.menubar.setGeometry(QtCore.QRect(0, 0, 700, 21))
@@ -42,118 +50,66 @@ class Ui_MainWindow(object):
         self.toolBar.setObjectName("toolBar")
         MainWindow.addToolBar(QtCore.Qt.TopToolBarArea, self.toolBar)
         self.actionNew = QtWidgets.QAction(MainWindow)
-        icon = QtGui.QIcon()
-        icon.addPixmap(QtGui.QPixmap("resources/pictures/icon/new.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.actionNew.setIcon(icon)
         self.actionNew.setObjectName("actionNew")
         self.actionOpen = QtWidgets.QAction(MainWindow)
-        icon1 = QtGui.QIcon()
-        icon1.addPixmap(QtGui.QPixmap("resources/pictures/icon/open.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.actionOpen.setIcon(icon1)
         self.actionOpen.setObjectName("actionOpen")
         self.actionSave = QtWidgets.QAction(MainWindow)
-        icon2 = QtGui.QIcon()
-        icon2.addPixmap(QtGui.QPixmap("resources/pictures/icon/save.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.actionSave.setIcon(icon2)
         self.actionSave.setObjectName("actionSave")
         self.actionPrint = QtWidgets.QAction(MainWindow)
-        icon3 = QtGui.QIcon()
-        icon3.addPixmap(QtGui.QPixmap("resources/pictures/icon/print.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.actionPrint.setIcon(icon3)
         self.actionPrint.setObjectName("actionPrint")
         self.actionPrint_Preview = QtWidgets.QAction(MainWindow)
-        icon4 = QtGui.QIcon()
-        icon4.addPixmap(QtGui.QPixmap("resources/pictures/icon/printprev.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.actionPrint_Preview.setIcon(icon4)
         self.actionPrint_Preview.setObjectName("actionPrint_Preview")
         self.actionExport_PDF = QtWidgets.QAction(MainWindow)
-        icon5 = QtGui.QIcon()
-        icon5.addPixmap(QtGui.QPixmap("resources/pictures/icon/pdf.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.actionExport_PDF.setIcon(icon5)
         self.actionExport_PDF.setObjectName("actionExport_PDF")
         self.actionQuit = QtWidgets.QAction(MainWindow)
-        icon6 = QtGui.QIcon()
-        icon6.addPixmap(QtGui.QPixmap("resources/pictures/icon/exit.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.actionQuit.setIcon(icon6)
         self.actionQuit.setObjectName("actionQuit")
         self.actionUndo = QtWidgets.QAction(MainWindow)
-        icon7 = QtGui.QIcon()
-        icon7.addPixmap(QtGui.QPixmap("resources/pictures/icon/undo.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.actionUndo.setIcon(icon7)
         self.actionUndo.setObjectName("actionUndo")
         self.actionRedo = QtWidgets.QAction(MainWindow)
-        icon8 = QtGui.QIcon()
-        icon8.addPixmap(QtGui.QPixmap("resources/pictures/icon/redo.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.actionRedo.setIcon(icon8)
         self.actionRedo.setObjectName("actionRedo")
         self.actionCut = QtWidgets.QAction(MainWindow)
-        icon9 = QtGui.QIcon()
-        icon9.addPixmap(QtGui.QPixmap("resources/pictures/icon/cut.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.actionCut.setIcon(icon9)
         self.actionCut.setObjectName("actionCut")
         self.actionCopy = QtWidgets.QAction(MainWindow)
-        icon10 = QtGui.QIcon()
-        icon10.addPixmap(QtGui.QPixmap("resources/pictures/icon/copy.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.actionCopy.setIcon(icon10)
         self.actionCopy.setObjectName("actionCopy")
         self.actionPaste = QtWidgets.QAction(MainWindow)
-        icon11 = QtGui.QIcon()
-        icon11.addPixmap(QtGui.QPixmap("resources/pictures/icon/paste.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.actionPaste.setIcon(icon11)
         self.actionPaste.setObjectName("actionPaste")
         self.actionBold = QtWidgets.QAction(MainWindow)
-        icon12 = QtGui.QIcon()
-        icon12.addPixmap(QtGui.QPixmap("resources/pictures/icon/bold.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.actionBold.setIcon(icon12)
         self.actionBold.setObjectName("actionBold")
         self.actionItalic = QtWidgets.QAction(MainWindow)
-        icon13 = QtGui.QIcon()
-        icon13.addPixmap(QtGui.QPixmap("resources/pictures/icon/italic.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.actionItalic.setIcon(icon13)
         self.actionItalic.setObjectName("actionItalic")
         self.actionUnderline = QtWidgets.QAction(MainWindow)
-        icon14 = QtGui.QIcon()
-        icon14.addPixmap(QtGui.QPixmap("resources/pictures/icon/underline.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.actionUnderline.setIcon(icon14)
         self.actionUnderline.setObjectName("actionUnderline")
         self.actionLeft = QtWidgets.QAction(MainWindow)
-        icon15 = QtGui.QIcon()
-        icon15.addPixmap(QtGui.QPixmap("resources/pictures/icon/left.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.actionLeft.setIcon(icon15)
         self.actionLeft.setObjectName("actionLeft")
         self.actionRight = QtWidgets.QAction(MainWindow)
-        icon16 = QtGui.QIcon()
-        icon16.addPixmap(QtGui.QPixmap("resources/pictures/icon/right.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.actionRight.setIcon(icon16)
         self.actionRight.setObjectName("actionRight")
         self.actionCenter = QtWidgets.QAction(MainWindow)
-        icon17 = QtGui.QIcon()
-        icon17.addPixmap(QtGui.QPixmap("resources/pictures/icon/center.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.actionCenter.setIcon(icon17)
         self.actionCenter.setObjectName("actionCenter")
         self.actionJustify = QtWidgets.QAction(MainWindow)
-        icon18 = QtGui.QIcon()
-        icon18.addPixmap(QtGui.QPixmap("resources/pictures/icon/justify.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.actionJustify.setIcon(icon18)
         self.actionJustify.setObjectName("actionJustify")
         self.actionFont = QtWidgets.QAction(MainWindow)
-        icon19 = QtGui.QIcon()
-        icon19.addPixmap(QtGui.QPixmap("resources/pictures/icon/font.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.actionFont.setIcon(icon19)
         self.actionFont.setObjectName("actionFont")
         self.actionColor = QtWidgets.QAction(MainWindow)
-        icon20 = QtGui.QIcon()
-        icon20.addPixmap(QtGui.QPixmap("resources/pictures/icon/color.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.actionColor.setIcon(icon20)
         self.actionColor.setObjectName("actionColor")
         self.actionAbout_App = QtWidgets.QAction(MainWindow)
-        icon21 = QtGui.QIcon()
-        icon21.addPixmap(QtGui.QPixmap("resources/pictures/icon/about.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.actionAbout_App.setIcon(icon21)
         self.actionAbout_App.setObjectName("actionAbout_App")
+        self.actionGo_to_Line = QtWidgets.QAction(MainWindow)
+        self.actionGo_to_Line.setObjectName("actionGo_to_Line")
+        self.actionSave_As = QtWidgets.QAction(MainWindow)
+        self.actionSave_As.setObjectName("actionSave_As")
+        self.actionClose = QtWidgets.QAction(MainWindow)
+        self.actionClose.setObjectName("actionClose")
+        self.actionFind = QtWidgets.QAction(MainWindow)
+        self.actionFind.setObjectName("actionFind")
+        self.actionReplace = QtWidgets.QAction(MainWindow)
+        self.actionReplace.setObjectName("actionReplace")
+        self.actionFind_in_Files = QtWidgets.QAction(MainWindow)
+        self.actionFind_in_Files.setObjectName("actionFind_in_Files")
         self.menuFile.addAction(self.actionNew)
         self.menuFile.addAction(self.actionOpen)
         self.menuFile.addAction(self.actionSave)
+        self.menuFile.addAction(self.actionSave_As)
+        self.menuFile.addAction(self.actionClose)
         self.menuFile.addSeparator()
         self.menuFile.addAction(self.actionPrint)
         self.menuFile.addAction(self.actionPrint_Preview)
@@ -166,6 +122,11 @@ class Ui_MainWindow(object):
         self.menuEdit.addAction(self.actionCut)
         self.menuEdit.addAction(self.actionCopy)
         self.menuEdit.addAction(self.actionPaste)
+        self.menuEdit.addSeparator()
+        self.menuEdit.addAction(self.actionFind)
+        self.menuEdit.addAction(self.actionReplace)
+        self.menuEdit.addAction(self.actionFind_in_Files)
+        self.menuEdit.addAction(self.actionGo_to_Line)
         self.menuFormat.addAction(self.actionBold)
         self.menuFormat.addAction(self.actionItalic)
         self.menuFormat.addAction(self.actionUnderline)
@@ -249,7 +210,20 @@ class Ui_MainWindow(object):
         self.actionFont.setText(_translate("MainWindow", "Font"))
         self.actionColor.setText(_translate("MainWindow", "Color"))
         self.actionAbout_App.setText(_translate("MainWindow", "About App"))
-
+        self.actionGo_to_Line.setText(_translate("MainWindow", "Go to Line"))
+        self.actionGo_to_Line.setShortcut(_translate("MainWindow", "Ctrl+G"))
+        self.actionSave_As.setText(_translate("MainWindow", "Save As"))
+        self.actionSave_As.setShortcut(_translate("MainWindow", "Ctrl+Shift+S"))
+        self.actionClose.setText(_translate("MainWindow", "Close"))
+        self.actionClose.setShortcut(_translate("MainWindow", "Ctrl+W"))
+        self.actionFind.setText(_translate("MainWindow", "Find"))
+        self.actionFind.setShortcut(_translate("MainWindow", "Ctrl+F"))
+        self.actionReplace.setText(_translate("MainWindow", "Replace"))
+        self.actionReplace.setShortcut(_translate("MainWindow", "Ctrl+H"))
+        self.actionFind_in_Files.setText(_translate("MainWindow", "Find in Files"))
+        self.actionFind_in_Files.setShortcut(_translate("MainWindow", "Ctrl+Shift+F"))
+from PyQt5.QtWidgets import QTabBar
+from resources import resources_rc
 
 
 if __name__ == "__main__":
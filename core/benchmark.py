@@ -0,0 +1,491 @@
+"""
+Benchmark the main operations of the application on synthetic documents, without a window on screen.
+
+Usage:
+    python -m core.benchmark [--sizes MB,...] [--kinds plain,rich,native] [--operations open,save,...]
+                             [-o FILE] [--baseline FILE [--update-baseline]] [--tolerance PERCENT]
+
+Plain text, rich text (HTML) and native documents of the given sizes are generated once in a data directory. The
+native documents hold the same formatted text as the HTML ones, so that opening them compares loading the native
+format with parsing HTML. Each operation
+is timed on each of them in a NotePadWindow of its own, shown on the offscreen Qt platform, in a worker process, so
+that the peak memory reported for an operation is not that of the previous ones. Files too large for the text
+edit are opened in large file mode, where only opening them is timed.
+
+Rich text and native documents are only benchmarked below NotePadWindow.LARGE_FILE_SIZE (64 MB): at that size and
+above the window opens files read-only in large file mode, which shows plain text and has no formatting to
+restore, and parsing the HTML instead takes about 60 times the size of the document in memory, some 4 GB at 64 MB.
+
+The results are written as JSON to stdout or to the output file, and a summary to stderr. Given a baseline,
+written by an earlier run with --update-baseline, the exit status is 1 if an operation got slower or used more
+memory than the baseline by more than the tolerance. Timings are only comparable on the same machine, a warning
+is printed if the baseline was recorded on another one. benchmarks/baseline.json is the reference baseline
+of the repository, see the machine and sizes it records.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from PyQt5.QtCore import QT_VERSION_STR, QStandardPaths
+from PyQt5.QtGui import QTextCursor, QTextDocument
+from PyQt5.QtTest import QTest
+from PyQt5.QtWidgets import QApplication
+
+from core.file_saver import atomic_write
+from core.rich_text import NATIVE_SUFFIX, RichTextFormats, is_native
+from pyNotePad import NotePadWindow
+
+KINDS = ('plain', 'rich', 'native')
+EXTENSIONS = {'plain': '.txt', 'rich': '.html', 'native': NATIVE_SUFFIX}
+OPERATIONS = ('open', 'save', 'search', 'export', 'typing')
+SIZES = (1, 10, 100, 1000)
+MB = 1024 * 1024
+
+WORDS = (
+    'lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor incididunt ut labore et dolore '
+    'magna aliqua enim ad minim veniam quis nostrud exercitation ullamco laboris nisi aliquip ex ea commodo '
+    'consequat duis aute irure in reprehenderit voluptate velit esse cillum fugiat nulla pariatur excepteur sint '
+    'occaecat cupidatat non proident sunt culpa qui officia deserunt mollit anim id est laborum'
+).split()
+RICH_TAGS = ('b', 'i', 'u')
+# Word searched for by the search benchmark, about one word in a hundred
+QUERY = 'consectetur'
+# Number of keys typed by the typing benchmark
+KEYS = 50
+# Differences below these are noise, never regressions
+TIME_FLOOR = 0.005
+MEMORY_FLOOR = 8
+# Longest an operation may take before it is reported as failed, in seconds
+TIMEOUT = 3600
+
+
+def synthetic_block(kind, seed, size=MB):
+    """
+    Return about `size` characters of pseudo-random text, the same for the same seed.
+
+    Plain text is lines of words. Rich text is HTML paragraphs with words in bold, italic or underlined.
+    """
+    rng = random.Random(seed)
+    lines = []
+    length = 0
+    while length < size:
+        words = [rng.choice(WORDS) for _ in range(rng.randint(4, 16))]
+        if kind == 'rich':
+            for number, word in enumerate(words):
+                if rng.random() < 0.2:
+                    tag = rng.choice(RICH_TAGS)
+                    words[number] = f'<{tag}>{word}</{tag}>'
+            line = f'<p>{" ".join(words)}</p>\n'
+        else:
+            line = ' '.join(words) + '\n'
+        lines.append(line)
+        length += len(line)
+    return ''.join(lines)
+
+
+def generate_document(filename, kind, size):
+    """
+    Write a synthetic document of about `size` bytes, unless it was already generated.
+
+    Parameters:
+        filename: The path of the file to write.
+        kind: 'plain' for a text file, 'rich' for an HTML file.
+        size: The size of the document, in bytes.
+    """
+    if os.path.exists(filename) and os.path.getsize(filename) >= size:
+        return
+
+    # A few distinct blocks repeated make up documents of any size in little time
+    blocks = [synthetic_block(kind, seed).encode('utf-8') for seed in range(4)]
+    os.makedirs(os.path.dirname(filename) or '.', exist_ok=True)
+    with open(filename + '.part', 'wb') as file:
+        if kind == 'rich':
+            file.write(b'<!DOCTYPE html>\n<html><body>\n')
+        written = 0
+        while written < size:
+            block = blocks[written // MB % len(blocks)]
+            file.write(block)
+            written += len(block)
+        if kind == 'rich':
+            file.write(b'</body></html>\n')
+    os.replace(filename + '.part', filename)
+
+
+def convert_to_native(source, filename):
+    """
+    Convert an HTML document to a native document, unless it was already converted.
+    """
+    if os.path.exists(filename):
+        return
+
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=1, mp_context=context, initializer=_start_worker) as executor:
+        executor.submit(_convert_to_native, source, filename).result()
+
+
+def _convert_to_native(source, filename):
+    document = QTextDocument()
+    with open(source, encoding='utf-8') as file:
+        document.setHtml(file.read())
+    atomic_write(filename, document.toPlainText(), RichTextFormats.capture(document))
+
+
+def document_filename(data_dir, kind, size):
+    return os.path.join(data_dir, f'{kind}-{size}MB{EXTENSIONS[kind]}')
+
+
+def benchmark_name(kind, size, operation):
+    return f'{kind}-{size}MB-{operation}'
+
+
+def reset_peak_rss():
+    # Linux resets the peak of the process on request, elsewhere the peak is the one since the process started
+    try:
+        with open('/proc/self/clear_refs', 'w', encoding='ascii') as file:
+            file.write('5')
+    except OSError:
+        pass
+
+
+def peak_rss():
+    """
+    Return the peak resident memory of the process in MB, or None if it cannot be measured on this platform.
+    """
+    try:
+        with open('/proc/self/status', encoding='utf-8') as file:
+            for line in file:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+
+    try:
+        import resource
+    except ImportError:
+        return None
+    # Bytes on macOS, kB elsewhere
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maxrss / MB if sys.platform == 'darwin' else maxrss / 1024
+
+
+def machine():
+    """
+    Describe the machine the benchmarks run on, to tell whether the timings of two runs can be compared.
+    """
+    processor = platform.processor() or platform.machine()
+    try:
+        with open('/proc/cpuinfo', encoding='utf-8') as file:
+            for line in file:
+                if line.startswith('model name'):
+                    processor = line.split(':', 1)[1].strip()
+                    break
+    except OSError:
+        pass
+    return {'processor': processor, 'cpus': os.cpu_count()}
+
+
+_app = None
+
+
+def _start_worker():
+    global _app
+    _app = QApplication(['benchmark', '-platform', 'offscreen'])
+    _app.setApplicationName('PyNotePad')
+    # Keep the settings and the journals of the benchmarks apart from those of the user. Journals left there by a
+    # benchmark that crashed would be offered for recovery, in a modal dialog that would never be answered.
+    QStandardPaths.setTestModeEnabled(True)
+    app_data = QStandardPaths.writableLocation(QStandardPaths.AppDataLocation)
+    shutil.rmtree(os.path.join(app_data, 'recovery'), ignore_errors=True)
+    # Nor should the documents of the previous benchmarks be reopened, and loaded while this one is timed
+    try:
+        os.remove(os.path.join(app_data, 'session.json'))
+    except FileNotFoundError:
+        pass
+
+
+def wait_until(condition, timeout=TIMEOUT):
+    """
+    Process events until `condition()` is true.
+    """
+    started = time.perf_counter()
+    while not condition():
+        if time.perf_counter() - started > timeout:
+            raise TimeoutError(f'Gave up after {timeout} s')
+        _app.processEvents()
+
+
+def open_document(window, kind, filename):
+    """
+    Open a synthetic document in the current tab of a window, and wait for it to be fully loaded.
+    """
+    if kind == 'rich':
+        with open(filename, encoding='utf-8') as file:
+            window.tab.document.setHtml(file.read())
+        _app.processEvents()
+        return
+
+    window.open_files([filename])
+    tab = window.tab
+    wait_until(lambda: tab.loader is None and (tab.largeView is None or tab.largeView.index.complete))
+    # Up to the document being painted in the window, its view restored
+    _app.processEvents()
+
+
+def run_operation(window, operation, scratch_dir):
+    """
+    Run an operation on the document of the current tab of a window.
+
+    Returns:
+        A (seconds, details) tuple: the time the operation took, and a dict of other measurements.
+    """
+    if operation == 'save':
+        # Native documents are saved with their formatting, others as plain text
+        suffix = NATIVE_SUFFIX if is_native(window.tab.filename) else '.txt'
+        started = time.perf_counter()
+        window.write_file(os.path.join(scratch_dir, 'saved' + suffix))
+        wait_until(lambda: not window.saver.is_saving())
+        return time.perf_counter() - started, {}
+
+    if operation == 'search':
+        window.find_dialog()
+        dialog = window.findDialog
+        started = time.perf_counter()
+        # Typing the query starts the search
+        dialog.findEdit.setText(QUERY)
+        wait_until(lambda: dialog.worker is None)
+        return time.perf_counter() - started, {'matches': len(dialog.starts)}
+
+    if operation == 'export':
+        started = time.perf_counter()
+        window.write_pdf(os.path.join(scratch_dir, 'exported.pdf'))
+        return time.perf_counter() - started, {}
+
+    if operation == 'typing':
+        # Type in the middle of the document, where each key press lays out the most text after it
+        document = window.tab.document
+        window.textEdit.setTextCursor(QTextCursor(document.findBlockByNumber(document.blockCount() // 2)))
+        window.textEdit.ensureCursorVisible()
+        _app.processEvents()
+        latencies = []
+        for _ in range(KEYS):
+            started = time.perf_counter()
+            QTest.keyClick(window.textEdit, 'x')
+            _app.processEvents()
+            latencies.append(time.perf_counter() - started)
+        latencies.sort()
+        # The median is the time of a key press, the others show how much it varies
+        return statistics.median(latencies), {
+            'p95_seconds': latencies[int(len(latencies) * 0.95)],
+            'max_seconds': latencies[-1],
+        }
+
+    raise ValueError(f'Unknown operation: {operation}')
+
+
+def _benchmark(kind, filename, operation):
+    window = NotePadWindow()
+    window.resize(1024, 768)
+    # Documents are opened in a window on screen, which lays out what it shows
+    QTest.qWaitForWindowExposed(window)
+    _app.processEvents()
+
+    with tempfile.TemporaryDirectory(prefix='pynotepad-benchmark-') as scratch_dir:
+        try:
+            if operation == 'open':
+                reset_peak_rss()
+                started = time.perf_counter()
+                open_document(window, kind, filename)
+                seconds, details = time.perf_counter() - started, {}
+            else:
+                open_document(window, kind, filename)
+                if window.tab.largeView is not None:
+                    return {'skipped': 'the document is open read-only in large file mode'}
+                reset_peak_rss()
+                seconds, details = run_operation(window, operation, scratch_dir)
+        finally:
+            window.tab.document.setModified(False)
+            window.close()
+
+    return {'seconds': seconds, 'peak_rss_mb': peak_rss(), **details}
+
+
+def run_benchmark(kind, size, operation, data_dir, repeat=1):
+    """
+    Run one benchmark, in a new worker process for each repetition.
+
+    Parameters:
+        kind: One of KINDS.
+        size: The size of the document, in MB.
+        operation: One of OPERATIONS.
+        data_dir: The directory the synthetic documents are generated in.
+        repeat: The number of times to run it; the fastest run is kept.
+
+    Returns:
+        The result, a dict with the time taken in seconds and the peak resident memory in MB, or with the reason
+        the benchmark was skipped or the error it failed with.
+    """
+    result = {'name': benchmark_name(kind, size, operation), 'kind': kind, 'size_mb': size, 'operation': operation}
+    if kind != 'plain' and size * MB >= NotePadWindow.LARGE_FILE_SIZE:
+        return {**result, 'skipped': 'formatted documents this large are only opened as plain text, in large file mode'}
+
+    filename = document_filename(data_dir, kind, size)
+    if kind == 'native':
+        source = document_filename(data_dir, 'rich', size)
+        generate_document(source, 'rich', size * MB)
+        convert_to_native(source, filename)
+    else:
+        generate_document(filename, kind, size * MB)
+
+    runs = []
+    for _ in range(repeat):
+        # A process per run, so that the memory and the caches of one run do not carry over to the next
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=1, mp_context=context, initializer=_start_worker) as executor:
+            try:
+                run = executor.submit(_benchmark, kind, filename, operation).result()
+            except BrokenProcessPool:
+                return {**result, 'error': 'the worker process crashed'}
+            except Exception as error:
+                return {**result, 'error': f'{type(error).__name__}: {error}'}
+        if 'skipped' in run:
+            return {**result, **run}
+        runs.append(run)
+
+    return {**result, **min(runs, key=lambda run: run['seconds'])}
+
+
+def compare(results, baseline, tolerance):
+    """
+    Compare results with those of a baseline run.
+
+    Parameters:
+        results: The results of this run.
+        baseline: The results of the baseline run, those of benchmarks that did not run this time are ignored.
+        tolerance: How much slower or bigger a result may be than its baseline, as a fraction of it.
+
+    Returns:
+        The list of (name, metric, baseline value, value) tuples of the regressions.
+    """
+    floors = {'seconds': TIME_FLOOR, 'peak_rss_mb': MEMORY_FLOOR}
+    baseline = {result['name']: result for result in baseline}
+    regressions = []
+    for result in results:
+        previous = baseline.get(result['name'])
+        if previous is None:
+            continue
+        for metric, floor in floors.items():
+            value, reference = result.get(metric), previous.get(metric)
+            if value is None or reference is None:
+                continue
+            if value > reference * (1 + tolerance) and value - reference > floor:
+                regressions.append((result['name'], metric, reference, value))
+    return regressions
+
+
+def format_result(result, previous=None):
+    name = result['name']
+    if 'skipped' in result:
+        return f'   skipped            {name}: {result["skipped"]}'
+    if 'error' in result:
+        return f'    FAILED            {name}: {result["error"]}'
+
+    memory = f'{result["peak_rss_mb"]:7.1f} MB' if result['peak_rss_mb'] is not None else '      ? MB'
+    line = f'{result["seconds"]:9.3f} s {memory}  {name}'
+    if previous is not None and previous.get('seconds'):
+        line += f' ({(result["seconds"] / previous["seconds"] - 1) * 100:+.0f}%)'
+    return line
+
+
+def main(argv=None):
+    def names(choices):
+        def parse(value):
+            items = [item for item in value.split(',') if item]
+            unknown = [item for item in items if item not in choices]
+            if unknown:
+                raise argparse.ArgumentTypeError(f'unknown: {", ".join(unknown)}, choose from {", ".join(choices)}')
+            return items
+        return parse
+
+    def sizes(value):
+        try:
+            return [int(size) for size in value.split(',') if size]
+        except ValueError as error:
+            raise argparse.ArgumentTypeError('sizes must be whole numbers of MB') from error
+
+    parser = argparse.ArgumentParser(prog='python -m core.benchmark', description='Benchmark PyNotePad.')
+    parser.add_argument('--sizes', type=sizes, default=list(SIZES),
+                        help='comma-separated sizes of the documents in MB, by default %(default)s')
+    parser.add_argument('--kinds', type=names(KINDS), default=list(KINDS),
+                        help='comma-separated kinds of documents, by default all of: ' + ', '.join(KINDS))
+    parser.add_argument('--operations', type=names(OPERATIONS), default=list(OPERATIONS),
+                        help='comma-separated operations to time, by default all of: ' + ', '.join(OPERATIONS))
+    parser.add_argument('--repeat', type=int, default=1, help='runs of each benchmark, the fastest is kept')
+    parser.add_argument('--data-dir', default=os.path.join(tempfile.gettempdir(), 'pynotepad-benchmark'),
+                        help='directory to generate the documents in, and to reuse them from')
+    parser.add_argument('-o', '--output', help='file to write the results to as JSON, instead of stdout')
+    parser.add_argument('--baseline', help='results of an earlier run to compare with')
+    parser.add_argument('--update-baseline', action='store_true',
+                        help='write the results to the baseline file instead of comparing with it')
+    parser.add_argument('--tolerance', type=float, default=20,
+                        help='percentage by which a result may exceed the baseline, by default %(default)s')
+    arguments = parser.parse_args(argv)
+    if arguments.update_baseline and not arguments.baseline:
+        parser.error('--update-baseline requires --baseline')
+
+    previous = {}
+    if arguments.baseline and not arguments.update_baseline:
+        with open(arguments.baseline, encoding='utf-8') as file:
+            baseline = json.load(file)
+        previous = {result['name']: result for result in baseline['results']}
+        if baseline.get('machine') != machine():
+            recorded = baseline.get('machine') or {}
+            print(f'Warning: the baseline was recorded on another machine ({recorded.get("processor", "unknown")}, '
+                  f'{recorded.get("cpus", "?")} CPUs), its timings may not be comparable', file=sys.stderr)
+
+    results = []
+    for kind in arguments.kinds:
+        for size in arguments.sizes:
+            for operation in arguments.operations:
+                result = run_benchmark(kind, size, operation, arguments.data_dir, arguments.repeat)
+                results.append(result)
+                print(format_result(result, previous.get(result['name'])), file=sys.stderr, flush=True)
+
+    report = json.dumps({
+        'python': platform.python_version(),
+        'qt': QT_VERSION_STR,
+        'platform': platform.platform(),
+        'machine': machine(),
+        'sizes': arguments.sizes,
+        'repeat': arguments.repeat,
+        'results': results,
+    }, indent=2)
+    outputs = [arguments.output] if arguments.output else []
+    if arguments.update_baseline:
+        outputs.append(arguments.baseline)
+    for output in outputs:
+        with open(output, 'w', encoding='utf-8') as file:
+            file.write(report + '\n')
+    if not arguments.output:
+        print(report)
+
+    failures = [result for result in results if 'error' in result]
+    regressions = compare(results, previous.values(), arguments.tolerance / 100) if previous else []
+    for name, metric, reference, value in regressions:
+        print(f'Regression: {name} {metric} {reference:.3f} -> {value:.3f}', file=sys.stderr)
+    for result in failures:
+        print(f'Failed: {result["name"]}: {result["error"]}', file=sys.stderr)
+    return 1 if regressions or failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
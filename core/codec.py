@@ -0,0 +1,212 @@
+import codecs
+import io
+import os
+import re
+from bisect import bisect_left
+
+# Bytes read from the start of a file to detect its encoding and line endings
+SNIFF_SIZE = 64 * 1024
+# Characters encoded at a time when writing, so that the encoded text never exists in full
+WRITE_CHUNK_SIZE = 256 * 1024
+
+# UTF-32 first, the UTF-32 LE mark starts with the UTF-16 LE one
+BOMS = [
+    (codecs.BOM_UTF32_LE, 'utf-32-le'),
+    (codecs.BOM_UTF32_BE, 'utf-32-be'),
+    (codecs.BOM_UTF8, 'utf-8'),
+    (codecs.BOM_UTF16_LE, 'utf-16-le'),
+    (codecs.BOM_UTF16_BE, 'utf-16-be'),
+]
+# Encodings tried in turn for a file without a byte order mark; Latin-1 decodes any file
+FALLBACK_ENCODINGS = ['utf-8', 'cp1252', 'latin-1']
+NEWLINE_NAMES = {'\n': 'LF', '\r\n': 'CRLF', '\r': 'CR'}
+# Characters outside the Basic Multilingual Plane, which take two UTF-16 code units
+ASTRAL = re.compile('[\U00010000-\U0010FFFF]')
+
+
+class TextFormat:
+    """
+    The encoding, byte order mark and line endings of a text file, detected when it is read so that it can be
+    written back the same way. Documents always hold \\n line endings, whatever those of their file.
+
+    Attributes:
+        encoding: The name of the Python codec of the file, without its byte order mark, e.g. 'utf-16-le'.
+        bom: Whether the file starts with a byte order mark.
+        newline: The line ending of the file, '\\n', '\\r\\n' or '\\r'.
+    """
+
+    def __init__(self, encoding='utf-8', bom=False, newline=os.linesep):
+        self.encoding = encoding
+        self.bom = bom
+        self.newline = newline
+
+    def __eq__(self, other):
+        return isinstance(other, TextFormat) and \
+            (self.encoding, self.bom, self.newline) == (other.encoding, other.bom, other.newline)
+
+    def __repr__(self):
+        return f'TextFormat({self.encoding!r}, bom={self.bom}, newline={self.newline!r})'
+
+    def name(self):
+        """
+        Return a short description of the format for the user, e.g. 'UTF-8 BOM, CRLF'.
+        """
+        name = codecs.lookup(self.encoding).name.upper().replace('ISO8859', 'ISO-8859').replace('CP', 'Windows-')
+        if self.bom:
+            name += ' BOM'
+        return f'{name}, {NEWLINE_NAMES[self.newline]}'
+
+    def bom_bytes(self):
+        return '\ufeff'.encode(self.encoding) if self.bom else b''
+
+    def is_ascii_compatible(self):
+        """
+        Whether lines can be found by looking for \\n bytes, i.e. the encoding is not UTF-16 or UTF-32.
+        """
+        return b'\n'.decode(self.encoding, errors='ignore') == '\n'
+
+    def fallback(self):
+        """
+        Return the format to try next if the file turns out not to be in this encoding, or None if there is none.
+        """
+        if self.bom or self.encoding not in FALLBACK_ENCODINGS[:-1]:
+            return None
+        encoding = FALLBACK_ENCODINGS[FALLBACK_ENCODINGS.index(self.encoding) + 1]
+        return TextFormat(encoding, False, self.newline)
+
+    def text_reader(self, file):
+        """
+        Wrap a binary file positioned at its start in a text reader that decodes it incrementally, with the line
+        endings translated to \\n.
+        """
+        file.seek(len(self.bom_bytes()))
+        return io.TextIOWrapper(file, encoding=self.encoding, newline=None)
+
+    def write(self, file, text):
+        """
+        Write text to a binary file in this format, a slice of at most WRITE_CHUNK_SIZE characters at a time.
+
+        Parameters:
+            file: The binary file to write to.
+            text: The text, with \\n line endings.
+
+        Raises:
+            UnicodeEncodeError: The text holds characters the encoding cannot represent.
+        """
+        writer = io.TextIOWrapper(file, encoding=self.encoding, newline=self.newline)
+        try:
+            if self.bom:
+                writer.write('\ufeff')
+            for start in range(0, len(text), WRITE_CHUNK_SIZE):
+                writer.write(text[start:start + WRITE_CHUNK_SIZE])
+            writer.flush()
+        finally:
+            writer.detach()
+
+
+def detect_newline(text, complete=False):
+    """
+    Return the line ending of the first line of `text`, or None if it has none.
+
+    Parameters:
+        text: The start of a file.
+        complete: Whether `text` is the whole file, rather than possibly ending between the \\r and \\n of a line.
+    """
+    line_feed = text.find('\n')
+    carriage_return = text.find('\r')
+    if carriage_return == -1 or line_feed != -1 and line_feed < carriage_return:
+        return '\n' if line_feed != -1 else None
+    if text[carriage_return + 1:carriage_return + 2] == '\n' or carriage_return + 1 == len(text) and not complete:
+        return '\r\n'
+    return '\r'
+
+
+def detect_format(head, complete=False):
+    """
+    Detect the format of a file from its first bytes.
+
+    The encoding is that of the byte order mark, if any. Otherwise UTF-16 is recognized by its zero bytes, and
+    the other encodings are tried in turn: UTF-8, Windows-1252, then Latin-1, which decodes anything.
+
+    Parameters:
+        head: The first bytes of the file, e.g. SNIFF_SIZE of them.
+        complete: Whether `head` is the whole file, rather than possibly ending in the middle of a character.
+
+    Returns:
+        The TextFormat of the file. Its line ending is the platform's if the bytes hold no line break.
+    """
+    bom = False
+    for mark, encoding in BOMS:
+        if head.startswith(mark):
+            bom = True
+            head = head[len(mark):]
+            break
+    else:
+        encoding = None
+        # Text in UTF-16 without a byte order mark has a zero byte in most of its ASCII characters
+        even, odd = head[0:4096:2], head[1:4096:2]
+        if len(head) >= 2 and odd.count(0) > len(odd) // 3 and even.count(0) < len(even) // 10:
+            encoding = 'utf-16-le'
+        elif len(head) >= 2 and even.count(0) > len(even) // 3 and odd.count(0) < len(odd) // 10:
+            encoding = 'utf-16-be'
+        else:
+            for candidate in FALLBACK_ENCODINGS:
+                try:
+                    codecs.getincrementaldecoder(candidate)().decode(head, complete)
+                except UnicodeDecodeError:
+                    continue
+                encoding = candidate
+                break
+
+    text = codecs.getincrementaldecoder(encoding)(errors='replace').decode(head, complete)
+    return TextFormat(encoding, bom, detect_newline(text, complete) or os.linesep)
+
+
+def sniff_file(filename):
+    """
+    Detect the format of a file from its first SNIFF_SIZE bytes.
+    """
+    with open(filename, 'rb') as file:
+        head = file.read(SNIFF_SIZE)
+    return detect_format(head, len(head) < SNIFF_SIZE)
+
+
+def read_text(filename):
+    """
+    Read a whole text file in the format it was detected in.
+
+    Returns:
+        A (text, format) tuple, the line endings of the text being translated to \\n.
+    """
+    text_format = sniff_file(filename)
+    while True:
+        with open(filename, 'rb') as file:
+            reader = text_format.text_reader(file)
+            try:
+                return reader.read(), text_format
+            except UnicodeDecodeError:
+                text_format = text_format.fallback()
+                if text_format is None:
+                    raise
+            finally:
+                reader.detach()
+
+
+def astral_positions(text):
+    """
+    Return the positions in `text` of its characters outside the Basic Multilingual Plane, in order.
+    """
+    if text.isascii():
+        return []
+    return [match.start() for match in ASTRAL.finditer(text)]
+
+
+def utf16_positions(text):
+    """
+    Return a function converting positions in `text`, which count code points, to positions in the QString or
+    QTextDocument holding the same text, which count UTF-16 code units.
+    """
+    astral = astral_positions(text)
+    if not astral:
+        return lambda position: position
+    return lambda position: position + bisect_left(astral, position)
@@ -0,0 +1,476 @@
+import hashlib
+import json
+import multiprocessing
+import os
+import re
+import struct
+import zipfile
+from array import array
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from core.codec import TextFormat, read_text, utf16_positions
+from core.file_saver import atomic_write
+from core.instrumentation import profiler
+from core.rich_text import NATIVE_SUFFIX, NATIVE_TEXT_FORMAT, TEXT_MEMBER, is_native, open_document
+from core.search import compile_query
+
+# Extensions of the files that are indexed as notes
+NOTE_EXTENSIONS = ('.txt', '.text', '.md', '.markdown', '.log', NATIVE_SUFFIX)
+# Notes bigger than this are left out of the index
+MAX_NOTE_SIZE = 16 * 1024 * 1024
+# Version of the layout of the index on disk, increased whenever it changes; an index of another version is rebuilt
+INDEX_VERSION = 1
+MANIFEST = 'manifest.json'
+MANIFEST_FORMAT = TextFormat('utf-8', False, '\n')
+# Words are runs of letters, digits and underscores, indexed lowercased
+WORD = re.compile(r'\w+')
+
+
+def read_note(filename):
+    """
+    Read the plain text of a note, a text file in the encoding it was detected in or a native document.
+
+    Raises:
+        OSError: The file could not be read.
+        ValueError: The file is a damaged native document.
+        UnicodeDecodeError: The file could not be decoded.
+    """
+    if not is_native(filename):
+        return read_text(filename)[0]
+    try:
+        with open_document(filename) as archive, archive.open(TEXT_MEMBER) as file:
+            reader = NATIVE_TEXT_FORMAT.text_reader(file)
+            try:
+                return reader.read()
+            finally:
+                reader.detach()
+    except (zipfile.BadZipFile, KeyError, struct.error) as error:
+        # A member missing from the archive, or damaged past its directory
+        raise ValueError(f'Damaged PyNotePad document: {error}') from None
+
+
+def find_lines(text, query, case_sensitive=False, whole_words=False):
+    """
+    Yield the lines of a text that hold a literal query, with the first match on each of them.
+
+    Returns:
+        An iterator of (line, column, length, line text) tuples, the line numbers and columns being 0-based.
+        Columns and lengths count UTF-16 code units, like the positions in a document.
+    """
+    line = 0
+    position = 0
+    last_line = -1
+    for match in compile_query(query, False, case_sensitive, whole_words).finditer(text):
+        start = match.start()
+        line += text.count('\n', position, start)
+        position = start
+        if line == last_line:
+            continue
+        line_start = text.rfind('\n', 0, start) + 1
+        line_end = text.find('\n', start)
+        if line_end == -1:
+            line_end = len(text)
+        last_line = line
+        line_text = text[line_start:line_end]
+        utf16 = utf16_positions(line_text)
+        column = utf16(start - line_start)
+        yield line, column, utf16(min(match.end(), line_end) - line_start) - column, line_text
+
+
+def _index_notes(root, first_id, paths):
+    # Run in a worker process: the inverted index of a batch of notes, whose ids follow from first_id
+    postings = {}
+    for number, path in enumerate(paths):
+        try:
+            text = read_note(os.path.join(root, path))
+        except (OSError, ValueError):
+            continue
+        for word in set(WORD.findall(text.lower())):
+            ids = postings.get(word)
+            if ids is None:
+                ids = postings[word] = array('i')
+            ids.append(first_id + number)
+    return _pack(postings)
+
+
+def _pack(postings):
+    # Postings as three flat objects, cheap to pass between processes and to store: the words, one per line, the
+    # number of ids of each word, and the ids of all the words one after the other
+    ids = array('i')
+    for word_ids in postings.values():
+        ids += word_ids
+    return '\n'.join(postings), array('i', map(len, postings.values())), ids
+
+
+def _with_grams(grams, words):
+    # A copy of a table of the words holding each trigram, with more words added. The lists of the table are copied
+    # before being added to rather than changed, since queries may be reading them meanwhile.
+    grams = dict(grams)
+    copied = set()
+    for word in words:
+        for gram in {word[start:start + 3] for start in range(len(word) - 2)}:
+            if gram not in copied:
+                grams[gram] = grams[gram] + [word] if gram in grams else [word]
+                copied.add(gram)
+            else:
+                grams[gram].append(word)
+    return grams
+
+
+def _unpack(packed, postings):
+    # Append packed postings to those of a dictionary; their ids must all follow those already in it
+    words, counts, ids = packed
+    words = words.split('\n') if words else []
+    if len(words) != len(counts) or sum(counts) != len(ids):
+        raise ValueError('Damaged index postings')
+
+    offset = 0
+    for word, count in zip(words, counts):
+        if word in postings:
+            postings[word] += ids[offset:offset + count]
+        else:
+            postings[word] = ids[offset:offset + count]
+        offset += count
+
+
+class FileIndex:
+    """
+    Persistent inverted index of the words of the notes in a directory and its subdirectories.
+
+    For each word, the index holds the ids of the notes it appears in, and for each note its path and the
+    modification time and size it had when it was read. Updating the index only reads the notes whose time or
+    size changed and those that were added since: they get new ids, and the ids they had are dropped. A large
+    update reads the notes across a pool of worker processes, in batches whose postings are simply concatenated,
+    since the ids of a batch follow those of the previous one.
+
+    On disk, the postings of each update make an immutable segment, and a manifest lists the notes and the
+    segments; it is replaced atomically, so an update that did not complete leaves the previous index intact.
+    Once there are many segments or dropped ids, they are merged into a single segment and the ids renumbered.
+
+    A query looks up the notes holding every word of a literal string, which may start and end in the middle of
+    a word, in milliseconds: the words starting with a string are found by bisection in the sorted words, and
+    those holding it elsewhere among the words holding its rarest trigram. Only the notes found then have to be
+    read to find the matching lines, see find_lines.
+    The index is a cache: one that cannot be read is rebuilt from the notes.
+
+    The index can be updated by one thread while others query it: an update swaps in the new state at once.
+    """
+    # Notes read per task of a worker process
+    BATCH_SIZE = 128
+    # Updates of fewer notes are read in the calling thread, rather than paying for starting worker processes
+    PARALLEL_THRESHOLD = 256
+    # Segments that trigger a merge, along with dropped ids outnumbering the notes
+    MAX_SEGMENTS = 8
+
+    def __init__(self, root, directory):
+        """
+        Parameters:
+            root: The directory of the notes.
+            directory: The directory the indexes are kept in, each one in a subdirectory named after its root.
+        """
+        self.root = os.path.realpath(root)
+        self.directory = os.path.join(directory, hashlib.sha1(os.fsencode(self.root)).hexdigest())
+        self.loaded = False
+        self._serial = 0
+        self._segments = []
+        # Paths relative to the root and (mtime, size) of the notes by id, None for dropped ids; postings by word;
+        # the words in order, for the queries that give the start of a word; the words holding each trigram, for
+        # those that give its end or a part of it
+        self._state = [], [], {}, [], {}
+
+    def __len__(self):
+        paths = self._state[0]
+        return len(paths) - paths.count(None)
+
+    def contains(self, filename):
+        """
+        Whether a file lies in the directory of the notes.
+        """
+        return os.path.realpath(filename).startswith(os.path.join(self.root, ''))
+
+    def load(self):
+        """
+        Read the index from disk, or start an empty one if there is none or it cannot be read.
+        """
+        self.loaded = True
+        try:
+            with profiler.span('load_index', 'io', file=self.root):
+                with open(os.path.join(self.directory, MANIFEST), encoding='utf-8') as file:
+                    manifest = json.load(file)
+                if manifest['version'] != INDEX_VERSION or manifest['root'] != self.root:
+                    return
+                postings = {}
+                for name in manifest['segments']:
+                    self._read_segment(os.path.join(self.directory, name), postings)
+        except (OSError, ValueError, KeyError, TypeError, zipfile.BadZipFile):
+            return
+
+        paths = [entry[0] if entry else None for entry in manifest['files']]
+        stamps = [tuple(entry[1:]) if entry else None for entry in manifest['files']]
+        self._serial = manifest['serial']
+        self._segments = manifest['segments']
+        self._state = paths, stamps, postings, sorted(postings), _with_grams({}, postings)
+
+    def _read_segment(self, filename, postings):
+        with zipfile.ZipFile(filename) as archive:
+            words = archive.read('words.txt').decode('utf-8')
+            counts = array('i', archive.read('counts.dat'))
+            ids = array('i', archive.read('ids.dat'))
+        # The ids of a segment all follow those of the segments before it
+        _unpack((words, counts, ids), postings)
+
+    def _write_segment(self, postings):
+        # In the native byte order: the index is a cache of this machine
+        self._serial += 1
+        name = f'segment-{self._serial}.zip'
+        words, counts, ids = _pack(postings)
+        # Ids compress little, the fastest compression level saves as much as the default one in a fraction of the time
+        with zipfile.ZipFile(os.path.join(self.directory, name), 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as archive:
+            archive.writestr('words.txt', words.encode('utf-8'))
+            archive.writestr('counts.dat', counts.tobytes())
+            archive.writestr('ids.dat', ids.tobytes())
+        return name
+
+    def scan(self):
+        """
+        List the notes under the root with their modification time and size.
+
+        Returns:
+            A dictionary of (mtime, size) tuples by path relative to the root.
+        """
+        notes = {}
+        for directory, subdirectories, names in os.walk(self.root):
+            # Hidden directories hold the files of tools, e.g. .git, rather than notes
+            subdirectories[:] = [name for name in subdirectories if not name.startswith('.')]
+            for name in names:
+                if not name.lower().endswith(NOTE_EXTENSIONS):
+                    continue
+                path = os.path.join(directory, name)
+                try:
+                    info = os.stat(path)
+                except OSError:
+                    continue
+                if info.st_size <= MAX_NOTE_SIZE:
+                    notes[os.path.relpath(path, self.root)] = (info.st_mtime_ns, info.st_size)
+        return notes
+
+    def update(self, jobs=None, progress=None, interrupted=None):
+        """
+        Bring the index up to date with the notes on disk, reading only those that changed, and save it.
+
+        Parameters:
+            jobs: The number of worker processes, by default the number of CPUs.
+            progress: Optional callable, called with (notes read, notes to read) as batches complete.
+            interrupted: Optional callable returning True to stop the update, which then leaves the index unchanged.
+
+        Returns:
+            True if the index changed.
+
+        Raises:
+            OSError: The index could not be saved.
+        """
+        if not self.loaded:
+            self.load()
+        paths, stamps, postings, words, grams = self._state
+
+        notes = self.scan()
+        known = {path: number for number, path in enumerate(paths) if path is not None}
+        changed = [path for path, stamp in notes.items() if path not in known or stamps[known[path]] != stamp]
+        dropped = [number for path, number in known.items() if path not in notes or notes[path] != stamps[number]]
+        if not changed and not dropped:
+            return False
+        changed.sort()
+
+        first_id = len(paths)
+        batches = [changed[start:start + self.BATCH_SIZE] for start in range(0, len(changed), self.BATCH_SIZE)]
+        added = {}
+        with profiler.span('update_index', 'io', file=self.root, notes=len(changed)):
+            if len(changed) < self.PARALLEL_THRESHOLD:
+                results = (_index_notes(self.root, first_id + number * self.BATCH_SIZE, batch)
+                           for number, batch in enumerate(batches))
+                executor = None
+            else:
+                # Spawned rather than forked, forking a process that runs Qt threads is not safe
+                executor = ProcessPoolExecutor(jobs, mp_context=multiprocessing.get_context('spawn'))
+                results = executor.map(_index_notes, [self.root] * len(batches),
+                                       range(first_id, first_id + len(changed), self.BATCH_SIZE), batches)
+            try:
+                for number, packed in enumerate(results):
+                    if interrupted is not None and interrupted():
+                        return False
+                    _unpack(packed, added)
+                    if progress is not None:
+                        progress(min((number + 1) * self.BATCH_SIZE, len(changed)), len(changed))
+            finally:
+                if executor is not None:
+                    executor.shutdown(cancel_futures=True)
+
+            paths = paths + changed
+            stamps = stamps + [notes[path] for path in changed]
+            for number in dropped:
+                paths[number] = stamps[number] = None
+            new_words = [word for word in added if word not in postings]
+            postings = dict(postings)
+            for word, ids in added.items():
+                postings[word] = postings[word] + ids if word in postings else ids
+
+            os.makedirs(self.directory, exist_ok=True)
+            segments, obsolete = self._segments, []
+            if len(segments) >= self.MAX_SEGMENTS or paths.count(None) > len(notes):
+                paths, stamps, postings = self._compact(paths, stamps, postings)
+                words = sorted(postings)
+                grams = _with_grams({}, words)
+                segments, obsolete = [self._write_segment(postings)], segments
+            else:
+                if added:
+                    segments = segments + [self._write_segment(added)]
+                if new_words:
+                    words = sorted(words + new_words)
+                    grams = _with_grams(grams, new_words)
+            self._write_manifest(paths, stamps, segments)
+            self._segments = segments
+            for name in obsolete:
+                os.unlink(os.path.join(self.directory, name))
+
+        self._state = paths, stamps, postings, words, grams
+        return True
+
+    def _compact(self, paths, stamps, postings):
+        # Drop the ids of the notes that were read again or removed, and number the others from 0
+        renumbered = array('i', [-1]) * len(paths)
+        number = 0
+        for old, path in enumerate(paths):
+            if path is not None:
+                renumbered[old] = number
+                number += 1
+
+        compacted = {}
+        for word, ids in postings.items():
+            ids = array('i', [renumbered[old] for old in ids if renumbered[old] >= 0])
+            if ids:
+                compacted[word] = ids
+        return [path for path in paths if path is not None], [stamp for stamp in stamps if stamp is not None], \
+            compacted
+
+    def _write_manifest(self, paths, stamps, segments):
+        files = [[path, *stamp] if path is not None else None for path, stamp in zip(paths, stamps)]
+        manifest = {
+            'version': INDEX_VERSION, 'root': self.root, 'serial': self._serial, 'segments': segments,
+            'files': files,
+        }
+        atomic_write(os.path.join(self.directory, MANIFEST), json.dumps(manifest), MANIFEST_FORMAT)
+
+    def candidates(self, query):
+        """
+        Return the notes that may hold a literal string, in the order of their paths.
+
+        A note is a candidate if it holds every word of the string, the first of which may be the end of a longer
+        word, and the last the start of one, unless the string starts or ends with a character that is not part
+        of a word. A string holding no word at all may be anywhere, and every note is a candidate.
+
+        Parameters:
+            query: The string to search for, in any case.
+
+        Returns:
+            The absolute paths of the candidate notes.
+        """
+        paths, _, postings, words, grams = self._state
+        query = query.lower()
+        tokens = list(WORD.finditer(query))
+        found = None
+        for number, token in enumerate(tokens):
+            word = token.group()
+            # Whether the word in the note starts and ends where it does in the query
+            starts = number > 0 or token.start() > 0
+            ends = number < len(tokens) - 1 or token.end() < len(query)
+            if starts and ends:
+                matches = [word] if word in postings else []
+            elif starts:
+                matches = words[bisect_left(words, word):bisect_left(words, word + '\U0010ffff')]
+            else:
+                # Words of one or two letters have no trigram, and are looked for in every word
+                holding = words
+                if len(word) >= 3:
+                    holding = min((grams.get(word[start:start + 3], []) for start in range(len(word) - 2)), key=len)
+                if ends:
+                    matches = [candidate for candidate in holding if candidate.endswith(word)]
+                else:
+                    matches = [candidate for candidate in holding if word in candidate]
+
+            ids = set()
+            for match in matches:
+                ids.update(postings[match])
+            found = ids if found is None else found & ids
+            if not found:
+                return []
+
+        if found is None:
+            found = range(len(paths))
+        return sorted(os.path.join(self.root, paths[number]) for number in found if paths[number] is not None)
+
+
+class IndexUpdater(QThread):
+    """
+    Worker thread that loads a FileIndex if needed and brings it up to date with FileIndex.update.
+
+    Signals:
+        progress(int, int): The number of notes read so far, and of notes to read.
+        failed(str): The index could not be saved, with the error message.
+    """
+    progress = pyqtSignal(int, int)
+    failed = pyqtSignal(str)
+
+    def __init__(self, index, jobs=None, parent=None):
+        super().__init__(parent)
+        self.index = index
+        self.jobs = jobs
+
+    def run(self):
+        try:
+            self.index.update(self.jobs, self.progress.emit, self.isInterruptionRequested)
+        except OSError as error:
+            self.failed.emit(str(error))
+
+
+class FileSearchWorker(QThread):
+    """
+    Worker thread that reads notes and streams back the lines holding a query, see find_lines.
+
+    Matches are emitted in batches, a batch per note read, up to `limit` of them.
+
+    Signals:
+        found(list): A batch of (filename, line, column, length, line text) tuples.
+    """
+    found = pyqtSignal(list)
+
+    # Most matching lines reported
+    LIMIT = 5000
+
+    def __init__(self, filenames, query, case_sensitive=False, whole_words=False, limit=LIMIT, parent=None):
+        super().__init__(parent)
+        self.filenames = filenames
+        self.query = query
+        self.options = (case_sensitive, whole_words)
+        self.limit = limit
+        self.count = 0
+
+    def run(self):
+        for filename in self.filenames:
+            if self.isInterruptionRequested() or self.count >= self.limit:
+                return
+            try:
+                text = read_note(filename)
+            except (OSError, ValueError):
+                continue
+
+            batch = []
+            for line, column, length, line_text in find_lines(text, self.query, *self.options):
+                batch.append((filename, line, column, length, line_text))
+                if self.count + len(batch) >= self.limit:
+                    break
+            if batch:
+                self.count += len(batch)
+                self.found.emit(batch)
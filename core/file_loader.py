@@ -0,0 +1,123 @@
+import os
+import struct
+
+from PyQt5.QtCore import QThread, QSemaphore, pyqtSignal
+
+from core.codec import SNIFF_SIZE, detect_format
+from core.instrumentation import profiler
+from core.rich_text import NATIVE_TEXT_FORMAT, TEXT_MEMBER, RichTextFormats, is_native, open_document
+
+
+class FileLoader(QThread):
+    """
+    Worker thread that reads a text file in fixed-size chunks and streams the decoded text back to the GUI.
+
+    The file is decoded incrementally, so at no point does the worker hold more than one chunk of text. Its encoding
+    and line endings are detected from its first bytes, unless it was read before in a known format that its byte
+    order mark still matches, and the line endings of the text are translated to \\n.
+    At most `max_pending` chunks can be waiting for the GUI thread; once that limit is reached the worker
+    blocks until `chunk_consumed` is called, which keeps memory bounded when the document is slower
+    to fill than the disk is to read. Once the load completed, `size` is the number of bytes that were read, which
+    may be more than the size of the file when the load started if it kept growing.
+
+    The text of a native document is streamed the same way from its archive, and its formats are read up front
+    and handed over before the text, so that each chunk can be formatted as it is appended.
+
+    Signals:
+        decoding(object): The TextFormat the file is decoded in, emitted before its first chunk. Emitted again if
+            the file turns out not to be in that encoding past its first bytes: the chunks received so far must be
+            dropped, the file is decoded again from its start in another one.
+        chunk_loaded(str): A decoded chunk of text, to be appended to the document.
+        progress(int, int): The number of bytes read so far and the total size of the file.
+        formats_loaded(object): The RichTextFormats of a native document, emitted before its first chunk.
+        failed(str): An error message, emitted instead of completing the load.
+    """
+    decoding = pyqtSignal(object)
+    chunk_loaded = pyqtSignal(str)
+    formats_loaded = pyqtSignal(object)
+    progress = pyqtSignal(int, int)
+    failed = pyqtSignal(str)
+
+    CHUNK_SIZE = 64 * 1024
+    MAX_PENDING = 2
+
+    def __init__(self, filename, text_format=None, chunk_size=CHUNK_SIZE, max_pending=MAX_PENDING, parent=None):
+        """
+        Parameters:
+            filename: The path of the file to load.
+            text_format: The TextFormat the file was last read in, if known, to decode it in instead of detecting it.
+        """
+        super().__init__(parent)
+        self.filename = filename
+        self.text_format = text_format
+        self.chunk_size = chunk_size
+        self.size = None
+        self._slots = QSemaphore(max_pending)
+
+    def chunk_consumed(self):
+        """
+        Must be called by the receiver once a chunk emitted by `chunk_loaded` has been appended.
+        """
+        self._slots.release()
+
+    def cancel(self):
+        """
+        Ask the worker to stop after the current chunk and unblock it if it is waiting on the GUI.
+        """
+        self.requestInterruption()
+        self._slots.release()
+
+    def run(self):
+        try:
+            if is_native(self.filename):
+                self._load_native()
+                return
+            total = os.path.getsize(self.filename)
+            with open(self.filename, 'rb') as file:
+                head = file.read(SNIFF_SIZE)
+                text_format = detect_format(head, len(head) < SNIFF_SIZE)
+                known = self.text_format
+                if known is not None and known.bom == text_format.bom and head.startswith(known.bom_bytes()):
+                    text_format = known
+                while True:
+                    try:
+                        self._stream(file, text_format, total)
+                        self.size = file.tell()
+                        break
+                    except UnicodeDecodeError:
+                        # The start of the file was valid in the encoding, the rest is not
+                        text_format = text_format.fallback()
+                        if text_format is None:
+                            raise
+        except (OSError, ValueError) as error:
+            self.failed.emit(str(error))
+
+    def _load_native(self):
+        import zipfile
+
+        try:
+            with open_document(self.filename) as archive:
+                self.formats_loaded.emit(RichTextFormats.read(archive))
+                with archive.open(TEXT_MEMBER) as file:
+                    self._stream(file, NATIVE_TEXT_FORMAT, archive.getinfo(TEXT_MEMBER).file_size)
+        except (zipfile.BadZipFile, KeyError, struct.error) as error:
+            # A member missing from the archive, or damaged past its directory
+            raise ValueError(f'Damaged PyNotePad document: {error}') from None
+
+    def _stream(self, file, text_format, total):
+        self.decoding.emit(text_format)
+        reader = text_format.text_reader(file)
+        try:
+            while not self.isInterruptionRequested():
+                with profiler.span('read', 'io', file=self.filename):
+                    text = reader.read(self.chunk_size)
+                if not text:
+                    break
+                self._slots.acquire()
+                if self.isInterruptionRequested():
+                    break
+                self.chunk_loaded.emit(text)
+                self.progress.emit(min(file.tell(), total), total)
+        finally:
+            # The file is closed by its owner, not by the reader
+            reader.detach()
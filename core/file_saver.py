@@ -0,0 +1,156 @@
+import os
+import stat
+import tempfile
+
+from PyQt5.QtCore import QObject, QThread, pyqtSignal
+
+from core.codec import TextFormat
+from core.instrumentation import profiler
+
+# The umask can only be read by setting it, which is not safe once save threads are running
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def atomic_write(filename, text, text_format=None):
+    """
+    Write text to a file so that the file is either fully replaced or left untouched.
+
+    The text is written to a temporary file in the same directory, flushed to disk, then renamed over
+    the target, so a crash or a full disk in the middle of the write never leaves a truncated file behind.
+    The permissions of an existing target are kept, a new one gets the usual permissions allowed by the umask
+    rather than the owner-only ones of temporary files, and symbolic links are written through.
+
+    Parameters:
+        filename: The path of the file to write.
+        text: The content to write, with \\n line endings.
+        text_format: The TextFormat to write the text in, by default UTF-8 with the line endings of the platform,
+            or the RichTextFormats of a native document.
+
+    Raises:
+        OSError: The file could not be written.
+        UnicodeEncodeError: The text holds characters the encoding of `text_format` cannot represent.
+    """
+    target = os.path.realpath(filename)
+    directory, name = os.path.split(target)
+    fd, temp = tempfile.mkstemp(prefix=f'.{name}.', suffix='.tmp', dir=directory)
+
+    try:
+        with open(fd, 'wb') as file:
+            (text_format or TextFormat()).write(file, text)
+            os.fsync(file.fileno())
+
+        if os.path.exists(target):
+            os.chmod(temp, stat.S_IMODE(os.stat(target).st_mode))
+        else:
+            os.chmod(temp, 0o666 & ~_UMASK)
+        os.replace(temp, target)
+    except BaseException:
+        os.unlink(temp)
+        raise
+
+    if hasattr(os, 'O_DIRECTORY'):
+        dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+class SaveWorker(QThread):
+    """
+    Worker thread that writes one snapshot of a document with atomic_write.
+    The error message, if the write failed, is left in `error`.
+    """
+
+    def __init__(self, filename, text, text_format=None, parent=None):
+        super().__init__(parent)
+        self.filename = filename
+        self.text = text
+        self.text_format = text_format or TextFormat()
+        self.error = None
+
+    def run(self):
+        try:
+            with profiler.span('atomic_write', 'io', file=self.filename):
+                atomic_write(self.filename, self.text, self.text_format)
+        except OSError as error:
+            self.error = str(error)
+        except UnicodeEncodeError as error:
+            self.error = f'The character {error.object[error.start]!r} cannot be written in {self.text_format.encoding}.'
+        self.text = None
+
+
+class FileSaver(QObject):
+    """
+    Runs saves in the background, one worker per file.
+
+    A save requested while the same file is still being written does not queue up behind it: the snapshot
+    is kept as pending and replaces any snapshot already pending, so only the latest one is written once
+    the current write completes.
+
+    Signals:
+        started(str): A file started being written.
+        saved(str): A file was written successfully and no newer snapshot is pending for it.
+        failed(str, str): A file could not be written, with the error message.
+    """
+    started = pyqtSignal(str)
+    saved = pyqtSignal(str)
+    failed = pyqtSignal(str, str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._workers = {}
+        self._pending = {}
+
+    def save(self, filename, text, text_format=None):
+        """
+        Save a snapshot of a document to a file in the background.
+
+        Parameters:
+            filename: The path of the file to write.
+            text: The snapshot of the document to write.
+            text_format: The TextFormat or RichTextFormats to write it in, see atomic_write.
+        """
+        if filename in self._workers:
+            self._pending[filename] = text, text_format
+        else:
+            self._start(filename, text, text_format)
+
+    def is_saving(self, filename=None):
+        if filename is None:
+            return bool(self._workers)
+        return filename in self._workers
+
+    def wait(self):
+        """
+        Block until every running and pending save has been written.
+        """
+        while self._workers:
+            worker = next(iter(self._workers.values()))
+            worker.wait()
+            self._finish(worker)
+
+    def _start(self, filename, text, text_format):
+        worker = SaveWorker(filename, text, text_format, self)
+        worker.finished.connect(lambda: self._finish(worker))
+        self._workers[filename] = worker
+        self.started.emit(filename)
+        worker.start()
+
+    def _finish(self, worker):
+        filename = worker.filename
+        if self._workers.get(filename) is not worker:
+            return
+
+        del self._workers[filename]
+        worker.deleteLater()
+
+        # A newer snapshot is being written by the time a failure is reported, see is_saving
+        pending = self._pending.pop(filename, None)
+        if pending is not None:
+            self._start(filename, *pending)
+        if worker.error is not None:
+            self.failed.emit(filename, worker.error)
+        elif pending is None:
+            self.saved.emit(filename)
@@ -0,0 +1,154 @@
+import codecs
+import io
+import os
+
+from PyQt5.QtCore import QObject, QFileSystemWatcher, QTimer, pyqtSignal
+
+from core.instrumentation import profiler
+
+
+class _WatchedFile:
+    """
+    What is known of a watched file: how far it was read, and how to decode what is appended to it.
+    """
+    __slots__ = ('text_format', 'size', 'mtime', 'tail', 'decoder')
+
+    def __init__(self, text_format, size, mtime, tail):
+        self.text_format = text_format
+        self.size = size
+        self.mtime = mtime
+        self.tail = tail
+        self.decoder = None
+        if text_format is not None:
+            # Characters and \r\n line endings split between two appends are decoded once both halves arrived
+            self.decoder = io.IncrementalNewlineDecoder(
+                codecs.getincrementaldecoder(text_format.encoding)(errors='replace'), translate=True)
+
+
+class FileWatcher(QObject):
+    """
+    Watches files for changes made by other programs, and tells the files that were only appended to from
+    those that were rewritten.
+
+    Each file is watched from a known state: the number of bytes that were read from it, and the last of those
+    bytes. Once a file changed and `delay` ms went by without further changes, it is compared with that state.
+    If it grew and still holds the same bytes where it used to end, only the new bytes are read, decoded, and
+    reported by `appended`, so following a log costs the size of what was logged rather than that of the log.
+    Any other change is reported by `rewritten`.
+
+    Files replaced by renaming another file over them, as editors and FileSaver do, are watched again under
+    their name.
+
+    Signals:
+        appended(str, str): A file and the text appended to it, with \\n line endings. A large append is read and
+            reported in several parts.
+        rewritten(str): A file changed otherwise than by an append. It is watched from its new state.
+        removed(str): A file that was deleted or moved away. It is no longer watched.
+    """
+    appended = pyqtSignal(str, str)
+    rewritten = pyqtSignal(str)
+    removed = pyqtSignal(str)
+
+    DELAY = 100
+    # Bytes compared at the end of the known part of a file to tell an append from a rewrite
+    TAIL_SIZE = 1024
+    # Most bytes read from a file at a time, the rest of a large append is read on the next pass of the event loop
+    READ_SIZE = 1024 * 1024
+
+    def __init__(self, delay=DELAY, parent=None):
+        super().__init__(parent)
+        self._files = {}
+        self._changed = set()
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.fileChanged.connect(self._file_changed)
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay)
+        self._timer.timeout.connect(self._check)
+
+    def watch(self, filename, text_format=None, size=None):
+        """
+        Start watching a file, or forget what happened to it until now, e.g. after it was saved.
+
+        Parameters:
+            filename: The path of the file.
+            text_format: The TextFormat to decode appended text in, or None to report any change as a rewrite,
+                e.g. for a file that is not plain text.
+            size: The number of bytes of the file that were read, by default its current size. If the file is
+                already bigger, the bytes after them are reported as appended.
+
+        Raises:
+            OSError: The file could not be read.
+        """
+        info = os.stat(filename)
+        size = info.st_size if size is None else size
+        with open(filename, 'rb') as file:
+            file.seek(max(0, size - self.TAIL_SIZE))
+            tail = file.read(max(0, size - file.tell()))
+
+        mtime = info.st_mtime_ns if size == info.st_size else None
+        self._files[filename] = _WatchedFile(text_format, size, mtime, tail)
+        if filename not in self._watcher.files():
+            self._watcher.addPath(filename)
+        if size != info.st_size:
+            self._file_changed(filename)
+
+    def unwatch(self, filename):
+        self._files.pop(filename, None)
+        self._changed.discard(filename)
+        if filename in self._watcher.files():
+            self._watcher.removePath(filename)
+
+    def is_watched(self, filename):
+        return filename in self._files
+
+    def _file_changed(self, filename):
+        if filename in self._files:
+            self._changed.add(filename)
+            self._timer.start()
+
+    def _check(self):
+        changed, self._changed = self._changed, set()
+        for filename in changed:
+            state = self._files.get(filename)
+            if state is None:
+                continue
+            try:
+                info = os.stat(filename)
+                if filename not in self._watcher.files():
+                    self._watcher.addPath(filename)
+                if (info.st_size, info.st_mtime_ns) == (state.size, state.mtime):
+                    continue
+                if state.decoder is not None and info.st_size > state.size \
+                        and self._tail(filename, state) == state.tail:
+                    self._read_appended(filename, state, info)
+                    continue
+                self.watch(filename, state.text_format)
+            except OSError:
+                self.unwatch(filename)
+                self.removed.emit(filename)
+                continue
+            self.rewritten.emit(filename)
+
+    def _tail(self, filename, state):
+        with open(filename, 'rb') as file:
+            file.seek(state.size - len(state.tail))
+            return file.read(len(state.tail))
+
+    def _read_appended(self, filename, state, info):
+        with profiler.span('read_appended', 'io', file=filename):
+            with open(filename, 'rb') as file:
+                file.seek(state.size)
+                data = file.read(min(info.st_size - state.size, self.READ_SIZE))
+        state.size += len(data)
+        state.tail = (state.tail + data)[-self.TAIL_SIZE:]
+        if state.size >= info.st_size:
+            state.mtime = info.st_mtime_ns
+        else:
+            # The rest of the append is read on the next pass
+            self._changed.add(filename)
+            QTimer.singleShot(0, self._check)
+
+        text = state.decoder.decode(data)
+        if text:
+            self.appended.emit(filename, text)
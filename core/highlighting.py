@@ -0,0 +1,458 @@
+import builtins
+import keyword
+import os
+import re
+import time
+
+from PyQt5.QtCore import QObject, QPoint, QTimer
+from PyQt5.QtGui import QColor, QFont, QTextCharFormat, QTextLayout
+
+from core.codec import utf16_positions
+
+# Color, bold and italic of each kind of token
+TOKEN_STYLES = {
+    'keyword': ('#0033b3', True, False),
+    'builtin': ('#000080', False, False),
+    'definition': ('#00627a', True, False),
+    'decorator': ('#9e880d', False, False),
+    'string': ('#067d17', False, False),
+    'number': ('#1750eb', False, False),
+    'comment': ('#8c8c8c', False, True),
+    'key': ('#871094', False, False),
+    'literal': ('#0033b3', True, False),
+    'timestamp': ('#8c8c8c', False, False),
+    'error': ('#c00000', True, False),
+    'warning': ('#b36b00', True, False),
+    'info': ('#0033b3', False, False),
+    'debug': ('#8c8c8c', False, False),
+    'heading': ('#0033b3', True, False),
+    'strong': (None, True, False),
+    'emphasis': (None, False, True),
+    'code': ('#067d17', False, False),
+    'link': ('#1750eb', False, False),
+    'list': ('#871094', True, False),
+    'quote': ('#8c8c8c', False, True),
+}
+
+LEXERS = []
+
+
+def register_lexer(lexer_class):
+    """
+    Make a Lexer subclass available to the application: files with one of its extensions are highlighted
+    with it, and it is listed in the Syntax menu. Can be used as a class decorator.
+    """
+    LEXERS.append(lexer_class)
+    return lexer_class
+
+
+def lexer_for_filename(filename):
+    """
+    Return a new instance of the registered lexer for the extension of `filename`, or None for plain text.
+    """
+    if filename is None:
+        return None
+
+    extension = os.path.splitext(filename)[1][1:].lower()
+    for lexer_class in LEXERS:
+        if extension in lexer_class.extensions:
+            return lexer_class()
+    return None
+
+
+def token_format(color, bold, italic):
+    text_format = QTextCharFormat()
+    if color is not None:
+        text_format.setForeground(QColor(color))
+    if bold:
+        text_format.setFontWeight(QFont.Bold)
+    if italic:
+        text_format.setFontItalic(True)
+    return text_format
+
+
+class Lexer:
+    """
+    Splits the lines of a language into tokens for the SyntaxHighlighter.
+
+    A lexer is given one line at a time, along with the state the previous line ended in, and returns the tokens
+    of the line and the state it ends in. States are small ints, 0 being the state at the start of a document;
+    a language with no construct spanning lines, like JSON, always stays in state 0.
+
+    Subclasses set the `name` and the file `extensions` of their language, and implement `tokens`.
+    """
+    name = None
+    extensions = ()
+
+    def tokens(self, text, state):
+        """
+        Parameters:
+            text: The text of the line, without its line break.
+            state: The state the previous line ended in.
+
+        Returns:
+            A (tokens, state) tuple: the list of (start, length, kind) tokens of the line, kind being a key
+            of TOKEN_STYLES, and the state the line ends in.
+        """
+        raise NotImplementedError
+
+
+class RegexLexer(Lexer):
+    """
+    Lexer for tokens that are matched by regular expressions, given as a list of (pattern, kind) `rules`.
+    At each position the rules are tried in order, and the first that matches wins.
+    """
+    rules = []
+
+    def __init__(self):
+        self.pattern = re.compile('|'.join(
+            f'(?P<t{number}>{pattern})' for number, (pattern, _) in enumerate(self.rules)
+        ))
+        self.kinds = {f't{number}': kind for number, (_, kind) in enumerate(self.rules)}
+
+    def tokens(self, text, state):
+        return self.scan(text), state
+
+    def scan(self, text, position=0):
+        return [
+            (match.start(), match.end() - match.start(), self.kinds[match.lastgroup])
+            for match in self.pattern.finditer(text, position)
+        ]
+
+
+@register_lexer
+class PythonLexer(RegexLexer):
+    """
+    Python. A line ends in state 1 or 2 inside a string opened with ''' or \""" respectively.
+    """
+    name = 'Python'
+    extensions = ('py', 'pyw', 'pyi')
+
+    QUOTES = ("'''", '"""')
+    PREFIX = r'(?i:[rbuf]{0,2})'
+    rules = [
+        (r'#.*', 'comment'),
+        (PREFIX + r"(?:'''|\"\"\")", 'triple'),
+        (PREFIX + r"'(?:[^'\\]|\\.)*'?", 'string'),
+        (PREFIX + r'"(?:[^"\\]|\\.)*"?', 'string'),
+        (r'@[\w.]+', 'decorator'),
+        (r'(?<=\bdef )\w+|(?<=\bclass )\w+', 'definition'),
+        (r'\b(?:' + '|'.join(keyword.kwlist) + r')\b', 'keyword'),
+        (r'\b(?:' + '|'.join(name for name in dir(builtins) if not name.startswith('_')) + r')\b', 'builtin'),
+        (r'\b(?:0[xXoObB][\da-fA-F_]+|\d[\d_]*\.?[\d_]*(?:[eE][+-]?\d+)?[jJ]?)\b|\.\d[\d_]*\b', 'number'),
+    ]
+
+    def __init__(self):
+        super().__init__()
+        self.endings = [re.compile(r'(?:[^\\]|\\.)*?' + quote) for quote in self.QUOTES]
+
+    def tokens(self, text, state):
+        tokens = []
+        position = 0
+        if state:
+            match = self.endings[state - 1].match(text)
+            if match is None:
+                return [(0, len(text), 'string')], state
+            tokens.append((0, match.end(), 'string'))
+            position = match.end()
+
+        while True:
+            match = self.pattern.search(text, position)
+            if match is None:
+                return tokens, 0
+            kind = self.kinds[match.lastgroup]
+            position = match.end()
+            if kind != 'triple':
+                tokens.append((match.start(), match.end() - match.start(), kind))
+                continue
+
+            # The rest of the line is in the string unless it is closed on it
+            state = self.QUOTES.index(match.group()[-3:]) + 1
+            ending = self.endings[state - 1].match(text, position)
+            if ending is None:
+                tokens.append((match.start(), len(text) - match.start(), 'string'))
+                return tokens, state
+            tokens.append((match.start(), ending.end() - match.start(), 'string'))
+            position = ending.end()
+
+
+@register_lexer
+class JsonLexer(RegexLexer):
+    """
+    JSON, and JSON Lines.
+    """
+    name = 'JSON'
+    extensions = ('json', 'jsonl')
+
+    rules = [
+        (r'"(?:[^"\\]|\\.)*"(?=\s*:)', 'key'),
+        (r'"(?:[^"\\]|\\.)*"?', 'string'),
+        (r'-?\b\d+(?:\.\d+)?(?:[eE][+-]?\d+)?\b', 'number'),
+        (r'\b(?:true|false|null)\b', 'literal'),
+    ]
+
+
+@register_lexer
+class LogLexer(RegexLexer):
+    """
+    Log files: timestamps at the start of lines, severity levels and quoted strings.
+    """
+    name = 'Log'
+    extensions = ('log',)
+
+    rules = [
+        (r'^\[?\d{4}-\d\d-\d\d[T ]\d\d:\d\d:\d\d(?:[.,]\d+)?(?:Z|[+-]\d\d:?\d\d)?\]?', 'timestamp'),
+        (r'^[A-Z][a-z]{2} [ \d]\d \d\d:\d\d:\d\d', 'timestamp'),
+        (r'\b(?:FATAL|CRITICAL|SEVERE|ERROR|ERR)\b', 'error'),
+        (r'\b(?:WARNING|WARN)\b', 'warning'),
+        (r'\b(?:INFO|NOTICE)\b', 'info'),
+        (r'\b(?:DEBUG|TRACE)\b', 'debug'),
+        (r'"[^"]*"', 'string'),
+    ]
+
+
+@register_lexer
+class MarkdownLexer(RegexLexer):
+    """
+    Markdown. A line ends in state 1 inside a fenced code block.
+    """
+    name = 'Markdown'
+    extensions = ('md', 'markdown')
+
+    FENCE = re.compile(r'\s{0,3}(?:```|~~~)')
+    HEADING = re.compile(r'#{1,6}(?:\s|$)')
+    QUOTE = re.compile(r'\s{0,3}>')
+    rules = [
+        (r'^\s*(?:[-*+]|\d+[.)])(?=\s)', 'list'),
+        (r'`[^`]*`', 'code'),
+        (r'\*\*[^*]+\*\*|__[^_]+__', 'strong'),
+        (r'\*[^*\s][^*]*\*|\b_[^_\s][^_]*_\b', 'emphasis'),
+        (r'!?\[[^\]]*\]\([^)]*\)', 'link'),
+    ]
+
+    def tokens(self, text, state):
+        if self.FENCE.match(text):
+            return [(0, len(text), 'code')], 1 - state
+        if state:
+            return [(0, len(text), 'code')], state
+        if self.HEADING.match(text):
+            return [(0, len(text), 'heading')], 0
+        if self.QUOTE.match(text):
+            return [(0, len(text), 'quote')], 0
+        return self.scan(text), 0
+
+
+class SyntaxHighlighter(QObject):
+    """
+    Highlights the syntax of a QTextDocument with a Lexer, incrementally.
+
+    The state the lexer ended each block in is kept in the user state of the block. After an edit, blocks are
+    lexed again from the first one that changed, and past the changed ones only until a block ends in the same
+    state as before, since the blocks after it cannot change. The edited blocks are highlighted right away;
+    anything more, like a whole file after it was loaded or after a string was opened at its top, is done in
+    slices of at most SLICE_TIME seconds from a zero timer, i.e. whenever the event loop is idle.
+
+    As with QSyntaxHighlighter, formats are set on the layouts of the blocks: they are shown but are not part
+    of the document, and do not touch its undo stack or its modified flag. A block whose formats are set has to
+    be laid out again, which costs QTextDocumentLayout time in proportion to the blocks after it, so in the
+    background only the blocks in view of `view` are given their formats. The others are only lexed, and are
+    given theirs as they are scrolled into view.
+    """
+    SLICE_TIME = 0.005
+    # Flag of the user state of a block, set when its formats are up to date with its state
+    FORMATTED = 1
+
+    def __init__(self, document, view=None, lexer=None):
+        super().__init__(document)
+        self.document = document
+        self.view = view
+        self.lexer = lexer
+        self.formats = {kind: token_format(*style) for kind, style in TOKEN_STYLES.items()}
+        # [start, end] positions of each range of the document that changed since it was lexed. They are moved
+        # along with the edits by hand: QTextCursors would do it, but must not be deleted in the middle of an edit
+        self._pending = []
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.highlight_slice)
+        document.contentsChange.connect(self.contents_changed)
+        if view is not None:
+            view.verticalScrollBar().valueChanged.connect(self.update_view)
+            view.verticalScrollBar().rangeChanged.connect(self.update_view)
+        if lexer is not None:
+            self.rehighlight()
+
+    def set_lexer(self, lexer):
+        """
+        Highlight the document with another Lexer, or clear its highlighting if `lexer` is None.
+        """
+        self.lexer = lexer
+        self.rehighlight()
+
+    def rehighlight(self):
+        self._pending = [[0, self.document.characterCount() - 1]]
+        self.timer.start(0)
+
+    def update_view(self):
+        """
+        Give their formats to the blocks that came into view, once the event loop is idle.
+        """
+        # The scroll bar changes while the document is being laid out, when its blocks cannot be looked at yet
+        if self.shown():
+            self.timer.start(0)
+
+    def is_idle(self):
+        return not self._pending
+
+    def contents_changed(self, position, removed, added):
+        for pending in self._pending:
+            for index, pending_position in enumerate(pending):
+                if pending_position >= position + removed:
+                    pending[index] = pending_position + added - removed
+                elif pending_position > position:
+                    pending[index] = position
+        if self.lexer is None:
+            return
+
+        # The document lays the edited blocks out once this returns, the formats set meanwhile come at no cost
+        self._pending.append([position, position + added])
+        self.highlight(time.perf_counter() + self.SLICE_TIME, edited=(position, position + added))
+        if self._pending:
+            self.timer.start(0)
+
+    def highlight_slice(self):
+        self.highlight(time.perf_counter() + self.SLICE_TIME)
+        self.format_visible_blocks()
+        if not self._pending:
+            self.timer.stop()
+
+    def highlight(self, deadline, edited=None):
+        """
+        Lex pending blocks, the first ones in the document first, until `deadline`.
+
+        Parameters:
+            deadline: The time.perf_counter() value to stop at.
+            edited: The (start, end) positions of the text inserted by the edit in progress, if any. The blocks
+                in that range are given their formats, as they are laid out along with the edit. Otherwise only
+                the blocks in view are.
+        """
+        visible = None if edited is not None else self.visible_blocks()
+        while self._pending and time.perf_counter() < deadline:
+            self._pending.sort()
+            start, end = self._pending[0]
+            block = self.document.findBlock(start)
+            number = block.blockNumber()
+            state = max(block.previous().userState(), 0) >> 1
+            formatted = []
+            converged = False
+
+            while block.isValid() and time.perf_counter() < deadline:
+                previous = block.userState()
+                tokens, state = self.lex(block, state)
+                if edited is not None:
+                    formatting = edited[0] <= block.position() + block.length() and block.position() <= edited[1]
+                else:
+                    formatting = visible is not None and visible[0] <= number <= visible[1]
+                if formatting:
+                    if self.set_formats(block, tokens):
+                        formatted.append(block)
+                    block.setUserState(state << 1 | self.FORMATTED)
+                else:
+                    block.setUserState(state << 1)
+
+                changed = block.position() + block.length() > end
+                block = block.next()
+                number += 1
+                if changed and previous != -1 and state == previous >> 1:
+                    converged = True
+                    break
+
+            self.mark_dirty(formatted)
+
+            # Other ranges are done as far as this one went, and gone if they ended before
+            self._pending.pop(0)
+            if not block.isValid():
+                self._pending = []
+                break
+            reached = block.position()
+            self._pending = [[max(first, reached), last] for first, last in self._pending if last >= reached]
+            if not converged:
+                self._pending.append([reached, end])
+
+    def format_visible_blocks(self):
+        """
+        Give their formats to the blocks in view that were lexed but not formatted, up to the first pending change.
+        """
+        visible = self.visible_blocks()
+        if visible is None:
+            return
+
+        limit = min(start for start, _ in self._pending) if self._pending else None
+        block = self.document.findBlockByNumber(visible[0])
+        formatted = []
+        for _ in range(visible[1] - visible[0] + 1):
+            if not block.isValid() or limit is not None and block.position() >= limit:
+                break
+            user_state = block.userState()
+            if user_state != -1 and not user_state & self.FORMATTED:
+                tokens, _ = self.lex(block, max(block.previous().userState(), 0) >> 1)
+                if self.set_formats(block, tokens):
+                    formatted.append(block)
+                block.setUserState(user_state | self.FORMATTED)
+            block = block.next()
+        self.mark_dirty(formatted)
+
+    def visible_blocks(self):
+        """
+        Return the (first, last) numbers of the blocks in view, or None if the document is not shown.
+        """
+        if not self.shown():
+            return None
+
+        # Hit testing only lays the document out down to the bottom of the view, whereas looking at the rectangle of
+        # a block lays it out down to that block, i.e. most of a document that was just loaded. In the corner of the
+        # margin, hit testing can land on blocks that were not laid out yet, the top left of the text is tested instead.
+        viewport = self.view.viewport()
+        margin = int(self.document.documentMargin())
+        first = self.view.cursorForPosition(QPoint(margin, margin)).blockNumber()
+        last = self.view.cursorForPosition(QPoint(viewport.width() - 1, viewport.height() - 1)).blockNumber()
+        return first, max(first, last)
+
+    def shown(self):
+        return self.view is not None and self.view.document() is self.document and self.view.isVisible()
+
+    def lex(self, block, state):
+        if self.lexer is None:
+            return [], 0
+        text = block.text()
+        tokens, state = self.lexer.tokens(text, state)
+        if not text.isascii():
+            # Lexers count code points, layouts UTF-16 code units
+            utf16 = utf16_positions(text)
+            tokens = [(utf16(start), utf16(start + length) - utf16(start), kind) for start, length, kind in tokens]
+        return tokens, state
+
+    def set_formats(self, block, tokens):
+        """
+        Set the formats of the tokens of a block on its layout.
+
+        Returns:
+            False if there was nothing to change, the block having no tokens and no formats.
+        """
+        ranges = []
+        for start, length, kind in tokens:
+            format_range = QTextLayout.FormatRange()
+            format_range.start = start
+            format_range.length = length
+            format_range.format = self.formats[kind]
+            ranges.append(format_range)
+        if not ranges and not block.layout().formats():
+            return False
+        block.layout().setFormats(ranges)
+        return True
+
+    def mark_dirty(self, blocks):
+        """
+        Lay out again the blocks whose formats were set, in a single pass.
+        """
+        if blocks:
+            start = blocks[0].position()
+            self.document.markContentsDirty(start, blocks[-1].position() + blocks[-1].length() - start)
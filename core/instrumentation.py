@@ -0,0 +1,180 @@
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import nullcontext
+
+from PyQt5.QtCore import Qt, QTimer
+
+# Span returned while the profiler is off: entering and leaving it does nothing
+_NO_SPAN = nullcontext()
+
+
+class Span:
+    """
+    Context manager that records the time spent in its block as an event of a Profiler.
+    """
+    __slots__ = ('profiler', 'name', 'category', 'args', 'start')
+
+    def __init__(self, owner, name, category, args):
+        self.profiler = owner
+        self.name = name
+        self.category = category
+        self.args = args
+        self.start = None
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.profiler.record(self.name, self.category, self.start, time.perf_counter() - self.start, self.args)
+        return False
+
+
+class Profiler:
+    """
+    Opt-in record of where the application spends its time: the slots of the actions of the main window,
+    file reads and writes, and the stalls of the event loop.
+
+    Events are kept in a ring buffer of the last `capacity` ones, and can be exported in the Chrome trace
+    event format, to be opened in chrome://tracing or https://ui.perfetto.dev. Events can be recorded from
+    any thread.
+
+    The profiler is off until `enable` is called. While it is off `span` returns a shared no-op context manager
+    and `timed` returns the function it is given unchanged, so the instrumented code runs as it would without it.
+    """
+    CAPACITY = 100000
+    # Default length from which the event loop is considered stalled, in ms
+    STALL_THRESHOLD = 50
+    # Interval of the timer that detects stalls, in ms; a stall is a timeout that came late
+    HEARTBEAT_INTERVAL = 10
+
+    def __init__(self, capacity=CAPACITY):
+        self.enabled = False
+        self.events = deque(maxlen=capacity)
+        # Last event of each category, and the count and longest of the stalls, for the status bar
+        self.latest = {}
+        self.stall_count = 0
+        self.longest_stall = 0
+        self.stall_threshold = self.STALL_THRESHOLD
+        self.origin = time.perf_counter()
+        self.heartbeat = None
+        self.last_beat = None
+
+    def enable(self, stall_threshold=STALL_THRESHOLD):
+        """
+        Start recording events. Needs a QCoreApplication, for the timer that detects stalls of the event loop.
+
+        Parameters:
+            stall_threshold: The length from which the event loop is considered stalled, in ms.
+        """
+        self.enabled = True
+        self.stall_threshold = stall_threshold
+        self.heartbeat = QTimer()
+        self.heartbeat.setTimerType(Qt.PreciseTimer)
+        self.heartbeat.timeout.connect(self.beat)
+        self.heartbeat.start(self.HEARTBEAT_INTERVAL)
+        self.last_beat = time.perf_counter()
+
+    def span(self, name, category, **args):
+        """
+        Return a context manager that records the time spent in its block.
+
+        Parameters:
+            name: The name of the event, e.g. the function being timed.
+            category: The kind of event, e.g. 'slot' or 'io'.
+            args: Details to record with the event, e.g. the file being read.
+        """
+        if not self.enabled:
+            return _NO_SPAN
+        return Span(self, name, category, args)
+
+    def timed(self, function, name=None, category='slot'):
+        """
+        Return a wrapper of `function` that records the time spent in each call, to be connected to a signal
+        in place of the function. Returns the function itself if the profiler is off.
+
+        Like a slot connected directly, the wrapper drops the arguments of the signal the function does not take.
+        """
+        if not self.enabled:
+            return function
+
+        # Imported only when profiling, it takes long to import
+        import inspect
+
+        name = name or getattr(function, '__name__', repr(function))
+        try:
+            parameters = inspect.signature(function).parameters.values()
+        except (TypeError, ValueError):
+            # Slots of Qt classes have no signature, those connected here take no arguments
+            count = 0
+        else:
+            if any(parameter.kind == parameter.VAR_POSITIONAL for parameter in parameters):
+                count = None
+            else:
+                count = sum(parameter.kind in (parameter.POSITIONAL_ONLY, parameter.POSITIONAL_OR_KEYWORD)
+                            for parameter in parameters)
+
+        def slot(*args):
+            with Span(self, name, category, {}):
+                return function(*args[:count])
+        return slot
+
+    def record(self, name, category, start, duration, args=None):
+        event = (name, category, start, duration, threading.get_ident(), args or {})
+        self.events.append(event)
+        self.latest[category] = event
+
+    def beat(self):
+        now = time.perf_counter()
+        late = now - self.last_beat - self.HEARTBEAT_INTERVAL / 1000
+        if late * 1000 >= self.stall_threshold:
+            self.record('event loop stall', 'stall', self.last_beat + self.HEARTBEAT_INTERVAL / 1000, late)
+            self.stall_count += 1
+            self.longest_stall = max(self.longest_stall, late)
+        self.last_beat = now
+
+    def summary(self):
+        """
+        Return a one line summary of the last events, for the status bar.
+        """
+        parts = []
+        for category in ('slot', 'io'):
+            event = self.latest.get(category)
+            if event is not None:
+                parts.append(f'{event[0]} {event[3] * 1000:.1f} ms')
+        if self.stall_count:
+            parts.append(f'{self.stall_count} stalls, longest {self.longest_stall * 1000:.0f} ms')
+        else:
+            parts.append('no stalls')
+        return ' | '.join(parts)
+
+    def trace(self):
+        """
+        Return the recorded events in the Chrome trace event format.
+        """
+        pid = os.getpid()
+        threads = {thread.ident: thread.name for thread in threading.enumerate()}
+        events = []
+        for name, category, start, duration, thread, args in list(self.events):
+            events.append({
+                'name': name, 'cat': category, 'ph': 'X', 'pid': pid, 'tid': thread,
+                'ts': round((start - self.origin) * 1e6, 1), 'dur': round(duration * 1e6, 1), 'args': args,
+            })
+        for thread in {event['tid'] for event in events}:
+            # Worker QThreads are not Python threads and have no name
+            name = threads.get(thread, 'worker')
+            events.append({'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': thread, 'args': {'name': name}})
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def export_trace(self, filename):
+        """
+        Write the recorded events to a file in the Chrome trace event format.
+        """
+        with open(filename, 'w', encoding='utf-8') as file:
+            json.dump(self.trace(), file)
+
+
+profiler = Profiler()
@@ -0,0 +1,251 @@
+import glob
+import json
+import os
+import re
+import shutil
+import tempfile
+
+from PyQt5.QtCore import QObject, QLockFile
+
+from core.codec import read_text
+from core.file_saver import SaveWorker
+from core.rich_text import is_native, read_document
+from core.instrumentation import profiler
+
+
+class EditJournal(QObject):
+    """
+    Append-only journal of the edits made to a document, used to recover unsaved changes after a crash.
+
+    Each session owns a directory holding the journal as a series of generations. A generation is a snapshot,
+    either the full text (snapshot-N.txt) or a reference to a file whose content it matches (snapshot-N.json),
+    and a log of the edits made after it (journal-N.log), one JSON line per edit. Recording an edit only
+    appends that edit, so its cost depends on the size of the edit, not on the size of the document.
+
+    Generations are started by `compact`, which writes a text snapshot in the background, and by `checkpoint`,
+    whose snapshot is later provided with `commit_reference` once the document was saved to a file.
+    When a snapshot is complete, older generations are deleted. A snapshot that never completed is simply
+    skipped on recovery, since the edits of its generation follow those of the previous one.
+
+    A QLockFile in the directory is held for as long as the session lives, so the directories of sessions
+    that crashed can be told apart from the ones of running instances.
+    """
+
+    def __init__(self, root, parent=None):
+        super().__init__(parent)
+        os.makedirs(root, exist_ok=True)
+        self.directory = tempfile.mkdtemp(prefix='session-', dir=root)
+        self.lock = QLockFile(os.path.join(self.directory, 'lock'))
+        self.lock.tryLock(0)
+        self.filename = None
+        self.generation = 0
+        self.size = 0
+        self.active = False
+        self._log = None
+        self._worker = None
+
+    def _path(self, kind, generation, ext):
+        return os.path.join(self.directory, f'{kind}-{generation}.{ext}')
+
+    def _open_log(self):
+        if self._log is not None:
+            self._log.close()
+        self._log = open(self._path('journal', self.generation, 'log'), 'a', encoding='utf-8')
+        self._log.write(json.dumps({'file': self.filename}) + '\n')
+        self._log.flush()
+        self.size = 0
+
+    def _reference(self, filename):
+        info = os.stat(filename)
+        return {'file': filename, 'size': info.st_size, 'mtime': info.st_mtime_ns}
+
+    def start(self, filename=None, text=None):
+        """
+        Start a new journal for a document.
+
+        Parameters:
+            filename: The file the document is associated with, if any.
+            text: The content of the document if it does not match `filename` on disk, e.g. after a recovery.
+                If both are None, the document is empty.
+        """
+        self.stop()
+        if self._worker is not None:
+            self._worker.wait()
+            self._worker = None
+        for path in glob.glob(os.path.join(self.directory, '*-*.*')):
+            os.unlink(path)
+
+        self.filename = filename
+        self.generation = 0
+        if filename is None or text is not None:
+            with open(self._path('snapshot', 0, 'txt'), 'w', encoding='utf-8') as file:
+                file.write(text or '')
+        else:
+            with open(self._path('snapshot', 0, 'json'), 'w', encoding='utf-8') as file:
+                json.dump(self._reference(filename), file)
+        self._open_log()
+        self.active = True
+
+    def stop(self):
+        """
+        Stop recording edits, e.g. while the document is being replaced.
+        """
+        self.active = False
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
+    def record(self, position, removed, text):
+        """
+        Append an edit: `removed` characters at `position` were replaced by `text`. Like the positions of
+        QTextDocument, `position` and `removed` count UTF-16 code units, so that a character outside the BMP
+        counts for two.
+        """
+        line = json.dumps([position, removed, text]) + '\n'
+        with profiler.span('journal_record', 'io'):
+            self._log.write(line)
+            self._log.flush()
+        self.size += len(line)
+
+    def sync(self):
+        """
+        Flush the journal to disk.
+        """
+        if self._log is not None:
+            with profiler.span('journal_sync', 'io'):
+                os.fsync(self._log.fileno())
+
+    def checkpoint(self, filename=None):
+        """
+        Start a new generation whose snapshot will be provided later with `commit_reference`.
+
+        Parameters:
+            filename: The file the document is now associated with, if it changed.
+
+        Returns:
+            The number of the new generation.
+        """
+        if filename is not None:
+            self.filename = filename
+        self.generation += 1
+        self._open_log()
+        return self.generation
+
+    def commit_reference(self, generation, filename):
+        """
+        Record that the snapshot of `generation` was written to `filename`, and drop older generations.
+        """
+        if generation > self.generation:
+            return
+        with open(self._path('snapshot', generation, 'json'), 'w', encoding='utf-8') as file:
+            json.dump(self._reference(filename), file)
+        self._prune(generation)
+
+    def compact(self, text):
+        """
+        Start a new generation and write `text`, the current content of the document, as its snapshot
+        in the background. Does nothing if a previous compaction is still running.
+        """
+        if self.is_compacting():
+            return
+        generation = self.checkpoint()
+        worker = SaveWorker(self._path('snapshot', generation, 'txt'), text, parent=self)
+        worker.finished.connect(lambda: self._compacted(worker, generation))
+        self._worker = worker
+        worker.start()
+
+    def is_compacting(self):
+        return self._worker is not None and self._worker.isRunning()
+
+    def _compacted(self, worker, generation):
+        if worker is self._worker and worker.error is None:
+            self._prune(generation)
+
+    def _prune(self, generation):
+        for path in glob.glob(os.path.join(self.directory, '*-*.*')):
+            number = re.search(r'-(\d+)\.', os.path.basename(path))
+            if number and int(number.group(1)) < generation:
+                os.unlink(path)
+
+    def discard(self):
+        """
+        Delete the journal, when the session ends cleanly.
+        """
+        self.stop()
+        if self._worker is not None:
+            self._worker.wait()
+        self.lock.unlock()
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    @staticmethod
+    def orphans(root):
+        """
+        Return the journal directories under `root` left behind by sessions that did not end cleanly,
+        most recently modified first. Each returned directory is locked, the lock is returned with it.
+        """
+        result = []
+        for directory in glob.glob(os.path.join(root, 'session-*')):
+            lock = QLockFile(os.path.join(directory, 'lock'))
+            if lock.tryLock(0):
+                result.append((os.path.getmtime(directory), directory, lock))
+        result.sort(key=lambda item: item[0], reverse=True)
+        return [(directory, lock) for _, directory, lock in result]
+
+    @staticmethod
+    def recover(directory):
+        """
+        Rebuild a document from the journal in `directory`.
+
+        Returns:
+            A (filename, text) tuple, or None if there is nothing to recover: no edit was recorded since
+            the last complete snapshot, or that snapshot refers to a file that has changed since.
+        """
+        generations = sorted(
+            int(re.search(r'journal-(\d+)\.log$', path).group(1))
+            for path in glob.glob(os.path.join(directory, 'journal-*.log'))
+        )
+
+        # The generation of the last complete snapshot, the edits are replayed from it
+        text = base = None
+        for base in reversed(generations):
+            snapshot = os.path.join(directory, f'snapshot-{base}')
+            if os.path.exists(snapshot + '.txt'):
+                with open(snapshot + '.txt', encoding='utf-8') as file:
+                    text = file.read()
+                break
+            if os.path.exists(snapshot + '.json'):
+                with open(snapshot + '.json', encoding='utf-8') as file:
+                    reference = json.load(file)
+                try:
+                    info = os.stat(reference['file'])
+                    if (info.st_size, info.st_mtime_ns) != (reference['size'], reference['mtime']):
+                        return None
+                    if is_native(reference['file']):
+                        text = read_document(reference['file'])[0]
+                    else:
+                        text = read_text(reference['file'])[0]
+                except (OSError, ValueError):
+                    return None
+                break
+
+        if text is None:
+            return None
+
+        # Edits are replayed over UTF-16, the unit their positions are recorded in
+        data = bytearray(text.encode('utf-16-le', 'surrogatepass'))
+        filename = None
+        edits = 0
+        for generation in generations[generations.index(base):]:
+            with open(os.path.join(directory, f'journal-{generation}.log'), encoding='utf-8') as file:
+                filename = json.loads(file.readline())['file']
+                for line in file:
+                    try:
+                        position, removed, inserted = json.loads(line)
+                    except ValueError:
+                        break
+                    data[position * 2:(position + removed) * 2] = inserted.encode('utf-16-le', 'surrogatepass')
+                    edits += 1
+
+        if edits == 0:
+            return None
+        return filename, data.decode('utf-16-le', 'surrogatepass')
@@ -0,0 +1,211 @@
+import mmap
+import os
+import re
+from array import array
+
+from PyQt5.QtCore import Qt, QThread, pyqtSignal
+from PyQt5.QtGui import QPainter
+from PyQt5.QtWidgets import QAbstractScrollArea
+
+from core.instrumentation import profiler
+
+
+class LineIndex:
+    """
+    Sparse line-offset index over a memory-mapped, read-only file.
+
+    Only the byte offset of every `stride`-th line is kept, so the index stays a few MB even for multi-GB files,
+    and any line is reached by jumping to the nearest checkpoint and scanning at most `stride` lines forward.
+    The file contents themselves are never copied into memory, only the lines that are asked for are decoded.
+    Lines are found by their \n bytes, so the encoding must be ASCII-compatible, e.g. not UTF-16.
+    """
+    STRIDE = 64
+
+    def __init__(self, filename, stride=STRIDE, encoding='utf-8', start=0):
+        self.filename = filename
+        self.stride = stride
+        self.encoding = encoding
+        self._file = open(filename, 'rb')
+        if os.fstat(self._file.fileno()).st_size:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            self._map = b''
+        # The first line starts after the byte order mark, if any
+        self._checkpoints = array('q', [start])
+        self.line_count = 0
+        self.complete = False
+
+    @property
+    def size(self):
+        return len(self._map)
+
+    def build(self, progress=None, should_stop=None):
+        """
+        Scan the file and record the offset of every `stride`-th line.
+
+        This may take a few seconds on very large files and is meant to run on a worker thread;
+        `line_count` grows as the scan progresses, so lines can be read before it completes.
+
+        Parameters:
+            progress: Optional callable, called with the number of lines indexed so far.
+            should_stop: Optional callable returning True to abort the scan.
+
+        Returns:
+            True if the whole file was indexed, False if the scan was stopped.
+        """
+        block = re.compile(rb'(?:[^\n]*\n){%d}' % self.stride)
+        position = self._checkpoints[-1]
+
+        while True:
+            match = block.match(self._map, position)
+            if match is None:
+                break
+            position = match.end()
+            self._checkpoints.append(position)
+            self.line_count += self.stride
+
+            if len(self._checkpoints) % 4096 == 0:
+                if should_stop is not None and should_stop():
+                    return False
+                if progress is not None:
+                    progress(self.line_count)
+
+        while position < self.size:
+            position = self._map.find(b'\n', position) + 1 or self.size
+            self.line_count += 1
+        self.complete = True
+        if progress is not None:
+            progress(self.line_count)
+        return True
+
+    def offset(self, number):
+        """
+        Return the byte offset at which line `number` (0-based) starts.
+        """
+        checkpoint = min(number // self.stride, len(self._checkpoints) - 1)
+        position = self._checkpoints[checkpoint]
+        for _ in range(number - checkpoint * self.stride):
+            position = self._map.find(b'\n', position) + 1
+            if position == 0:
+                return self.size
+        return position
+
+    def lines(self, first, count):
+        """
+        Decode and return up to `count` lines starting at line `first` (0-based), without their line endings.
+        """
+        count = max(0, min(count, self.line_count - first))
+        position = self.offset(first)
+        result = []
+
+        for _ in range(count):
+            end = self._map.find(b'\n', position)
+            if end == -1:
+                end = self.size
+            result.append(self._map[position:end].rstrip(b'\r').decode(self.encoding, errors='replace'))
+            position = end + 1
+
+        return result
+
+    def close(self):
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._file.close()
+
+
+class LineIndexer(QThread):
+    """
+    Worker thread that builds a LineIndex and reports the number of lines indexed so far.
+    """
+    progress = pyqtSignal(int)
+
+    def __init__(self, index, parent=None):
+        super().__init__(parent)
+        self.index = index
+
+    def run(self):
+        with profiler.span('index', 'io', file=self.index.filename):
+            self.index.build(self.progress.emit, self.isInterruptionRequested)
+
+
+class LargeFileView(QAbstractScrollArea):
+    """
+    Read-only viewer that only materializes the lines visible in its viewport.
+
+    Lines are pulled from a LineIndex on demand, together with `BUFFER_LINES` lines on either side so that
+    small scrolls are served from the cache, and painted directly; no QTextDocument is ever built.
+    Very long lines are truncated to `MAX_LINE_LENGTH` characters for display.
+    """
+    BUFFER_LINES = 100
+    MAX_LINE_LENGTH = 4096
+    MARGIN = 4
+
+    def __init__(self, index, parent=None):
+        super().__init__(parent)
+        self.index = index
+        self._cache_first = 0
+        self._cache = []
+        self.setFocusPolicy(Qt.StrongFocus)
+        self.verticalScrollBar().setSingleStep(1)
+        self.verticalScrollBar().valueChanged.connect(self.viewport().update)
+        self.horizontalScrollBar().valueChanged.connect(self.viewport().update)
+        self.update_scrollbars()
+
+    def first_line(self):
+        return self.verticalScrollBar().value()
+
+    def visible_line_count(self):
+        return max(1, self.viewport().height() // self.fontMetrics().lineSpacing())
+
+    def goto_line(self, number):
+        """
+        Scroll so that line `number` (0-based) is at the top of the viewport.
+        """
+        self.verticalScrollBar().setValue(number)
+
+    def update_scrollbars(self):
+        visible = self.visible_line_count()
+        vbar = self.verticalScrollBar()
+        vbar.setPageStep(visible)
+        vbar.setRange(0, max(0, self.index.line_count - visible))
+        self.viewport().update()
+
+    def visible_lines(self):
+        first = self.first_line()
+        count = min(self.visible_line_count() + 1, self.index.line_count - first)
+
+        if not (self._cache_first <= first and first + count <= self._cache_first + len(self._cache)):
+            self._cache_first = max(0, first - self.BUFFER_LINES)
+            self._cache = self.index.lines(self._cache_first, first - self._cache_first + count + self.BUFFER_LINES)
+
+        start = first - self._cache_first
+        return self._cache[start:start + count]
+
+    def paintEvent(self, _event):
+        painter = QPainter(self.viewport())
+        metrics = self.fontMetrics()
+        x = self.MARGIN - self.horizontalScrollBar().value()
+        y = metrics.ascent()
+        widest = 0
+
+        for line in self.visible_lines():
+            line = line[:self.MAX_LINE_LENGTH]
+            painter.drawText(x, y, line)
+            widest = max(widest, metrics.horizontalAdvance(line))
+            y += metrics.lineSpacing()
+
+        hbar = self.horizontalScrollBar()
+        hbar.setPageStep(self.viewport().width())
+        hbar.setMaximum(max(hbar.maximum(), widest + 2 * self.MARGIN - self.viewport().width()))
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.update_scrollbars()
+
+    def keyPressEvent(self, event):
+        if event.key() == Qt.Key_Home:
+            self.goto_line(0)
+        elif event.key() == Qt.Key_End:
+            self.goto_line(self.index.line_count)
+        else:
+            super().keyPressEvent(event)
@@ -0,0 +1,200 @@
+"""
+Export text files to PDF without a window, in parallel.
+
+Usage:
+    python -m core.pdf_export [-o DIR] [-j JOBS] FILE_OR_GLOB...
+
+Each file is rendered by a worker process of its own offscreen Qt application, with the same printer settings
+as File > Export PDF. The time taken by each file and the files that failed are reported on stdout. Sources that
+would write the same PDF, such as notes.txt and notes.md, keep their extension in its name: notes.txt.pdf and
+notes.md.pdf.
+"""
+import argparse
+import glob
+import os
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+from PyQt5.QtCore import QFileInfo
+from PyQt5.QtGui import QGuiApplication, QTextDocument
+from PyQt5.QtPrintSupport import QPrinter
+
+from core.codec import read_text
+from core.rich_text import is_native, read_document
+
+
+def pdf_filename(filename):
+    """
+    Return `filename` with a ".pdf" extension if it has none.
+    """
+    if QFileInfo(filename).suffix() == "":
+        filename += ".pdf"
+    return filename
+
+
+def pdf_printer(filename):
+    """
+    Return a high resolution QPrinter that prints to the PDF file `filename`.
+    """
+    printer = QPrinter(QPrinter.HighResolution)
+    printer.setOutputFormat(QPrinter.PdfFormat)
+    printer.setOutputFileName(filename)
+    return printer
+
+
+def export_file(source, target):
+    """
+    Render a text file to a PDF file.
+
+    Parameters:
+        source: The path of the text file.
+        target: The path of the PDF file to write.
+    """
+    document = QTextDocument()
+    if is_native(source):
+        text, formats = read_document(source)
+        document.setPlainText(text)
+        formats.apply(document)
+    else:
+        document.setPlainText(read_text(source)[0])
+
+    os.makedirs(os.path.dirname(target) or '.', exist_ok=True)
+    document.print(pdf_printer(target))
+
+
+_app = None
+
+
+def _start_worker():
+    # Text layout needs a QGuiApplication, the offscreen platform provides one without a display
+    global _app
+    _app = QGuiApplication(['pdf_export', '-platform', 'offscreen'])
+
+
+def _export(source, target):
+    started = time.perf_counter()
+    try:
+        export_file(source, target)
+    except Exception as error:
+        # Whatever went wrong with one file, the others are still exported
+        return source, target, time.perf_counter() - started, str(error) or type(error).__name__
+    return source, target, time.perf_counter() - started, None
+
+
+def expand_inputs(patterns):
+    """
+    Return the files matching a list of paths and glob patterns, without duplicates and in order.
+    Patterns may use ** to match subdirectories.
+    """
+    files = {}
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern, recursive=True)) if glob.has_magic(pattern) else [pattern]
+        for match in matches:
+            if not os.path.isdir(match):
+                files.setdefault(os.path.abspath(match), None)
+    return list(files)
+
+
+def output_files(sources, output_dir=None):
+    """
+    Return the PDF file to write for each source file.
+
+    Without `output_dir`, each PDF is written next to its source. Otherwise the PDFs are written to `output_dir`,
+    in the same subdirectories as their sources relative to the deepest directory they all share. Sources that
+    differ only by their extension keep it in the name of their PDF, so that none overwrites another.
+
+    Raises:
+        ValueError: Two sources would still be written to the same PDF, or a source would be overwritten.
+    """
+    if output_dir is None:
+        stems = [os.path.splitext(source)[0] for source in sources]
+    else:
+        base = os.path.commonpath([os.path.dirname(source) for source in sources])
+        stems = [os.path.join(output_dir, os.path.splitext(os.path.relpath(source, base))[0]) for source in sources]
+
+    counts = Counter(os.path.normcase(stem) for stem in stems)
+    targets = [
+        (stem + os.path.splitext(source)[1] if counts[os.path.normcase(stem)] > 1 else stem) + '.pdf'
+        for source, stem in zip(sources, stems)
+    ]
+
+    written = {}
+    inputs = {os.path.normcase(os.path.abspath(source)) for source in sources}
+    for source, target in zip(sources, targets):
+        key = os.path.normcase(os.path.abspath(target))
+        if key in written or key in inputs:
+            raise ValueError(f'{source} would overwrite {written.get(key, target)}')
+        written[key] = source
+    return targets
+
+
+def export_files(sources, targets, jobs=None, report=None):
+    """
+    Render text files to PDF files across a pool of worker processes.
+
+    Parameters:
+        sources: The paths of the text files.
+        targets: The paths of the PDF files to write, one per source.
+        jobs: The number of worker processes, by default the number of CPUs.
+        report: Optional callable, called with (source, target, seconds, error) as each file completes;
+            error is None if the file was exported. If a worker process dies, the files it had not exported
+            yet are reported as failed.
+
+    Returns:
+        The list of (source, error) tuples of the files that could not be exported.
+    """
+    failures = []
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_start_worker) as executor:
+        futures = {
+            executor.submit(_export, source, target): (source, target) for source, target in zip(sources, targets)
+        }
+        for future in as_completed(futures):
+            try:
+                source, target, seconds, error = future.result()
+            except BrokenProcessPool:
+                # A worker crashed, the pool fails all the files that did not complete
+                source, target = futures[future]
+                seconds, error = 0.0, 'a worker process terminated abruptly'
+            if error is not None:
+                failures.append((source, error))
+            if report is not None:
+                report(source, target, seconds, error)
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m core.pdf_export', description='Export text files to PDF.')
+    parser.add_argument('inputs', nargs='+', metavar='FILE', help='files or glob patterns of the files to export')
+    parser.add_argument('-o', '--output-dir', help='directory to write the PDF files to, instead of next to each file')
+    parser.add_argument('-j', '--jobs', type=int, help='number of worker processes, by default the number of CPUs')
+    arguments = parser.parse_args(argv)
+
+    sources = expand_inputs(arguments.inputs)
+    if not sources:
+        parser.error('no input files')
+    try:
+        targets = output_files(sources, arguments.output_dir)
+    except ValueError as error:
+        parser.error(str(error))
+
+    def report(source, target, seconds, error):
+        if error is None:
+            print(f'{seconds * 1000:9.1f} ms  {source} -> {target}', flush=True)
+        else:
+            print(f'   FAILED     {source}: {error}', flush=True)
+
+    started = time.perf_counter()
+    failures = export_files(sources, targets, arguments.jobs, report)
+    elapsed = time.perf_counter() - started
+
+    print(f'Exported {len(sources) - len(failures)} of {len(sources)} files in {elapsed:.2f} s')
+    for source, error in failures:
+        print(f'Failed: {source}: {error}', file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
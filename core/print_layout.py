@@ -0,0 +1,408 @@
+import queue
+from collections import OrderedDict
+
+from PyQt5.QtCore import QPointF, QRectF, QSizeF, Qt, QThread, pyqtSignal
+from PyQt5.QtGui import QAbstractTextDocumentLayout, QColor, QFont, QFontMetricsF, QGuiApplication, QImage, QPainter, \
+    QPalette, QTextCursor, QTextDocument, QTextDocumentFragment, QTextFormat
+from PyQt5.QtWidgets import QAbstractScrollArea
+
+
+def printer_settings(printer):
+    """
+    Return the settings of a QPrinter that the pagination of a document depends on, as a hashable tuple:
+    the resolution, the size of the paper and the paintable area of the page on it, in device pixels.
+    """
+    from PyQt5.QtPrintSupport import QPrinter
+
+    paper = printer.paperRect(QPrinter.DevicePixel)
+    page = printer.pageRect(QPrinter.DevicePixel)
+    return printer.resolution(), paper.width(), paper.height(), page.x(), page.y(), printer.width(), printer.height()
+
+
+def has_formatting(document):
+    """
+    Whether any text or paragraph of a document has a format of its own, so that its plain text is not enough
+    to lay it out. Formats that are no longer used may still count.
+    """
+    return any(
+        format.properties() for format in document.allFormats()
+        if format.type() in (QTextFormat.CharFormat, QTextFormat.BlockFormat)
+    )
+
+
+class PageLayout:
+    """
+    A snapshot of a document paginated for a printer, as QTextDocument.print would print it.
+
+    Taking the snapshot is cheap and done in the GUI thread: the plain text of the document, or
+    a QTextDocumentFragment if it has formatting. Paginating it is the expensive part and is done once,
+    by a PageRenderer; any page can then be rendered at any scale without laying out the document again.
+    The settings of the printer and, once paginated, `page_count` can be read from any thread, and setting
+    `cancelled` from any thread stops the pagination at the next chunk of text.
+    """
+    # QTextDocument.print puts margins of 2 cm around the text
+    MARGIN = 2 / 2.54
+    # Frame margins are given at screen resolution and scaled to the device by the layout; this is the
+    # resolution Qt assumes when there is no screen
+    DEFAULT_DPI = 100
+    # The text is inserted and laid out in chunks, so that the thread paginating it does not hold the GIL for long
+    INSERT_CHARACTERS = 64 * 1024
+
+    def __init__(self, document, printer):
+        self.settings = printer_settings(printer)
+        self.resolution, paper_width, paper_height, page_x, page_y, width, height = self.settings
+        self.paper = QSizeF(paper_width, paper_height)
+        self.origin = QPointF(page_x, page_y)
+        self.body = QRectF(0, 0, width, height)
+        self.default_font = document.defaultFont()
+        self.text_option = document.defaultTextOption()
+        self.indent_width = document.indentWidth()
+        screen = QGuiApplication.primaryScreen()
+        self.screen_dpi = round(screen.logicalDotsPerInchY()) if screen is not None else self.DEFAULT_DPI
+        if has_formatting(document):
+            self.text, self.fragment = None, QTextDocumentFragment(document)
+        else:
+            self.text, self.fragment = document.toPlainText(), None
+        # Set by build: the device the document is laid out for, and where page numbers are drawn on a page
+        self.device = None
+        self.page_number_pos = None
+        self.document = None
+        self.page_count = 0
+        self.error = None
+        self.cancelled = False
+
+    def build(self, progress=None, should_stop=None):
+        """
+        Lay the snapshot out in pages.
+
+        Parameters:
+            progress: Optional callable, called with the number of pages laid out so far.
+            should_stop: Optional callable returning True to abort.
+
+        Returns:
+            True if the whole document was paginated, False if it was stopped or could not be laid out,
+            in which case `error` tells why.
+        """
+        # Fonts are measured at the resolution of the printer, a QImage can be used from any thread
+        self.device = QImage(1, 1, QImage.Format_Mono)
+        self.device.setDotsPerMeterX(round(self.resolution / 0.0254))
+        self.device.setDotsPerMeterY(round(self.resolution / 0.0254))
+
+        document = QTextDocument()
+        document.setUndoRedoEnabled(False)
+        document.setDefaultFont(self.default_font)
+        document.setDefaultTextOption(self.text_option)
+        document.setIndentWidth(self.indent_width)
+        document.documentLayout().setPaintDevice(self.device)
+
+        margin = int(self.MARGIN * self.screen_dpi)
+        frame = document.rootFrame().frameFormat()
+        frame.setMargin(margin)
+        document.rootFrame().setFrameFormat(frame)
+
+        # The page size comes first: laid out as a single page, a long document overflows the layout coordinates
+        # at printer resolution. Each chunk is laid out as it is inserted.
+        document.setPageSize(self.body.size())
+        cursor = QTextCursor(document)
+        if self.fragment is not None:
+            cursor.insertFragment(self.fragment)
+        else:
+            pages = 0
+            for start in range(0, len(self.text), self.INSERT_CHARACTERS):
+                if should_stop is not None and should_stop():
+                    return False
+                cursor.insertText(self.text[start:start + self.INSERT_CHARACTERS])
+                # Positions in the layout are fixed point numbers that wrap around past about 33 million pixels
+                if document.pageCount() < pages:
+                    self.error = f'The document is too long to be laid out at {self.resolution} dpi.'
+                    return False
+                pages = document.pageCount()
+                if progress is not None:
+                    progress(pages)
+        self.text = self.fragment = None
+
+        scale = self.resolution / self.screen_dpi
+        metrics = QFontMetricsF(self.default_font, self.device)
+        self.page_number_pos = QPointF(
+            self.body.width() - margin * scale,
+            self.body.height() - margin * scale + metrics.ascent() + 5 * self.resolution / 72
+        )
+        self.document = document
+        self.page_count = document.pageCount()
+        return True
+
+    def paint_page(self, painter, index):
+        """
+        Paint page `index` (0-based) with its page number, in printer device pixels relative to the paintable area.
+        """
+        painter.save()
+        view = QRectF(0, index * self.body.height(), self.body.width(), self.body.height())
+        painter.translate(0, -view.top())
+        painter.setClipRect(view)
+
+        context = QAbstractTextDocumentLayout.PaintContext()
+        context.clip = view
+        context.palette.setColor(QPalette.Text, Qt.black)
+        self.document.documentLayout().draw(painter, context)
+
+        painter.setClipping(False)
+        # The painter may be on a QImage of another resolution, the size of the font is given in printer pixels
+        font = QFont(self.default_font)
+        if font.pointSizeF() > 0:
+            font.setPixelSize(round(font.pointSizeF() * self.resolution / 72))
+        painter.setFont(font)
+        number = str(index + 1)
+        painter.drawText(
+            QPointF(round(self.page_number_pos.x() - painter.fontMetrics().horizontalAdvance(number)),
+                    round(self.page_number_pos.y() + view.top())),
+            number
+        )
+        painter.restore()
+
+    def render_page(self, index, scale):
+        """
+        Return an image of page `index` (0-based), paper margins included, `scale` screen pixels per printer pixel.
+        """
+        size = self.paper * scale
+        image = QImage(round(size.width()), round(size.height()), QImage.Format_RGB32)
+        image.fill(Qt.white)
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setRenderHint(QPainter.TextAntialiasing)
+        painter.scale(scale, scale)
+        painter.translate(self.origin)
+        self.paint_page(painter, index)
+        painter.end()
+        return image
+
+    def release(self):
+        self.document = None
+        self.device = None
+
+
+class PageRenderer(QThread):
+    """
+    Worker thread that paginates PageLayouts and renders their pages.
+
+    The text layout of a document holds on to fonts that belong to the thread it was made in, and that go away
+    with it; so each PageLayout is built, rendered and released in this thread only, which lives as long as
+    its owner. Requests are queued with `paginate`, `render` and `release`, and handled in order.
+
+    Render requests made before `generation` was last increased are skipped, so that a view scrolling past
+    many pages does not wait for all of them to be rendered.
+
+    Every pagination request is answered by exactly one of `paginated`, `failed` and `cancelled`, unless the
+    thread is stopped first.
+
+    Signals:
+        progress(object, int): The number of pages of the layout with this key laid out so far.
+        paginated(object, int): The layout with this key was paginated, with its number of pages.
+        failed(object, str): The layout with this key could not be paginated, with the error message.
+        cancelled(object): The pagination of the layout with this key was stopped, its `cancelled` being set.
+        rendered(object, int, float, QImage): A page of the layout with this key, rendered at a scale.
+    """
+    progress = pyqtSignal(object, int)
+    paginated = pyqtSignal(object, int)
+    failed = pyqtSignal(object, str)
+    cancelled = pyqtSignal(object)
+    rendered = pyqtSignal(object, int, float, QImage)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.requests = queue.Queue()
+        self.generation = 0
+        self._layouts = {}
+
+    def paginate(self, key, layout):
+        self.requests.put(('paginate', key, layout))
+
+    def render(self, key, index, scale):
+        self.requests.put(('render', key, (index, scale, self.generation)))
+
+    def release(self, key):
+        self.requests.put(('release', key, None))
+
+    def stop(self):
+        """
+        Abort the pagination in progress, if any, and wait for the thread to exit.
+        """
+        self.requestInterruption()
+        self.requests.put(None)
+        self.wait()
+
+    def run(self):
+        while True:
+            request = self.requests.get()
+            if request is None:
+                break
+
+            kind, key, arguments = request
+            if kind == 'paginate':
+                layout = arguments
+                if layout.build(lambda pages: self.progress.emit(key, pages),
+                                lambda: layout.cancelled or self.isInterruptionRequested()):
+                    self._layouts[key] = layout
+                    self.paginated.emit(key, layout.page_count)
+                elif layout.error is not None:
+                    self.failed.emit(key, layout.error)
+                elif not self.isInterruptionRequested():
+                    self.cancelled.emit(key)
+            elif kind == 'render':
+                index, scale, generation = arguments
+                if generation == self.generation and key in self._layouts:
+                    self.rendered.emit(key, index, scale, self._layouts[key].render_page(index, scale))
+            elif kind == 'release' and key in self._layouts:
+                self._layouts.pop(key).release()
+
+        for layout in self._layouts.values():
+            layout.release()
+        self._layouts.clear()
+
+
+class PageView(QAbstractScrollArea):
+    """
+    Scrollable view of the pages of a PageLayout, one under the other.
+
+    Pages are only rendered, by a PageRenderer, when they scroll into view, and a blank page is shown until
+    they arrive. The last CACHE_PAGES rendered pages are kept so that scrolling back and forth does not
+    render them again.
+    """
+    CACHE_PAGES = 16
+    SPACING = 10
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.pageLayout = None
+        self.renderer = None
+        self.key = None
+        self.zoom = 1.0
+        self.message = ''
+        self._pages = OrderedDict()
+        self._requested = set()
+        self._visible = None
+        self.viewport().setBackgroundRole(QPalette.Dark)
+        # Fitting the width of the pages must not make the vertical scroll bar appear and take some of it
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOn)
+        self.verticalScrollBar().valueChanged.connect(self.viewport().update)
+        self.horizontalScrollBar().valueChanged.connect(self.viewport().update)
+
+    def set_layout(self, layout, renderer=None, key=None):
+        """
+        Show the pages of a paginated PageLayout, rendered by `renderer` where it is known by `key`.
+        """
+        if renderer is not None and renderer is not self.renderer:
+            renderer.rendered.connect(self.page_rendered)
+        self.pageLayout = layout
+        self.renderer = renderer or self.renderer
+        self.key = key
+        self._pages.clear()
+        self._requested.clear()
+        self._visible = None
+        self.update_scrollbars()
+
+    def set_message(self, message):
+        """
+        Show a message instead of the pages, e.g. while the document is being paginated.
+        """
+        self.message = message
+        self.viewport().update()
+
+    def scale(self):
+        """
+        The ratio of screen pixels to printer pixels at the current zoom; a zoom of 1 shows pages at their actual size.
+        """
+        return self.zoom * self.logicalDpiX() / self.pageLayout.resolution
+
+    def page_size(self):
+        size = self.pageLayout.paper * self.scale()
+        return int(size.width()), int(size.height())
+
+    def set_zoom(self, zoom):
+        if self.pageLayout is not None:
+            # Keep the page at the top of the viewport in view
+            _, height = self.page_size()
+            position = self.verticalScrollBar().value() / (height + self.SPACING)
+        self.zoom = zoom
+        self._pages.clear()
+        self._requested.clear()
+        self.update_scrollbars()
+        if self.pageLayout is not None:
+            _, height = self.page_size()
+            self.verticalScrollBar().setValue(round(position * (height + self.SPACING)))
+
+    def fit_width(self):
+        if self.pageLayout is not None:
+            width = self.viewport().width() - 2 * self.SPACING
+            self.set_zoom(width * self.pageLayout.resolution / (self.pageLayout.paper.width() * self.logicalDpiX()))
+
+    def current_page(self):
+        if self.pageLayout is None:
+            return 0
+        _, height = self.page_size()
+        return min(self.verticalScrollBar().value() // (height + self.SPACING), self.pageLayout.page_count - 1)
+
+    def update_scrollbars(self):
+        if self.pageLayout is None:
+            self.verticalScrollBar().setRange(0, 0)
+            self.horizontalScrollBar().setRange(0, 0)
+        else:
+            width, height = self.page_size()
+            total = self.pageLayout.page_count * (height + self.SPACING) + self.SPACING
+            self.verticalScrollBar().setRange(0, max(0, total - self.viewport().height()))
+            self.verticalScrollBar().setPageStep(self.viewport().height())
+            self.verticalScrollBar().setSingleStep(max(1, height // 20))
+            self.horizontalScrollBar().setRange(0, max(0, width + 2 * self.SPACING - self.viewport().width()))
+            self.horizontalScrollBar().setPageStep(self.viewport().width())
+        self.viewport().update()
+
+    def request_pages(self, first, last):
+        """
+        Ask the renderer for the pages from `first` to `last` that are neither cached nor already asked for.
+        Requests for pages that went out of view since are dropped.
+        """
+        visible = (first, last, self.scale())
+        if visible != self._visible:
+            self._visible = visible
+            self.renderer.generation += 1
+            self._requested.clear()
+
+        for index in range(first, last + 1):
+            if index not in self._pages and index not in self._requested:
+                self._requested.add(index)
+                self.renderer.render(self.key, index, self.scale())
+
+    def page_rendered(self, key, index, scale, image):
+        if key != self.key or scale != self.scale():
+            return
+
+        self._requested.discard(index)
+        self._pages[index] = image
+        while len(self._pages) > self.CACHE_PAGES + len(self._requested):
+            self._pages.popitem(last=False)
+        self.viewport().update()
+
+    def paintEvent(self, _event):
+        painter = QPainter(self.viewport())
+        if self.pageLayout is None or not self.pageLayout.page_count:
+            painter.drawText(self.viewport().rect(), Qt.AlignCenter, self.message)
+            return
+
+        width, height = self.page_size()
+        x = max(self.SPACING, (self.viewport().width() - width) // 2) - self.horizontalScrollBar().value()
+        top = self.verticalScrollBar().value()
+        first = max(0, (top - self.SPACING) // (height + self.SPACING))
+        last = min(self.pageLayout.page_count - 1, (top + self.viewport().height()) // (height + self.SPACING))
+        self.request_pages(first, last)
+
+        for index in range(first, last + 1):
+            y = self.SPACING + index * (height + self.SPACING) - top
+            painter.fillRect(x + 3, y + 3, width, height, QColor(0, 0, 0, 64))
+            if index in self._pages:
+                self._pages.move_to_end(index)
+                painter.drawImage(x, y, self._pages[index])
+            else:
+                painter.fillRect(x, y, width, height, Qt.white)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.update_scrollbars()
@@ -0,0 +1,275 @@
+import sys
+from array import array
+
+from PyQt5.QtCore import QByteArray, QDataStream, QIODevice
+from PyQt5.QtGui import QTextCursor, QTextFormat
+
+from core.codec import TextFormat
+
+# Extension of the files saved in the native format, with their formatting
+NATIVE_SUFFIX = '.pnd'
+# Members of the zip archive of a native document
+TEXT_MEMBER = 'text.txt'
+FORMATS_MEMBER = 'formats.dat'
+CHAR_RUNS_MEMBER = 'chars.dat'
+BLOCK_RUNS_MEMBER = 'blocks.dat'
+# Version of the layout of FORMATS_MEMBER, increased whenever it changes
+FORMAT_VERSION = 1
+# The text of a native document is stored as UTF-8 with \n line endings
+NATIVE_TEXT_FORMAT = TextFormat('utf-8', False, '\n')
+
+
+def is_native(filename):
+    """
+    Whether a file is a document in the native format, from its extension.
+    """
+    return filename is not None and filename.lower().endswith(NATIVE_SUFFIX)
+
+
+def open_document(filename):
+    """
+    Open the zip archive of a native document.
+
+    Raises:
+        OSError: The file could not be read.
+        ValueError: The file is not a native document.
+    """
+    # Imported on first use, it takes long to import and is not needed to start
+    import zipfile
+
+    try:
+        return zipfile.ZipFile(filename)
+    except zipfile.BadZipFile as error:
+        raise ValueError(f'Not a PyNotePad document: {error}') from None
+
+
+def read_document(filename):
+    """
+    Read a whole native document.
+
+    Returns:
+        A (text, formats) tuple, the plain text of the document and its RichTextFormats.
+    """
+    with open_document(filename) as archive:
+        formats = RichTextFormats.read(archive)
+        with archive.open(TEXT_MEMBER) as file:
+            reader = NATIVE_TEXT_FORMAT.text_reader(file)
+            try:
+                return reader.read(), formats
+            finally:
+                reader.detach()
+
+
+def merge_char_format(document, ranges, char_format):
+    """
+    Merge a character format into ranges of a document, as a single edit that is undone in one step.
+
+    Only the fragments within the ranges change, and only their blocks are laid out again, whatever the size of
+    the document.
+
+    Parameters:
+        document: The QTextDocument to format.
+        ranges: The (start, end) positions of the ranges of text to format.
+        char_format: The QTextCharFormat to merge; the properties it does not set are left as they are.
+    """
+    cursor = QTextCursor(document)
+    cursor.beginEditBlock()
+    for start, end in ranges:
+        cursor.setPosition(start)
+        cursor.setPosition(end, QTextCursor.KeepAnchor)
+        cursor.mergeCharFormat(char_format)
+    cursor.endEditBlock()
+
+
+def _int_array(data=b''):
+    # Runs are stored little-endian whatever the platform
+    runs = array('i', data)
+    if sys.byteorder == 'big':
+        runs.byteswap()
+    return runs
+
+
+class RichTextFormats:
+    """
+    The character and block formats of a QTextDocument, kept apart from its plain text.
+
+    Each distinct format of the document is stored once, and the text refers to it by index in runs of characters
+    and of blocks, so formatting costs a few bytes per styled span rather than the markup HTML wraps around it.
+    Runs in the default format are left out: a document holding plain text has none, and loading it costs no
+    more than loading a text file.
+
+    A native document is a zip archive of the text, stored uncompressed to be streamed like a text file, and of
+    the formats and runs, compressed. Capturing the formats of a document and applying them must be done in the
+    thread of the document; writing and reading them can be done in any thread.
+
+    Attributes:
+        formats: The QTextFormats referred to by the runs.
+        char_runs: An array of (start, length, format index) triples, the positions being those of the plain text.
+        block_runs: An array of (first block position, last block position, format index) triples.
+    """
+    # The text of a native document is always UTF-8, see NATIVE_TEXT_FORMAT
+    encoding = NATIVE_TEXT_FORMAT.encoding
+
+    def __init__(self, formats=(), char_runs=None, block_runs=None):
+        self.formats = list(formats)
+        self.char_runs = char_runs if char_runs is not None else _int_array()
+        self.block_runs = block_runs if block_runs is not None else _int_array()
+        # Runs applied so far, and the formats they refer to, see apply
+        self._char_offset = 0
+        self._block_offset = 0
+        self._block_start = 0
+        self._char_formats = None
+        self._block_formats = None
+        self._char_columns = None
+
+    @classmethod
+    def capture(cls, document):
+        """
+        Return the formats of the text of a document, to be saved along with its toPlainText().
+        """
+        formats = document.allFormats()
+        styled = [bool(text_format.properties()) for text_format in formats]
+        char_runs = _int_array()
+        block_runs = _int_array()
+        run_end = -1
+
+        block = document.begin()
+        while block.isValid():
+            index = block.blockFormatIndex()
+            if styled[index]:
+                # Consecutive blocks in the same format make a single run
+                if block_runs and block_runs[-1] == index and block.previous().blockFormatIndex() == index:
+                    block_runs[-2] = block.position()
+                else:
+                    block_runs.extend((block.position(), block.position(), index))
+
+            fragments = block.begin()
+            while not fragments.atEnd():
+                fragment = fragments.fragment()
+                index = fragment.charFormatIndex()
+                if styled[index]:
+                    start = fragment.position()
+                    if start == run_end and char_runs[-1] == index:
+                        char_runs[-2] += fragment.length()
+                    else:
+                        char_runs.extend((start, fragment.length(), index))
+                    run_end = start + fragment.length()
+                fragments += 1
+            block = block.next()
+
+        return cls(formats, char_runs, block_runs)
+
+    def apply(self, document, end=None):
+        """
+        Apply the formats to a document holding the plain text they were captured from, in a single edit block.
+
+        A document being loaded can be formatted as its text arrives: given `end`, only the runs that lie before
+        that position are applied, and the next call resumes with the runs after them.
+
+        Parameters:
+            document: The QTextDocument to format.
+            end: The position up to which the text of the document is complete, by default all of it.
+        """
+        if self._char_formats is None:
+            self._char_formats = {index: self.formats[index].toCharFormat() for index in set(self.char_runs[2::3])}
+            self._block_formats = {
+                index: self.formats[index].toBlockFormat() for index in set(self.block_runs[2::3])
+            }
+            # The fields of the runs apart, which keeps the loop below, run once per styled span, short
+            self._char_columns = self.char_runs[0::3], self.char_runs[1::3], self.char_runs[2::3]
+        if end is None:
+            end = document.characterCount()
+        blocks = self.block_runs
+
+        cursor = QTextCursor(document)
+        cursor.beginEditBlock()
+        set_position, set_char_format = cursor.setPosition, cursor.setCharFormat
+        starts, lengths, indexes = self._char_columns
+        char_formats = self._char_formats
+        keep_anchor = QTextCursor.KeepAnchor
+        run, count = self._char_offset, len(starts)
+        while run < count:
+            start = starts[run]
+            run_end = start + lengths[run]
+            if run_end > end:
+                break
+            set_position(start)
+            set_position(run_end, keep_anchor)
+            set_char_format(char_formats[indexes[run]])
+            run += 1
+        self._char_offset = run
+
+        offset = self._block_offset
+        while offset < len(blocks) and blocks[offset] < end:
+            # A run of blocks is formatted as far as its text was loaded, the rest of it by the next call
+            last = min(blocks[offset + 1], end - 1)
+            cursor.setPosition(max(blocks[offset], self._block_start))
+            cursor.setPosition(last, QTextCursor.KeepAnchor)
+            cursor.setBlockFormat(self._block_formats[blocks[offset + 2]])
+            if last < blocks[offset + 1]:
+                self._block_start = last
+                break
+            offset += 3
+        self._block_offset = offset
+        cursor.endEditBlock()
+
+    def write(self, file, text):
+        """
+        Write a native document, the plain text and these formats, to a binary file.
+
+        Parameters:
+            file: The binary file to write to, which must be seekable.
+            text: The plain text of the document.
+        """
+        import zipfile
+
+        data = QByteArray()
+        stream = QDataStream(data, QIODevice.WriteOnly)
+        stream.setVersion(QDataStream.Qt_5_15)
+        stream.writeUInt32(FORMAT_VERSION)
+        stream.writeUInt32(len(self.formats))
+        for text_format in self.formats:
+            # The streaming operator of Qt, which returns the stream
+            stream = stream << text_format
+
+        char_runs, block_runs = _int_array(self.char_runs.tobytes()), _int_array(self.block_runs.tobytes())
+        with zipfile.ZipFile(file, 'w') as archive:
+            # Encoded to UTF-8 a slice at a time, straight into the archive
+            with archive.open(TEXT_MEMBER, 'w', force_zip64=len(text) > 2 ** 29) as member:
+                NATIVE_TEXT_FORMAT.write(member, text)
+            archive.writestr(FORMATS_MEMBER, bytes(data), zipfile.ZIP_DEFLATED)
+            archive.writestr(CHAR_RUNS_MEMBER, char_runs.tobytes(), zipfile.ZIP_DEFLATED)
+            archive.writestr(BLOCK_RUNS_MEMBER, block_runs.tobytes(), zipfile.ZIP_DEFLATED)
+
+    @classmethod
+    def read(cls, archive):
+        """
+        Read the formats of a native document from its open zip archive.
+
+        Raises:
+            ValueError: The formats are missing, of a later version, or inconsistent.
+        """
+        import zipfile
+
+        try:
+            data = QByteArray(archive.read(FORMATS_MEMBER))
+            char_runs = _int_array(archive.read(CHAR_RUNS_MEMBER))
+            block_runs = _int_array(archive.read(BLOCK_RUNS_MEMBER))
+        except (KeyError, zipfile.BadZipFile) as error:
+            raise ValueError(f'Damaged PyNotePad document: {error}') from None
+
+        stream = QDataStream(data)
+        stream.setVersion(QDataStream.Qt_5_15)
+        if stream.readUInt32() > FORMAT_VERSION:
+            raise ValueError('The document was saved by a later version of PyNotePad')
+        formats = []
+        for _ in range(stream.readUInt32()):
+            text_format = QTextFormat()
+            # The streaming operator of Qt, which reads into text_format and returns the stream
+            stream = stream >> text_format
+            formats.append(text_format)
+
+        if stream.status() != QDataStream.Ok or len(char_runs) % 3 or len(block_runs) % 3 \
+                or max(char_runs[2::3] + block_runs[2::3], default=0) >= len(formats):
+            raise ValueError('Damaged PyNotePad document: inconsistent formats')
+        return cls(formats, char_runs, block_runs)
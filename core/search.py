@@ -0,0 +1,222 @@
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from core.codec import astral_positions
+
+
+class SearchIndex:
+    """
+    Snapshot of a document prepared for repeated searches.
+
+    It holds the text of the document at a given revision, the offsets at which its lines start, a lowercased copy
+    of the text for case-insensitive literal searches, and the results of the literal searches already run.
+    All of these are computed on first use and kept for as long as the document is not edited, so searching
+    again for the same or another string does not pay for any of them a second time.
+
+    Positions in the text count code points, while those of the document count UTF-16 code units, in which
+    characters outside the BMP take two; `document_span` and `text_position` convert between the two.
+    """
+
+    def __init__(self, text, revision):
+        self.text = text
+        self.revision = revision
+        self._line_starts = None
+        self._folded = None
+        self._astral = None
+        self._document_astral = None
+        self._results = {}
+
+    @property
+    def line_starts(self):
+        if self._line_starts is None:
+            self._line_starts = array('q', [0])
+            self._line_starts.extend(match.end() for match in re.finditer('\n', self.text))
+        return self._line_starts
+
+    def line_of(self, position):
+        """
+        Return the line number (0-based) of a position in the text.
+        """
+        return bisect_right(self.line_starts, position) - 1
+
+    @property
+    def astral(self):
+        if self._astral is None:
+            self._astral = array('q', astral_positions(self.text))
+        return self._astral
+
+    def document_span(self, start, end):
+        """
+        Return the positions in the document of a span of the text.
+        """
+        astral = self.astral
+        if not astral:
+            return start, end
+        return start + bisect_left(astral, start), end + bisect_left(astral, end)
+
+    def text_position(self, position):
+        """
+        Return the position in the text of a position in the document.
+        """
+        if not self.astral:
+            return position
+        if self._document_astral is None:
+            self._document_astral = array('q', (start + number for number, start in enumerate(self.astral)))
+        return position - bisect_left(self._document_astral, position)
+
+    def literal_results(self, query, case_sensitive):
+        """
+        Return the (start, end) spans found by an earlier literal search for `query` in the text, or None.
+        """
+        return self._results.get((query, case_sensitive))
+
+    def keep_literal_results(self, query, case_sensitive, spans):
+        """
+        Keep the spans found by a literal search, for `literal_results` to return them to the next one.
+        """
+        self._results[(query, case_sensitive)] = spans
+
+    def folded(self):
+        """
+        Return the lowercased text, or None if lowercasing changes its length and thus the match positions.
+        """
+        if self._folded is None:
+            folded = self.text.lower()
+            self._folded = folded if len(folded) == len(self.text) else False
+        return self._folded or None
+
+
+def compile_query(query, regex=False, case_sensitive=False, whole_words=False):
+    """
+    Compile a search query to a regular expression.
+
+    Parameters:
+        query: The string to search for.
+        regex: Whether the query is a regular expression rather than a literal string.
+        case_sensitive: Whether the case of the letters must match.
+        whole_words: Whether matches must start and end at word boundaries.
+
+    Returns:
+        The compiled pattern. `^` and `$` match at line boundaries.
+
+    Raises:
+        re.error: If the query is not a valid regular expression.
+    """
+    pattern = query if regex else re.escape(query)
+    if whole_words:
+        pattern = rf'\b(?:{pattern})\b'
+    flags = re.MULTILINE if case_sensitive else re.MULTILINE | re.IGNORECASE
+    return re.compile(pattern, flags)
+
+
+def find_all(index, query, regex=False, case_sensitive=False, whole_words=False):
+    """
+    Yield the (start, end) positions in the text of the non-overlapping matches of a query in a SearchIndex.
+
+    Plain literal searches use `str.find` on the text, or on its lowercased copy when the case does not matter,
+    and their results are cached in the index; other searches go through the regular expression engine.
+
+    Raises:
+        re.error: If the query is not a valid regular expression.
+    """
+    if not query:
+        return
+
+    haystack = None
+    if not regex and not whole_words:
+        haystack = index.text if case_sensitive else index.folded()
+
+    if haystack is None:
+        for match in compile_query(query, regex, case_sensitive, whole_words).finditer(index.text):
+            yield match.span()
+        return
+
+    cached = index.literal_results(query, case_sensitive)
+    if cached is not None:
+        yield from cached
+        return
+
+    needle = query if case_sensitive else query.lower()
+    results = []
+    position = haystack.find(needle)
+    while position != -1:
+        span = (position, position + len(needle))
+        results.append(span)
+        yield span
+        position = haystack.find(needle, span[1])
+    index.keep_literal_results(query, case_sensitive, results)
+
+
+def expander(pattern, template):
+    """
+    Return a function that expands a replacement template for a match of `pattern`, like Match.expand does.
+
+    Match.expand parses the template again on every call, which dominates the cost of replacing many matches.
+    Here the template is parsed once; templates using escapes other than group references and the common
+    character escapes fall back to Match.expand.
+
+    Raises:
+        re.error: If the template refers to a group that does not exist.
+    """
+    if '\\' not in template:
+        return lambda match: template
+
+    escapes = {'\\': '\\', 'n': '\n', 't': '\t', 'r': '\r', 'f': '\f', 'v': '\v', 'a': '\a', 'b': '\b'}
+    parts = []
+    position = 0
+    for token in re.finditer(r'\\(?:g<([^>]*)>|([1-9][0-9]?)|(.))', template, re.DOTALL):
+        parts.append(template[position:token.start()])
+        group = token.group(1) or token.group(2)
+        if group is not None:
+            group = int(group) if group.isdigit() else group
+            if group not in pattern.groupindex and not (isinstance(group, int) and group <= pattern.groups):
+                raise re.error(f'invalid group reference {group}')
+            parts.append((group,))
+        elif token.group(3) in escapes:
+            parts.append(escapes[token.group(3)])
+        else:
+            return lambda match: match.expand(template)
+        position = token.end()
+    parts.append(template[position:])
+
+    def expand(match):
+        return ''.join(part if isinstance(part, str) else match.group(*part) or '' for part in parts)
+    return expand
+
+
+class SearchWorker(QThread):
+    """
+    Worker thread that runs find_all over a SearchIndex and streams the matches back in batches.
+
+    The first batch is small so that the first matches show up at once, and each batch is twice as large
+    as the previous one, so that a search with many matches only emits a few signals.
+
+    Signals:
+        found(list): A batch of (start, end) positions in the document, in document order.
+    """
+    found = pyqtSignal(list)
+
+    BATCH_SIZE = 100
+
+    def __init__(self, index, query, regex=False, case_sensitive=False, whole_words=False, parent=None):
+        super().__init__(parent)
+        self.index = index
+        self.query = query
+        self.options = (regex, case_sensitive, whole_words)
+
+    def run(self):
+        batch = []
+        size = self.BATCH_SIZE
+        for start, end in find_all(self.index, self.query, *self.options):
+            batch.append(self.index.document_span(start, end))
+            if len(batch) == size:
+                if self.isInterruptionRequested():
+                    return
+                self.found.emit(batch)
+                batch = []
+                size *= 2
+        if batch:
+            self.found.emit(batch)
@@ -0,0 +1,89 @@
+import codecs
+import json
+
+from core.codec import NEWLINE_NAMES, TextFormat
+from core.file_saver import atomic_write
+
+# Version of the layout of the session file, increased whenever it changes; a session of a later version is ignored
+SESSION_VERSION = 1
+SESSION_FORMAT = TextFormat('utf-8', False, '\n')
+
+
+class SessionDocument:
+    """
+    A document of a saved session: its file, the format it was read in, and where it was being viewed.
+
+    Attributes:
+        filename: The path of the file of the document.
+        text_format: The TextFormat the file was read in.
+        cursor: The position of the cursor in the document.
+        scroll: The position of the vertical scroll bar, or the first line shown in large file mode.
+        last_used: When the document was last shown; the greater, the more recently.
+        follow: Whether the view scrolls to the end when another program appends to the file.
+    """
+
+    def __init__(self, filename, text_format=None, cursor=0, scroll=0, last_used=0, follow=False):
+        self.filename = filename
+        self.text_format = text_format or TextFormat()
+        self.cursor = cursor
+        self.scroll = scroll
+        self.last_used = last_used
+        self.follow = follow
+
+    def to_json(self):
+        text_format = self.text_format
+        return {
+            'file': self.filename, 'encoding': text_format.encoding, 'bom': text_format.bom,
+            'newline': text_format.newline, 'cursor': self.cursor, 'scroll': self.scroll,
+            'lastUsed': self.last_used, 'follow': self.follow,
+        }
+
+    @classmethod
+    def from_json(cls, data):
+        # Checked here rather than failing when the file is loaded
+        codecs.lookup(data['encoding'])
+        if data['newline'] not in NEWLINE_NAMES:
+            raise ValueError(f'Unknown line ending {data["newline"]!r}')
+        text_format = TextFormat(data['encoding'], bool(data['bom']), data['newline'])
+        return cls(data['file'], text_format, int(data['cursor']), int(data['scroll']), int(data['lastUsed']),
+                   bool(data['follow']))
+
+
+def write_session(filename, documents, current=None):
+    """
+    Save a session atomically.
+
+    Parameters:
+        filename: The path of the session file.
+        documents: The SessionDocuments of the open tabs, in the order of the tabs.
+        current: The index in `documents` of the document of the current tab, if it has one.
+
+    Raises:
+        OSError: The file could not be written.
+    """
+    session = {
+        'version': SESSION_VERSION, 'current': current, 'documents': [document.to_json() for document in documents],
+    }
+    atomic_write(filename, json.dumps(session, indent=1), SESSION_FORMAT)
+
+
+def read_session(filename):
+    """
+    Read a session saved by write_session. Only the session file is read, not the documents.
+
+    Returns:
+        A (documents, current) tuple, as given to write_session; no documents if there is no session, or if it
+        cannot be read.
+    """
+    try:
+        with open(filename, encoding='utf-8') as file:
+            session = json.load(file)
+        if session['version'] > SESSION_VERSION:
+            return [], None
+        documents = [SessionDocument.from_json(data) for data in session['documents']]
+        current = session['current']
+        if current is not None and not 0 <= current < len(documents):
+            current = None
+    except (OSError, ValueError, LookupError, TypeError):
+        return [], None
+    return documents, current
@@ -0,0 +1,100 @@
+import getpass
+import json
+import os
+import socket
+
+from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtNetwork import QLocalServer, QLocalSocket
+
+
+class SingleInstance(QObject):
+    """
+    Local server through which later launches of the application hand their files to the running instance.
+
+    The first instance listens on a local socket (a Unix domain socket, or a named pipe on Windows) that
+    only the user can connect to. A later launch connects to it with `send`, writes the files it was given
+    as one line of JSON, and exits without ever building a window.
+
+    Signals:
+        files_received(list): Another launch asked to open these files, as absolute paths.
+    """
+    files_received = pyqtSignal(list)
+
+    SERVER_NAME = f'PyNotePad-{getpass.getuser()}'
+    # How long a launch waits for the running instance before starting one of its own, in ms
+    TIMEOUT = 1000
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.server = QLocalServer(self)
+        self.server.setSocketOptions(QLocalServer.UserAccessOption)
+        self.server.newConnection.connect(self.accept)
+
+    @classmethod
+    def send(cls, files):
+        """
+        Hand files to the running instance, if there is one.
+
+        Parameters:
+            files: The paths of the files to open, relative to the current directory or absolute.
+
+        Returns:
+            True if a running instance received the files, False if there is none.
+        """
+        message = json.dumps({'files': [os.path.abspath(file) for file in files]}).encode('utf-8') + b'\n'
+        if os.name == 'nt':
+            connection = QLocalSocket()
+            connection.connectToServer(cls.SERVER_NAME)
+            if not connection.waitForConnected(cls.TIMEOUT):
+                return False
+            connection.write(message)
+            delivered = connection.waitForBytesWritten(cls.TIMEOUT)
+            connection.disconnectFromServer()
+            return delivered
+
+        # Done without Qt, which warns about its timers when a QLocalSocket is used before the application exists.
+        # QLocalServer listens on a socket of that name in the temporary directory of Qt
+        path = os.path.join(os.environ.get('TMPDIR') or '/tmp', cls.SERVER_NAME)
+        with socket.socket(socket.AF_UNIX) as connection:
+            connection.settimeout(cls.TIMEOUT / 1000)
+            try:
+                connection.connect(path)
+                connection.sendall(message)
+            except OSError:
+                return False
+        return True
+
+    def listen(self):
+        """
+        Start accepting files from later launches.
+
+        If another instance is listening already, e.g. one started at the same time, this one keeps running
+        on its own. A socket left behind by an instance that crashed is replaced.
+
+        Returns:
+            True if this instance is now the one later launches hand their files to.
+        """
+        # With UserAccessOption, listening replaces the socket of another instance instead of failing
+        connection = QLocalSocket()
+        connection.connectToServer(self.SERVER_NAME)
+        if connection.waitForConnected(self.TIMEOUT):
+            connection.abort()
+            return False
+
+        QLocalServer.removeServer(self.SERVER_NAME)
+        return self.server.listen(self.SERVER_NAME)
+
+    def accept(self):
+        while self.server.hasPendingConnections():
+            connection = self.server.nextPendingConnection()
+            connection.readyRead.connect(lambda connection=connection: self.receive(connection))
+            connection.disconnected.connect(connection.deleteLater)
+
+    def receive(self, connection):
+        while connection.canReadLine():
+            try:
+                files = json.loads(bytes(connection.readLine()).decode('utf-8'))['files']
+            except (ValueError, KeyError, TypeError):
+                connection.abort()
+                return
+            self.files_received.emit([file for file in files if isinstance(file, str)])
@@ -0,0 +1,73 @@
+import argparse
+import sys
+import time
+
+# Taken before Qt is imported, so that the imports are part of the startup time
+STARTED = time.perf_counter()
+
+from PyQt5.QtCore import QEvent, QObject, QTimer  # noqa: E402
+
+
+def parse_arguments(argv):
+    """
+    Parse the command line of the application.
+
+    Parameters:
+        argv: The arguments, without the program name.
+
+    Returns:
+        A (arguments, remaining) tuple: the parsed arguments, and the ones left for QApplication such as -style.
+    """
+    parser = argparse.ArgumentParser(prog='pyNotePad', description='A simple note taking application.')
+    parser.add_argument('files', nargs='*', help='files to open')
+    parser.add_argument('--new-instance', action='store_true',
+                        help='start a new instance instead of opening the files in the running one')
+    parser.add_argument('--startup-timing', action='store_true',
+                        help='print how long it took to show the window to stderr')
+    parser.add_argument('--profile', action='store_true',
+                        help='record the time spent in actions, file reads and writes and event loop stalls, '
+                             'shown in the status bar and exported with File > Export Performance Trace')
+    parser.add_argument('--stall-threshold', type=int, default=50, metavar='MS',
+                        help='length from which the event loop is considered stalled when profiling, '
+                             'by default %(default)s ms')
+    return parser.parse_known_args(argv)
+
+
+class StartupTimer(QObject):
+    """
+    Measures how long the application takes to start, from the import of this module to the first paint
+    of the main window.
+
+    Steps are recorded along the way with `mark`; once the window has been painted for the first time,
+    the time spent in each step is printed to stderr.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.marks = [('start', STARTED)]
+
+    def mark(self, name):
+        self.marks.append((name, time.perf_counter()))
+
+    def watch(self, window):
+        """
+        Report the startup time once `window` has been painted for the first time.
+        """
+        window.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint:
+            obj.removeEventFilter(self)
+            # The window and its children are painted in the same pass, the frame is complete
+            # once control is back in the event loop
+            QTimer.singleShot(0, self.report)
+        return False
+
+    def report(self):
+        self.mark('first paint')
+        steps = [
+            f'{name} {(end - start) * 1000:.1f} ms'
+            for (_, start), (name, end) in zip(self.marks, self.marks[1:])
+        ]
+        total = (self.marks[-1][1] - STARTED) * 1000
+        print(f'startup: {", ".join(steps)}, total {total:.1f} ms', file=sys.stderr)
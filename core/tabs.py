@@ -0,0 +1,71 @@
+from PyQt5.QtCore import QFileInfo
+
+from core.codec import TextFormat
+
+
+class Tab:
+    """
+    A document open in a tab of the window.
+
+    A tab can exist with nothing but its metadata: its QTextDocument is only created when the tab is first
+    activated, and it may be dropped again while the tab is in the background and unmodified, in which case
+    it is reloaded from its file on the next activation. The cursor and scroll positions survive both, and so
+    does the encoding and line endings the file is written back in.
+    """
+    # Rough memory cost of a character in a QTextDocument, text, fragments and layout included
+    BYTES_PER_CHARACTER = 4
+
+    def __init__(self, filename=None):
+        self.filename = filename
+        self.textFormat = TextFormat()
+        self.document = None
+        self.journal = None
+        self.loader = None
+        self.loadProgress = 0
+        self.richText = None
+        self.largeView = None
+        self.highlighter = None
+        self.indexer = None
+        self.saveRevision = None
+        self.saveGeneration = None
+        self.cursorPosition = 0
+        self.scrollPosition = 0
+        self.lastUsed = 0
+        # Whether the view scrolls to the end when another program appends to the file
+        self.follow = False
+        # The (line, column, length) to select once the file is loaded, see NotePadWindow.open_at
+        self.pendingSelection = None
+        # The TextFormat the file was read in by a previous session, to load it in instead of detecting it again
+        self.formatHint = None
+        # Unsaved changes recovered after a crash, applied once the file is loaded, see NotePadWindow.recover_changes
+        self.recoveredText = None
+        # Whether a snapshot of the document is being written to its file, see NotePadWindow.write_file
+        self.saving = False
+        # Whether the tab is closed once its document is saved, see NotePadWindow.close_tab
+        self.closing = False
+
+    def title(self):
+        title = QFileInfo(self.filename).fileName() if self.filename else 'Untitled'
+        if self.document is not None and self.document.isModified() and self.loader is None:
+            title += '*'
+        return title
+
+    def is_blank(self):
+        """
+        Whether the tab holds an empty, unmodified, untitled document that opening a file may reuse.
+        """
+        return self.filename is None and self.document is not None and self.document.isEmpty() \
+            and not self.document.isModified() and self.loader is None and self.largeView is None
+
+    def is_evictable(self):
+        """
+        Whether the document can be dropped and later reloaded from its file without losing anything. A document
+        being saved is not, since its file only holds it once the save succeeded.
+        """
+        return self.document is not None and self.filename is not None and not self.document.isModified() \
+            and not self.saving and self.loader is None and self.largeView is None
+
+    def memory_size(self):
+        if self.document is None:
+            return 0
+        return self.document.characterCount() * self.BYTES_PER_CHARACTER
@@ -1,70 +1,1201 @@
+import os
+import re
+import shutil
 import sys
+import time
 
-from PyQt5.QtCore import QFileInfo, Qt
-from PyQt5.QtGui import QFont
-from PyQt5.QtWidgets import QMainWindow, QApplication, QFileDialog, QMessageBox, QFontDialog, QColorDialog
-from PyQt5.QtPrintSupport import QPrintDialog, QPrinter, QPrintPreviewDialog
+# Imported first so that the startup time includes the imports of Qt
+from core.startup import StartupTimer, parse_arguments
+from core.single_instance import SingleInstance
+
+if __name__ == '__main__':
+    arguments, qt_arguments = parse_arguments(sys.argv[1:])
+    # When an instance is already running it opens the files, so the GUI is not even imported here
+    if not arguments.new_instance and SingleInstance.send(arguments.files):
+        sys.exit(0)
+
+from PyQt5.QtCore import QFileInfo, QPoint, Qt, QStandardPaths, QTimer, QSettings
+from bisect import bisect_left
+from collections import OrderedDict
+from functools import partial
+
+from PyQt5.QtGui import QFont, QIcon, QTextCursor, QTextCharFormat, QColor, QTextDocument
+from PyQt5.QtWidgets import QMainWindow, QApplication, QFileDialog, QMessageBox, QFontDialog, QColorDialog, \
+    QProgressBar, QPushButton, QInputDialog, QDialog, QTextEdit, QActionGroup, QAction, QLabel, QDockWidget, \
+    QTreeWidgetItem
 from GUI.pyNotePadGUI import Ui_MainWindow
+from GUI.findDialogGUI import Ui_FindDialog
+from GUI.findInFilesGUI import Ui_FindInFilesPanel
+from GUI.printPreviewGUI import Ui_PrintPreviewDialog
+from core.codec import sniff_file, utf16_positions
+from core.file_loader import FileLoader
+from core.file_saver import FileSaver
+from core.file_watcher import FileWatcher
+from core.journal import EditJournal
+from core.session import SessionDocument, read_session, write_session
+from core.search import SearchIndex, SearchWorker, compile_query, expander, find_all
+from core.tabs import Tab
+from core.large_file import LineIndex, LineIndexer, LargeFileView
+from core.print_layout import PageLayout, PageRenderer, printer_settings
+from core.highlighting import LEXERS, SyntaxHighlighter, lexer_for_filename
+from core.rich_text import NATIVE_SUFFIX, RichTextFormats, is_native, merge_char_format
+from core.instrumentation import profiler
+
+
+class FindDialog(QDialog, Ui_FindDialog):
+    """
+    Non-modal Find and Replace dialog for a QTextEdit.
+
+    Searches run on a SearchWorker over a snapshot of the document, and matches are highlighted as they stream in.
+    The snapshot is kept in a SearchIndex until the document is edited, so repeated searches skip re-reading it.
+    Only the matches in view are highlighted: the cursor of a highlight lays the document out down to it, which
+    for matches spread over a document that was just loaded would mean laying out most of it.
+    """
+    # Highlighting is skipped past this number of matches in view
+    MAX_HIGHLIGHTS = 10000
+
+    def __init__(self, textEdit, parent=None):
+        super().__init__(parent)
+        self.setupUi(self)
+        self.textEdit = textEdit
+        self.index = None
+        self.document = None
+        self.worker = None
+        self.starts = []
+        self.ends = []
+        self.current = None
+        self.pendingMove = None
+        self.highlight = QTextCharFormat()
+        self.highlight.setBackground(QColor(Qt.yellow))
+
+        self.findEdit.textChanged.connect(self.start_search)
+        self.caseCheckBox.toggled.connect(self.start_search)
+        self.wordsCheckBox.toggled.connect(self.start_search)
+        self.regexCheckBox.toggled.connect(self.start_search)
+        self.textEdit.verticalScrollBar().valueChanged.connect(self.highlight_visible)
+        self.findNextButton.clicked.connect(self.find_next)
+        self.findPreviousButton.clicked.connect(self.find_previous)
+        self.replaceButton.clicked.connect(self.replace)
+        self.replaceAllButton.clicked.connect(self.replace_all)
+        self.watch_document()
+
+    def watch_document(self):
+        """
+        Follow the document shown in the text edit widget, after the window switched to another tab.
+        """
+        document = self.textEdit.document()
+        if document is self.document:
+            return
+
+        if self.document is not None:
+            self.document.contentsChanged.disconnect(self.invalidate)
+            self.stop_search()
+            self.statusLabel.clear()
+        self.index = None
+        self.document = document
+        self.document.contentsChanged.connect(self.invalidate)
+
+    def options(self):
+        return self.regexCheckBox.isChecked(), self.caseCheckBox.isChecked(), self.wordsCheckBox.isChecked()
+
+    def search_index(self):
+        """
+        Return the SearchIndex of the current revision of the document, taking a new snapshot only if it was edited.
+        """
+        document = self.textEdit.document()
+        if self.index is None or self.index.revision != document.revision():
+            self.index = SearchIndex(document.toPlainText(), document.revision())
+        return self.index
+
+    def is_stale(self):
+        return self.index is None or self.index.revision != self.textEdit.document().revision()
+
+    def start_search(self):
+        """
+        Start searching for the query in the background, replacing any search in progress.
+        """
+        self.stop_search()
+        query = self.findEdit.text()
+        if not query:
+            self.statusLabel.clear()
+            return
+
+        try:
+            compile_query(query, *self.options())
+        except re.error as error:
+            self.statusLabel.setText(f'Invalid regular expression: {error}')
+            return
+
+        self.worker = SearchWorker(self.search_index(), query, *self.options(), parent=self)
+        self.worker.found.connect(self.add_matches)
+        self.worker.finished.connect(self.search_finished)
+        self.statusLabel.setText('Searching...')
+        self.worker.start()
+
+    def stop_search(self):
+        if self.worker is not None:
+            self.worker.requestInterruption()
+            self.worker.wait()
+            self.worker = None
+        self.starts = []
+        self.ends = []
+        self.current = None
+        self.pendingMove = None
+        self.textEdit.setExtraSelections([])
+
+    def invalidate(self):
+        """
+        Drop the matches of a search when the document is edited, since their positions no longer hold.
+        """
+        if self.worker is not None or self.starts:
+            self.stop_search()
+            self.statusLabel.clear()
+
+    def add_matches(self, batch):
+        if self.sender() is not self.worker:
+            return
+
+        self.starts.extend(start for start, _ in batch)
+        self.ends.extend(end for _, end in batch)
+        self.statusLabel.setText(f'{len(self.starts)} matches so far...')
+
+        self.highlight_visible()
+
+        if self.pendingMove is not None and self.select_match(self.pendingMove, wrap=False):
+            self.pendingMove = None
+
+    def highlight_visible(self):
+        """
+        Highlight the matches in the blocks in view, in place of those highlighted before.
+        """
+        if not self.starts:
+            return
+
+        # Hit testing only lays the document out down to the bottom of the view. In the corner of the margin it
+        # can land on blocks that were not laid out yet, the top left of the text is tested instead.
+        viewport = self.textEdit.viewport()
+        margin = int(self.textEdit.document().documentMargin())
+        first = self.textEdit.cursorForPosition(QPoint(margin, margin)).block().position()
+        last = self.textEdit.cursorForPosition(QPoint(viewport.width() - 1, viewport.height() - 1)).block()
+        number = bisect_left(self.ends, first)
+        stop = min(bisect_left(self.starts, last.position() + last.length()), number + self.MAX_HIGHLIGHTS)
+
+        document = self.textEdit.document()
+        selections = []
+        for start, end in zip(self.starts[number:stop], self.ends[number:stop]):
+            # Reading back selection.cursor would tie the two wrappers in a reference cycle,
+            # keeping the cursors alive in the document until the garbage collector runs
+            cursor = QTextCursor(document)
+            cursor.setPosition(start)
+            cursor.setPosition(end, QTextCursor.KeepAnchor)
+            selection = QTextEdit.ExtraSelection()
+            selection.cursor = cursor
+            selection.format = self.highlight
+            selections.append(selection)
+        self.textEdit.setExtraSelections(selections)
+
+    def search_finished(self):
+        if self.sender() is not self.worker:
+            return
+
+        self.worker = None
+        self.statusLabel.setText(f'{len(self.starts)} matches')
+        if self.pendingMove is not None:
+            self.select_match(self.pendingMove)
+            self.pendingMove = None
+
+    def find_next(self):
+        self.find_match(backward=False)
+
+    def find_previous(self):
+        self.find_match(backward=True)
+
+    def find_match(self, backward):
+        """
+        Select the next or previous match from the cursor, starting a search first if there is none for the
+        current revision. If the match is not known yet, it is selected as soon as the search reaches it.
+        """
+        if self.is_stale() or (self.worker is None and not self.starts):
+            self.start_search()
+        if not self.select_match(backward, wrap=self.worker is None) and self.worker is not None:
+            self.pendingMove = backward
+
+    def select_match(self, backward, wrap=True):
+        """
+        Select the match after the current selection, or before it if `backward` is True.
+
+        Returns:
+            True if a match was selected.
+        """
+        if not self.starts:
+            return False
+
+        cursor = self.textEdit.textCursor()
+        selected = self.current is not None and self.current < len(self.starts) \
+            and (self.starts[self.current], self.ends[self.current]) == (cursor.selectionStart(), cursor.selectionEnd())
+
+        if backward:
+            number = self.current - 1 if selected else bisect_left(self.starts, cursor.selectionStart()) - 1
+            if number < 0:
+                if not wrap:
+                    return False
+                number = len(self.starts) - 1
+        else:
+            number = self.current + 1 if selected else bisect_left(self.starts, cursor.selectionEnd())
+            if number == len(self.starts):
+                if not wrap:
+                    return False
+                number = 0
+
+        cursor.setPosition(self.starts[number])
+        cursor.setPosition(self.ends[number], QTextCursor.KeepAnchor)
+        self.textEdit.setTextCursor(cursor)
+        self.current = number
+        line = self.index.line_of(self.index.text_position(self.starts[number])) + 1
+        self.statusLabel.setText(f'Match {number + 1} of {len(self.starts)}, line {line}')
+        return True
+
+    def replacements(self, pattern, spans):
+        """
+        Return the replacement text of each match, given by its positions in the document, expanding group
+        references for regular expressions.
+        """
+        if not self.regexCheckBox.isChecked():
+            return [self.replaceEdit.text()] * len(spans)
+        expand = expander(pattern, self.replaceEdit.text())
+        return [expand(pattern.match(self.index.text, self.index.text_position(start))) for start, _ in spans]
+
+    def replace(self):
+        """
+        Replace the selected match, if the selection is one, and select the next match.
+        """
+        cursor = self.textEdit.textCursor()
+        number = bisect_left(self.starts, cursor.selectionStart())
+
+        if not self.is_stale() and number < len(self.starts) and cursor.hasSelection() \
+                and (self.starts[number], self.ends[number]) == (cursor.selectionStart(), cursor.selectionEnd()):
+            pattern = compile_query(self.findEdit.text(), *self.options())
+            try:
+                text, = self.replacements(pattern, [(self.starts[number], self.ends[number])])
+            except re.error as error:
+                self.statusLabel.setText(f'Invalid replacement: {error}')
+                return
+            cursor.insertText(text)
+        self.find_next()
+
+    def replace_all(self):
+        """
+        Replace every match in the document as a single edit block, which is undone in one step.
+
+        The matches of the current search are reused when it completed on the current revision,
+        otherwise they are found synchronously. They are replaced from the last to the first, so that
+        the positions of the remaining ones are not shifted by the replacements.
+        """
+        query = self.findEdit.text()
+        try:
+            pattern = compile_query(query, *self.options())
+        except re.error as error:
+            self.statusLabel.setText(f'Invalid regular expression: {error}')
+            return
+
+        if self.is_stale() or self.worker is not None or not self.starts:
+            self.stop_search()
+            index = self.search_index()
+            spans = [index.document_span(start, end) for start, end in find_all(index, query, *self.options())]
+        else:
+            spans = list(zip(self.starts, self.ends))
+        # Every highlight holds a cursor that the document would have to update on each replacement
+        self.stop_search()
+
+        try:
+            replacements = self.replacements(pattern, spans)
+        except re.error as error:
+            self.statusLabel.setText(f'Invalid replacement: {error}')
+            return
+
+        cursor = QTextCursor(self.textEdit.document())
+        cursor.beginEditBlock()
+        for (start, end), text in zip(reversed(spans), reversed(replacements)):
+            cursor.setPosition(start)
+            cursor.setPosition(end, QTextCursor.KeepAnchor)
+            cursor.insertText(text)
+        cursor.endEditBlock()
+
+        self.statusLabel.setText(f'Replaced {len(spans)} occurrences')
+
+    def hideEvent(self, event):
+        self.stop_search()
+        super().hideEvent(event)
+
+
+class FindInFilesPanel(QDockWidget, Ui_FindInFilesPanel):
+    """
+    Dockable Find in Files panel, searching the notes of a folder through its persistent FileIndex.
+
+    The index is loaded and brought up to date by an IndexUpdater in the background when the folder is chosen,
+    when the panel is shown again, when a file of the folder is saved, and on Refresh; only the notes changed
+    since the last update are read. A query looks up the notes holding its words in the index, then a
+    FileSearchWorker reads just those and streams the matching lines back, grouped by file. Activating a line
+    opens its file at that line.
+    """
+
+    def __init__(self, notePad):
+        super().__init__(notePad)
+        self.setupUi(self)
+        self.notePad = notePad
+        self.index = None
+        self.updater = None
+        self.pendingUpdate = False
+        self.worker = None
+        self.fileItems = {}
+        self.matchCount = 0
+
+        self.chooseButton.clicked.connect(self.choose_directory)
+        self.refreshButton.clicked.connect(self.update_index)
+        self.queryEdit.textChanged.connect(self.start_search)
+        self.caseCheckBox.toggled.connect(self.start_search)
+        self.wordsCheckBox.toggled.connect(self.start_search)
+        self.resultsTree.itemActivated.connect(self.open_result)
+
+        directory = QSettings().value('findInFiles/directory', '', type=str)
+        if directory and os.path.isdir(directory):
+            self.set_directory(directory)
+
+    def choose_directory(self):
+        directory = QFileDialog.getExistingDirectory(self, 'Find in Files', self.index.root if self.index else '')
+
+        if directory:
+            QSettings().setValue('findInFiles/directory', directory)
+            self.set_directory(directory)
+
+    def set_directory(self, directory):
+        """
+        Search the notes of another folder, indexing those that changed since it was last searched.
+        """
+        # Imported on first use, along with the process pool it indexes with, which takes long to import
+        from core.file_index import FileIndex
+
+        self.stop()
+        self.index = FileIndex(directory, self.notePad.index_dir())
+        self.directoryLabel.setText(self.index.root)
+        self.directoryLabel.setToolTip(self.index.root)
+        self.update_index()
+
+    def update_index(self):
+        """
+        Bring the index up to date with the notes on disk in the background, or once more after the update in
+        progress if there is one.
+        """
+        if self.index is None:
+            return
+        if self.updater is not None:
+            self.pendingUpdate = True
+            return
+
+        from core.file_index import IndexUpdater
+
+        self.updater = IndexUpdater(self.index, parent=self)
+        self.updater.progress.connect(self.update_progress)
+        self.updater.failed.connect(self.update_failed)
+        self.updater.finished.connect(self.update_finished)
+        if not self.index.loaded:
+            self.statusLabel.setText('Loading the index...')
+        self.updater.start()
+
+    def file_saved(self, filename):
+        if self.index is not None and self.index.contains(filename):
+            self.update_index()
+
+    def update_progress(self, done, total):
+        if self.sender() is self.updater:
+            self.statusLabel.setText(f'Indexing {done} of {total} notes...')
+
+    def update_failed(self, message):
+        if self.sender() is self.updater:
+            self.statusLabel.setText(f'Unable to save the index: {message}')
+
+    def update_finished(self):
+        if self.sender() is not self.updater:
+            return
+
+        self.updater = None
+        if self.pendingUpdate:
+            self.pendingUpdate = False
+            self.update_index()
+        elif self.queryEdit.text():
+            # The notes that changed may hold new matches, or have lost theirs
+            self.start_search()
+        else:
+            self.statusLabel.setText(f'{len(self.index)} notes indexed')
+
+    def start_search(self):
+        """
+        Look up the notes that may hold the query in the index, and start finding its lines in them in the
+        background, replacing any search in progress.
+        """
+        self.stop_search()
+        query = self.queryEdit.text()
+        if not query or self.index is None:
+            self.statusLabel.clear()
+            return
+
+        from core.file_index import FileSearchWorker
+
+        filenames = self.index.candidates(query)
+        self.worker = FileSearchWorker(
+            filenames, query, self.caseCheckBox.isChecked(), self.wordsCheckBox.isChecked(), parent=self)
+        self.worker.found.connect(self.add_results)
+        self.worker.finished.connect(self.search_finished)
+        self.statusLabel.setText(f'Searching {len(filenames)} notes...')
+        self.worker.start()
+
+    def stop_search(self):
+        if self.worker is not None:
+            self.worker.requestInterruption()
+            self.worker.wait()
+            self.worker = None
+        self.resultsTree.clear()
+        self.fileItems = {}
+        self.matchCount = 0
+
+    def stop(self):
+        """
+        Stop the search and the index update in progress, e.g. before the window closes.
+        """
+        self.stop_search()
+        if self.updater is not None:
+            self.updater.requestInterruption()
+            self.updater.wait()
+            self.updater = None
+        self.pendingUpdate = False
+
+    def add_results(self, batch):
+        if self.sender() is not self.worker:
+            return
+
+        for filename, line, column, length, text in batch:
+            fileItem = self.fileItems.get(filename)
+            if fileItem is None:
+                fileItem = self.fileItems[filename] = QTreeWidgetItem(self.resultsTree)
+                fileItem.setText(0, os.path.relpath(filename, self.index.root))
+                fileItem.setToolTip(0, filename)
+                fileItem.setData(0, Qt.UserRole, (filename, line, column, length))
+                fileItem.setExpanded(True)
+            item = QTreeWidgetItem(fileItem)
+            item.setText(0, f'{line + 1}: {text.strip()[:200]}')
+            item.setData(0, Qt.UserRole, (filename, line, column, length))
+        self.matchCount += len(batch)
+        self.statusLabel.setText(f'{self.matchCount} matches in {len(self.fileItems)} notes so far...')
+
+    def search_finished(self):
+        if self.sender() is not self.worker:
+            return
+
+        limit = ' (first ones shown)' if self.matchCount >= self.worker.limit else ''
+        self.worker = None
+        self.statusLabel.setText(f'{self.matchCount} matches in {len(self.fileItems)} notes{limit}')
+
+    def open_result(self, item):
+        """
+        Open the file of a result, with its match selected; a file opens at its first match.
+        """
+        filename, line, column, length = item.data(0, Qt.UserRole)
+        self.notePad.open_at(filename, line, column, length)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self.updater is None:
+            self.update_index()
+
+
+class PrintPreviewDialog(QDialog, Ui_PrintPreviewDialog):
+    """
+    Print preview of the current document of a NotePadWindow.
+
+    The document is paginated on a worker thread, and the window keeps the result keyed on the revision of
+    the document and the printer settings, so the preview opens at once when nothing changed since the last
+    time, and going back to previous page settings does not paginate again. Zooming only renders the pages
+    in view again, at the new scale.
+    """
+    ZOOM_STEP = 1.25
+
+    def __init__(self, notePad, printer):
+        super().__init__(notePad)
+        self.setupUi(self)
+        self.notePad = notePad
+        self.printer = printer
+        self.key = None
+
+        self.printButton.clicked.connect(self.print_document)
+        self.pageSetupButton.clicked.connect(self.page_setup)
+        self.zoomInButton.clicked.connect(lambda: self.set_zoom(self.pageView.zoom * self.ZOOM_STEP))
+        self.zoomOutButton.clicked.connect(lambda: self.set_zoom(self.pageView.zoom / self.ZOOM_STEP))
+        self.fitWidthButton.clicked.connect(self.fit_width)
+        self.pageView.verticalScrollBar().valueChanged.connect(self.update_page_label)
+        renderer = notePad.page_renderer()
+        renderer.progress.connect(self.update_progress)
+        renderer.paginated.connect(self.paginated)
+        renderer.failed.connect(self.pagination_failed)
+        self.paginate()
+
+    def paginate(self):
+        """
+        Show the pages of the document for the current printer settings, paginating it first if needed.
+        """
+        self.key = self.notePad.paginate(self.printer)
+        layout = self.notePad.page_layout(self.printer)
+        if layout is not None:
+            self.show_layout(layout)
+            return
+
+        self.pageView.set_layout(None)
+        self.pageView.set_message('Paginating...')
+        self.pageLabel.clear()
+
+    def update_progress(self, key, pages):
+        if key == self.key:
+            self.pageView.set_message(f'Paginating... {pages} pages')
+
+    def paginated(self, key):
+        if key == self.key:
+            self.show_layout(self.notePad.page_layout(self.printer))
+
+    def pagination_failed(self, key, error):
+        if key == self.key:
+            self.pageView.set_message(error)
+
+    def show_layout(self, layout):
+        first = self.pageView.pageLayout is None
+        self.pageView.set_layout(layout, self.notePad.page_renderer(), self.key)
+        if first:
+            self.fit_width()
+        self.update_page_label()
+
+    def set_zoom(self, zoom):
+        self.pageView.set_zoom(min(max(zoom, 0.1), 10))
+        self.zoomLabel.setText(f'{self.pageView.zoom:.0%}')
+        self.update_page_label()
+
+    def fit_width(self):
+        self.pageView.fit_width()
+        self.zoomLabel.setText(f'{self.pageView.zoom:.0%}')
+
+    def update_page_label(self):
+        layout = self.pageView.pageLayout
+        if layout is not None:
+            self.pageLabel.setText(f'Page {self.pageView.current_page() + 1} of {layout.page_count}')
+
+    def page_setup(self):
+        from PyQt5.QtPrintSupport import QPageSetupDialog
+
+        if QPageSetupDialog(self.printer, self).exec_() == QDialog.Accepted:
+            self.paginate()
+
+    def print_document(self):
+        from PyQt5.QtPrintSupport import QPrintDialog
+
+        if QPrintDialog(self.printer, self).exec_() == QPrintDialog.Accepted:
+            self.notePad.textEdit.print(self.printer)
+            self.accept()
+
+    def done(self, result):
+        renderer = self.notePad.page_renderer()
+        renderer.progress.disconnect(self.update_progress)
+        renderer.paginated.disconnect(self.paginated)
+        renderer.failed.disconnect(self.pagination_failed)
+        # Only connected once a layout was shown
+        if self.pageView.renderer is not None:
+            renderer.rendered.disconnect(self.pageView.page_rendered)
+        # Nobody is waiting for a pagination still in progress
+        self.notePad.cancel_pagination(self.key)
+        super().done(result)
 
 
 class NotePadWindow(QMainWindow, Ui_MainWindow):
+    # Files at least this big are opened read-only in large file mode instead of being loaded into the text edit
+    LARGE_FILE_SIZE = 64 * 1024 * 1024
+    # How often the crash-recovery journals are flushed to disk, and the size that triggers a compaction
+    JOURNAL_SYNC_INTERVAL = 5000
+    JOURNAL_COMPACT_SIZE = 1024 * 1024
+    # Default memory budget of the open documents, in MB, overridden by the tabs/memoryBudget setting
+    MEMORY_BUDGET = 512
+    # Number of paginated documents kept for print preview
+    PAGE_LAYOUT_CACHE = 4
+    # How often the performance readout in the status bar is refreshed when profiling, in ms
+    PROFILE_REFRESH_INTERVAL = 500
+    # Longest time spent adding the tabs of a restored session before going back to the event loop, in seconds
+    RESTORE_SLICE = 0.01
+    # Icon of each action, in resources/resources.qrc
+    ICONS = {
+        'actionNew': 'new.png', 'actionOpen': 'open.png', 'actionSave': 'save.png', 'actionPrint': 'print.png',
+        'actionPrint_Preview': 'printprev.png', 'actionExport_PDF': 'pdf.png', 'actionQuit': 'exit.png',
+        'actionUndo': 'undo.png', 'actionRedo': 'redo.png', 'actionCut': 'cut.png', 'actionCopy': 'copy.png',
+        'actionPaste': 'paste.png', 'actionBold': 'bold.png', 'actionItalic': 'italic.png',
+        'actionUnderline': 'underline.png', 'actionLeft': 'left.png', 'actionRight': 'right.png',
+        'actionCenter': 'center.png', 'actionJustify': 'justify.png', 'actionFont': 'font.png',
+        'actionColor': 'color.png', 'actionAbout_App': 'about.png',
+    }
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setupUi(self)
+        self.tab = None
+        # Shown by the text edit widget while the document of the current tab is being loaded
+        self.loadingDocument = QTextDocument(self)
+        # The tab whose cursor and scroll positions are to be restored, see restore_view
+        self.viewPending = None
+        self.findDialog = None
+        self.findInFiles = None
+        self.useCount = 0
+        self.restoreQueue = []
+        self.restoreAnchor = None
+        self.restoredPaths = set()
+        self.preloadQueue = []
+        self.savedSession = None
+        self.printer = None
+        self.pageRenderer = None
+        self.pageLayouts = OrderedDict()
+        self.paginating = {}
+        self.saver = FileSaver(self)
+        self.watcher = FileWatcher(parent=self)
+        self.journalTimer = QTimer(self)
+        self.journalTimer.start(self.JOURNAL_SYNC_INTERVAL)
+        self.restoreTimer = QTimer(self)
+        self.restoreTimer.setSingleShot(True)
+        self.setup_statusbar()
+        self.setup_profiling()
+        self.setup_syntax_menu()
+        self.setup_follow_action()
         self.setup_connects()
+        self.new_tab()
         self.show()
+        QTimer.singleShot(0, self.setup_icons)
+        QTimer.singleShot(0, self.restore_session)
+        QTimer.singleShot(0, self.recover_session)
+
+    def setup_statusbar(self):
+        # Progress and cancel widgets for background file loading, hidden when idle
+        self.loadProgress = QProgressBar(self.statusbar)
+        self.loadProgress.setMaximumWidth(200)
+        self.loadProgress.setRange(0, 100)
+        self.loadProgress.hide()
+        self.statusbar.addPermanentWidget(self.loadProgress)
+
+        self.loadCancel = QPushButton('Cancel', self.statusbar)
+        self.loadCancel.clicked.connect(self.cancel_load)
+        self.loadCancel.hide()
+        self.statusbar.addPermanentWidget(self.loadCancel)
+
+        # Encoding and line endings of the current document, kept when it is saved
+        self.formatLabel = QLabel(self.statusbar)
+        self.statusbar.addPermanentWidget(self.formatLabel)
+
+    def setup_profiling(self):
+        # Live readout in the status bar and trace export, only when the application was started with --profile
+        if not profiler.enabled:
+            return
+
+        self.profileLabel = QLabel(self.statusbar)
+        self.statusbar.addPermanentWidget(self.profileLabel)
+        self.profileTimer = QTimer(self)
+        self.profileTimer.timeout.connect(lambda: self.profileLabel.setText(profiler.summary()))
+        self.profileTimer.start(self.PROFILE_REFRESH_INTERVAL)
+
+        self.actionExport_Trace = QAction('Export Performance Trace...', self)
+        self.actionExport_Trace.triggered.connect(self.export_trace)
+        self.menuFile.insertAction(self.actionQuit, self.actionExport_Trace)
+
+    def setup_syntax_menu(self):
+        # One checkable action per registered lexer, the syntax of the current tab being checked
+        self.menuSyntax = self.menuFormat.addMenu('Syntax')
+        self.syntaxGroup = QActionGroup(self)
+        for lexer_class in [None] + LEXERS:
+            action = self.menuSyntax.addAction(lexer_class.name if lexer_class is not None else 'Plain Text')
+            action.setCheckable(True)
+            action.setData(lexer_class)
+            self.syntaxGroup.addAction(action)
+        self.syntaxGroup.triggered.connect(self.select_syntax)
+
+    def setup_icons(self):
+        # Set here rather than in the .ui file, whose generated code decodes every icon while the window is built:
+        # QIcon decodes an image as it is made, so the icons are only set once the window was first shown
+        for name, icon in self.ICONS.items():
+            getattr(self, name).setIcon(QIcon(f':/icon/pictures/icon/{icon}'))
+
+    def setup_follow_action(self):
+        # Checked per tab, like tail -f: text appended to the file by another program is scrolled to
+        self.actionFollow = QAction('Follow File', self)
+        self.actionFollow.setCheckable(True)
+        self.actionFollow.setStatusTip('Scroll to the end of the file when another program appends to it')
+        self.menuFile.insertAction(self.actionPrint, self.actionFollow)
+        self.menuFile.insertSeparator(self.actionPrint)
 
     def setup_connects(self):
+        # Wraps the slots to record the time spent in them when profiling, returns them unchanged otherwise
+        timed = profiler.timed
+
         # File menu actions
-        self.actionSave.triggered.connect(self.save_file)
-        self.actionNew.triggered.connect(self.new_file)
-        self.actionOpen.triggered.connect(self.open_file)
-        self.actionPrint.triggered.connect(self.print_file)
-        self.actionPrint_Preview.triggered.connect(self.preview_dialog)
-        self.actionExport_PDF.triggered.connect(self.export_pdf)
-        self.actionQuit.triggered.connect(self.exit_app)
+        self.actionSave.triggered.connect(timed(self.save_file))
+        self.actionSave_As.triggered.connect(timed(self.save_file_as))
+        self.actionNew.triggered.connect(timed(self.new_file))
+        self.actionOpen.triggered.connect(timed(self.open_file))
+        self.actionClose.triggered.connect(timed(self.close_file))
+        self.actionPrint.triggered.connect(timed(self.print_file))
+        self.actionPrint_Preview.triggered.connect(timed(self.preview_dialog))
+        self.actionExport_PDF.triggered.connect(timed(self.export_pdf))
+        self.actionFollow.toggled.connect(timed(self.follow_file))
+        self.actionQuit.triggered.connect(timed(self.exit_app))
 
         # Edit menu actions
-        self.actionUndo.triggered.connect(self.textEdit.undo)
-        self.actionRedo.triggered.connect(self.textEdit.redo)
-        self.actionCut.triggered.connect(self.textEdit.cut)
-        self.actionCopy.triggered.connect(self.textEdit.copy)
-        self.actionPaste.triggered.connect(self.textEdit.paste)
+        self.actionUndo.triggered.connect(timed(self.textEdit.undo))
+        self.actionRedo.triggered.connect(timed(self.textEdit.redo))
+        self.actionCut.triggered.connect(timed(self.textEdit.cut))
+        self.actionCopy.triggered.connect(timed(self.textEdit.copy))
+        self.actionPaste.triggered.connect(timed(self.textEdit.paste))
+        self.actionFind.triggered.connect(timed(self.find_dialog))
+        self.actionReplace.triggered.connect(timed(self.find_dialog))
+        self.actionFind_in_Files.triggered.connect(timed(self.find_in_files))
+        self.actionGo_to_Line.triggered.connect(timed(self.goto_line))
 
         # Format menu actions
-        self.actionBold.triggered.connect(self.bold_text)
-        self.actionItalic.triggered.connect(self.italic_text)
-        self.actionUnderline.triggered.connect(self.underline_text)
-        self.actionLeft.triggered.connect(self.align_left_text)
-        self.actionCenter.triggered.connect(self.align_center_text)
-        self.actionRight.triggered.connect(self.align_right_text)
-        self.actionJustify.triggered.connect(self.justify_text)
-        self.actionFont.triggered.connect(self.font_dialog)
-        self.actionColor.triggered.connect(self.color_dialog)
+        self.actionBold.triggered.connect(timed(self.bold_text))
+        self.actionItalic.triggered.connect(timed(self.italic_text))
+        self.actionUnderline.triggered.connect(timed(self.underline_text))
+        self.actionLeft.triggered.connect(timed(self.align_left_text))
+        self.actionCenter.triggered.connect(timed(self.align_center_text))
+        self.actionRight.triggered.connect(timed(self.align_right_text))
+        self.actionJustify.triggered.connect(timed(self.justify_text))
+        self.actionFont.triggered.connect(timed(self.font_dialog))
+        self.actionColor.triggered.connect(timed(self.color_dialog))
 
         # About menu actions
-        self.actionAbout_App.triggered.connect(self.about)
+        self.actionAbout_App.triggered.connect(timed(self.about))
+
+        # Actions that act on the text edit, disabled in large file mode and while the document is being loaded
+        self.textActions = [
+            self.actionSave, self.actionSave_As, self.actionFollow, self.actionPrint, self.actionPrint_Preview,
+            self.actionExport_PDF,
+            self.actionUndo, self.actionRedo, self.actionCut, self.actionCopy, self.actionPaste,
+            self.actionFind, self.actionReplace,
+            self.actionBold, self.actionItalic, self.actionUnderline, self.actionLeft, self.actionCenter,
+            self.actionRight, self.actionJustify, self.actionFont, self.actionColor, self.menuSyntax.menuAction(),
+        ]
+
+        # Tabs
+        self.tabBar.currentChanged.connect(timed(self.switch_tab))
+        self.tabBar.tabCloseRequested.connect(
+            timed(lambda index: self.close_tab(self.tabBar.tabData(index)), 'close_tab'))
+
+        # Crash-recovery journals, and the session, saved at the same pace
+        self.journalTimer.timeout.connect(timed(self.sync_journals))
+        self.journalTimer.timeout.connect(timed(self.save_session))
+        self.restoreTimer.timeout.connect(timed(self.restore_tabs))
+
+        # Background saves
+        self.saver.started.connect(timed(self.save_started))
+        self.saver.saved.connect(timed(self.save_finished))
+        self.saver.failed.connect(timed(self.save_failed))
+
+        # Changes made to the open files by other programs
+        self.watcher.appended.connect(timed(self.file_appended))
+        self.watcher.rewritten.connect(timed(self.file_rewritten))
+        self.watcher.removed.connect(timed(self.file_removed))
+
+    def tabs(self):
+        return [self.tabBar.tabData(index) for index in range(self.tabBar.count())]
+
+    def tab_index(self, tab):
+        return self.tabs().index(tab)
+
+    def new_tab(self, filename=None, activate=True, index=-1):
+        """
+        Add a tab for a document, and activate it unless `activate` is False.
+
+        Background tabs only hold the name of their file; the document is created and loaded
+        when the tab is first activated.
+
+        Parameters:
+            filename: The file of the document, or None for a new untitled document.
+            activate: Whether to switch to the new tab.
+            index: The position of the new tab, by default after the others.
+
+        Returns:
+            The new Tab.
+        """
+        tab = Tab(filename)
+
+        self.tabBar.blockSignals(True)
+        index = self.tabBar.insertTab(index, tab.title())
+        self.tabBar.setTabData(index, tab)
+        self.tabBar.setTabToolTip(index, filename or '')
+        self.tabBar.blockSignals(False)
+
+        if activate or self.tab is None:
+            self.activate_tab(tab)
+        return tab
+
+    def activate_tab(self, tab):
+        index = self.tab_index(tab)
+        if self.tabBar.currentIndex() != index:
+            self.tabBar.setCurrentIndex(index)
+        else:
+            self.switch_tab(index)
+
+    def switch_tab(self, index):
+        """
+        Show the document of the tab at `index` in the text edit widget, creating and loading it first if needed.
+        """
+        tab = self.tabBar.tabData(index) if index >= 0 else None
+        if tab is None or tab is self.tab:
+            return
+
+        if self.tab is not None:
+            self.save_view(self.tab)
+            if self.tab.largeView is not None:
+                self.tab.largeView.hide()
+
+        self.tab = tab
+        self.useCount += 1
+        tab.lastUsed = self.useCount
+
+        if tab.document is None:
+            self.create_document(tab)
+        self.show_tab(tab)
+        self.enforce_memory_budget()
+
+    def create_document(self, tab):
+        """
+        Create the QTextDocument of a tab and load its file into it, if it has one.
+        """
+        if tab.journal is None:
+            # Created with the document, so that background tabs cost nothing until they are loaded
+            tab.journal = EditJournal(self.recovery_dir(), self)
+
+        if tab.filename is not None:
+            self.load_file(tab.filename, tab)
+        else:
+            self.new_document(tab)
+            tab.journal.start()
+
+    def new_document(self, tab):
+        """
+        Give a tab a new, empty QTextDocument in place of the one it had, if any, highlighted as before.
+
+        A file is always loaded into a new document: once the text edit widget has laid a document out, every chunk
+        appended to it is laid out at once, which makes loading a file many times slower.
+        """
+        lexer = tab.highlighter.lexer if tab.highlighter is not None else lexer_for_filename(tab.filename)
+        if tab.document is not None:
+            tab.document.deleteLater()
+
+        tab.document = QTextDocument(self)
+        tab.document.setDefaultFont(self.textEdit.font())
+        tab.document.contentsChange.connect(partial(self.record_edit, tab))
+        tab.document.modificationChanged.connect(lambda: self.update_tab_title(tab))
+        tab.highlighter = SyntaxHighlighter(tab.document, self.textEdit, lexer)
+
+    def show_tab(self, tab):
+        """
+        Bring the widgets of the window in line with the current tab.
+        """
+        if tab.largeView is not None:
+            self.textEdit.hide()
+            tab.largeView.show()
+            tab.largeView.setFocus()
+        else:
+            # A document being loaded is only shown once loaded, so that it is not laid out chunk by chunk
+            self.textEdit.setDocument(tab.document if tab.loader is None else self.loadingDocument)
+            self.textEdit.setReadOnly(tab.loader is not None)
+            self.textEdit.show()
+            if tab.loader is None:
+                self.restore_view(tab)
+                tab.highlighter.update_view()
+
+        for action in self.textActions:
+            action.setEnabled(tab.largeView is None and tab.loader is None)
+        self.actionFollow.setEnabled(tab.largeView is None and tab.filename is not None)
+        self.actionFollow.setChecked(tab.follow)
+
+        self.loadProgress.setValue(tab.loadProgress)
+        self.loadProgress.setVisible(tab.loader is not None)
+        self.loadCancel.setVisible(tab.loader is not None)
+        self.formatLabel.setText(tab.textFormat.name())
+
+        if self.findDialog is not None:
+            self.findDialog.watch_document()
+
+        self.update_syntax_menu()
+        self.setWindowTitle(f'{tab.title()} - PyNotePad')
+
+    def save_view(self, tab):
+        # The view of a document being loaded, or whose view is still to be restored, is not shown yet
+        if tab.largeView is not None:
+            tab.scrollPosition = tab.largeView.first_line()
+        elif tab.document is not None and tab.loader is None and tab is not self.viewPending:
+            tab.cursorPosition = self.textEdit.textCursor().position()
+            tab.scrollPosition = self.textEdit.verticalScrollBar().value()
+
+    def restore_view(self, tab):
+        """
+        Move the cursor and the scroll bar of a tab back where they were, or to the end if it follows its file.
+
+        Either lays the document out up to there at once, so it is left to the next pass of the event loop, once the
+        document was painted, and skipped when they were at the start, as they are after a file was first loaded.
+        """
+        if tab.largeView is not None:
+            tab.largeView.goto_line(tab.scrollPosition)
+        elif tab.cursorPosition or tab.scrollPosition or tab.follow:
+            self.viewPending = tab
+            QTimer.singleShot(0, partial(self.restore_position, tab))
+
+    def restore_position(self, tab):
+        if tab is not self.viewPending:
+            return
+
+        self.viewPending = None
+        if tab is self.tab and tab.loader is None and tab.largeView is None:
+            cursor = QTextCursor(tab.document)
+            cursor.setPosition(min(tab.cursorPosition, tab.document.characterCount() - 1))
+            self.textEdit.setTextCursor(cursor)
+            self.textEdit.verticalScrollBar().setValue(tab.scrollPosition)
+            if tab.follow:
+                self.textEdit.moveCursor(QTextCursor.End)
+
+    def update_tab_title(self, tab):
+        if tab not in self.tabs():
+            return
+
+        index = self.tab_index(tab)
+        self.tabBar.setTabText(index, tab.title())
+        self.tabBar.setTabToolTip(index, tab.filename or '')
+        if tab is self.tab:
+            self.setWindowTitle(f'{tab.title()} - PyNotePad')
+
+    def file_filters(self):
+        """
+        Return the filters of the file dialogs: text files, native documents, then the files of each language that
+        can be highlighted.
+        """
+        filters = ['Text files (*.txt)', f'PyNotePad documents (*{NATIVE_SUFFIX})']
+        for lexer_class in LEXERS:
+            patterns = ' '.join(f'*.{extension}' for extension in lexer_class.extensions)
+            filters.append(f'{lexer_class.name} files ({patterns})')
+        filters.append('All files (*)')
+        return ';;'.join(filters)
+
+    def detect_syntax(self, tab):
+        """
+        Highlight the document of a tab as the language its file name says it is in, or as plain text.
+        """
+        lexer = lexer_for_filename(tab.filename)
+        if type(lexer) is not type(tab.highlighter.lexer):
+            tab.highlighter.set_lexer(lexer)
+            self.update_syntax_menu()
+
+    def select_syntax(self, action):
+        lexer_class = action.data()
+        self.tab.highlighter.set_lexer(lexer_class() if lexer_class is not None else None)
+
+    def update_syntax_menu(self):
+        if self.tab is None or self.tab.highlighter is None:
+            return
+
+        lexer_class = type(self.tab.highlighter.lexer) if self.tab.highlighter.lexer is not None else None
+        for action in self.syntaxGroup.actions():
+            action.setChecked(action.data() is lexer_class)
+
+    def memory_budget(self):
+        return QSettings().value('tabs/memoryBudget', self.MEMORY_BUDGET, type=int) * 1024 * 1024
+
+    def enforce_memory_budget(self):
+        """
+        Drop the documents of the least recently used background tabs until the open documents fit in
+        the memory budget. Only unmodified documents that can be reloaded from their file are dropped.
+        """
+        tabs = self.tabs()
+        total = sum(tab.memory_size() for tab in tabs)
+
+        for tab in sorted(tabs, key=lambda tab: tab.lastUsed):
+            if total <= self.memory_budget():
+                break
+            if tab is not self.tab and tab.is_evictable():
+                total -= tab.memory_size()
+                self.evict_document(tab)
+
+    def evict_document(self, tab):
+        # Reloaded from the file as it then is on the next activation
+        if tab.filename is not None:
+            self.watcher.unwatch(tab.filename)
+        tab.journal.stop()
+        tab.document.deleteLater()
+        tab.document = None
+        tab.highlighter = None
+
+    def close_file(self):
+        self.close_tab(self.tab)
+
+    def close_tab(self, tab):
+        """
+        Close a tab, prompting to save its document first if it was modified. Only then is the tab shown, and
+        the tab that was current before is shown again afterwards.
+
+        A document being saved is written in the background, so its tab is only closed once its file was written,
+        see save_finished. If the file cannot be written, the tab is kept open, along with its journal.
+
+        Returns:
+            True if the tab was closed or will be once its document is saved, False if the user cancelled.
+        """
+        if tab.closing:
+            return True
+
+        previous = self.tab
+        # A document being loaded is only modified by the load
+        if tab.document is not None and tab.loader is None and tab.document.isModified():
+            self.activate_tab(tab)
+            saved = self.maybe_save()
+            if previous is not tab and previous in self.tabs():
+                self.activate_tab(previous)
+            if not saved:
+                return False
+            if self.is_being_saved(tab):
+                tab.closing = True
+                return True
+
+        self.discard_tab(tab)
+        return True
+
+    def is_being_saved(self, tab):
+        """
+        Whether the document of a tab, as it is now, is being written to its file in the background.
+        """
+        return tab.filename is not None and self.saver.is_saving(tab.filename) \
+            and tab.document.isModified() and tab.saveRevision == tab.document.revision()
+
+    def discard_tab(self, tab):
+        """
+        Close a tab without prompting, and open a new untitled tab if it was the last one.
+        """
+        self.stop_load(tab)
+        self.close_large_file(tab)
+        if tab.journal is not None:
+            tab.journal.discard()
+        if tab.filename is not None:
+            self.watcher.unwatch(tab.filename)
+
+        if tab is self.tab:
+            self.tab = None
+        self.tabBar.removeTab(self.tab_index(tab))
+        if tab.document is not None:
+            tab.document.deleteLater()
+
+        if self.tabBar.count() == 0:
+            self.new_tab()
+        elif self.tab is None:
+            self.switch_tab(self.tabBar.currentIndex())
 
     def save_file(self):
         """
         Save the current file.
 
-        This function prompts the user to select a file to save.
-        If a file is selected, the function opens the file in write mode and writes the content of the text edit widget to it.
-        After the file is saved, a message box is displayed to inform the user that the file has been saved successfully.
+        If the document was opened from or already saved to a file, it is saved to that file again,
+        otherwise the user is prompted to select a file as with `save_file_as`.
+
+        Returns:
+            True if a save was started, False if the user cancelled the file dialog or the document is still being
+            loaded.
+        """
+        if self.tab.filename is None:
+            return self.save_file_as()
+
+        return self.write_file(self.tab.filename)
+
+    def save_file_as(self):
+        """
+        Prompt the user to select a file and save the document to it.
+
+        Returns:
+            True if a save was started, False if the user cancelled the file dialog or the document is still being
+            loaded.
+        """
+        if self.tab.loader is not None:
+            return False
+
+        filename = QFileDialog.getSaveFileName(self, 'Save File', '', self.file_filters())
+
+        if not filename[0]:
+            return False
+
+        if self.tab.filename is not None:
+            self.watcher.unwatch(self.tab.filename)
+        self.tab.filename = filename[0]
+        self.update_tab_title(self.tab)
+        self.detect_syntax(self.tab)
+        return self.write_file(self.tab.filename)
+
+    def write_file(self, filename):
+        """
+        Write a snapshot of the current document to a file in the background.
+
+        The text is captured immediately, so the user can keep editing while the FileSaver writes it, and it is
+        written with the encoding, byte order mark and line endings the file was read with. The file is replaced
+        atomically, and a save requested while the same file is still being written is coalesced with any other
+        pending save of that file instead of being queued. Native documents are saved with their formatting.
+
+        A document still being loaded is never written, since it only holds the start of its file.
 
         Parameters:
-            None
+            filename: The path of the file to write.
 
         Returns:
-            None
+            True if the save was started, False if the document is still being loaded.
         """
-        filename = QFileDialog.getSaveFileName(self, 'Save File', '', 'Text files (*.txt)')
+        if self.tab.loader is not None:
+            return False
+
+        self.tab.saving = True
+        self.tab.saveRevision = self.tab.document.revision()
+        self.tab.saveGeneration = self.tab.journal.checkpoint(filename)
+        if is_native(filename):
+            text_format = RichTextFormats.capture(self.tab.document)
+        else:
+            text_format = self.tab.textFormat
+        self.saver.save(filename, self.tab.document.toPlainText(), text_format)
+        return True
 
-        if filename[0]:
-            with open(filename[0], 'w', encoding='utf-8') as file:
-                file.write(self.textEdit.toPlainText())
-            QMessageBox.information(self, 'Save File', 'File saved successfully')
+    def save_started(self, filename):
+        self.statusbar.showMessage(f'Saving {QFileInfo(filename).fileName()}...')
+
+    def save_finished(self, filename):
+        """
+        Clear the modified flag if nothing was edited since the snapshot that was just written was taken, and close
+        the tab if it was waiting for the save to be closed.
+        """
+        for tab in self.tabs():
+            if tab.filename == filename and tab.document is not None and tab.saveGeneration is not None:
+                tab.saving = False
+                tab.journal.commit_reference(tab.saveGeneration, filename)
+                if tab.document.revision() == tab.saveRevision:
+                    tab.document.setModified(False)
+                self.watch_file(tab)
+                if tab.closing:
+                    # Edited again while it was being saved, it is not closed without asking
+                    tab.closing = False
+                    if not tab.document.isModified():
+                        self.discard_tab(tab)
+        if self.findInFiles is not None:
+            self.findInFiles.file_saved(filename)
+        self.statusbar.showMessage(f'Saved {QFileInfo(filename).fileName()}', 3000)
+
+    def save_failed(self, filename, message):
+        """
+        Report a file that could not be written. Unless a newer snapshot of its document is being written, its tab
+        is no longer saving, and stays open if it was closed after asking to save it.
+        """
+        for tab in self.tabs():
+            if tab.filename == filename and not self.saver.is_saving(filename):
+                tab.saving = tab.closing = False
+        self.statusbar.clearMessage()
+        QMessageBox.warning(self, 'Save File', f'Unable to save {QFileInfo(filename).fileName()}:\n{message}')
 
     def maybe_save(self):
         """
@@ -73,7 +1204,7 @@ class NotePadWindow(QMainWindow, Ui_MainWindow):
         and based on the user's choice, it either saves the file using the save_file method
         or cancels the operation. Returns True if the operation completes successfully.
         """
-        if not self.textEdit.document().isModified():
+        if not self.tab.document.isModified():
             return True
 
         ret = QMessageBox.warning(
@@ -84,40 +1215,337 @@ class NotePadWindow(QMainWindow, Ui_MainWindow):
         )
 
         if ret == QMessageBox.Save:
-            self.save_file()
+            return self.save_file()
         if ret == QMessageBox.Cancel:
             return False
         return True
 
     def new_file(self):
         """
-        Clears the text in the textEdit widget if the user chooses to save any changes.
+        Opens a new untitled document in a new tab.
+        """
+        self.new_tab()
 
-        This function first checks if there are any changes made to the text in the textEdit widget.
-        If there are changes, it prompts the user with a warning message asking if they want to save their changes.
-        If the user chooses to save their changes, the function calls the `save_file` method to save the file.
-        If the user chooses not to save their changes or cancels the operation, the function continues without saving the file.
-        Regardless of the user's choice, the function clears the text in the textEdit widget.
+    def open_file(self):
+        """
+        A function that opens a file dialog to select files to open, each in its own tab.
+        The first file is loaded and shown, the others are only loaded when their tab is activated.
+        """
+        filenames, _ = QFileDialog.getOpenFileNames(self, 'Open File', '', self.file_filters())
+
+        for number, filename in enumerate(filenames):
+            self.open_document(filename, activate=number == 0)
+
+    def open_files(self, filenames):
+        """
+        Open files given on the command line, of this launch or of a later one, and bring the window to the front.
+        The first file is shown, the others are opened in background tabs.
 
         Parameters:
-            None
+            filenames: The paths of the files to open.
+        """
+        for number, filename in enumerate(filenames):
+            self.open_document(os.path.abspath(filename), activate=number == 0)
+
+        if self.isMinimized():
+            self.showNormal()
+        self.raise_()
+        self.activateWindow()
+
+    def open_document(self, filename, activate=True):
+        """
+        Open a file in a tab.
+
+        If the file is already open, its tab is used. Otherwise, the current tab is reused if it is blank,
+        or a new tab is added.
+
+        Parameters:
+            filename: The path of the file to open.
+            activate: Whether to switch to the tab of the file. Background tabs are loaded lazily.
 
         Returns:
-            None
+            The Tab of the file.
         """
-        if self.maybe_save():
-            self.textEdit.clear()
+        path = os.path.realpath(filename)
+        for tab in self.tabs():
+            if tab.filename is not None and os.path.realpath(tab.filename) == path:
+                if activate:
+                    self.activate_tab(tab)
+                return tab
 
-    def open_file(self):
+        if activate and self.tab is not None and self.tab.is_blank():
+            tab = self.tab
+            tab.filename = filename
+            self.update_tab_title(tab)
+            self.detect_syntax(tab)
+            self.load_file(filename, tab)
+            return tab
+
+        return self.new_tab(filename, activate)
+
+    def load_file(self, filename, tab):
+        """
+        Load a file into the document of a tab without blocking the GUI.
+
+        The file is read and decoded in chunks by a FileLoader worker thread, and each chunk is appended
+        to the end of a new document as it arrives. The document is only shown once loaded, and undo is disabled
+        for the duration of the load. Progress is shown in the status bar along with a button to cancel.
+        Files of LARGE_FILE_SIZE bytes or more are opened in large file mode instead, unless they are in UTF-16
+        or UTF-32, whose lines cannot be found without decoding them, or native documents, whose formatting is
+        restored once their text has been loaded.
+
+        Parameters:
+            filename: The path of the file to load.
+            tab: The Tab to load the file into.
+        """
+        self.stop_load(tab)
+        self.close_large_file(tab)
+        tab.journal.stop()
+        self.watcher.unwatch(filename)
+        self.new_document(tab)
+
+        try:
+            size = os.path.getsize(filename)
+            text_format = sniff_file(filename) if size >= self.LARGE_FILE_SIZE and not is_native(filename) else None
+        except OSError as error:
+            QMessageBox.warning(self, 'Open File', f'Unable to open file:\n{error}')
+            self.discard_tab(tab)
+            return
+
+        if text_format is not None and text_format.is_ascii_compatible():
+            self.open_large_file(filename, tab, text_format)
+            return
+
+        tab.document.setUndoRedoEnabled(False)
+        tab.loadProgress = 0
+
+        loader = tab.loader = FileLoader(filename, tab.formatHint, parent=self)
+        tab.formatHint = None
+        loader.decoding.connect(partial(self.set_text_format, tab, loader))
+        loader.chunk_loaded.connect(partial(self.append_chunk, tab, loader))
+        loader.formats_loaded.connect(partial(self.set_rich_text, tab, loader))
+        loader.progress.connect(partial(self.update_load_progress, tab, loader))
+        loader.failed.connect(partial(self.load_failed, tab, loader))
+        loader.finished.connect(partial(self.load_finished, tab, loader))
+
+        if tab is self.tab:
+            self.show_tab(tab)
+            self.statusbar.showMessage(f'Loading {QFileInfo(filename).fileName()}...')
+        loader.start()
+
+    def set_text_format(self, tab, loader, text_format):
+        """
+        Record the format the file of a tab is being decoded in. If the loader started over in another encoding,
+        the text it had appended in the previous one is dropped.
+
+        Parameters:
+            tab: The Tab being loaded.
+            loader: The FileLoader decoding the file.
+            text_format: The TextFormat of the file.
+        """
+        if tab.loader is loader:
+            if not tab.document.isEmpty():
+                tab.document.clear()
+            tab.textFormat = text_format
+            if tab is self.tab:
+                self.formatLabel.setText(text_format.name())
+
+    def append_chunk(self, tab, loader, text):
+        """
+        Append a chunk of text streamed by the loader to the end of the document of its tab.
+
+        Parameters:
+            tab: The Tab being loaded.
+            loader: The FileLoader that read the chunk.
+            text: The decoded chunk of text.
+        """
+        if tab.loader is loader and not loader.isInterruptionRequested():
+            cursor = QTextCursor(tab.document)
+            cursor.movePosition(QTextCursor.End)
+            if tab.richText is None:
+                cursor.insertText(text)
+            else:
+                # Formatted in the same edit as it is inserted, so that the chunk is laid out only once
+                cursor.beginEditBlock()
+                cursor.insertText(text, QTextCharFormat())
+                tab.richText.apply(tab.document, cursor.position())
+                cursor.endEditBlock()
+        loader.chunk_consumed()
+
+    def set_rich_text(self, tab, loader, formats):
+        """
+        Keep the formats of a native document being loaded, to restore its formatting as its text is appended.
+
+        Parameters:
+            tab: The Tab being loaded.
+            loader: The FileLoader reading the document.
+            formats: The RichTextFormats of the document.
+        """
+        if tab.loader is loader:
+            tab.richText = formats
+
+    def update_load_progress(self, tab, loader, done, total):
+        if tab.loader is loader:
+            tab.loadProgress = int(done * 100 / total) if total else 100
+            if tab is self.tab:
+                self.loadProgress.setValue(tab.loadProgress)
+
+    def load_failed(self, tab, loader, message):
+        if tab.loader is loader:
+            self.end_load(tab)
+            if tab.recoveredText is not None:
+                # The changes recovered for the file are kept in its tab instead
+                self.set_recovered_text(tab, tab.recoveredText)
+                tab.recoveredText = None
+            else:
+                self.discard_tab(tab)
+            QMessageBox.warning(self, 'Open File', f'Unable to open file:\n{message}')
+            self.preload_next()
+
+    def load_finished(self, tab, loader):
+        if tab.loader is loader:
+            if tab.richText is not None:
+                # The runs that reach the end of the text
+                tab.richText.apply(tab.document)
+            self.end_load(tab)
+            tab.journal.start(tab.filename)
+            self.watch_file(tab, loader.size)
+            if tab.recoveredText is not None:
+                self.apply_recovered_text(tab, tab.recoveredText)
+                tab.recoveredText = None
+            if tab is self.tab:
+                self.statusbar.showMessage(f'Loaded {QFileInfo(tab.filename).fileName()}', 3000)
+            if tab.pendingSelection is not None:
+                self.select_line(tab, *tab.pendingSelection)
+            self.enforce_memory_budget()
+            self.preload_next()
+
+    def cancel_load(self):
         """
-        A function that opens a file dialog to select a file to open, reads the content of the selected file,
-        and sets the content to the text edit widget.
+        Stop loading the file of the current tab, and close the tab.
         """
-        filename = QFileDialog.getOpenFileName(self, 'Open File', '', 'Text files (*.txt)')
+        if self.tab.loader is not None:
+            self.stop_load(self.tab)
+            self.discard_tab(self.tab)
+            self.statusbar.showMessage('Loading cancelled', 3000)
 
-        if filename[0]:
-            with open(filename[0], 'r', encoding='utf-8') as file:
-                self.textEdit.setText(file.read())
+    def stop_load(self, tab):
+        """
+        Stop the background load of a tab, if any, and wait for the worker thread to exit.
+        """
+        if tab.loader is not None:
+            tab.loader.cancel()
+            tab.loader.wait()
+            self.end_load(tab)
+
+    def end_load(self, tab):
+        """
+        Restore the document of a tab once its loader thread has stopped, whether it completed, failed or was cancelled.
+        """
+        tab.loader = None
+        tab.richText = None
+        tab.document.setUndoRedoEnabled(True)
+        tab.document.setModified(False)
+        if tab is self.tab:
+            self.show_tab(tab)
+
+    def watch_file(self, tab, size=None):
+        """
+        Watch the file of a tab for changes made by other programs, from the state it was read or saved in.
+
+        Parameters:
+            tab: The Tab whose file to watch.
+            size: The number of bytes of the file the document holds, by default the current size of the file.
+        """
+        try:
+            # Native documents are archives, any change to them is a rewrite
+            self.watcher.watch(tab.filename, None if is_native(tab.filename) else tab.textFormat, size)
+        except OSError:
+            pass
+
+    def watched_tabs(self, filename):
+        """
+        Return the tabs whose loaded documents are those of a file, unless the application is saving it.
+        """
+        if self.saver.is_saving(filename):
+            return []
+        return [tab for tab in self.tabs()
+                if tab.filename == filename and tab.document is not None and tab.loader is None]
+
+    def file_appended(self, filename, text):
+        """
+        Append the text another program appended to a file to the documents open on it.
+
+        The documents stay unmodified, since they still match their file, and the tabs that follow their file are
+        scrolled to the end. As when a file is reloaded, the undo history starts over, so that undoing cannot remove
+        the text of the other program. A document with unsaved changes is not touched, the user is asked what to do
+        instead.
+        """
+        for tab in self.watched_tabs(filename):
+            if tab.document.isModified():
+                self.file_conflict(tab)
+                continue
+
+            # The journal starts over from the file, which the document matches again once the text is appended
+            tab.journal.stop()
+            cursor = QTextCursor(tab.document)
+            cursor.movePosition(QTextCursor.End)
+            tab.document.setUndoRedoEnabled(False)
+            cursor.insertText(text)
+            tab.document.setUndoRedoEnabled(True)
+            tab.document.setModified(False)
+            tab.journal.start(tab.filename)
+
+            if tab.follow and tab is self.tab:
+                self.textEdit.moveCursor(QTextCursor.End)
+
+    def file_rewritten(self, filename):
+        """
+        Reload the documents open on a file that another program rewrote, or ask what to do if they have unsaved
+        changes.
+        """
+        for tab in self.watched_tabs(filename):
+            if tab.document.isModified():
+                self.file_conflict(tab)
+            else:
+                self.reload_file(tab)
+
+    def file_removed(self, filename):
+        # The documents no longer have a file to match, closing them prompts to save them
+        tabs = self.watched_tabs(filename)
+        for tab in tabs:
+            tab.document.setModified(True)
+        if tabs:
+            self.statusbar.showMessage(f'{QFileInfo(filename).fileName()} was deleted or moved by another program')
+
+    def file_conflict(self, tab):
+        """
+        Ask whether to reload a document with unsaved changes whose file was changed by another program, losing
+        the changes, or to keep them, in which case the file is overwritten on the next save. The file is not
+        watched until then.
+        """
+        self.watcher.unwatch(tab.filename)
+        name = QFileInfo(tab.filename).fileName()
+        answer = QMessageBox.question(
+            self, 'File Changed',
+            f'{name} was changed by another program, and it has unsaved changes here.\n\n'
+            f'Reload it from the file and lose your changes?',
+            QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
+        if answer == QMessageBox.Yes:
+            self.reload_file(tab)
+
+    def reload_file(self, tab):
+        """
+        Load the file of a tab again, keeping the cursor and scroll positions.
+        """
+        if tab is self.tab:
+            self.save_view(tab)
+        self.load_file(tab.filename, tab)
+
+    def follow_file(self, checked):
+        self.tab.follow = checked
+        if checked and self.tab.largeView is None:
+            self.textEdit.moveCursor(QTextCursor.End)
 
     def print_file(self):
         """
@@ -126,8 +1554,10 @@ class NotePadWindow(QMainWindow, Ui_MainWindow):
         This function opens a print dialog and allows the user to select a printer and configure the printing settings.
         If the user accepts the dialog, the contents of the textEdit widget are printed using the selected printer.
         """
-        printer = QPrinter(QPrinter.HighResolution)
-        dialog = QPrintDialog(printer)
+        from PyQt5.QtPrintSupport import QPrintDialog
+
+        printer = self.default_printer()
+        dialog = QPrintDialog(printer, self)
 
         if dialog.exec_() == QPrintDialog.Accepted:
             self.textEdit.print(printer)
@@ -136,24 +1566,91 @@ class NotePadWindow(QMainWindow, Ui_MainWindow):
         """
         Opens a print preview dialog for the current text in the textEdit widget.
 
-        This function creates a QPrinter object with high resolution and assigns it to the `printer` variable.
-        Then, it creates a QPrintPreviewDialog object with the `printer` and `self` as arguments and assigns it to the `preview_dialog` variable.
-        The `paintRequested` signal of the `preview_dialog` is connected to the `print_preview` method.
-        Finally, the `exec_` method of the `preview_dialog` is called to display the print preview dialog.
+        The document is paginated on a worker thread and its pages are only rendered as they scroll into view,
+        so the window stays responsive on long documents. See PrintPreviewDialog.
         """
-        printer = QPrinter(QPrinter.HighResolution)
-        preview_dialog = QPrintPreviewDialog(printer, self)
-        preview_dialog.paintRequested.connect(self.print_preview)
-        preview_dialog.exec_()
+        dialog = PrintPreviewDialog(self, self.default_printer())
+        dialog.exec_()
+        dialog.deleteLater()
 
-    def print_preview(self, printer):
+    def default_printer(self):
+        """
+        Return the printer used to print and preview documents, created on first use so that its settings
+        are kept from one print to the next.
         """
-        A function that prints a preview of the text in the textEdit widget using the provided printer.
+        if self.printer is None:
+            from PyQt5.QtPrintSupport import QPrinter
 
-        Parameters:
-            printer: The printer object to use for printing the text.
+            self.printer = QPrinter(QPrinter.HighResolution)
+        return self.printer
+
+    def page_layout_key(self, printer):
+        document = self.textEdit.document()
+        return document, document.revision(), document.defaultFont().key(), printer_settings(printer)
+
+    def page_renderer(self):
+        """
+        Return the PageRenderer worker thread that paginates documents for print preview, started on first use.
+        """
+        if self.pageRenderer is None:
+            self.pageRenderer = PageRenderer(self)
+            self.pageRenderer.paginated.connect(self.paginated)
+            self.pageRenderer.failed.connect(self.pagination_failed)
+            self.pageRenderer.cancelled.connect(self.pagination_cancelled)
+            self.pageRenderer.start()
+        return self.pageRenderer
+
+    def page_layout(self, printer):
+        """
+        Return the PageLayout of the current revision of the document for the settings of `printer`,
+        or None if it was not paginated yet.
+        """
+        key = self.page_layout_key(printer)
+        if key in self.pageLayouts:
+            self.pageLayouts.move_to_end(key)
+        return self.pageLayouts.get(key)
+
+    def paginate(self, printer):
+        """
+        Start paginating the current revision of the document for the settings of `printer` in the background,
+        unless it is already paginated or being paginated. Once done, the layout is available from `page_layout`.
+
+        Returns:
+            The key of the layout, as used by the signals of the PageRenderer.
+        """
+        key = self.page_layout_key(printer)
+        if key in self.paginating:
+            # Resumed if it was cancelled, see pagination_cancelled
+            self.paginating[key].cancelled = False
+        elif key not in self.pageLayouts:
+            self.paginating[key] = PageLayout(self.textEdit.document(), printer)
+            self.page_renderer().paginate(key, self.paginating[key])
+        return key
+
+    def cancel_pagination(self, key):
+        """
+        Stop paginating the layout with this key, if it is being paginated, unless `paginate` asks for it again
+        before the PageRenderer gets to it.
         """
-        self.textEdit.print(printer)
+        if key in self.paginating:
+            self.paginating[key].cancelled = True
+
+    def paginated(self, key):
+        self.pageLayouts[key] = self.paginating.pop(key)
+        while len(self.pageLayouts) > self.PAGE_LAYOUT_CACHE:
+            old_key, _ = self.pageLayouts.popitem(last=False)
+            self.pageRenderer.release(old_key)
+
+    def pagination_failed(self, key):
+        del self.paginating[key]
+
+    def pagination_cancelled(self, key):
+        layout = self.paginating[key]
+        if layout.cancelled:
+            del self.paginating[key]
+        else:
+            # Asked for again after it was stopped: paginated from the start
+            self.pageRenderer.paginate(key, layout)
 
     def export_pdf(self):
         """
@@ -167,13 +1664,502 @@ class NotePadWindow(QMainWindow, Ui_MainWindow):
         filename, _ = QFileDialog.getSaveFileName(self, 'Export PDF', '', '.pdf')
 
         if filename and filename != "":
-            if QFileInfo(filename).suffix() == "":
-                filename += ".pdf"
+            from core.pdf_export import pdf_filename
+
+            self.write_pdf(pdf_filename(filename))
+
+    def write_pdf(self, filename):
+        """
+        Render the current document to a PDF file.
+
+        Parameters:
+            filename: The path of the PDF file to write.
+        """
+        from core.pdf_export import pdf_printer
+
+        with profiler.span('write_pdf', 'io', file=filename):
+            self.textEdit.document().print(pdf_printer(filename))
+
+    def export_trace(self):
+        """
+        Save the events recorded by the profiler to a file in the Chrome trace event format.
+        """
+        filename, _ = QFileDialog.getSaveFileName(self, 'Export Performance Trace', 'trace.json', 'Trace (*.json)')
 
-            printer = QPrinter(QPrinter.HighResolution)
-            printer.setOutputFormat(QPrinter.PdfFormat)
-            printer.setOutputFileName(filename)
-            self.textEdit.document().print(printer)
+        if filename:
+            try:
+                profiler.export_trace(filename)
+            except OSError as error:
+                QMessageBox.warning(self, 'Export Performance Trace', f'Unable to export the trace:\n{error}')
+
+    def open_large_file(self, filename, tab, text_format):
+        """
+        Open a file read-only in large file mode.
+
+        The file is memory-mapped and a LargeFileView replaces the text edit widget for the tab; it only decodes
+        the lines currently on screen, so memory use does not depend on the size of the file. The line index is
+        built by a LineIndexer worker thread, and the view can be scrolled while it is running.
+
+        Parameters:
+            filename: The path of the file to open.
+            tab: The Tab to open the file in.
+            text_format: The TextFormat of the file, detected from its first bytes.
+        """
+        try:
+            index = LineIndex(filename, encoding=text_format.encoding, start=len(text_format.bom_bytes()))
+        except OSError as error:
+            QMessageBox.warning(self, 'Open File', f'Unable to open file:\n{error}')
+            self.discard_tab(tab)
+            return
+
+        tab.textFormat = text_format
+        tab.largeView = LargeFileView(index, self.centralwidget)
+        tab.largeView.setFont(self.textEdit.font())
+        tab.largeView.hide()
+        self.verticalLayout.addWidget(tab.largeView)
+
+        tab.indexer = LineIndexer(index, self)
+        tab.indexer.progress.connect(partial(self.update_index_progress, tab))
+        tab.indexer.start()
+
+        if tab is self.tab:
+            self.show_tab(tab)
+
+    def update_index_progress(self, tab, line_count):
+        if tab.largeView is None:
+            return
+
+        tab.largeView.update_scrollbars()
+        if tab is self.tab:
+            name = QFileInfo(tab.filename).fileName()
+            if tab.largeView.index.complete:
+                self.statusbar.showMessage(f'{name}: {line_count} lines (read-only)')
+            else:
+                self.statusbar.showMessage(f'{name}: indexing, {line_count} lines so far (read-only)')
+
+    def close_large_file(self, tab):
+        """
+        Leave large file mode for a tab, if active.
+        """
+        if tab.largeView is None:
+            return
+
+        tab.indexer.requestInterruption()
+        tab.indexer.wait()
+        tab.indexer = None
+        tab.largeView.index.close()
+        tab.largeView.deleteLater()
+        tab.largeView = None
+        if tab is self.tab:
+            self.statusbar.clearMessage()
+            self.show_tab(tab)
+
+    def find_dialog(self):
+        """
+        Show the Find and Replace dialog, with the current selection as the query.
+        """
+        if self.findDialog is None:
+            self.findDialog = FindDialog(self.textEdit, self)
+
+        selection = self.textEdit.textCursor().selectedText()
+        if selection and ' ' not in selection:
+            self.findDialog.findEdit.setText(selection)
+        if self.sender() is self.actionReplace:
+            self.findDialog.replaceEdit.setFocus()
+        else:
+            self.findDialog.findEdit.setFocus()
+        self.findDialog.findEdit.selectAll()
+        self.findDialog.show()
+        self.findDialog.raise_()
+        self.findDialog.activateWindow()
+
+    def find_in_files(self):
+        """
+        Show the Find in Files panel, with the current selection as the query.
+        """
+        if self.findInFiles is None:
+            self.findInFiles = FindInFilesPanel(self)
+            self.addDockWidget(Qt.LeftDockWidgetArea, self.findInFiles)
+
+        selection = self.textEdit.textCursor().selectedText()
+        if selection and '\u2029' not in selection:
+            self.findInFiles.queryEdit.setText(selection)
+        self.findInFiles.show()
+        self.findInFiles.raise_()
+        self.findInFiles.queryEdit.setFocus()
+        self.findInFiles.queryEdit.selectAll()
+
+    def index_dir(self):
+        return os.path.join(QStandardPaths.writableLocation(QStandardPaths.AppDataLocation), 'index')
+
+    def open_at(self, filename, line, column=0, length=0):
+        """
+        Open a file and select text on one of its lines, once it is loaded if it is being loaded.
+
+        Parameters:
+            filename: The path of the file to open.
+            line: The 0-based number of the line.
+            column: The position of the text in the line.
+            length: The length of the text to select.
+        """
+        tab = self.open_document(filename)
+        if tab not in self.tabs():
+            return
+        if tab.loader is not None:
+            tab.pendingSelection = line, column, length
+        else:
+            self.select_line(tab, line, column, length)
+
+    def select_line(self, tab, line, column=0, length=0):
+        tab.pendingSelection = None
+        if tab.largeView is not None:
+            tab.largeView.goto_line(line)
+            return
+
+        block = tab.document.findBlockByNumber(min(line, tab.document.blockCount() - 1))
+        cursor = QTextCursor(block)
+        if column + length <= block.length() - 1:
+            cursor.setPosition(block.position() + column)
+            cursor.setPosition(block.position() + column + length, QTextCursor.KeepAnchor)
+        if tab is self.tab:
+            self.textEdit.setTextCursor(cursor)
+            self.textEdit.ensureCursorVisible()
+            self.textEdit.setFocus()
+        else:
+            tab.cursorPosition = cursor.position()
+
+    def goto_line(self):
+        """
+        Prompt for a line number and move to that line, in the text edit widget or in the large file view.
+        """
+        largeView = self.tab.largeView
+        if largeView is not None:
+            current, count = largeView.first_line(), largeView.index.line_count
+        else:
+            current, count = self.textEdit.textCursor().blockNumber(), self.textEdit.document().blockCount()
+
+        number, ok = QInputDialog.getInt(self, 'Go to Line', 'Line number:', current + 1, 1, max(count, 1))
+
+        if ok:
+            if largeView is not None:
+                largeView.goto_line(number - 1)
+            else:
+                cursor = QTextCursor(self.textEdit.document().findBlockByNumber(number - 1))
+                self.textEdit.setTextCursor(cursor)
+                self.textEdit.ensureCursorVisible()
+
+    def recovery_dir(self):
+        return os.path.join(QStandardPaths.writableLocation(QStandardPaths.AppDataLocation), 'recovery')
+
+    def record_edit(self, tab, position, removed, added):
+        """
+        Append an edit of the document of a tab to its crash-recovery journal.
+
+        Only the inserted text is read back from the document, so the cost of recording an edit
+        depends on the size of that edit and not on the size of the document.
+
+        Parameters:
+            tab: The Tab whose document was edited.
+            position: The position of the edit in the document, in UTF-16 code units like all document positions.
+            removed: The number of UTF-16 code units removed.
+            added: The number of UTF-16 code units inserted.
+        """
+        if not tab.journal.active:
+            return
+
+        document = tab.document
+        cursor = QTextCursor(document)
+        cursor.setPosition(position)
+        cursor.setPosition(min(position + added, document.characterCount() - 1), QTextCursor.KeepAnchor)
+        text = cursor.selectedText().replace('\u2029', '\n').replace('\u2028', '\n')
+        tab.journal.record(position, removed, text)
+
+    def sync_journals(self):
+        """
+        Flush the crash-recovery journals to disk, and compact those that have grown large compared to their document.
+        """
+        for tab in self.tabs():
+            if tab.journal is None or not tab.journal.active:
+                continue
+
+            tab.journal.sync()
+            if tab.journal.size > max(self.JOURNAL_COMPACT_SIZE, tab.document.characterCount() // 4):
+                tab.journal.compact(tab.document.toPlainText())
+
+    def session_file(self):
+        return os.path.join(QStandardPaths.writableLocation(QStandardPaths.AppDataLocation), 'session.json')
+
+    def save_session(self):
+        """
+        Save the files open in tabs, the format they were read in, and their cursor and scroll positions, to be
+        reopened by restore_session on the next launch. The session file is only written if it would change.
+        """
+        if self.tab is not None:
+            self.save_view(self.tab)
+
+        # The tabs of the last session that were not added back yet keep their place around the current one
+        documents = [document for document, before in self.restoreQueue if before]
+        current = None
+        for tab in self.tabs():
+            if tab.filename is None:
+                continue
+            if tab is self.tab:
+                current = len(documents)
+            documents.append(SessionDocument(
+                tab.filename, tab.textFormat, tab.cursorPosition, tab.scrollPosition, tab.lastUsed, tab.follow))
+        documents += [document for document, before in self.restoreQueue if not before]
+
+        state = [document.to_json() for document in documents], current
+        if state != self.savedSession:
+            try:
+                write_session(self.session_file(), documents, current)
+            except OSError:
+                return
+            self.savedSession = state
+
+    def restore_session(self):
+        """
+        Reopen the files of the last session in tabs, with their cursor and scroll positions.
+
+        Only the session file is read before the window is usable, and only the tab that was current is added
+        at once; it is loaded in the background like any file. The other tabs are added once it is loaded, on the
+        following passes of the event loop, a slice of RESTORE_SLICE at a time, since adding a tab takes longer
+        the more there are. Their documents are then loaded one after the other in the background, most recently
+        used first, see preload_next. Files already opened from the command line keep their tab, and stay current.
+        """
+        documents, current = read_session(self.session_file())
+        if not documents:
+            return
+
+        newest = max(document.last_used for document in documents)
+        if current is None:
+            current = [document.last_used for document in documents].index(newest)
+        for document in documents:
+            # Older than anything used in this session, in the same order
+            document.last_used -= newest
+
+        self.restoredPaths = {os.path.realpath(tab.filename) for tab in self.tabs() if tab.filename is not None}
+        blank = self.tab if self.tab.is_blank() else None
+        self.restoreAnchor = self.restore_tab(documents[current])
+        if blank is not None and self.restoreAnchor is not None:
+            # In place of the untitled tab the window starts with
+            self.activate_tab(self.restoreAnchor)
+            self.discard_tab(blank)
+
+        self.restoreQueue = [(document, number < current) for number, document in enumerate(documents)
+                             if number != current]
+        self.preload_next()
+
+    def restore_tab(self, document, index=-1):
+        """
+        Add a background tab for a document of the restored session, unless its file is open already.
+
+        Returns:
+            The new Tab, or None if the file was open.
+        """
+        path = os.path.realpath(document.filename)
+        if path in self.restoredPaths:
+            return None
+        self.restoredPaths.add(path)
+
+        tab = self.new_tab(document.filename, activate=False, index=index)
+        tab.textFormat = tab.formatHint = document.text_format
+        tab.cursorPosition = document.cursor
+        tab.scrollPosition = document.scroll
+        tab.follow = document.follow
+        tab.lastUsed = document.last_used
+        self.preloadQueue.append(tab)
+        return tab
+
+    def restore_tabs(self):
+        """
+        Add the next tabs of the restored session, then start loading their documents once they are all added.
+        """
+        started = time.perf_counter()
+        while self.restoreQueue and time.perf_counter() - started < self.RESTORE_SLICE:
+            document, before = self.restoreQueue.pop(0)
+            anchor = self.restoreAnchor
+            self.restore_tab(document, self.tab_index(anchor) if before and anchor in self.tabs() else -1)
+
+        if self.restoreQueue:
+            self.restoreTimer.start(0)
+            return
+        self.restoreAnchor = None
+        self.restoredPaths = set()
+        self.preloadQueue.sort(key=lambda tab: tab.lastUsed, reverse=True)
+        self.preload_next()
+
+    def preload_next(self):
+        """
+        Load the document of the next tab of the restored session in the background, unless a file is being
+        loaded already, in which case this is called again once it is.
+
+        Documents are loaded in the order they were last used, for as long as they fit in the memory budget.
+        Large files are left to be opened when their tab is activated, and tabs of files that no longer exist
+        are closed.
+        """
+        if any(tab.loader is not None for tab in self.tabs()):
+            return
+        if self.restoreQueue:
+            # The tabs of the session are all added before their documents are loaded
+            self.restoreTimer.start(0)
+            return
+
+        total = sum(tab.memory_size() for tab in self.tabs())
+        while self.preloadQueue:
+            tab = self.preloadQueue.pop(0)
+            if tab not in self.tabs() or tab.document is not None:
+                continue
+            try:
+                size = os.path.getsize(tab.filename)
+            except OSError:
+                self.discard_tab(tab)
+                self.statusbar.showMessage(f'{tab.filename} no longer exists', 3000)
+                continue
+            if size >= self.LARGE_FILE_SIZE:
+                continue
+            if total + size * Tab.BYTES_PER_CHARACTER > self.memory_budget():
+                self.preloadQueue = []
+                return
+
+            self.create_document(tab)
+            return
+
+    def recover_session(self):
+        """
+        Offer to recover the unsaved changes of sessions that did not exit cleanly.
+
+        The journals left by crashed sessions are replayed, most recent first, and those holding unsaved changes
+        are offered to the user in turn; each one restored is opened in its own tab. Replayed journals are deleted.
+        """
+        for directory, lock in EditJournal.orphans(self.recovery_dir()):
+            recovered = EditJournal.recover(directory)
+
+            if recovered is not None:
+                filename, text = recovered
+                name = QFileInfo(filename).fileName() if filename else 'an untitled document'
+                ret = QMessageBox.question(
+                    self, 'Recover',
+                    "PyNotePad did not exit cleanly.\n"
+                    f"Do you want to recover your unsaved changes to {name} ?"
+                )
+
+                if ret == QMessageBox.Yes:
+                    self.recover_changes(filename, text)
+
+            lock.unlock()
+            shutil.rmtree(directory, ignore_errors=True)
+
+    def recover_changes(self, filename, text):
+        """
+        Open the unsaved changes recovered from a journal.
+
+        The changes to a file that can still be loaded are applied to its tab, the one it was restored in if any,
+        once the file is loaded: the document keeps the encoding, line endings and formatting of the file, and the
+        file is watched as usual. Otherwise the recovered text is opened in a tab of its own.
+
+        Parameters:
+            filename: The file the changes were made to, or None for an untitled document.
+            text: The recovered text of the document.
+        """
+        if filename is not None:
+            # Not restored again by the session, whose tabs may still be being added
+            self.restoredPaths.add(os.path.realpath(filename))
+            try:
+                loadable = is_native(filename) or os.path.getsize(filename) < self.LARGE_FILE_SIZE
+            except OSError:
+                loadable = False
+            if loadable:
+                tab = self.open_document(filename)
+                if tab.loader is None and tab.document is not None:
+                    self.apply_recovered_text(tab, text)
+                else:
+                    tab.recoveredText = text
+                return
+
+        tab = self.tab if self.tab.is_blank() else self.new_tab()
+        tab.filename = filename
+        self.set_recovered_text(tab, text)
+
+    def set_recovered_text(self, tab, text):
+        """
+        Replace the document of a tab by recovered text, when the file it was recovered from cannot be loaded.
+        """
+        if tab.filename is not None:
+            try:
+                tab.textFormat = sniff_file(tab.filename)
+            except OSError:
+                pass
+        tab.journal.stop()
+        tab.document.setPlainText(text)
+        tab.document.setModified(True)
+        tab.journal.start(tab.filename, text)
+        self.update_tab_title(tab)
+        if tab.filename is not None:
+            self.watch_file(tab)
+
+    def apply_recovered_text(self, tab, text):
+        """
+        Bring a document loaded from its file in line with the text recovered for it, in one edit that can be undone.
+
+        Only the text between the start and the end the document and the recovered text have in common is
+        replaced, so that the formatting of a native document is kept around the changes.
+        """
+        current = tab.document.toRawText().replace('\u2029', '\n')
+        start = len(os.path.commonprefix([current, text]))
+        end = len(os.path.commonprefix([current[start:][::-1], text[start:][::-1]]))
+        utf16 = utf16_positions(current)
+        cursor = QTextCursor(tab.document)
+        cursor.setPosition(utf16(start))
+        cursor.setPosition(utf16(len(current) - end), QTextCursor.KeepAnchor)
+        cursor.insertText(text[start:len(text) - end])
+
+    def save_modified(self):
+        """
+        Prompt to save each document with unsaved changes before the window closes, and wait for the saves.
+
+        Returns:
+            True if the window can close. False if the user cancelled, or if a file could not be written, in which
+            case its tab is shown and its document and journal are kept.
+        """
+        current = self.tab
+        saving = [tab for tab in self.tabs() if tab.closing]
+        for tab in self.tabs():
+            if tab.closing or tab.document is None or tab.loader is not None or not tab.document.isModified():
+                continue
+            self.activate_tab(tab)
+            if not self.maybe_save():
+                if current in self.tabs():
+                    self.activate_tab(current)
+                return False
+            if self.is_being_saved(tab):
+                saving.append(tab)
+
+        self.saver.wait()
+        failed = [tab for tab in saving if tab in self.tabs() and tab.document.isModified()]
+        if failed:
+            self.activate_tab(failed[0])
+            return False
+        return True
+
+    def closeEvent(self, event):
+        if not self.save_modified():
+            event.ignore()
+            return
+
+        self.save_session()
+        if self.pageRenderer is not None:
+            self.pageRenderer.stop()
+        if self.findInFiles is not None:
+            self.findInFiles.stop()
+        for tab in self.tabs():
+            self.stop_load(tab)
+            self.close_large_file(tab)
+        self.saver.wait()
+        for tab in self.tabs():
+            if tab.journal is not None:
+                tab.journal.discard()
+        super().closeEvent(event)
 
     def exit_app(self):
         """
@@ -181,20 +2167,47 @@ class NotePadWindow(QMainWindow, Ui_MainWindow):
         """
         self.close()
 
+    def format_selection(self, char_format):
+        """
+        Merge a character format into the selected text, or into the format of the text typed next if nothing
+        is selected. The rest of the document is left alone, and the change is undone in one step.
+        """
+        cursor = self.textEdit.textCursor()
+        if cursor.hasSelection():
+            merge_char_format(self.tab.document, [(cursor.selectionStart(), cursor.selectionEnd())], char_format)
+        else:
+            self.textEdit.mergeCurrentCharFormat(char_format)
+
+    def selection_format(self):
+        """
+        Get the format the bold, italic and underline actions toggle: the format of the first selected character,
+        or the format of the text typed next if nothing is selected.
+
+        Returns:
+            QTextCharFormat: The character format.
+        """
+        cursor = self.textEdit.textCursor()
+        if not cursor.hasSelection():
+            return self.textEdit.currentCharFormat()
+        # A cursor reports the format of the character before it, so it is placed after the first selected one
+        cursor = QTextCursor(self.tab.document)
+        cursor.setPosition(self.textEdit.textCursor().selectionStart() + 1)
+        return cursor.charFormat()
+
     def bold_text(self):
-        font = QFont()
-        font.setBold(True)
-        self.textEdit.setFont(font)
+        char_format = QTextCharFormat()
+        char_format.setFontWeight(QFont.Normal if self.selection_format().fontWeight() > QFont.Normal else QFont.Bold)
+        self.format_selection(char_format)
 
     def italic_text(self):
-        font = QFont()
-        font.setItalic(True)
-        self.textEdit.setFont(font)
+        char_format = QTextCharFormat()
+        char_format.setFontItalic(not self.selection_format().fontItalic())
+        self.format_selection(char_format)
 
     def underline_text(self):
-        font = QFont()
-        font.setUnderline(True)
-        self.textEdit.setFont(font)
+        char_format = QTextCharFormat()
+        char_format.setFontUnderline(not self.selection_format().fontUnderline())
+        self.format_selection(char_format)
 
     def align_left_text(self):
         self.textEdit.setAlignment(Qt.AlignLeft)
@@ -223,6 +2236,26 @@ class NotePadWindow(QMainWindow, Ui_MainWindow):
 
 
 if __name__ == '__main__':
-    app = QApplication(sys.argv)
+    timer = None
+    if arguments.startup_timing:
+        timer = StartupTimer()
+        timer.mark('imports')
+
+    app = QApplication(sys.argv[:1] + qt_arguments)
+    app.setApplicationName('PyNotePad')
+    if timer is not None:
+        timer.mark('application')
+    if arguments.profile:
+        profiler.enable(arguments.stall_threshold)
+
     window = NotePadWindow()
+    if timer is not None:
+        timer.mark('window')
+        timer.watch(window)
+
+    if not arguments.new_instance:
+        instance = SingleInstance(window)
+        instance.files_received.connect(window.open_files)
+        instance.listen()
+    window.open_files(arguments.files)
     sys.exit(app.exec_())
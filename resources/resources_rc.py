@@ -0,0 +1,1085 @@
+# -*- coding: utf-8 -*-
+
+# Resource object code
+#
+# Created by: The Resource Compiler for PyQt5 (Qt v5.15.2)
+#
+# WARNING! All changes made in this file will be lost!
+
+from PyQt5 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x01\xda\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
+\x00\x00\x01\xa1\x49\x44\x41\x54\x78\xda\x63\x64\x40\x03\xd2\x6d\
+\xb3\x4c\x98\x79\xf8\xd3\x81\x4c\x47\x20\x96\x67\x95\x53\x62\x60\
+\x62\xe7\x78\x08\x64\xef\xfb\xfb\xe9\xc3\xcc\x7b\xe1\xb6\x67\x91\
+\xd5\x33\xc2\x18\xa2\xd9\xd5\x5c\x9c\xea\x7a\x53\x80\xcc\x04\x64\
+\x71\xa8\x01\x30\xee\x7f\x20\x9e\xff\xfd\xea\xf9\xdc\x27\x25\x71\
+\xdf\xe0\x06\x88\x66\x56\x71\x71\x6a\xea\xef\x06\x32\xad\xd0\x5d\
+\x84\x66\x00\x0c\x1c\x05\x1a\xe2\x06\x32\x04\x6c\x80\xdc\xa4\x95\
+\xf3\x80\x54\x22\x03\x16\x80\xc3\x00\x10\x98\x77\xdb\x53\x37\x99\
+\x51\xaa\x69\x9a\x09\x8b\x80\xf0\x29\x64\x67\x83\xc3\x82\xe1\x0d\
+\xc3\x5b\x06\x3e\x86\xbf\x72\x1a\xb8\x0c\xf8\x0f\x0c\x13\x53\x46\
+\xa0\xed\xb3\x81\x9c\x14\x98\xa8\x0c\xc3\x6b\x06\x69\xc6\xb7\x70\
+\xd3\x04\xe4\xa4\x18\x58\xd8\xd9\xc0\xec\xfb\xff\x25\x18\xee\x30\
+\x48\x21\x1b\x32\x1b\x64\xc0\x1d\x20\x43\x19\xee\x64\x86\x3f\x0c\
+\x61\x4c\x87\x19\x4e\xfc\xd7\x62\x70\x57\xd2\x61\x90\x53\x53\x67\
+\x60\xe7\xe4\x04\xcb\x9d\xff\xf0\x8d\x61\xe5\xe3\xf7\xc8\x06\xdc\
+\x05\x19\xf0\x1b\xc8\x60\x81\x89\x38\x30\x5e\x62\xf0\x66\x3a\xcd\
+\x70\xe9\xbf\x12\xc3\x75\x7e\x6f\x06\x61\x25\x55\x06\x16\x0e\x88\
+\x17\x9e\xff\xf8\xcd\x70\xf5\xd3\x0f\x64\x03\xfe\x60\x18\x00\x02\
+\x1a\x0c\x8f\x19\x6e\x03\x3d\x63\x22\xc4\x83\x62\xc0\x33\xa0\x01\
+\x97\x3f\x7e\xc7\x30\x00\xc5\x0b\x30\xc0\x0c\x0c\x84\x4c\x65\x51\
+\x06\x05\x35\x0d\x06\x36\xa8\x17\xce\xbd\xff\xc6\xb0\xfc\xf1\x3b\
+\x0c\x2f\xa0\x04\xa2\x2c\x30\x10\xa5\x48\x09\x44\xc9\xfa\xc9\x26\
+\xac\xc2\x62\x64\x45\xe3\x9f\xf7\x6f\x4d\x29\x4f\x48\x20\x96\x48\
+\x72\x11\x17\x97\xbe\x39\x49\x49\xf9\xeb\xd9\x63\x6e\xcf\x6a\xd2\
+\xbf\xc1\x9d\x0d\x35\x84\xa8\xcc\xf4\xf5\xcc\x91\xdc\x67\xb5\x99\
+\x88\xcc\x84\x0c\xa0\x61\x82\x35\x3b\xff\x7e\xf5\x7c\xe6\x83\x78\
+\x37\x94\xec\x0c\x00\xe0\x78\x99\x88\xf9\x85\xc6\x5b\x00\x00\x00\
+\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x02\xb2\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
+\x00\x00\x02\x79\x49\x44\x41\x54\x78\xda\x95\x93\x5f\x48\x53\x71\
+\x14\xc7\xcf\xbd\x77\x7f\x6f\xdb\x75\xe6\xdc\x6e\x6b\x5b\xbd\x29\
+\xa3\x7f\xe8\xc3\xf6\x92\xa0\x45\x4f\x9a\xf4\xe7\x25\x10\xac\x1e\
+\xca\x60\xe4\x4b\x89\x46\x6d\x77\x08\x7b\xc8\x97\x48\x9f\xaa\x07\
+\xa1\x1e\x24\xea\x71\x2f\x3d\xc8\x16\x4e\x18\x22\x2a\x24\x8a\x48\
+\x9b\x8c\x20\x18\x73\x5e\x37\xf4\xde\xdd\x3f\xbf\xce\x7c\x88\x59\
+\x2b\xeb\xc0\x8f\x03\xe7\x77\xf8\xf0\xfd\x9e\xf3\xfb\x51\x51\x8e\
+\xbb\x7e\x71\x60\xe0\x03\x6d\xb3\x01\x31\x18\x80\x30\x0c\x00\x4d\
+\x03\x50\x14\xe8\xaa\x0a\x94\xa6\x01\x60\x86\x6a\x15\x2a\xcb\xcb\
+\x1b\xd7\x52\xa9\x76\xa8\x0b\xea\x01\xc0\xe0\xe5\x78\x7c\x7a\x61\
+\x66\xe6\xcb\xd7\xd5\xd5\xc4\xae\xa6\x49\x67\xfa\xfa\xa2\xc1\xde\
+\x5e\x78\x3d\x34\x94\xe4\x08\xf9\xdc\xcc\xb2\xfc\xf9\xfe\xfe\xdb\
+\x5a\x3e\x5f\x18\x9e\x9b\xf3\x1e\x02\x3c\x03\x08\x9f\x08\x06\x9f\
+\xce\x67\x32\x6d\xef\x00\xc4\xae\xa6\x26\xaa\xbf\xb3\x53\xe7\x7b\
+\x7a\x60\x61\x62\x42\x78\x21\x8a\xb1\x5a\xa3\xe0\xf5\x8e\x36\xdb\
+\xed\x23\xc3\x6b\x6b\xc7\x0f\x01\x04\x80\x31\x1b\xcb\x9e\x7c\xb4\
+\xb7\x17\xae\x15\x1c\x68\xe9\x42\x47\xc7\x47\x93\xc9\x04\x66\x93\
+\x89\x18\x31\x1b\xd0\x1a\x85\x96\x34\xb4\xa3\x28\x0a\xba\xa9\x1e\
+\x9c\x62\xb1\xb8\x41\xc1\xef\x31\x18\x0c\x06\xa7\x95\x52\x09\xe4\
+\xcd\xcd\xd4\xaa\xae\x27\xfd\x7e\x7f\xd4\xe7\xf3\x41\x3a\x9d\x4e\
+\xe2\x7d\x0a\x81\x6e\xac\xdd\x91\x24\xa9\xd0\x08\x10\x6e\xf7\x78\
+\x26\xef\x49\x12\x7c\xdf\xd9\x11\x9e\xeb\x7a\x8c\xe7\x79\xe2\xf1\
+\x78\x60\x69\x69\x49\x20\x84\x1c\x58\x42\x45\xa3\x4e\xa7\x73\xa4\
+\x11\x60\xec\xaa\xd9\x1c\xbf\x85\x52\xe7\x29\x4a\x98\xd4\xb4\x18\
+\x36\x92\xd6\xd6\x56\x58\x5f\x5f\xff\x09\xc0\x70\x23\x64\xab\x11\
+\x00\xa6\xd0\xfb\x59\x5c\xdd\x5b\x04\xbc\x41\x80\xc3\xe1\x20\x2d\
+\x2d\x2d\x90\xcd\x66\x05\x1d\x15\xd5\xcf\xb0\x21\xe0\x95\xd9\x4c\
+\xba\x10\x10\x41\xc0\x7b\x55\x8d\x71\x1c\x47\x6a\x43\xdd\xde\xde\
+\xfe\x15\x00\x0d\x01\x2f\x2d\x16\x72\x05\x2d\x3c\xa4\x69\xe1\x93\
+\xa2\xc4\x8c\x46\x23\xa9\x6d\x00\x25\x0b\x98\xff\x0e\xe0\x01\x98\
+\xfb\x2c\xab\x5e\x92\x65\x78\xcc\x30\xe3\x99\x6a\x35\x62\x41\x60\
+\xed\x0e\x57\x78\x34\xc0\x6f\x30\x74\xdf\xb5\x58\x66\xdb\x2a\x15\
+\x98\xb2\xdb\x13\x59\x42\x6e\x56\x68\x7a\x1f\x55\x80\x28\x8a\x82\
+\x8a\x96\xfe\x08\x38\x77\xfa\x94\xc8\x6a\x0a\x17\x90\xf6\x01\x74\
+\x1d\x4a\xec\x31\xf8\x66\x65\xb5\xdc\xce\x2e\x63\xc3\xbf\x92\xcf\
+\xe7\x05\x54\x71\xf4\x0c\xea\xc3\xc2\xd0\x0c\xef\xf3\xab\x2e\x97\
+\x0b\x56\x56\x56\xc6\x65\x59\x8e\xfc\x17\x80\x65\xd9\xee\x40\x20\
+\x30\xeb\x76\xbb\x61\x71\x71\x31\x81\x0a\x6e\xe0\x13\x96\xff\x09\
+\x10\x0a\x85\x44\xaf\xd7\xcb\xe1\x43\x02\xab\xd5\x0a\xe5\x72\x19\
+\x72\xb9\x9c\x5a\x28\x14\x9e\xa0\x9a\x89\x5a\xcf\x0f\x3b\xe8\x17\
+\xe2\x25\x12\xbb\x06\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\
+\x82\
+\x00\x00\x02\xb5\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
+\x00\x00\x02\x7c\x49\x44\x41\x54\x78\xda\x95\x93\x5b\x48\x14\x61\
+\x14\xc7\xff\xdf\x37\x3b\x7b\x73\xd7\x75\x95\xb5\xbc\x6c\x25\x24\
+\x5d\x30\x0a\x31\xc4\x22\x0a\xf2\x25\x14\xa4\x12\x6b\xd1\x22\xd3\
+\xec\x21\xa8\xb7\xa0\x82\xa0\xc0\xd7\x4a\xec\x61\xb4\x24\xe8\x21\
+\x8d\x7a\x28\x52\x12\x2a\xaa\x07\x95\x48\xb4\xc0\xda\x20\x41\x71\
+\xcb\xc4\xcb\xb6\xae\xab\x7b\x9b\x9d\xaf\x6f\x66\x32\x91\xc9\xa0\
+\x73\xe6\xc0\xe1\x9b\x73\x7e\xe7\xbb\x9c\x43\xa0\x4b\x1e\x28\xd9\
+\x0b\x02\x17\xf7\x29\xfe\x2d\x8c\x6b\x18\x0a\xeb\xe3\x7e\x80\xa8\
+\xc9\xb4\x32\xff\x19\xad\xc8\xdd\x45\x28\x21\xea\x02\xc8\x9a\xa9\
+\xea\x07\xa6\x30\xa6\xf4\x4c\x8e\x28\xdd\xdf\x2a\x08\xaf\x5c\xe3\
+\x6a\x2f\xee\xa2\xe9\xa6\xbf\xa6\x65\x5a\x93\x08\xc6\x44\xc3\xba\
+\x12\x96\xd9\x7c\xd3\x90\x8f\x40\x20\x67\xbc\xf7\x77\xb6\x93\x34\
+\x61\x55\x80\x40\x19\x4e\x14\xa6\x40\xa2\xbb\x71\x6f\x62\xd8\xb8\
+\x99\xc5\x14\x02\x27\x3f\x36\xa8\x80\xb3\xdb\x3a\x8b\x24\xc1\xb1\
+\x72\x74\x9b\xa8\xa0\xae\x20\x17\x3e\x4f\x2b\x3a\xc7\x7b\x71\xe7\
+\x7b\x87\x01\x90\x8a\x28\xf0\xfb\x46\x1a\x35\x40\xc9\xe3\xad\x92\
+\xe8\xd4\x01\x0e\x73\x0a\x35\x39\xe5\xf0\xe5\x35\xc3\x6e\x75\xe2\
+\xf5\x8f\x56\xbc\x08\xb5\x61\x8e\x1f\x23\x18\x33\x23\x18\xa7\x88\
+\x29\x11\x24\x17\x14\x0c\x56\x7f\xd1\x01\x07\x9e\x6e\x96\xcc\xe9\
+\x14\x16\x2a\xa0\x6e\xdd\x79\x1c\xde\x78\x1a\x26\x93\x09\xea\x95\
+\xca\xb2\xac\xd9\xb2\x7c\x9a\x1d\xc6\xe5\xb1\x7a\x24\xc2\x0a\xde\
+\x54\x8d\xea\x80\xca\xe7\x05\x92\xcd\x45\x50\x6a\xa9\xc5\xb9\x2d\
+\x97\x60\xb5\x5a\xd7\x7c\xc3\x91\xe9\xf7\xb8\x36\xee\x43\x6c\x9e\
+\xa1\xfb\xd0\x98\x0e\x38\xf6\xd2\x2b\xd9\x33\x08\x54\x3d\x98\x5e\
+\x8f\xa3\xf9\x17\x61\x16\x2d\x5a\x42\x22\x19\xd7\x4c\xbb\x38\xc6\
+\x30\x1a\xfa\x80\xdb\xb3\xa7\xb0\x14\x62\x78\x58\x1e\xd0\x01\x0d\
+\x6f\x73\x25\x87\x7b\xa5\x4a\xa1\x79\x1f\x6a\x73\x5a\xe0\xb2\x7b\
+\xd0\x1d\xb8\x81\x57\x91\x9b\x86\x9d\x44\x7e\x02\x1d\xfb\x27\x75\
+\xc0\x85\x81\x6c\xc9\xe9\x5e\x1d\xe0\xa6\x9b\x70\x24\x43\xc2\xe7\
+\x48\x2f\x06\x12\xb7\x0c\x80\x05\x0e\x68\x29\x9b\xd6\x01\x57\x06\
+\xb3\x24\x57\x26\x33\x04\x89\x70\x22\x8b\xed\xc0\x14\xe9\x37\xfc\
+\x9b\x0f\x12\x34\x97\xcc\x69\x80\xa6\xeb\x43\xee\x36\x4f\x76\x0a\
+\xff\x23\x33\xd3\x14\x57\x8b\x43\x0d\x6a\x2b\x1f\x2f\x7b\x54\xf8\
+\xc0\x57\x3a\x43\xdc\xbc\x6d\xd3\x44\x19\x16\x41\x81\x89\x77\x22\
+\x25\xec\xf7\xe5\x11\x24\xb9\xc5\x65\x8a\xc5\xa4\x80\x50\x5c\x44\
+\xd7\xbb\x6c\xd6\x57\xfd\xb5\x56\xed\x7f\xaf\xb3\x6a\x7d\x4f\x59\
+\xa3\xbd\x68\xbb\x67\x91\x6c\x70\x46\x91\x65\x4b\xf0\x86\x92\x35\
+\x88\x1a\x90\x54\x88\x96\x38\x17\x35\x63\x62\xc1\x06\xff\x8c\x83\
+\xf5\xdf\x5d\xf2\x87\x9f\x4c\x55\x2c\x0f\x90\x97\x97\xdb\xc3\xa3\
+\xd3\xb0\xf6\x2c\xfe\x19\x03\xae\x51\x3e\xce\x03\xdc\x1f\xff\x05\
+\xf4\x49\xec\x08\xa0\x25\xf0\xcd\x00\x00\x00\x00\x49\x45\x4e\x44\
+\xae\x42\x60\x82\
+\x00\x00\x03\x07\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
+\x00\x00\x02\xce\x49\x44\x41\x54\x78\xda\x6d\x93\x59\x48\x54\x61\
+\x14\xc7\x7f\xdf\x75\x66\xd4\x9c\x94\x5c\x46\x1d\xb1\x22\xac\xc4\
+\x0a\x94\xb6\x87\xb0\xa0\xb2\xb7\x96\x87\x32\x44\x08\xda\x5e\x22\
+\x54\xc2\x40\xa4\x68\xc1\x28\x0d\x12\x29\x82\xa0\x82\x96\x17\x51\
+\x62\xec\xa9\x87\x29\xb2\x85\x20\x86\xa4\x52\xcb\x4a\xa3\xa1\x44\
+\xc7\x56\xa7\x99\xd1\x59\xee\xed\xcc\x9d\x8a\x69\x39\x70\xe6\x9b\
+\xef\x72\xfe\xff\xb3\xfd\x3f\xc5\xbf\x56\xe9\x80\x5d\xab\x60\xf5\
+\x02\x98\x6d\xc8\x87\xd7\xe0\x7d\x08\xf7\x7c\x70\x59\xae\xf7\x93\
+\x83\x55\xd2\xff\x9c\x02\xb8\xb8\x0f\x36\x6f\x9d\x89\xca\xcd\x02\
+\x9b\x15\xa2\x3a\x04\xa6\xe0\x8b\x1f\x6e\x06\x31\xce\xcb\x31\x06\
+\xbb\x25\xfe\x53\x32\x81\x63\x31\xf4\xb6\x65\x52\xba\x72\x1e\xa4\
+\xa6\x41\x38\x06\x91\xd8\x9f\x67\x30\x08\x23\xe3\x70\x74\x8a\xa1\
+\x7e\xa9\x50\x70\x3e\x93\xc0\x09\xee\x2b\xf9\xac\xab\x2c\x91\x8c\
+\x51\x61\x95\x20\x8b\xf0\xa7\x84\x20\xde\x42\xd8\x06\x5f\xed\x12\
+\x2d\x3e\x25\x44\x6f\x3f\x42\x63\x80\xdb\xa3\xb0\x3e\x4e\xb0\xb9\
+\x35\x13\x57\xfd\x12\x88\x09\xc0\xfa\x02\xb4\x10\xff\xb5\x90\xb4\
+\x34\x98\x03\x93\x82\xba\x23\x24\x27\x23\x6c\x51\x85\xd0\xe3\x29\
+\x67\x53\x96\x64\xb1\x3c\x93\xec\xb3\x0a\xb1\xb4\xb6\xa2\xbb\xdd\
+\xe8\x57\xaf\x9a\x40\xad\xa6\x06\xad\xb6\x96\x58\x53\x13\xc1\x17\
+\xfd\x3c\xce\x16\x92\x08\xec\xff\x4a\x8f\xda\x62\xc7\x77\x7d\x31\
+\x79\xfa\x7b\x29\x59\xdc\x72\xb0\x11\x5b\xdb\x69\x0c\xc3\x20\xd2\
+\xd0\x60\x36\x6e\xbd\x70\x01\xa5\x69\x84\x5b\x8e\x13\x3d\x7c\x84\
+\xe1\x74\x18\x4a\x85\x73\x7e\x99\xc1\x81\x7c\xf4\x43\xb3\x51\x4a\
+\xa6\xa2\xe2\x3d\xcf\x75\x32\xe3\x6e\x2f\xb6\x39\x25\x26\x89\xfc\
+\x24\xc0\x6f\x06\x09\xac\x5b\x8b\xe6\x1d\xe7\xbb\x26\x3b\xcd\x80\
+\xce\x69\x74\x75\xd0\x89\xde\x58\x20\x04\x7d\x24\x26\x26\x16\x9b\
+\x57\x44\xce\x23\x0f\x56\x47\x81\x79\x8f\xf8\xc6\xf8\xb4\xbc\x9c\
+\x14\x01\xc7\x4d\x36\xcb\xad\x19\x70\x23\x8c\xa1\x76\xe4\x32\x7e\
+\xa2\x08\x87\x1a\x90\xaf\xd1\x04\x81\xbd\xbe\x9e\xcc\xf6\x76\x61\
+\x4d\x6c\x39\x5e\x89\xbf\xb9\x19\xff\xa9\x53\xe6\x7d\x5a\xfc\x8e\
+\xb4\x70\x2d\xc2\x84\x5a\x90\x4a\xcf\xad\xf9\x6c\xd2\xbd\x32\xac\
+\x49\xc8\xd8\xb6\x8d\xbc\xce\x4e\x13\x3c\xf9\xfc\x29\xca\x6a\x65\
+\x66\x69\x99\x49\x32\xb1\x7d\x3b\x81\xae\x2e\xc6\xa4\x85\x3e\xf1\
+\x96\x28\x37\xcd\x35\x5e\x9b\x83\xab\x42\xca\xd7\x84\xc4\x5e\x57\
+\x47\x71\x47\x07\x9f\xfb\x9e\xe0\xdd\x50\x25\x53\xb5\x30\xd7\x7d\
+\x9b\xac\xb2\x45\x8c\x54\x57\x33\xdd\xdd\x8d\x27\x05\x3c\xd2\xc7\
+\x59\x43\xd6\x18\x57\x63\x89\x4d\x84\x54\xc4\x5a\x9b\x54\xa0\x7f\
+\x56\x84\x97\x2d\x45\x1b\x18\x20\x3d\x98\x10\x44\x28\x3d\x9d\x88\
+\xb3\x90\x8c\xe1\x11\xde\x49\xe6\x11\x49\x76\xc6\xc0\x2d\x92\xae\
+\xfa\x25\xe5\xfc\x15\x69\xf4\x1e\xcb\x66\x61\x9a\xe8\xde\x22\x44\
+\x5a\xf4\x4f\x11\x4d\x49\xe4\x07\xf1\x51\x01\x5f\x36\x78\xf9\x0a\
+\xd6\xfc\x96\xf2\x4f\xcb\x75\xa6\x70\x69\x8f\x9d\x8d\x15\x16\x94\
+\x21\x42\x89\x7b\xfc\x31\x85\x04\xf4\x5d\xce\xbe\x18\x86\xcb\xc0\
+\x25\x2a\xdf\xfb\xf7\x63\x4a\xb6\x35\xd9\x8a\x9d\x65\x16\x56\x8b\
+\xe0\x8a\x75\x01\xfb\x62\x78\x87\x0c\x7a\xbf\x25\x9e\xf3\x83\xe4\
+\xe0\x1f\x70\x33\x14\x47\x26\x5e\xa0\xb1\x00\x00\x00\x00\x49\x45\
+\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x01\xa8\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
+\x00\x00\x01\x6f\x49\x44\x41\x54\x78\xda\x95\xd2\x3d\x4f\xc2\x50\
+\x14\x06\xe0\xf7\x4a\x28\x14\x8c\xab\x83\xc6\x9f\xe0\x6a\x18\xdd\
+\x60\x60\x22\x21\xea\xe6\x40\x4c\x88\x51\x41\xc4\x00\x45\x06\xbe\
+\x14\x11\xa2\x11\x12\x31\x71\xd3\x18\x12\x36\x82\x71\x72\x93\xd9\
+\xbf\x60\x74\x70\xc6\x50\xd2\x62\x6b\x4b\x53\xd2\xc2\xc5\xd4\xb3\
+\xf4\xb6\xcd\xfb\xdc\x73\xdb\x43\x30\x51\x89\x24\x27\xe3\x8f\x2a\
+\x16\x72\xc4\x78\x4f\x68\x40\x21\x9f\xa5\x86\x93\xa9\xb4\x75\x40\
+\x10\x04\xd3\x73\x86\x61\xfe\x07\x58\xee\xc0\x78\xe6\x97\xfe\x22\
+\x35\x68\x23\x12\x08\x21\x18\x4a\x5a\x76\xdd\xf5\x65\x06\xf4\x1d\
+\x3d\x91\x6b\x78\x83\x3e\x40\x14\xa9\x10\xb1\x33\x78\x6a\x76\xd0\
+\xad\xee\x8e\x3b\x9a\x02\xb6\xf7\x36\x21\x4d\x9c\x7f\xdc\x09\xe3\
+\xc0\xdd\xd5\xc3\x2c\x40\x56\x80\x1a\xb6\x42\x01\xc8\x22\x1d\x98\
+\x53\x3e\xe4\x7d\xa3\x35\x03\x90\x44\x78\x0e\x6f\x60\xa5\xba\x95\
+\x1d\x48\xb2\x0d\x5c\x3a\xa3\x01\x99\x13\x0e\xdf\xbd\x1e\x16\xe6\
+\xdd\xe8\xbc\xbe\xc1\x6e\xb7\x51\x83\xc2\xf0\x07\xde\xb5\x55\xf4\
+\xf9\x3e\x58\x97\x1b\xd9\x5c\x41\x03\x8e\xe3\x31\x9c\x95\xca\x96\
+\x76\xd7\xeb\x28\x16\xc5\x79\xb9\xa2\x01\x5c\x2a\x81\x5c\xbe\x88\
+\x56\xf3\x11\x07\xd1\x38\xfc\x7e\x1f\x78\x9e\x37\x05\x58\x96\x45\
+\xbb\xfd\x8c\xea\xc5\x29\x02\xc1\x0d\xe8\x19\xd3\x1c\xa8\xc0\x7e\
+\x24\x8e\x70\x38\x84\xc1\x60\x60\x02\x9c\x4e\x27\xea\xf5\x5b\x5c\
+\x56\x4b\x23\x60\xfc\x6b\xf5\x85\x0a\x19\x01\xda\x28\x1b\x01\x7d\
+\x22\x4d\x80\x7a\x5d\x5e\x5a\x19\x01\xb4\x52\x81\x8f\xcf\xf7\xd1\
+\x7a\x0a\xd0\xab\x56\x6b\xa8\xbd\x3b\x68\x80\x32\xce\x82\x82\x9b\
+\xde\xfd\x02\x08\xaf\xb7\xef\x80\x4c\xc5\x0a\x00\x00\x00\x00\x49\
+\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x02\x7b\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
+\x00\x00\x02\x42\x49\x44\x41\x54\x78\xda\x63\x64\xa0\x10\x30\x62\
+\x13\x9c\x1a\x21\x68\xce\xc3\xce\x14\xc9\xc8\xc8\xa0\xf7\xff\xff\
+\x7f\x26\xa0\xb2\x6b\x3f\xff\x32\xac\x3c\xff\xe4\xcf\x21\x0e\xe6\
+\x7f\x4a\x5c\x6c\x4c\xa5\x7f\xfe\xfe\x5f\xd5\xb9\xeb\xd3\x3e\x14\
+\x03\x6a\x3c\xf9\x05\x65\x04\x99\x67\x31\x33\x32\x04\xf3\xf0\xb0\
+\x31\x6a\x6a\x8a\x32\x48\x49\xf2\x32\x70\x73\x30\x33\xfc\xfd\xf5\
+\x9b\xe1\xed\xdb\xef\xb7\x8f\x5c\x78\xcd\x78\xe3\xe1\x57\x15\x75\
+\x69\x8e\xef\xbb\xae\x7c\xe5\x81\x1b\x50\xe6\xca\x27\x24\x25\xc0\
+\x7c\x80\x99\x89\x51\x57\x4b\x43\x84\xc1\xd2\x5c\x8a\x81\x05\x24\
+\xfb\xf7\x2f\x18\xff\x87\xd1\x7f\xfe\x32\x5c\xbd\xfb\x89\x41\x82\
+\x9f\xf9\x8b\x74\xee\x2d\x5e\xb8\x01\x9d\x81\x02\x9b\x80\x9a\x7d\
+\x8d\xf4\xc4\x18\x6c\x2c\xa4\x80\x8a\xff\x81\x35\x7d\xfc\xf0\xfd\
+\xfd\x97\xcf\xbf\xee\xb0\x30\xfd\xd7\x17\xe3\x63\x61\x83\x19\xf8\
+\xee\xc3\xcf\xb7\x52\x05\x77\x45\xc0\x06\xd4\x79\xf1\x7b\xb0\xb3\
+\x32\x6e\x93\x93\xe2\x61\x0c\xf5\x53\x61\x60\xfa\xf7\x8f\xe1\xdb\
+\xd7\x9f\x5f\xcf\x5d\x7a\x5d\x72\xe1\xf6\xa7\x79\x9f\xbf\xfd\x09\
+\xfb\xf5\xe7\xff\x22\x2d\x59\x0e\xc6\x20\x4b\x21\x06\x46\xa0\x2b\
+\xde\x7c\xf8\xf9\x5c\xa6\xf4\xa1\x14\xd8\x80\x06\x6f\x81\x8d\xcc\
+\x4c\x0c\x7e\xb1\xc1\xaa\x0c\x52\x22\x1c\x0c\xbf\x7e\xfc\xfe\xb3\
+\xef\xf8\x33\x77\xbf\xde\x47\xfb\xbc\x75\x39\x99\x0d\x64\xd8\x36\
+\x02\x15\x7a\x05\x5b\x08\x30\x2a\x88\xb0\xfc\xf9\xfc\xf5\xf7\x8b\
+\xd7\x1f\x7f\x9f\x30\x6e\x7d\x1e\xca\xe8\xa2\xc1\xc1\x64\xad\xcc\
+\xf1\x5e\x42\x84\x83\x2f\x29\x44\x05\xec\xbc\xeb\xb7\xdf\xcd\x34\
+\x28\xbd\x99\x81\x1c\xc0\x79\x8e\xbc\x26\x42\x3c\xcc\xdf\x5f\x7e\
+\xfc\x7b\x7f\xfa\xa1\xcf\xdf\xe0\xd1\xe8\xae\xc5\x29\x6c\xa1\xc8\
+\xfe\xda\x5c\x4f\x88\xd1\xd9\x4c\x0c\xec\xef\x35\xbb\x9f\x58\xc7\
+\xcc\x7c\x7e\x8c\xa8\x74\x00\x34\x40\x00\x68\xc0\x5b\x37\x0b\x71\
+\x26\x13\x0d\x5e\x86\xdf\x3f\xff\x30\x34\x2d\x79\x20\xd2\xb5\xe3\
+\xc3\x5b\xa2\x13\x52\xbd\xb7\xc0\x53\x57\x53\x11\x29\x53\x75\x1e\
+\x86\x7f\xbf\xff\x32\xcc\xdb\xf9\x5c\x23\x7b\xe9\x9b\x9b\xa4\x18\
+\x30\xc9\x58\x8d\x37\xd7\xcd\x90\x1f\x1c\x06\xe7\x6e\x7f\xae\xb7\
+\x6a\x7b\xd2\x44\xb4\x01\x19\xb6\xbc\x92\x6a\x92\x6c\x97\xd2\xdd\
+\x45\x45\x98\xff\xfd\x65\xf8\xf6\xfd\xcf\xf7\xa5\x47\x3f\xe8\xe5\
+\xae\x7c\x7f\x87\xe8\xbc\x50\xe1\xce\x6f\xe9\x6f\xcc\xbb\xc9\x40\
+\x96\x55\xe4\xe6\xb3\x9f\x4b\x0c\x9a\x9f\xc5\x12\xed\x02\x18\xa8\
+\xf3\x16\x50\xf6\xd4\xe1\xac\xdf\x79\xe5\x5b\x5a\xc3\xd6\x8f\x3f\
+\x48\x36\x80\x1c\x00\x00\x82\x1d\xe7\xb3\xbe\xc2\x07\x2f\x00\x00\
+\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x00\x6f\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
+\x00\x00\x00\x36\x49\x44\x41\x54\x78\xda\x63\x64\xa0\x10\x30\x02\
+\xf1\x71\x4a\x0d\x28\xa7\xd4\x00\x8a\xbd\xb0\x9d\x52\x03\xfa\x07\
+\xdc\x0b\xf3\x07\xdc\x00\x8a\xbd\x40\x71\x20\x52\x1c\x8d\x14\x7b\
+\x81\xe2\xa4\x4c\x71\x66\xa2\x08\x00\x00\x98\x56\x06\x57\xbf\xe4\
+\xa6\x52\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x02\x1e\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
+\x00\x00\x01\xe5\x49\x44\x41\x54\x78\xda\x85\x93\x4b\x48\x02\x61\
+\x10\xc7\x5d\x0d\x75\x75\x7d\x62\x16\x1a\x82\xef\x63\xd0\xad\x43\
+\xd0\xa5\x4b\x74\xa8\x43\x45\x44\x87\x8e\x15\x44\x54\x87\x28\x28\
+\xe8\x41\x41\x1d\x8a\x08\xbb\x57\x1e\xba\x77\xea\x12\x15\x05\x45\
+\x10\x94\x20\x2a\x2a\x18\x8a\x1d\x44\x45\xd7\x07\x6e\xdb\x7f\x85\
+\x8d\x65\x5b\x6b\x4e\xdf\x37\xb3\xf3\xfb\xe6\x3f\x33\x4b\xc8\x04\
+\xe6\xf5\x7a\xc7\xb5\x5a\xed\x31\x8e\xed\xb2\xd6\xc6\xb0\x2c\x7b\
+\x95\x4c\x26\x27\x0b\x85\x42\x89\x10\x01\x36\xaa\xd5\xea\x7d\xb1\
+\x58\x7c\x6d\x95\xad\x50\x28\x54\x76\xbb\xfd\xac\x56\xab\x5d\x47\
+\x22\x91\xbd\x1f\x80\xcf\xe7\x9b\x55\xab\xd5\x83\xdc\x37\xa2\x1c\
+\xb6\x5e\xaf\xdf\xe0\xc5\x7d\xc0\x59\xce\xe1\x72\xb9\xd6\x94\x4a\
+\x65\x57\x38\x1c\x9e\x69\x02\x9c\x4e\xe7\xa4\xc1\x60\xd8\xce\xe7\
+\xf3\x5b\x8d\x46\xa3\x26\xcc\x26\x49\xd2\x07\x59\xeb\xf0\x9f\xc6\
+\x62\xb1\x59\x0e\xf2\x0b\xe0\xf7\xfb\x4f\xa0\x2b\x8b\x92\x36\xc5\
+\x25\x5b\xad\xd6\x5e\x9b\xcd\xf6\xc0\x9d\x79\x08\xee\xab\x62\x40\
+\x80\x61\x98\x0f\x04\x77\xc4\x00\x8a\xa2\x48\xb7\xdb\xfd\x48\x10\
+\x44\x37\x77\x47\x05\xcb\x90\xa4\x96\x04\x20\x78\x6b\xb1\x58\x76\
+\xe1\xe2\x7b\x43\x27\x12\x89\x11\x24\xd0\x2a\x95\xaa\x13\xb1\x09\
+\x8d\x46\xd3\x57\x2a\x95\x9e\x25\x01\xb9\x5c\xee\xdc\x68\x34\x4e\
+\x09\x01\x99\x4c\xe6\xb0\x52\xa9\x30\xdc\xc5\xe1\x70\x4c\x23\x3e\
+\x0c\xc0\x53\x4b\x09\x68\x26\x29\x35\x3e\xcc\xbc\xf2\x2f\x00\xa5\
+\x46\xcc\x66\xf3\xa5\x14\xa0\x5c\x2e\x2f\x60\xf6\xc5\x3f\x01\xe9\
+\x74\xfa\x00\x4d\xeb\x91\x02\x40\xc6\x9b\xc9\x64\x1a\xfd\x13\x90\
+\xcd\x66\x8f\xf5\x7a\x7d\xbf\xa0\x07\x3f\x46\xd3\xf4\x83\x4e\xa7\
+\x1b\xe2\x00\x80\xbd\x60\x23\x3b\x00\x98\x13\x4b\x78\x87\x84\x0b\
+\x09\x00\x8b\x57\x97\x10\xaf\xa3\x8a\x45\x8c\x94\xc2\xba\xaf\xc5\
+\xe3\xf1\xe0\xbf\x7b\x20\x34\xae\x89\x00\xec\xa0\x9a\xad\x68\x34\
+\x1a\x90\xf1\x2f\x79\x3c\x9e\x15\xcc\x77\x00\x3d\x98\x12\xaf\x32\
+\x6f\x72\xb9\xbc\x0d\x1b\x78\x84\x8d\xfd\x0c\x85\x42\xf3\xbc\xbf\
+\x09\x80\x36\x0a\xff\x43\x10\x1f\x49\xfd\x4c\xbc\x7d\x21\xf9\x2e\
+\x95\x4a\x8d\x61\x5f\x3e\x79\xe7\x37\x4c\x81\x39\x20\xe8\x06\xf4\
+\xc6\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x02\x98\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
+\x00\x00\x02\x5f\x49\x44\x41\x54\x78\xda\x63\x64\x20\x02\xcc\xbd\
+\x6f\x38\xef\xe6\xc9\x2f\xd9\x5d\x11\xb7\xbf\xa3\xcb\x31\xa2\x0b\
+\x84\xd7\x8b\x32\x3a\xc7\x49\x24\x31\x30\xfe\x0d\x03\x4a\x0b\x31\
+\x32\x30\x3f\xf8\xf9\xf7\x8d\x3f\x37\xab\x42\x7f\xa2\xc2\xb1\x72\
+\x82\x06\x4c\xbd\x2d\x37\xf7\x3f\xc3\x9f\x24\x10\xfb\xff\x7f\x20\
+\x06\xd2\x7f\xff\x32\x31\xfc\xff\xc7\xf3\xe7\xc7\x07\x41\xd3\x2a\
+\xeb\xe3\x17\x70\x1a\xd0\xb6\x4f\x47\xf2\xd7\xef\x1f\x8c\xe7\xf7\
+\xbe\x7a\x27\xa9\xc2\x22\xaf\x64\xc2\x61\xfb\x9f\x85\xb5\xe6\xe7\
+\x2f\x16\xf9\x1f\x3f\x59\xbe\x32\xff\xe7\x0f\x6f\xb6\x39\xb5\x15\
+\xaf\x0b\xd0\x41\xe5\x11\x8d\x33\x40\x03\xee\xbd\xbe\xf7\xb3\x64\
+\x71\xca\xed\x47\x78\xbd\xf0\xf6\xed\xdb\x55\x40\x8a\xf3\xff\xff\
+\xff\xa7\x5e\xbf\x7e\x7d\xea\xfa\x8b\x13\xa7\x5f\x72\x9d\x57\xcc\
+\x34\x9f\x74\xf6\xc8\x7c\x3f\x05\x01\x1e\x76\x5b\xa0\x16\x26\x88\
+\xea\xff\x7f\x1f\x3d\xff\xbc\x89\xf1\x62\x9b\xb4\x86\x94\xb2\x61\
+\x2e\x93\xf3\x3c\x33\x06\x46\x66\x3d\xa0\x66\xb6\xcf\xdf\x7e\x32\
+\xfc\xf8\xf5\x07\x1c\x0a\x8c\x0c\xff\xef\xf0\xfd\xba\x74\x81\xff\
+\xdb\x5e\xdf\xff\xff\xff\x71\xc0\x6d\x66\x64\x64\xf8\xf7\xeb\x6b\
+\x07\xe3\xc3\x7e\xd9\x7e\x26\x7e\x85\x02\x2e\xff\x0d\x0c\xdf\x7f\
+\xff\x65\x78\xf9\xe6\x23\xc3\xa7\xaf\xdf\x19\xf8\xb8\x39\x19\xbe\
+\xff\xfc\xc9\xc0\xc7\xf2\x85\x41\xe1\xe7\x52\x86\x7f\x5f\x1e\x63\
+\x78\xef\xf7\x3f\xa6\x24\xc6\x6b\xcd\x42\x0d\xec\x72\x76\xf5\x02\
+\xde\xb3\x19\xf6\x9e\x59\xcf\x60\x22\xce\xce\xf0\xe7\xef\x3f\x06\
+\x2e\x0e\x76\x86\x0f\x1f\xdf\x30\x48\x31\x5f\x67\x60\xf8\x72\x17\
+\x12\x25\x68\xe0\xc4\x95\x8f\x0a\x8c\x7b\x0a\xb8\x73\xe5\xcc\xa3\
+\x26\x09\x19\xbb\x33\x30\xbf\x58\xc4\xf0\xef\xe7\x67\x84\x8a\xff\
+\xff\x80\xe8\x0f\xae\xf0\xbd\x27\xe2\x71\x54\x99\x71\x49\x3c\x5b\
+\xa4\x49\x60\xe9\x32\x61\x81\x9b\x0c\xff\xbf\xde\x21\x26\x61\xc2\
+\xc0\x1c\x31\xef\x0b\xa9\x8c\x53\x42\x59\x5c\xdd\x23\x63\x77\xf1\
+\xb1\x1c\x21\x45\x33\xc3\xb7\x9f\xff\x23\x15\x43\xef\xac\x60\x6c\
+\xf3\x63\x31\x0c\x0f\x91\x3b\xc7\xc5\xfb\x93\x14\xfd\xff\x0f\x5d\
+\xfc\x29\x19\xde\xf0\xe6\x25\xe3\xa4\x1c\x15\xf9\x60\xfb\xb7\x0f\
+\x08\x27\x29\x04\xf8\xf7\x9f\xf5\x82\x6c\xe8\x2b\x43\x70\x74\x2e\
+\x5b\x32\x5f\x49\x84\xe9\x62\x07\x2b\xc3\x57\x15\x60\x38\x73\x03\
+\x85\xd8\x81\xe2\x2c\x40\xcc\x84\x94\xd0\xfe\x01\xf1\x5f\x20\xfe\
+\x05\xb4\xfc\xfb\xc7\xff\xca\xbb\xbf\xfe\x97\xde\x70\xf5\xea\xb5\
+\x23\x8c\x89\x89\x89\x8c\xfc\xfc\xfc\xac\x9c\x9c\x9c\xac\xcc\xcc\
+\xcc\x2c\x40\x9a\x19\xa8\x90\x19\x6a\x00\xdc\xc9\x20\x43\x7e\xff\
+\xfe\xfd\x07\x84\x7f\xfc\xf8\xf1\xe7\xfb\xf7\xef\xbf\xa7\x4d\x9b\
+\xf6\x17\x00\x83\x4f\xfd\xb2\x7b\xc1\xd8\x18\x00\x00\x00\x00\x49\
+\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x01\xdf\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
+\x00\x00\x01\xa6\x49\x44\x41\x54\x78\xda\x63\x64\x40\x03\xdb\x3b\
+\x75\x4c\x04\x79\x59\xd3\x81\x4c\x47\x20\x96\xd7\x90\xe3\x64\xe0\
+\xe2\x60\x7e\x08\x64\xef\x7b\xfb\xe9\xf7\x4c\xc9\xa0\x13\x67\x91\
+\xd5\x33\xc2\x18\x93\xf2\x94\xb9\xcc\x34\xf8\xa6\x00\x99\x09\xc8\
+\xe2\x50\x03\x60\xdc\xff\x40\x3c\xff\xd8\x95\x8f\xb9\x0e\x05\x97\
+\xbe\xc1\x0d\x98\x98\xa3\xcc\x65\xae\xc5\xb7\x1b\xc8\xb4\x42\x77\
+\x11\x9a\x01\x30\x70\x14\x68\x88\x1b\xc8\x10\xb0\x01\x27\xa6\x19\
+\xce\x03\x52\x89\x0c\x58\x00\x0e\x03\x40\x60\x1e\x9b\xcb\xe1\x64\
+\xc6\x4d\xad\xda\x26\x62\x82\x6c\xa7\x60\xae\xb9\xc2\x20\xce\x70\
+\x9e\x51\x12\xae\x4a\x4c\x5e\x84\x81\x95\x9d\x05\xcc\xb6\xfd\xff\
+\x80\xc1\x9c\xe1\x09\xdc\x3b\xc0\x30\x31\x65\x04\xda\x3e\x1b\xc8\
+\x49\x81\x89\xfe\x01\x9a\xf3\x8b\x81\x05\x6e\x80\x9a\x3c\x37\x03\
+\x27\x3b\x13\x98\xcd\x01\x94\x65\x65\xf8\x87\xec\x8a\xd9\x20\x03\
+\xee\x00\x19\xca\xc8\xa2\x9b\x19\x34\x18\x9e\x31\xf2\x82\xd9\x22\
+\xf2\xa2\x0c\x2c\xec\xac\x0c\x0a\xff\xdf\x03\xfd\x78\x0e\xdd\x1b\
+\x77\x41\x06\xfc\x06\x32\xe0\x56\xbe\x60\xe0\x61\x78\xc6\xc0\x07\
+\x57\x21\x27\xcf\xcf\xc0\xce\x0e\x09\x03\x45\x86\xf7\x0c\x72\x0c\
+\x1f\x91\x0d\xf8\x43\x15\x03\x50\xbc\xf0\x0f\x18\x06\xf3\x19\x8d\
+\x80\xbe\x65\x42\xf1\x02\x2b\xc3\x5f\x86\xca\xff\x07\x19\x98\xc1\
+\x49\x01\xd5\x0b\x28\x81\x08\x03\xbf\x81\x06\xfc\x06\x2a\x07\x05\
+\xa2\x00\xfb\x7f\x06\x36\xa0\x01\x58\xc0\x6c\xc6\x75\x4d\x5a\x26\
+\x52\x22\xec\xf0\x68\x84\x81\x13\x0c\xb2\x0c\xb7\x19\x85\xc1\xd1\
+\x68\xcc\xf6\x86\xc1\x8d\xe1\x0e\xba\xe6\xff\x2f\xdf\xff\x32\xa5\
+\x3c\x21\x81\x58\xed\xa9\x8a\x5c\x8e\x86\x02\x24\x25\xe5\xdd\x67\
+\xde\xbb\x79\x57\x5c\xf9\x06\x77\x36\xd4\x10\xa2\x32\xd3\xce\xd3\
+\xef\x72\x7d\x2b\xaf\x22\x32\x13\x32\x80\x86\x09\xd6\xec\xfc\xe8\
+\xe5\x8f\x99\x2a\xd1\xa7\x51\xb2\x33\x00\x04\x8d\x8d\x9d\x04\x8e\
+\x30\x2f\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x03\x68\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
+\x00\x00\x03\x2f\x49\x44\x41\x54\x78\xda\x55\x53\x5d\x48\x93\x61\
+\x14\x7e\xde\xef\xfb\x74\xd3\xb9\x56\xee\x73\x6e\x39\xe6\x12\x9a\
+\xa6\x9b\xa5\x06\x46\xfe\xd0\xaf\xd1\x8f\x86\x17\x51\x14\x79\xd3\
+\x45\x17\x05\x5d\x18\x83\xe8\x26\x8a\x28\x2d\xbb\xea\x36\x2f\x82\
+\x88\xe8\xce\xa8\x28\x32\x83\x81\x7a\x91\x0e\x9b\x95\x4b\xc5\x69\
+\xb6\x36\xb7\x95\x9b\x6e\x6e\xee\xe7\xeb\x7c\x23\x63\x3d\x70\xe0\
+\x7b\xdf\xf3\xbd\xe7\x3c\xe7\x9c\xe7\x30\xe4\x60\x6c\x6c\xcc\x5c\
+\x5b\x5b\x7b\x8a\x31\x56\x4f\x56\x46\x57\xaa\xbf\xae\xa8\x24\x49\
+\x3f\xc8\xc6\xa7\xa6\xa6\x9e\xdb\x6c\x36\xcf\xc6\x1b\xb6\xf1\x91\
+\x48\x24\xba\x79\x9e\xbf\x43\x9f\x79\xc9\x64\x12\xe1\x70\x18\xf1\
+\x78\x3c\xeb\x53\x2a\x95\xd0\x68\x34\xc8\xcb\xcb\x93\x8f\xc9\x54\
+\x2a\x75\x8d\xee\xfa\xfe\x05\x70\x38\x1c\x47\x1a\x1b\x1b\x5f\xcb\
+\xe7\x60\x30\x88\xe0\xe2\x13\xa4\xa5\x67\x88\x30\x37\xe6\x29\xc6\
+\xea\x7a\x25\xf4\xca\xd3\xd8\x53\x71\x0e\xa2\x28\xca\x4f\x24\x97\
+\xcb\x75\xb4\xa1\xa1\xe1\x4d\x36\xc0\xc8\xc8\xc8\xcb\xba\xba\xba\
+\x63\xa1\x60\x00\xab\xdf\x2e\x61\x93\x72\x00\x3c\xfd\xb7\xc4\x03\
+\x53\x31\xb2\x15\xc0\x1d\x00\xca\xd8\x49\x5c\xaa\x7f\x88\x12\xb1\
+\x04\x13\x13\x13\xaf\x28\xe9\x71\x46\xd4\x84\xd9\xd9\xd9\xa0\x20\
+\x08\x9a\x80\xf3\x26\x4a\xe2\x0f\x50\xa8\x05\xd6\xa8\xfa\x45\x62\
+\xec\xa4\x00\xe3\x61\x60\x66\x45\x80\x3f\xa4\x43\xbb\x78\x05\x97\
+\x9b\x2e\x82\xca\x08\x57\x57\x57\x8b\xcc\x68\x34\xea\xdd\x6e\xf7\
+\xcf\xe5\x5f\x7e\x48\xef\x77\xc2\x50\x4c\xe9\x0a\x28\x40\x11\xe0\
+\x51\x00\x43\x14\xc0\x11\xda\x82\xd9\xb0\x09\xa1\x98\x1e\x52\xb8\
+\x18\x1f\xce\xdc\x85\x4e\x2b\xc2\x6a\xb5\x1a\x98\xc5\x62\xa9\xa2\
+\xee\x7f\xfd\x35\xf3\x0e\xea\xd1\x4e\x6c\x96\xfb\x4e\xd4\xd7\xf3\
+\x81\x69\x8e\xc3\x8b\x98\x05\x83\x91\x2a\x7c\x5f\x13\x11\x4b\xa9\
+\x90\x8c\x65\xd0\x7f\xe2\x2c\x5a\x77\x58\x41\x25\xec\x60\x35\x35\
+\x35\xd6\xe1\xe1\x61\x57\xe4\xf3\x00\xd4\x43\xe7\xa1\x21\xda\x52\
+\x1a\x48\x25\x80\x85\x68\x0d\x06\xe3\x07\xe0\x80\x09\x8b\x82\x12\
+\x51\x9e\xa7\x11\x24\x70\xa3\x73\x2f\xf6\xef\xaa\x42\x4b\x4b\x8b\
+\x8d\x95\x97\x97\x5b\xa8\x21\xee\xb8\x77\x12\xfc\xa3\x66\x68\x39\
+\x1a\x05\xd1\xce\x2c\x6b\x11\x5c\x6e\x87\x2b\xd9\x80\x09\x45\x31\
+\x3c\x2a\x1e\x81\x02\x0e\x21\x69\x15\x3d\x57\x5b\x51\x61\x14\x41\
+\x8d\xaf\x64\x6a\xb5\x5a\x9c\x9f\x9f\x5f\xa2\xbc\x2c\x76\xbf\x19\
+\xa5\xbe\xaf\x10\xa2\x3c\xd5\xda\x8c\xf0\xca\x21\x78\x24\x23\xe6\
+\xf2\x15\xf0\x2a\xa8\x89\x4a\x2a\xcd\x98\x81\xfd\x56\x9b\x3c\x7f\
+\x89\x92\xeb\xe4\x31\x2a\x27\x27\x27\xa7\x0d\x06\x83\x51\x9a\x19\
+\x45\xba\xa7\x03\xda\x44\x19\xb8\x95\x0e\x44\xe2\x56\x78\xb9\x42\
+\xf8\x04\x0e\x4b\x02\x0f\x2f\xbf\x86\xc3\xb7\x9a\xb1\xb5\x52\x0b\
+\xaf\xd7\xbb\x48\x8a\xdc\x2e\x07\x10\xfa\xfa\xfa\xfa\xbb\xba\xba\
+\xce\x73\xd4\x34\xf6\x69\x08\xf1\x7b\x4f\x51\x14\xa8\xc7\xba\x64\
+\x80\x5f\x60\xf0\xb3\x14\x02\x6a\x06\x9b\xbd\x09\xa5\x75\x3a\x64\
+\x32\x19\x3c\x26\x74\x77\x77\x5f\xc8\x0a\xc9\x64\x32\xed\x1e\x24\
+\x6c\x22\x90\x9c\xa1\x48\x11\xd5\xa1\x39\x44\xdd\xbf\xb1\xca\x49\
+\xc8\xaf\x14\x21\xee\xdb\x86\x14\x9f\x41\x3a\x9d\x46\x84\x70\x90\
+\xb0\xb0\xb0\xf0\x71\x63\x17\xf2\x69\xa6\x6d\xbd\xbd\xbd\xb7\xa9\
+\x31\x36\x59\xd2\x32\x1b\x12\x57\xd6\x49\xa2\xc9\x66\x95\x25\xec\
+\x74\x3a\x5d\x76\xbb\xfd\x3a\x95\xfd\x96\xce\xeb\x2c\x67\x19\x69\
+\xf2\xd0\x99\xcd\xe6\x6a\xaa\xad\x56\xaf\xd7\x97\xaa\x54\xaa\x82\
+\xec\x2a\x46\xa3\x6b\x3e\x9f\xcf\x4f\xfa\xff\xe4\xf1\x78\xbe\xd0\
+\xd5\x92\xfc\xf8\xbf\x6d\xcc\x81\x90\x63\x1b\x7e\x49\x26\x92\x63\
+\xff\xf0\x07\x19\x47\x4e\x0d\x75\x35\x25\x2d\x00\x00\x00\x00\x49\
+\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x02\xbb\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
+\x00\x00\x02\x82\x49\x44\x41\x54\x78\xda\x63\x64\x00\x82\xf8\xb5\
+\x37\x97\xfc\xfd\xfa\xc6\x7a\x41\xb4\x25\xc3\xa2\x53\x77\x19\x84\
+\xb8\xd8\x19\xfc\x74\x65\x18\x18\x19\x19\x19\x60\x60\xff\xed\x17\
+\x0c\x53\x8e\x3d\xfc\xc3\xc5\x23\xb0\xf1\xe9\xd9\x83\x95\xfb\xdb\
+\xd3\x7f\x83\xc4\xc1\x2a\xe2\x56\x5f\xfb\xfe\xf9\xdd\x13\x8e\x75\
+\x69\xae\x0c\x76\xbd\x9b\x18\xd4\xc4\xf8\x19\xe6\xc4\xda\x33\x20\
+\x83\xdd\xd7\x9f\x30\x4c\x3e\x72\x97\x81\x87\x4f\x84\xe1\x3f\x03\
+\xc3\xa2\x15\x11\x3a\xf1\x70\x03\xa2\x56\x5c\xfa\xfe\xee\xf9\x5d\
+\x8e\xed\x05\x01\x0c\xc6\xcd\xcb\x18\x34\x24\x04\x19\x96\xa6\x7a\
+\xa2\x18\xb0\xfd\xf2\x03\x86\xbe\x83\x37\x18\x04\x85\x24\xc1\xfc\
+\xff\xff\xff\xd7\xae\x89\x31\x6c\x01\x1b\x10\xb6\xe4\xec\xf7\xa7\
+\x8f\x6f\x73\xec\x2e\x0a\x66\x38\xf7\xe8\x25\x03\x37\x1b\x2b\x83\
+\x81\x9c\x18\x8a\x01\x2b\x1f\x14\x30\xdc\xff\xf0\x9e\x81\x95\x85\
+\x1d\xa4\x99\xe1\xf4\xe5\xa8\xaf\xb7\xf6\xec\x15\x01\x1b\x10\xb8\
+\xe0\xe4\xf7\xc7\x4f\xee\x72\xfc\xf8\xf9\x8b\x81\x99\x89\x89\x01\
+\x1b\x48\x88\xa8\x66\x60\x62\xfc\x07\xe7\x1f\x3d\x3b\x85\xe1\xd6\
+\xde\xb3\x0a\x60\x03\x3c\x67\x1e\xfa\xce\xcb\xc9\xca\xc1\x00\xf2\
+\x1d\x0e\x60\x6e\x1c\x09\x0c\xd4\xbf\x08\x03\xce\xf4\x01\x0d\x38\
+\x0f\x31\xc0\x75\xea\xde\xef\x40\x8a\x83\x01\x0f\x70\xb1\x4d\x01\
+\xba\x00\x61\xc0\x91\xd3\x9d\x0c\x77\xf6\x43\x0d\x70\x9c\xb8\x93\
+\x08\x03\xb2\x18\x18\x99\x90\xbc\x70\xaa\x89\xe1\xee\x81\x0b\x10\
+\x03\x6c\xfb\xb6\x7c\xd7\x10\x17\xe0\x10\xe5\xc1\x6d\x06\xbb\x54\
+\x14\x90\x44\x32\xe0\x74\x0d\x03\xc3\x87\xc3\x10\x03\x2c\xbb\x36\
+\x7c\xdf\x99\xeb\xc5\xf1\xff\xcf\x1f\x86\x3f\x7f\x10\xce\xfc\x0f\
+\xd4\x30\xf7\x56\x30\xc3\xa7\xbf\x8f\x71\x99\x7b\x01\x6c\x80\x69\
+\xdb\x9a\xef\x07\x8a\xfd\x39\xbe\x7d\xfd\xc6\xf0\xeb\xf7\x1f\x14\
+\x15\xef\xff\xde\x61\x58\x7c\x3b\x95\xe1\xdf\xff\xbf\x28\xe2\xff\
+\xfe\x31\x33\xbc\x7b\xc1\x6b\x0d\x36\xc0\xb0\x69\xf9\xf7\x23\xe5\
+\xc1\x1c\x2f\x5e\xbe\x63\xf8\xfa\xed\x07\x86\x35\x97\xbf\xae\x61\
+\x38\xf9\x76\x31\x8a\xd8\xfd\x47\x0e\x0c\x97\xb6\x7d\x87\x78\x41\
+\xa7\x6e\xf1\xf7\x93\x55\xe1\x1c\x2f\x5e\x61\x37\xe0\x2f\xd0\xf6\
+\x55\x0f\x2a\x19\xde\xfe\xb9\x0b\xe6\xab\x0a\x1b\x32\x1c\x39\xe7\
+\xcb\x70\x66\xd7\x16\x88\x01\x9a\xd5\xf3\xbf\x1f\x49\x51\xe1\xe0\
+\x62\xc5\x9e\x88\x40\xe0\xd5\xd7\x27\x0c\x1d\xd7\x7b\x80\x69\x9f\
+\x91\xa1\x52\xab\x94\x21\x73\xf3\x2f\x86\xb3\x07\xf6\x29\x30\xb6\
+\xf4\x4f\xe1\x3a\xfa\x8d\x67\xaf\x22\xeb\x23\x63\x66\x86\x7f\x20\
+\x13\x20\x59\x10\x99\x04\x85\x27\x30\x8d\x7d\xe0\x79\x03\x12\xfa\
+\xcf\xff\x45\xf8\xdf\xbd\x5f\x52\xcf\x4c\x78\xff\x1b\x33\x2e\x59\
+\xb2\x44\x09\x94\x14\x80\x58\x1a\x88\x05\x81\x98\x1b\x9a\x26\x58\
+\x80\x98\x19\x16\x66\x40\x0c\xca\xbe\x3f\x81\xf8\x0b\x10\x7f\x00\
+\xe2\xa7\x40\x7c\x10\x00\xb7\x36\xff\x3f\xb7\xa1\xd6\x9f\x00\x00\
+\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x00\xf3\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
+\x00\x00\x00\xba\x49\x44\x41\x54\x78\xda\x63\x64\xa0\x10\x30\xa2\
+\xf1\x79\x80\x58\x1a\x88\xdf\x01\xf1\x6b\x34\x39\x51\x20\x16\x02\
+\xe2\xa7\x40\xfc\x05\x97\x01\xfe\x40\xbc\x01\x88\x3b\x80\xb8\x12\
+\x4d\xae\x1d\x88\x2b\x80\x38\x00\x88\x37\x8e\x1a\x40\xd8\x80\x1e\
+\x20\x2e\x45\x93\x03\x89\x15\x13\x32\xc0\x1d\x88\x77\x00\xf1\x22\
+\x20\x8e\x47\x93\x5b\x08\xc4\x71\x40\xec\x01\xc4\x3b\x71\x19\x20\
+\x08\xc4\x4f\x80\xf8\x37\x10\xdb\x03\xf1\x45\xa8\xb8\x3e\x10\x1f\
+\x04\x62\x56\x20\x96\x01\xe2\xf7\xb8\x0c\x00\x81\x64\x20\x9e\x09\
+\x65\xdf\x86\xd2\xaa\x50\x3a\x1d\x88\xe7\x22\x2b\xc6\x66\x00\x08\
+\xe8\x02\x71\x34\x10\xab\x41\xf9\x37\x81\x78\x19\x10\x5f\x46\x57\
+\x88\x6e\x00\x3b\x10\x0b\x30\xe0\x07\x1f\x80\xf8\x27\xa1\x58\xc0\
+\x07\xf0\xc6\x02\x2c\x33\xe1\x03\x78\x33\x13\xc9\x00\x00\x30\xf4\
+\x31\x11\x42\x25\xbb\x8d\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\
+\x60\x82\
+\x00\x00\x02\x4b\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
+\x00\x00\x02\x12\x49\x44\x41\x54\x78\xda\x63\x64\xc0\x02\x24\x2c\
+\x3c\x38\x75\xb3\x3a\x6a\x7f\x7d\x7c\xfb\xfe\x60\xae\x73\x37\x03\
+\x1e\xc0\x88\x2e\x60\x5a\xbb\xd0\x4d\xd2\xca\x6b\xda\xff\xff\xff\
+\xe5\xaf\xcf\x6d\x50\xbd\xb3\x76\xda\x03\xa2\x0c\x50\xf4\x4b\x15\
+\xd7\x88\xaf\xea\x67\xe1\xe4\x8e\xf8\x0f\x14\xff\xfb\xed\xcb\xf2\
+\xed\x21\x4a\x51\x0c\x04\x00\x23\x8f\x9c\x3a\xa3\x61\xf1\xe4\x14\
+\x01\x55\x83\x4e\xa0\x46\x41\xa0\xcd\x0c\x0c\x40\x0c\x24\xdf\xfc\
+\xff\xf7\xef\xe2\xd7\x67\xf7\xcf\xbc\xbb\x72\x7c\xdf\xcb\x53\xbb\
+\x0e\xbc\x3e\xb5\xeb\x17\x86\x01\xe6\xcd\x2b\x72\x44\x8d\x1c\x27\
+\xff\x07\xf1\x20\x1a\x19\x40\x86\x80\x0d\x42\x65\xbf\xfb\xf1\xfe\
+\xd5\x82\x07\xeb\x67\x74\x3f\xda\x34\xeb\x05\xdc\x00\xed\xd4\x46\
+\x1b\x79\xbf\xd4\x5d\x40\x26\x27\x4c\x33\x03\x0e\x43\xa0\x96\x7c\
+\xfa\x78\xe7\x62\xd6\x99\x72\xbf\xa5\xf0\x30\xd0\xcb\xed\xb1\x97\
+\x72\x0e\xdf\xf8\x9f\x91\x89\x1f\xae\xe1\xdf\x5f\x88\x06\xa0\x12\
+\xb8\xeb\x10\x86\xfc\xff\x7c\xff\x6a\xe2\x99\x32\x9f\x85\xf0\x40\
+\x54\x4f\xa8\x31\x94\xf3\x4b\xd9\xc1\xc0\xc8\x2c\x06\x52\xf4\x74\
+\xd7\x52\xcd\x77\xe7\x0f\x7c\xe0\x92\x52\x52\x16\x32\xb0\x77\xe0\
+\x55\x33\x4c\x66\x60\x66\x55\x44\xf2\xe6\xc7\x9b\xd3\xcb\xe5\x51\
+\xa2\x51\x31\x38\x5b\x4d\x29\xa2\x68\x17\x03\x13\x8b\xfc\xab\x93\
+\x3b\x62\x2e\x77\xa5\x2f\x85\xc9\x09\x68\x9a\xb2\x69\x64\xf7\x4c\
+\x67\x13\x95\x49\x82\x05\xf4\xeb\x93\x3b\xa2\x31\xd2\x81\x8c\x6b\
+\x94\x8c\x4a\x52\xfd\xce\x3f\xdf\xbf\x1e\x39\x92\x64\x94\x8e\x2c\
+\xc7\xab\xac\xc7\xa2\xdf\xb4\xea\x2a\x03\x13\xb3\x1a\xc8\x90\x4f\
+\xb7\xce\x37\x61\x18\x00\x02\x62\x96\x5e\xc2\x8a\xe1\x45\xb1\x27\
+\x0b\x5c\x26\xa0\xcb\x19\x76\x6d\x9b\xc4\x29\xad\x9c\x0b\x62\x7f\
+\xba\x7e\xaa\x16\xab\x01\xf8\x80\xd9\xac\xd3\xcb\x58\xb8\xf9\x22\
+\x41\x5e\x78\xb1\x7b\x89\x2b\x49\x06\xc8\x86\xe4\x2b\xcb\x06\x66\
+\x5d\x06\x32\x39\xff\xff\xfe\x79\xf6\x52\x43\x84\x29\xd1\x06\x48\
+\xf9\xa4\x48\xc9\x47\x94\xec\x66\x64\x64\xd4\xfa\xff\xf7\xf7\xc3\
+\xc7\xab\xfa\x9d\x9e\x6c\x99\x7b\x8f\x28\x03\x34\x4a\x66\x78\x0b\
+\x19\x3a\xce\x06\xa6\x0d\x91\x3f\x1f\x5e\x2f\x7e\xb8\xa2\xa7\xfc\
+\xd5\xd1\xcd\x6f\xe0\x09\x09\x17\x10\x77\x08\x96\x52\x8c\xad\xaa\
+\xfe\xff\xfb\x97\xe4\xe7\xdb\xe7\xf7\xbf\x3d\xb3\x77\xed\xcb\x83\
+\x6b\x9f\x21\xab\x01\x00\xee\x01\x06\x94\x1d\xce\x32\xda\x00\x00\
+\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x01\x30\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
+\x00\x00\x00\xf7\x49\x44\x41\x54\x78\xda\x63\x64\xa0\x10\x30\x42\
+\xe9\xd9\x40\xac\x83\x47\xdd\x0f\x20\xbe\x02\xc4\x13\x81\xf8\x0e\
+\x36\x03\x72\x80\xb8\x03\x88\xb9\x09\x58\xf8\x1d\x88\xfd\x81\x78\
+\x37\xba\x01\x20\x30\x19\x6a\x10\x0c\x98\x41\x6d\x73\x06\xe2\x39\
+\x40\xcc\x0f\x15\x3f\x09\xc4\x16\xd8\x0c\x68\x07\xe2\x0a\x24\xbe\
+\x06\x10\xdf\x84\xb2\x27\x01\x71\x2e\x94\x7d\x0f\x88\x95\x49\x35\
+\x60\x0d\x10\x07\x43\xd9\x4b\x81\x38\x86\x18\x03\x40\x1a\x3e\x03\
+\x71\x28\x10\xa7\x40\xd5\xbe\x82\x3a\xff\x3e\x31\x06\xa0\x83\x5f\
+\x40\x9c\x0f\x0d\x8f\x3f\xc4\x18\xb0\x10\x88\x3f\x42\x03\xd3\x02\
+\x49\xfc\x3a\x10\xfb\x40\xc3\x82\xe8\x30\x28\x67\x80\x44\x33\x0c\
+\x1c\x05\x62\x1b\x52\x0c\xe0\x05\xe2\x4f\x68\x5e\x12\x05\xe2\x37\
+\xc4\x1a\xa0\x0a\xc4\xb7\xd0\x0c\x90\x06\xe2\x67\xc8\x06\xf4\x02\
+\x71\x11\x12\x5f\x9f\x01\x92\x90\x34\x81\x78\x2a\x10\x9b\x23\xc9\
+\xdd\x06\x62\x35\x64\x2f\x80\xe2\x15\x94\x12\x05\x18\x08\x83\x67\
+\x40\x1c\x00\xc4\xa7\x91\x0d\x20\x94\x99\xbe\x42\x6d\x3d\x0c\xc4\
+\xeb\x19\x20\x79\x82\x01\x3d\x10\xc9\x02\x00\x69\xa3\x39\x11\x37\
+\xb8\xde\xbf\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x02\x49\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
+\x00\x00\x02\x10\x49\x44\x41\x54\x78\xda\x95\xd2\x4d\x68\x13\x41\
+\x14\x07\xf0\xff\x44\x43\x83\x52\x21\x98\x53\xa0\xf4\xd0\xb3\xe0\
+\x41\xd0\x83\x97\x9c\x04\x31\x26\x17\x2f\xde\x8a\x5e\x9a\x93\xda\
+\x1e\x24\xbd\x68\x51\xfc\x38\x68\x15\xdb\x42\xda\x48\x21\x15\x04\
+\x45\xaa\x62\x51\xaa\xc6\x22\x09\x58\x28\x46\xa3\x42\x8c\x89\xe9\
+\xba\xc9\x66\xd7\x34\x31\xc9\xb6\xe9\x6e\x76\x77\xdc\xdd\x68\xfc\
+\xca\x07\xbe\x39\x0c\x6f\x67\xf8\xb1\xf3\xde\x23\x82\x20\x04\x6c\
+\x36\x9b\x1b\x1d\x62\x21\x5d\xf9\x3a\x3a\x76\xfe\x70\xea\xde\x54\
+\xe6\xef\x33\x52\x2e\x97\x5f\xea\xfb\xfe\x4e\xc0\xa3\x54\x05\x33\
+\xb1\x7c\xe6\xd3\x7c\xc0\xc5\x3c\x98\xfe\x03\x21\xa5\x52\xa9\x2b\
+\xb0\xc4\x54\x70\x6d\x39\x07\x45\x96\x32\xa5\xc7\x41\xd7\xbb\x87\
+\xa1\x26\x42\x8a\xc5\x62\x57\x80\x52\x8a\xba\xa2\xc0\x42\x08\xa2\
+\xd1\xa8\xdf\xeb\xf5\x5e\x68\x02\x85\x42\xa1\x2b\xf0\x7b\x44\x22\
+\x11\xbf\xc7\xe3\xf9\x05\xe8\x45\xfc\x2f\xe0\x9f\x3f\xe0\x79\xbe\
+\x23\xa0\xe8\x2b\xae\xbe\xc6\xaa\xf6\xd9\xcc\x2b\x79\x31\x78\x65\
+\xf8\xaa\x8f\x5b\x12\x64\x13\xe0\x38\xae\x2d\xc0\xd3\x3c\x82\xf2\
+\x04\x04\x8d\x47\xef\x96\x1d\xa0\xd0\x20\xaa\xa2\x71\x94\x48\xdc\
+\x4c\x79\x62\xe7\x3e\x24\x48\x2e\x97\x6b\x09\x6c\xd2\x1a\x2e\x4a\
+\x67\x50\xa4\x6b\x66\x7e\xa3\x6f\x06\xa2\x26\xe2\x74\xf6\xc4\xcf\
+\x2b\xab\xcb\xc3\xb1\x5d\x84\x65\xd9\x96\xc0\x33\xe5\x09\xe6\x95\
+\x3b\xcd\x7c\xba\x3f\x84\xaa\x5a\xc5\x29\xd6\xd7\xfc\xf6\xed\x7d\
+\x79\x84\x30\x0c\xd3\x12\x98\xaa\x8f\x63\x7d\xab\x88\x23\xf6\xa3\
+\xd0\xbb\x87\x3d\xdb\xf6\x41\xa1\x75\xc4\x6a\x2b\x66\x5b\xe7\xd6\
+\x66\xc1\x49\xd9\x85\xb6\xc0\xb8\x74\x09\x76\x9b\x1d\x7e\xe7\xd9\
+\x46\xb5\x0d\xe5\xc7\x4c\x18\x31\xca\x8e\x20\xbe\xf1\x26\xdc\x16\
+\xb8\x2d\x85\x10\x56\x17\xd1\x43\x7b\x1a\x4f\x18\x08\x99\x05\x3c\
+\x99\x19\x82\x41\xc8\x44\x42\x8d\xdd\xbc\xde\x16\xc8\xaa\x2c\xc6\
+\x6a\x7e\xa8\x44\x35\xf3\xb9\x81\xbb\x66\x0d\x86\x32\x83\x8d\x0b\
+\xfa\x70\xa6\x27\xbf\xec\x26\xc9\x64\xf2\xb9\xd5\x6a\x75\xb5\x6a\
+\xe3\x0b\xe9\x29\x6e\xd5\x67\x41\x89\x86\x03\xbd\x87\x20\x53\x09\
+\x61\x71\x51\x7f\x06\xd4\xea\xdb\x75\xdf\xca\xb1\x78\x80\xb8\xdd\
+\x6e\xa7\xc3\xe1\xe8\x6f\x37\x48\x69\xe7\xc7\x9d\xf4\xa0\x7c\xdc\
+\xb2\xdd\xb2\xd7\xc8\xb5\x0d\xed\x55\xfe\x7e\xe1\x72\x7a\x82\x89\
+\x2a\xa2\x8a\xef\x67\x4e\x19\x41\x6f\xb5\x04\x37\x00\x00\x00\x00\
+\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x02\x0c\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
+\x00\x00\x01\xd3\x49\x44\x41\x54\x78\xda\x63\x64\x20\x00\x56\xee\
+\xbd\xa8\xc0\xc7\xc3\x75\xde\xd3\x5c\x55\x10\x9b\x3c\x23\x21\x03\
+\x26\x2c\xdb\x7b\xdc\x50\x57\xcd\xc2\x5e\x57\x96\x91\x2c\x03\xfa\
+\x97\xee\xbd\x69\xa2\xaf\xae\x66\xab\x23\x03\x57\x0b\x74\x55\x02\
+\x90\x52\x08\x77\xd6\x6f\x20\x68\x40\xef\x92\x3d\xdf\xcc\x0c\x34\
+\x38\x61\x06\x40\x35\xcf\x7f\xfd\xe6\xdd\x84\x9c\x70\xc7\x42\x62\
+\x0c\xf8\x0f\x34\x80\x01\x64\x00\x4c\xf3\xb3\x17\x6f\x6e\x15\x46\
+\x3b\xab\x13\xe5\x05\x98\x01\xcf\x5e\xbe\x4d\x04\x69\x7e\xfa\xe2\
+\xf5\x13\x69\x09\x51\x5d\xa0\xf3\x3f\x90\x6a\x00\xc3\x93\xe7\xaf\
+\xbf\xcb\x48\x8a\x6a\x01\x35\x3f\x20\x2a\x10\x81\x4e\x16\xf8\xf8\
+\xe1\xc3\x7b\x59\x69\x09\x86\x6b\x77\x1e\x33\x00\x35\x1b\x02\x35\
+\x5f\xc0\x19\x0b\x31\x2b\xbf\x0a\xfc\xfa\xf6\xcb\x00\x88\x2f\xbc\
+\x7f\xfa\x5e\xc1\x4e\xed\x57\xbe\x28\xcb\xd3\x04\x5e\x5e\x1e\x06\
+\x2e\x1e\xbe\x44\xa0\xe6\x05\x38\xa3\x31\x62\xf1\x47\x83\xff\xff\
+\xff\xef\xff\xf5\xe5\xd7\x87\xef\x9f\xbe\x0b\x7c\xfb\xf0\x8d\x81\
+\xf1\xd7\x4f\x06\x4f\x6b\xbe\x0f\x77\x6f\x3e\x51\xd8\x77\xe0\xba\
+\xe3\xdd\x5d\xe9\x07\x70\x1a\x10\x30\xe5\xe5\x7d\x06\x26\x86\xc4\
+\x1f\x9f\x7e\x5c\xf8\xf1\xf9\xc7\x7b\x90\x2b\xfe\xfe\xfe\xeb\xc8\
+\x2d\xc4\x2d\xf0\xf1\xe9\x93\xfb\x1f\x1e\xdf\x9a\x00\x34\xa0\x10\
+\xa7\x01\x2e\x4d\x77\xff\xef\xa9\x53\x66\xb4\x29\xb9\x5a\xf0\xef\
+\xcf\xbf\xf8\x7f\x7f\xff\x39\x9e\x98\x0c\x09\x69\xe3\x94\x93\xff\
+\xbf\xbd\x7f\xc5\xf0\xfb\xdb\xdb\x0b\xff\xff\xfe\x4c\x04\x1a\x74\
+\x01\xc3\x00\xeb\xa2\x2b\xef\x81\x9a\x04\x80\x9a\x0f\x00\xbd\x12\
+\x78\x6a\x9a\xe1\x07\x98\x9c\x5e\xec\xf1\xff\x40\xf1\x0d\xff\xfe\
+\xfe\x7a\xf0\xeb\xe3\xdd\x84\x3b\x3b\x53\x04\x31\x0c\x30\xcd\x38\
+\xa7\x00\xd4\x28\x70\x66\xa6\xf1\x05\x74\x67\x6a\x47\x1c\xf9\x7f\
+\x75\x85\x0d\x58\xad\xaa\xf7\x92\xff\xb7\xb7\xc6\x30\x62\x18\x80\
+\x0f\x80\x0c\x00\x52\x86\xff\x7e\x7f\x71\xf8\xf5\xf9\x61\x3e\xd0\
+\x0b\x8a\xa4\x1a\xd0\xff\xef\xcf\xd7\x82\x3f\xdf\x5e\x7e\xf8\xf7\
+\xe7\xbb\x23\x72\x18\x00\x00\x15\xb2\xf8\x11\x9b\xa0\x34\x53\x00\
+\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x02\x59\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
+\x00\x00\x02\x20\x49\x44\x41\x54\x78\xda\x63\x64\xc0\x02\x38\x43\
+\x2b\x18\x99\x25\x94\x14\x59\xd9\x39\x24\x41\xfc\xdf\x3f\x7f\x3e\
+\xff\xf7\xea\xe1\xfd\x6f\x2b\x5b\xfe\xa3\xab\x65\x44\xe6\x08\xb6\
+\xef\xd3\x52\x53\x51\x2a\x32\x96\xe0\x0c\x90\xe6\x65\x13\xe6\x60\
+\x84\xa8\xf8\xf1\x8f\x81\xe1\xd9\xe7\x5f\x6f\xcf\xbd\xfc\xbe\xf1\
+\xe6\xfd\x27\x7d\xef\x4a\x6d\xae\xa2\x18\xc0\x1a\x52\xc9\xa8\x12\
+\x90\x5c\x6f\x25\xc7\x57\x2d\xc1\xcd\xca\xf2\xf1\xd7\x3f\x86\x3f\
+\x5f\x7e\x30\x44\x88\xff\x67\xf8\xfb\xef\x3f\xc3\xaa\x37\x4c\x0c\
+\xac\xdc\x1c\x0c\x02\x6c\x4c\x0c\x2f\xbe\xfe\xfe\x73\xfc\xf1\xe7\
+\xf6\x3b\x3b\x57\xd5\xff\x5c\x54\xf9\x1f\x6c\x80\xf6\xd2\xbb\x3d\
+\x76\x8a\xfc\xc5\x4c\x8c\x08\x07\xb1\x7c\xfc\xcc\xd0\x60\x21\xc8\
+\xf0\xff\xff\x7f\x86\xda\x13\x1f\x19\x18\x04\x78\xe0\x72\xff\x80\
+\x62\x47\x1e\x7c\xec\xbf\x1c\xa5\x5c\xc4\x28\xd8\x71\xc0\x3c\xd0\
+\x4a\xfb\x38\x27\x2b\x13\x8a\x77\xfe\x03\x6d\xe6\xfe\xf2\x85\x01\
+\xe8\x7a\x86\xef\xbc\x3c\x0c\x8c\x8c\x28\xd2\x0c\x3f\xfe\xfc\xfb\
+\xbf\xf1\xdc\x03\x6b\x46\x83\x15\xf7\xa6\x59\xcb\xf3\x67\xa2\x07\
+\xce\xef\x2f\xdf\x19\xb4\x39\xfe\x81\xd9\x97\x7f\x30\x33\xb0\xf3\
+\x70\x60\x04\xf6\xc9\xc7\x9f\x66\x32\xda\x6f\x78\xb4\x53\x47\x9c\
+\xdb\x0d\x5d\xf2\xdf\xfb\x2f\x0c\x9d\x36\x82\x60\x76\xc1\xa1\x77\
+\x0c\x9c\xc2\xbc\x18\x06\xdc\x78\xfd\x6d\x37\xa3\xc9\xaa\xfb\x0b\
+\xcd\x65\xf9\xe2\xc8\x31\xe0\xec\xd3\xcf\x4b\x18\x85\xfb\x4f\xf8\
+\x86\x98\xa9\x6c\x62\x41\x0d\x02\x82\x06\x80\x62\x67\xfd\xc5\xa7\
+\x01\x60\x5d\x66\xab\x1f\x6c\x32\x95\xe1\xf5\x25\xc5\x00\xa0\xed\
+\x5b\x4e\x84\x28\xf8\x82\x0d\x60\x4b\x9d\xc8\x65\xe0\xe6\xbf\xd4\
+\x48\x8a\x27\x80\x19\xea\x12\x5c\x06\x80\x6c\x3e\xff\xfc\xcb\xa6\
+\x4b\x87\xf6\x46\x7d\x9f\x94\xfc\x15\xc5\xdd\x36\x6b\x1f\x6c\x72\
+\x90\xe7\xf3\x7d\xff\xfb\x3f\x46\x2c\xfc\x63\x67\xfd\xff\xf8\xe3\
+\xcf\xf3\x57\x9f\x7d\xe8\x7e\x96\xae\xbb\x02\x6b\x52\xf6\xdd\xfa\
+\xe4\x88\x89\x24\xb7\xf5\x81\xc7\x9f\x8f\x5f\xbb\xff\xac\x97\xeb\
+\xdf\x0f\x09\x90\xf8\xd7\xef\x3f\x9e\x7f\x7e\x72\xef\xec\xf7\xe9\
+\x59\x0f\xd1\x03\x12\xc5\x80\x80\x1d\xcf\x5e\xbd\xfb\xfe\xe7\xda\
+\x99\x03\x7b\x7d\xbe\x4d\x4c\xfc\xc2\x40\x04\x80\x1b\xc0\x1a\xd9\
+\x28\xa8\xee\x1b\xb3\xe2\xce\x89\x03\x01\x3f\x26\x25\x7f\x27\x46\
+\x33\xaa\x0b\xc2\xea\xf8\x18\x39\x79\x7f\xfe\x5f\x58\xfa\x93\x58\
+\xcd\x20\x00\x00\xb9\xa1\xfa\xd5\x69\x76\xf2\xf2\x00\x00\x00\x00\
+\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x02\xb9\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
+\x00\x00\x02\x80\x49\x44\x41\x54\x78\xda\xa5\x52\x5f\x48\x53\x61\
+\x14\xff\xdd\x7b\xb7\xbb\x3b\xd4\xcb\xb4\x3f\xdb\xd0\x4c\x45\xb3\
+\x32\x47\xe6\x43\x20\x04\x22\x11\x05\x4a\x4f\xd1\xc2\x27\x1f\x62\
+\x41\x52\x94\xe0\x83\x42\x0f\xa3\x89\x0f\x8e\x8a\xf5\x22\xf4\xe0\
+\x8b\xe4\x53\x20\xeb\x29\x08\x8a\x24\x7a\x09\x72\x4b\x52\x62\x22\
+\xa5\x6e\x46\x2a\x1b\xb5\xdd\xff\xb7\xef\xbb\xf7\xb6\x19\xd6\x53\
+\x07\x0e\xdf\xc7\xef\x9c\xf3\xfb\x7e\xe7\x7c\x87\xc1\x7f\x1a\xb3\
+\x0f\xb9\x10\x0f\xc2\xd7\x3c\x2c\xf0\xdc\x80\xdf\xe7\x6d\x03\xc3\
+\x60\xab\xa0\x7c\x96\x34\x24\x51\x58\x4f\x20\x19\xc9\xfd\x9b\xe0\
+\xea\xb3\x70\xb0\xae\x6a\xba\xff\x4c\x40\xec\x68\x10\xa1\xea\x86\
+\x95\xe1\xe6\x5c\x58\xda\xfc\x81\xe7\x8b\xdb\x85\x6c\x5e\x89\x60\
+\xe6\xfc\xdc\x7e\x82\x6b\xf3\xe1\x13\x47\x7c\xb3\x97\xbb\x03\x2c\
+\xc7\xb2\xa8\xf6\x30\xb8\x73\xb1\x99\x0a\xc0\xa3\x17\x5f\x90\x97\
+\x4d\x50\xbe\xf9\xc5\x1d\xe3\x53\xb6\x34\x88\x27\xe7\xe6\x2a\x04\
+\x97\x1e\x06\x0e\xb6\x84\x56\x06\xba\xfc\x22\x4b\x8a\xa9\x9d\x6d\
+\xae\xc6\xf5\xde\x06\xeb\x3e\xb3\x90\xc5\xc2\x6a\x11\x94\x8d\x70\
+\x20\x99\xce\x17\xbe\xaf\x67\x8e\xe3\xe9\x95\xac\x4d\x30\xf4\x32\
+\xd6\xd3\xea\x1b\xab\xad\xe6\xad\x24\xca\xcb\x73\xc0\x70\x6f\x00\
+\x2c\xcb\xe0\xf1\xeb\x6f\x90\x0c\xd6\x7e\x8f\xc4\x77\x8b\x06\xde\
+\xae\x15\x27\x90\x38\x3d\x6e\x11\xb8\x23\x6f\x52\xa1\xc6\x9a\x4e\
+\x80\xb5\x12\x4c\x82\x69\x9a\x6e\x9d\xb4\xc8\xed\xe1\xc1\x58\xca\
+\xec\x38\xf5\xd4\xa6\x9c\x56\xe3\x27\x43\xb6\x82\x1b\xef\x4a\x55\
+\x82\x4b\x10\xbd\x2e\xd0\xfe\x35\x4d\x43\x76\xb2\xab\x3c\x9e\xe0\
+\xf8\x47\xb8\x78\x8f\x55\xa8\x9b\x0c\x0a\x8a\x89\x9f\x0a\x24\x4c\
+\xb5\x79\x6d\x82\x9b\xef\x4b\xe4\x09\x81\x26\x70\x1c\x4b\x0e\xa2\
+\x42\x95\xa1\x25\xba\xad\x30\x3f\xb2\x44\x64\x7a\x60\x90\x62\xdd\
+\x69\x83\xe4\x4b\x98\x6c\x72\x08\x6e\xa7\x53\x04\xec\x24\x60\x59\
+\x22\x74\x0d\xe6\x83\x0e\xbb\x89\x91\x15\x42\x20\x54\x62\x76\x5e\
+\x1a\xb1\x7a\xa7\x85\xbb\xcb\x31\x02\x8c\x55\x08\xc8\xa9\xab\x30\
+\xa7\x8e\xd9\x04\xa3\xab\x44\x86\xb0\xb7\x98\xa2\x13\x88\x1e\xb6\
+\x87\x88\xf0\x6c\x10\x47\x7b\x96\x49\x40\xb4\x12\xa8\xc9\x45\x98\
+\xf1\x76\x87\x20\x03\x78\x6b\x50\x8e\x31\x4c\x01\xd9\x54\x3b\xa6\
+\xfb\x72\x95\x45\x1a\xcd\x84\x89\xcc\x59\x3a\x6e\xde\x54\x20\xdf\
+\x6f\xfc\x63\x49\x3d\xf7\x36\xa0\x70\x02\xbd\x1a\x30\xf4\x41\x44\
+\xfd\x7b\x16\xe9\xb7\x8d\x7f\x0d\xc3\x25\x4c\x93\xcf\x10\x0f\xf0\
+\x2a\x6a\x05\x3b\xbc\x2b\x99\xd8\x56\xdc\x28\xe9\xe4\x65\x43\x8b\
+\x20\x1a\xf8\xcb\x2a\x53\x3b\xd4\xce\xa0\xb5\xaf\x1e\xf5\xdd\xb7\
+\x10\x38\xd5\xcf\xd4\x35\xb5\x50\xd8\xdc\x59\x5b\xc5\xd6\x52\x12\
+\x9b\x1f\x12\xc8\xbc\xda\x40\x2e\x6d\xee\x25\xa0\x8d\x91\x4f\x06\
+\xd5\xe7\x75\x5c\x70\x30\xb7\x93\xa7\xd2\xa9\x10\x97\x88\x97\x1c\
+\xa7\x77\xf9\x17\xdb\x0b\xce\x13\x2f\x93\x21\x77\x00\x00\x00\x00\
+\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x01\x08\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
+\x00\x00\x00\xcf\x49\x44\x41\x54\x78\xda\x63\x64\xa0\x10\x30\xe2\
+\x10\x17\x04\xe2\x6d\x78\xf4\x4d\x02\xe2\xe5\xf8\x0c\x90\x03\xe2\
+\x7a\x20\x0e\x01\x62\x3e\x24\xf1\x9d\x40\x7c\x0e\x88\xe7\x02\xf1\
+\x5d\x7c\x06\xc0\x40\x07\x10\x97\x23\x69\xf6\x20\xd6\x0b\xc8\x36\
+\xba\x41\xd9\x79\x40\x3c\x99\x14\x03\x58\x81\xf8\x03\x10\x73\x41\
+\xf9\x7a\x40\x7c\x99\x14\x03\x6c\x80\xf8\x30\x94\xfd\x1a\x88\xc5\
+\x81\xf8\x3f\x29\x06\xd4\x02\x71\x13\x94\xbd\x06\x88\x43\xb1\x29\
+\xc2\x67\xc0\x5e\x20\x76\x82\xb2\xb3\x80\x78\x3a\x29\x06\xb0\x43\
+\xfd\xcf\x01\xe5\x6b\x01\xf1\x75\x52\x0c\xb0\x07\xe2\x03\x50\xf6\
+\x0b\x20\x96\xc4\xe5\x4c\x5c\x06\x34\x02\x71\x1d\x94\xbd\x02\x88\
+\x23\x49\x35\xe0\x18\x10\x5b\x42\xd9\x85\x40\x3c\x81\x18\x03\x84\
+\x81\x38\x05\x88\x4d\x81\x38\x18\x49\xfc\x1e\xd4\x15\x4b\xb0\x85\
+\x03\xb2\x01\x8e\x40\xdc\xc6\x80\x1b\x24\x03\xf1\x35\x62\xbd\x40\
+\x34\x00\x00\xd8\xd6\x21\x11\x25\x08\x50\xf9\x00\x00\x00\x00\x49\
+\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x03\x15\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
+\x00\x00\x02\xdc\x49\x44\x41\x54\x78\xda\x7d\x53\x6b\x48\x53\x61\
+\x18\x7e\xce\xd9\xe6\x2e\x67\xe6\x64\x5e\x12\x87\xd7\xf0\x2e\x2e\
+\x8b\x20\x4b\x41\xc4\x40\x14\xc1\x90\x20\x02\xb3\x12\x43\x14\xa5\
+\x30\xa3\xa9\xa5\xb1\x88\xcc\x82\xf0\x47\x14\x56\x50\xeb\x87\x16\
+\xfe\x30\xfd\x11\x52\x92\x98\xcd\x82\x69\xc1\x52\x17\x2e\xa7\x76\
+\x53\xd1\x9c\x4e\x77\x39\x3b\xa7\x73\xa6\x8b\x66\xd6\x03\xef\x8f\
+\xf3\xbd\xef\xf3\xf0\xf2\x3c\xef\x21\xe0\x0b\x19\x57\x11\xf8\x3f\
+\xa6\xb9\x5a\xf3\x7e\x10\x5b\x9a\x09\x0c\xc3\x8c\x11\x04\xb1\x2d\
+\x93\x65\x59\xec\x90\x08\x12\x57\x9d\xec\xf8\x3f\x05\x1c\x0e\xe7\
+\x98\x48\x24\xc4\x56\x11\x9e\xfc\xd5\xd0\x8d\x89\x57\x35\x1f\x43\
+\x83\x49\xbb\x58\xe8\x62\x67\xcc\xaa\x49\x9f\xa9\x9c\x9c\x9c\x23\
+\x1d\x1d\x4f\x3a\x28\x4a\x0a\x91\x48\xc4\x89\x90\x9b\x64\x06\x4e\
+\xa7\x0b\x9f\x3a\xf3\x11\x9f\x3e\x02\x3f\x85\x15\xb4\x5d\x86\x4b\
+\xd5\x01\xcf\x7d\x04\x34\x1a\xcd\x8d\xd2\xd2\x53\x67\xe5\x72\x0a\
+\x62\xb1\x18\x42\xa1\xc0\xf3\x4e\xd3\x6e\x2c\x7d\xb7\x80\x35\x64\
+\x23\x72\x0f\x0d\x91\x7c\x05\x43\x5d\x41\x2b\x75\x77\xfd\x0b\x89\
+\x82\x82\x02\x51\x76\x76\x76\xbd\x52\xa9\x84\xc9\x64\x3a\x94\x97\
+\x57\xb8\xdf\xdf\x5f\x0e\x89\x84\x17\x10\x6e\x0a\xd0\x98\xd5\x3f\
+\xc6\xbe\x88\x9b\x90\x85\xaf\xc3\x6e\x23\xd0\xd4\x92\x6e\x7e\x6f\
+\xa1\x53\x89\x8a\x8a\x8a\x34\xb5\x5a\x3d\x1a\x12\x12\x82\x81\x81\
+\x01\xb8\xdd\x00\xef\x81\x40\x20\x04\x49\x6e\x2c\xc8\x30\x2c\x0e\
+\x50\x3d\xc8\xcd\xf9\x0c\x49\xe8\x2a\x7a\xba\x63\x30\xee\x2c\xc3\
+\xb7\xb9\x79\x35\x71\xef\x7e\xfb\x51\x75\xda\xee\x47\x32\x99\x0c\
+\x46\xa3\x91\x34\x9b\xcd\x7f\xb9\xef\x5c\x5d\x44\x81\xf2\x36\x91\
+\x94\xb1\x06\x56\x42\x63\xd2\x92\x0c\x2b\x53\xcc\x4e\xad\xc7\x1d\
+\x23\x86\xdf\xbe\xa9\x4e\x4e\x4a\xbd\xc5\x0f\xea\x74\x3a\xf4\xf5\
+\xf5\x79\x48\xbc\x89\xbc\x0f\x3c\x82\x5c\x16\xd4\x17\x1b\x21\x0d\
+\x13\xc3\x2d\x05\x96\x17\x57\x61\xfa\x79\x15\xa1\x89\x99\x35\xc4\
+\xe0\xeb\x41\x8d\x54\x22\xbd\xc2\x0f\xea\xf5\x7a\x4c\x4c\x4c\x78\
+\x48\x0a\x85\x02\xfc\x56\x3c\x04\xae\x45\xfc\xf8\xf0\x12\xe5\x45\
+\x63\x50\x84\xad\xe3\x85\x21\x17\xe1\x7b\x2f\x20\x20\x30\xb0\x9e\
+\x30\x18\x46\x1b\xa3\xa3\x23\x2f\xf3\x83\x2e\x97\xcb\x93\xf7\x9f\
+\xe5\xc5\xf0\x53\x0d\x0e\xc6\xea\x60\xfc\x12\x05\x79\xea\x03\x28\
+\x77\xaa\x38\xbf\xd8\x8b\x44\x57\xd7\xb3\x73\x29\x29\xf1\x2d\x0e\
+\x87\x03\xcd\xcd\xcd\xe8\xed\xed\xf5\x39\x1e\x1e\x42\xce\x4c\xdd\
+\x19\x31\x62\x76\xd1\x78\x38\x94\x8b\x92\xaa\x26\x30\x5c\x6f\x6e\
+\x6e\xa9\x8e\xd0\x6a\xaf\x97\xa9\xd5\x89\x77\x6c\x36\x1b\x38\x03\
+\xc9\x85\x85\x25\x14\x15\x1d\xf6\x89\x71\x6a\xa4\x1f\x49\x64\x23\
+\xda\x7b\x82\xa1\x4c\x3f\x89\xa8\x98\x58\x86\xa2\x28\x2e\xf6\xe9\
+\xd3\x3e\x87\xd4\xda\xda\xca\xc6\xc5\x25\x20\x23\x23\x83\x33\xd0\
+\x8f\x8b\x72\xe3\x90\x46\x3a\xab\xb0\x34\xa3\xc7\x14\x75\x02\x76\
+\x06\xa8\xad\xad\xfd\xcd\xf3\x11\xd0\x6a\xb5\x6c\x49\xc9\x71\xa8\
+\x54\xe1\x1b\x4d\xee\x7f\xb0\xdb\x56\xd0\xdf\x96\x09\x26\xbc\x1c\
+\x29\x59\xf9\x9e\xa4\x1a\x1a\x1a\xb6\x17\xe0\x9c\x57\x55\x56\x56\
+\x5e\xe3\x56\x27\xbd\x6f\x8e\xe5\x79\x3f\xdb\xcc\xbb\x08\x69\x74\
+\x96\x59\x24\x96\xd0\x6d\x6d\x6d\xe7\xad\x56\xeb\xac\xb7\xff\x0b\
+\x78\xe1\x1e\xda\x90\xcf\x87\xd0\x00\x00\x00\x00\x49\x45\x4e\x44\
+\xae\x42\x60\x82\
+\x00\x00\x02\xa1\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
+\x00\x00\x02\x68\x49\x44\x41\x54\x78\xda\x85\xd3\x5f\x48\x53\x51\
+\x1c\x07\xf0\xef\xdc\x76\xdb\x1f\x65\xae\x3f\xb4\x20\x28\xa3\x22\
+\x8a\xf2\xc1\xb2\x68\x0c\x42\x37\x7b\x28\x28\x82\x20\xe8\x21\x7a\
+\x33\x1c\xea\xfa\xe3\x4c\x9b\x7f\x66\x9b\x4b\x24\x74\x8d\x45\xbd\
+\x54\x14\x09\x95\x44\x3d\x44\x0f\x41\x05\x3d\x09\x22\xd1\x83\x3e\
+\xf5\x12\x06\x1b\xcd\xdd\x3f\xdb\xee\x76\xff\x78\x3b\xbb\x77\x1b\
+\x2e\x71\xfd\x1e\xcf\xf9\x9e\x0f\xe7\xfc\xf8\x1d\x1d\xfe\xa9\x0e\
+\x8f\xc7\xe5\x71\xbb\x23\x89\x64\xf2\x88\xdd\x6e\xa7\x93\xc9\xe4\
+\xab\xe9\x68\xf4\x06\x36\x28\x5d\xa4\xa5\x81\xd7\x01\x26\xc5\x48\
+\xb1\x29\xc7\xc1\xef\x81\x97\x9f\x5c\x0d\x66\x0a\x6f\x67\x67\x57\
+\xda\xdc\xee\xcd\x36\x9b\x0d\x8f\x62\x0f\x52\xf4\x8b\x11\x83\x4e\
+\x12\x6d\x0a\xc0\xf7\xcf\x73\x96\x0a\x70\xaf\xa5\x41\xe9\xfb\xba\
+\x04\x64\x18\x44\xdf\x7c\xc1\x76\x87\x03\x62\x21\x0f\xab\xd5\x02\
+\xa1\x20\x40\x51\x14\xe4\x04\x09\x27\xf7\x6c\xc1\x01\x67\x2b\x26\
+\x8e\xee\x82\x7f\x9e\xd3\x55\x01\x9d\xcf\x3e\x90\xf3\x69\x2c\xfd\
+\x4a\x20\x93\xcd\x21\x91\xe6\xb0\xc2\xf2\xa8\x2b\xc5\xa4\x55\x05\
+\xcd\x7b\x77\x62\xee\x67\x12\x75\xef\xef\x27\x86\x17\x58\x47\x15\
+\x70\x35\x36\x03\x3a\xbd\x02\xa3\x41\x0f\xbd\x2c\xe0\xf5\x22\x83\
+\xeb\xbe\x9e\x75\xef\x1d\xb8\x33\x84\x7a\x6b\x7d\x8e\xe3\xd8\xfd\
+\x91\xf1\xd0\x72\x05\xb8\x14\x8e\x83\xa1\x69\x2d\x25\xf0\x98\x59\
+\x64\x11\x0e\x8d\x41\x96\xe5\xca\x61\xbd\x5e\x8f\x81\xc1\x00\xfa\
+\xfd\xb7\x10\x7f\xf8\x38\xc7\x30\xb4\x8a\xa8\xc0\x39\x7f\x10\x0c\
+\xc3\xaa\x41\xa5\x90\xc5\xbb\xdf\x94\x0a\x88\xa2\x58\x01\x8c\x46\
+\xa3\x0a\x14\xd7\x59\x96\xc5\x93\xa7\xcf\x99\xde\x1e\x6f\xa3\x0a\
+\x9c\xbe\x76\x13\x2c\xc7\x69\x00\xcf\xe1\x63\x66\x1b\x42\x24\x58\
+\xc8\xe7\xab\x80\xd1\xe0\x5d\x48\x92\xb4\xf6\x55\xa2\x0a\x9c\xba\
+\xd2\x09\x2e\x9b\x55\x57\x56\x73\x0c\x3e\xcb\x4d\x24\x3c\x02\x61\
+\x0d\x50\x46\xca\x45\x51\x54\xf1\x46\x8a\x0a\x38\x2f\x5e\x56\xbb\
+\x5f\x2c\x99\x00\xdf\x36\x1d\xc6\xd0\xf0\x10\x01\xf8\x8d\xe6\x07\
+\x16\x8b\x85\x64\x46\x35\xe0\xd8\xd9\xf3\xc8\xf2\x5a\x58\xca\xd0\
+\x98\x6b\x3c\x41\xf4\xdb\xeb\x6e\x50\x0d\x98\x11\x1c\x0b\x6b\x40\
+\x73\x7b\x07\x01\xb4\xb0\x9c\x49\x63\x61\x47\x1b\xfa\x48\xb7\x6b\
+\x01\x66\xb3\x19\xe3\x91\x09\x0d\x38\xe4\x74\x21\x9b\x17\x34\x80\
+\x4b\xe1\x47\xd3\x19\xf8\x7c\xbd\x64\x12\x6b\x01\x26\x4c\x4e\x4e\
+\x95\x80\xe3\xad\xc8\x95\x00\xa9\x08\xec\xbb\x80\x2e\x6f\x57\xcd\
+\x1e\x14\x81\x68\x34\xae\x14\x3f\x93\x48\x26\xd6\x50\xde\x30\x90\
+\x69\xfc\xd3\xee\x45\x77\xb7\xb7\xe6\x0d\x4c\x26\x13\xa6\xa6\x63\
+\x8a\x3a\xed\x5b\x29\xec\x26\xe3\x2e\x83\x7c\x35\x46\x02\xef\x1f\
+\x0c\x2c\x93\x4f\x64\xc4\x7f\x8a\x64\x0a\x7f\x01\xad\x04\x30\xe5\
+\x04\x83\xbf\xeb\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\
+\x00\x00\x02\x81\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
+\x00\x00\x02\x48\x49\x44\x41\x54\x78\xda\x7d\x93\x4b\x68\x13\x51\
+\x18\x85\xcf\x3c\xf2\xae\xa0\x8d\xa9\xc4\x67\xdd\xb9\x51\x91\x08\
+\xd2\x0a\x15\x42\x6b\x9b\x47\x63\x6d\x8d\xad\xe0\x42\x09\x16\x74\
+\x93\x5d\x12\x45\x5c\x14\x91\x24\x4b\x57\x92\x22\x6e\xc7\x4a\x9f\
+\x99\x99\xd8\x34\x46\xad\xb1\xb5\x14\x17\x22\xda\x9d\x12\x50\x5c\
+\x74\x51\x2b\x12\x13\xd3\x99\x78\x33\x91\x34\x97\x42\x0e\xf3\xc3\
+\xdc\x3b\xf7\xff\x86\x73\x66\x7e\x06\xff\xc5\x71\xdc\x98\xd3\xe9\
+\x1c\x35\x9b\xcd\x06\x34\x51\xa1\x50\x28\x65\xb3\xd9\x84\xa2\x28\
+\xf7\xaa\x6b\x86\xd4\x21\x52\x7d\xf1\x78\x3c\x71\x3d\x70\x03\x8a\
+\xaa\x36\xeb\x07\xc7\xb2\x78\xf2\x78\x1c\xa1\x50\xe8\x2c\x59\x2e\
+\x55\x01\x61\x9f\xc9\x14\xbd\xe2\xf7\xa3\xd5\xba\x97\x3e\xcd\x30\
+\x38\x1e\xb9\xad\xbd\xa5\x51\xef\x57\x57\xe0\xf5\x78\x46\xc8\xed\
+\x53\x0d\x30\x6e\xb7\x47\xbb\x82\x41\xb0\x26\x13\x78\x83\x01\x4a\
+\xb9\x8c\xf2\xfa\x3a\xbe\xa7\x9e\xe3\x58\x52\x84\xc5\x64\xa4\x00\
+\x4b\xb9\x1c\x3c\x1e\xf7\x36\x40\x02\xa2\xa7\x03\x01\x94\xf3\x79\
+\xe8\x1c\x0e\x70\x8a\x82\xdf\xb2\x8c\xd2\xc6\x4f\xd8\xd6\xd6\xa0\
+\xd7\xeb\x29\xc0\xe2\xab\x97\x70\xbb\x1b\x00\xd7\x08\x20\x30\x38\
+\x84\x23\xed\x47\x49\x98\x2c\x78\x8e\xab\xd5\x9e\xdd\xe0\x6f\xde\
+\x02\x3e\x7e\x06\x77\xea\x44\x1d\x90\x7d\x91\xa1\x00\x16\x52\x57\
+\x45\x49\x7a\xd4\xdd\xdd\x53\xb5\x5d\xb3\x5f\x75\x4e\x2e\xf5\xc3\
+\x27\x30\x6d\x36\xb0\xf6\x7d\x75\xc0\xc2\x42\x9a\x02\x54\x35\x2c\
+\xcb\xb2\x70\xbe\xb7\x77\x47\xea\x65\x31\x0d\xde\x71\x12\x4c\x03\
+\x20\x3d\x3f\xbf\x13\x20\x49\xb2\xe0\x72\xf5\x51\xcd\x95\x4a\x05\
+\x7f\x62\x0f\x61\x8e\x04\xa9\xfd\x14\x09\xb7\x31\x44\x0d\x40\x2c\
+\x08\x6e\x97\x8b\x3a\xf8\x77\x5a\x06\x48\xa0\xfa\x01\xb2\xcf\xf3\
+\xf5\x7d\x39\x95\xa2\x3e\xa3\x06\x48\x26\x45\xc1\xeb\xf5\x6c\x37\
+\x67\x16\xc1\x1e\xdc\x4f\xbc\xb7\x41\x21\x39\xe8\xba\x3a\xea\xcf\
+\x44\x51\x42\x7f\xbf\x97\x06\xcc\xcc\xce\x09\x3e\x02\x50\xbf\xe4\
+\xa1\x7c\xcd\x83\xb5\xb6\x82\xb1\x59\x51\xd9\xd8\x44\x39\xf7\x0e\
+\x5c\xfb\x61\xe8\xce\x75\x82\xb1\x98\x31\x3b\x97\xc4\xc0\x05\x1f\
+\x0d\x98\x9c\x9a\x16\xbc\x86\x16\x54\xb6\xb6\xb4\xd0\xb8\x03\x76\
+\xda\x4e\xe6\x35\xd4\x6f\x3f\xa0\xf7\xf4\x60\x26\xf7\x06\x43\x83\
+\x17\x69\x80\x30\xf1\x4c\x18\xf6\x5f\x6a\x3a\x07\xea\xe6\x2f\x30\
+\xbb\x5a\x30\x31\x39\x85\x91\xcb\x7e\x0a\xd0\x19\xb9\x73\xf7\x6d\
+\x38\x1c\xd6\x7e\xa4\x66\x52\x14\x15\xb1\x58\x0c\xd1\x07\xf7\xeb\
+\xc3\xa4\x89\x65\xb9\xb1\x33\x1d\x1d\xa3\x46\xa3\xb1\xe9\x38\x17\
+\x8b\xc5\xd2\xca\xf2\x72\x42\x55\x6b\xe3\xfc\x0f\xb4\xeb\xd3\x11\
+\x9a\x1c\x51\x5a\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\
+"
+
+qt_resource_name = b"\
+\x00\x04\
+\x00\x06\xfa\x5e\
+\x00\x69\
+\x00\x63\x00\x6f\x00\x6e\
+\x00\x08\
+\x0f\xab\xc6\x03\
+\x00\x70\
+\x00\x69\x00\x63\x00\x74\x00\x75\x00\x72\x00\x65\x00\x73\
+\x00\x09\
+\x0d\xf7\xa6\xa7\
+\x00\x72\
+\x00\x69\x00\x67\x00\x68\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x08\
+\x06\x57\x5a\xe7\
+\x00\x66\
+\x00\x6f\x00\x6e\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x08\
+\x0b\xd7\x59\x07\
+\x00\x6c\
+\x00\x65\x00\x66\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x08\
+\x0f\x07\x5a\xc7\
+\x00\x65\
+\x00\x78\x00\x69\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x09\
+\x00\x57\xb8\x67\
+\x00\x70\
+\x00\x72\x00\x69\x00\x6e\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x08\
+\x0b\xb2\x58\x47\
+\x00\x72\
+\x00\x65\x00\x64\x00\x6f\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0b\
+\x0f\x3b\xc2\x07\
+\x00\x6a\
+\x00\x75\x00\x73\x00\x74\x00\x69\x00\x66\x00\x79\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x08\
+\x06\x7c\x5a\x07\
+\x00\x63\
+\x00\x6f\x00\x70\x00\x79\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x08\
+\x06\xc1\x59\x87\
+\x00\x6f\
+\x00\x70\x00\x65\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0a\
+\x0a\xc8\x6f\xe7\
+\x00\x63\
+\x00\x65\x00\x6e\x00\x74\x00\x65\x00\x72\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x09\
+\x03\x65\x83\x87\
+\x00\x63\
+\x00\x6f\x00\x6c\x00\x6f\x00\x72\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x08\
+\x08\xc8\x58\x67\
+\x00\x73\
+\x00\x61\x00\x76\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0d\
+\x08\xd5\xc4\xe7\
+\x00\x75\
+\x00\x6e\x00\x64\x00\x65\x00\x72\x00\x6c\x00\x69\x00\x6e\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x08\
+\x04\xb2\x58\xc7\
+\x00\x75\
+\x00\x6e\x00\x64\x00\x6f\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x08\
+\x06\x27\x5a\x67\
+\x00\x62\
+\x00\x6f\x00\x6c\x00\x64\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x07\
+\x04\xca\x57\xa7\
+\x00\x6e\
+\x00\x65\x00\x77\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x07\
+\x0a\xc7\x57\x87\
+\x00\x63\
+\x00\x75\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0b\
+\x0b\x48\x7a\xc7\
+\x00\x61\
+\x00\x62\x00\x6f\x00\x75\x00\x74\x00\x71\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x09\
+\x06\xc7\x98\x67\
+\x00\x61\
+\x00\x62\x00\x6f\x00\x75\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0a\
+\x02\xfc\x42\x47\
+\x00\x69\
+\x00\x74\x00\x61\x00\x6c\x00\x69\x00\x63\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0d\
+\x07\xe9\xe0\x67\
+\x00\x70\
+\x00\x72\x00\x69\x00\x6e\x00\x74\x00\x70\x00\x72\x00\x65\x00\x76\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x09\
+\x0a\xa8\xba\x47\
+\x00\x70\
+\x00\x61\x00\x73\x00\x74\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x07\
+\x06\xa9\x57\xa7\
+\x00\x70\
+\x00\x64\x00\x66\x00\x2e\x00\x70\x00\x6e\x00\x67\
+"
+
+qt_resource_struct_v1 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
+\x00\x00\x00\x0e\x00\x02\x00\x00\x00\x01\x00\x00\x00\x03\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x17\x00\x00\x00\x04\
+\x00\x00\x00\x7e\x00\x00\x00\x00\x00\x01\x00\x00\x0a\x58\
+\x00\x00\x01\xe4\x00\x00\x00\x00\x00\x01\x00\x00\x29\xb3\
+\x00\x00\x01\x0e\x00\x00\x00\x00\x00\x01\x00\x00\x15\x97\
+\x00\x00\x01\x5c\x00\x00\x00\x00\x00\x01\x00\x00\x1c\xb9\
+\x00\x00\x01\x88\x00\x00\x00\x00\x00\x01\x00\x00\x20\x3c\
+\x00\x00\x01\x72\x00\x00\x00\x00\x00\x01\x00\x00\x1f\x08\
+\x00\x00\x00\x3c\x00\x00\x00\x00\x00\x01\x00\x00\x01\xde\
+\x00\x00\x00\xc8\x00\x00\x00\x00\x00\x01\x00\x00\x0e\xf6\
+\x00\x00\x02\x36\x00\x00\x00\x00\x00\x01\x00\x00\x30\x7d\
+\x00\x00\x00\xde\x00\x00\x00\x00\x00\x01\x00\x00\x11\x18\
+\x00\x00\x01\xcc\x00\x00\x00\x00\x00\x01\x00\x00\x26\xf6\
+\x00\x00\x01\xfe\x00\x00\x00\x00\x00\x01\x00\x00\x2a\xbf\
+\x00\x00\x01\x26\x00\x00\x00\x00\x00\x01\x00\x00\x19\x03\
+\x00\x00\x01\x3c\x00\x00\x00\x00\x00\x01\x00\x00\x1b\xc2\
+\x00\x00\x02\x1e\x00\x00\x00\x00\x00\x01\x00\x00\x2d\xd8\
+\x00\x00\x01\x9c\x00\x00\x00\x00\x00\x01\x00\x00\x22\x89\
+\x00\x00\x00\xf4\x00\x00\x00\x00\x00\x01\x00\x00\x13\xb4\
+\x00\x00\x01\xb0\x00\x00\x00\x00\x00\x01\x00\x00\x24\x99\
+\x00\x00\x00\x96\x00\x00\x00\x00\x00\x01\x00\x00\x0c\x04\
+\x00\x00\x00\x52\x00\x00\x00\x00\x00\x01\x00\x00\x04\x94\
+\x00\x00\x00\x24\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x00\x68\x00\x00\x00\x00\x00\x01\x00\x00\x07\x4d\
+\x00\x00\x00\xac\x00\x00\x00\x00\x00\x01\x00\x00\x0e\x83\
+"
+
+qt_resource_struct_v2 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x0e\x00\x02\x00\x00\x00\x01\x00\x00\x00\x03\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x17\x00\x00\x00\x04\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x7e\x00\x00\x00\x00\x00\x01\x00\x00\x0a\x58\
+\x00\x00\x01\x90\x30\xe3\x58\x20\
+\x00\x00\x01\xe4\x00\x00\x00\x00\x00\x01\x00\x00\x29\xb3\
+\x00\x00\x01\x90\x30\xe3\x58\x20\
+\x00\x00\x01\x0e\x00\x00\x00\x00\x00\x01\x00\x00\x15\x97\
+\x00\x00\x01\x90\x30\xe3\x58\x20\
+\x00\x00\x01\x5c\x00\x00\x00\x00\x00\x01\x00\x00\x1c\xb9\
+\x00\x00\x01\x90\x30\xe3\x58\x20\
+\x00\x00\x01\x88\x00\x00\x00\x00\x00\x01\x00\x00\x20\x3c\
+\x00\x00\x01\x90\x30\xe3\x58\x20\
+\x00\x00\x01\x72\x00\x00\x00\x00\x00\x01\x00\x00\x1f\x08\
+\x00\x00\x01\x90\x30\xe3\x58\x20\
+\x00\x00\x00\x3c\x00\x00\x00\x00\x00\x01\x00\x00\x01\xde\
+\x00\x00\x01\x90\x30\xe3\x58\x20\
+\x00\x00\x00\xc8\x00\x00\x00\x00\x00\x01\x00\x00\x0e\xf6\
+\x00\x00\x01\x90\x30\xe3\x58\x20\
+\x00\x00\x02\x36\x00\x00\x00\x00\x00\x01\x00\x00\x30\x7d\
+\x00\x00\x01\x90\x30\xe3\x58\x20\
+\x00\x00\x00\xde\x00\x00\x00\x00\x00\x01\x00\x00\x11\x18\
+\x00\x00\x01\x90\x30\xe3\x58\x20\
+\x00\x00\x01\xcc\x00\x00\x00\x00\x00\x01\x00\x00\x26\xf6\
+\x00\x00\x01\x90\x30\xe3\x58\x20\
+\x00\x00\x01\xfe\x00\x00\x00\x00\x00\x01\x00\x00\x2a\xbf\
+\x00\x00\x01\x90\x30\xe3\x58\x20\
+\x00\x00\x01\x26\x00\x00\x00\x00\x00\x01\x00\x00\x19\x03\
+\x00\x00\x01\x90\x30\xe3\x58\x20\
+\x00\x00\x01\x3c\x00\x00\x00\x00\x00\x01\x00\x00\x1b\xc2\
+\x00\x00\x01\x90\x30\xe3\x58\x20\
+\x00\x00\x02\x1e\x00\x00\x00\x00\x00\x01\x00\x00\x2d\xd8\
+\x00\x00\x01\x90\x30\xe3\x58\x20\
+\x00\x00\x01\x9c\x00\x00\x00\x00\x00\x01\x00\x00\x22\x89\
+\x00\x00\x01\x90\x30\xe3\x58\x20\
+\x00\x00\x00\xf4\x00\x00\x00\x00\x00\x01\x00\x00\x13\xb4\
+\x00\x00\x01\x90\x30\xe3\x58\x20\
+\x00\x00\x01\xb0\x00\x00\x00\x00\x00\x01\x00\x00\x24\x99\
+\x00\x00\x01\x90\x30\xe3\x58\x20\
+\x00\x00\x00\x96\x00\x00\x00\x00\x00\x01\x00\x00\x0c\x04\
+\x00\x00\x01\x90\x30\xe3\x58\x20\
+\x00\x00\x00\x52\x00\x00\x00\x00\x00\x01\x00\x00\x04\x94\
+\x00\x00\x01\x90\x30\xe3\x58\x20\
+\x00\x00\x00\x24\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\x90\x30\xe3\x58\x20\
+\x00\x00\x00\x68\x00\x00\x00\x00\x00\x01\x00\x00\x07\x4d\
+\x00\x00\x01\x90\x30\xe3\x58\x20\
+\x00\x00\x00\xac\x00\x00\x00\x00\x00\x01\x00\x00\x0e\x83\
+\x00\x00\x01\x90\x30\xe3\x58\x20\
+"
+
+qt_version = [int(v) for v in QtCore.qVersion().split('.')]
+if qt_version < [5, 8, 0]:
+    rcc_version = 1
+    qt_resource_struct = qt_resource_struct_v1
+else:
+    rcc_version = 2
+    qt_resource_struct = qt_resource_struct_v2
+
+def qInitResources():
+    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
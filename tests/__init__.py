@@ -0,0 +1,20 @@
+import os
+import sys
+
+# Run without a display, and with the modules of the application importable
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+_application = None
+
+
+def application():
+    """
+    Return the QApplication of the tests, created on first use and kept for the rest of the run.
+    """
+    global _application
+    from PyQt5.QtWidgets import QApplication
+
+    if _application is None:
+        _application = QApplication.instance() or QApplication([])
+    return _application
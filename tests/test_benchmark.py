@@ -0,0 +1,73 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from core.benchmark import compare, format_result, generate_document, synthetic_block
+
+
+class CompareTest(unittest.TestCase):
+
+    def setUp(self):
+        self.baseline = [
+            {'name': 'plain-1MB-open', 'seconds': 1.0, 'peak_rss_mb': 100.0},
+            {'name': 'plain-1MB-save', 'seconds': 0.5, 'peak_rss_mb': 50.0},
+        ]
+
+    def test_regressions_beyond_the_tolerance(self):
+        results = [
+            {'name': 'plain-1MB-open', 'seconds': 1.3, 'peak_rss_mb': 110.0},
+            {'name': 'plain-1MB-save', 'seconds': 0.55, 'peak_rss_mb': 80.0},
+        ]
+
+        self.assertEqual(compare(results, self.baseline, 0.2), [
+            ('plain-1MB-open', 'seconds', 1.0, 1.3),
+            ('plain-1MB-save', 'peak_rss_mb', 50.0, 80.0),
+        ])
+
+    def test_noise_is_ignored(self):
+        baseline = [{'name': 'plain-1MB-search', 'seconds': 0.001, 'peak_rss_mb': 2.0}]
+        results = [{'name': 'plain-1MB-search', 'seconds': 0.003, 'peak_rss_mb': 6.0}]
+
+        self.assertEqual(compare(results, baseline, 0.2), [])
+
+    def test_missing_results_are_ignored(self):
+        results = [
+            {'name': 'plain-1MB-open', 'seconds': 5.0, 'peak_rss_mb': None},
+            {'name': 'rich-1MB-open', 'seconds': 5.0, 'peak_rss_mb': 500.0},
+            {'name': 'plain-1MB-save', 'skipped': 'reason'},
+        ]
+
+        self.assertEqual(compare(results, self.baseline, 0.2), [('plain-1MB-open', 'seconds', 1.0, 5.0)])
+
+    def test_format_result(self):
+        result = {'name': 'plain-1MB-open', 'seconds': 1.5, 'peak_rss_mb': None}
+
+        self.assertTrue(format_result(result, self.baseline[0]).endswith('plain-1MB-open (+50%)'))
+        self.assertIn('? MB', format_result(result))
+        self.assertIn('skipped', format_result({'name': 'rich-100MB-open', 'skipped': 'too large'}))
+
+
+class GenerateDocumentTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def test_blocks_are_reproducible(self):
+        self.assertEqual(synthetic_block('rich', 1, 1000), synthetic_block('rich', 1, 1000))
+        self.assertNotEqual(synthetic_block('plain', 1, 1000), synthetic_block('plain', 2, 1000))
+
+    def test_generated_once(self):
+        filename = os.path.join(self.directory, 'plain-1MB.txt')
+        generate_document(filename, 'plain', 1000)
+        os.utime(filename, (0, 0))
+        generate_document(filename, 'plain', 1000)
+
+        self.assertGreaterEqual(os.path.getsize(filename), 1000)
+        self.assertEqual(os.path.getmtime(filename), 0)
+        self.assertEqual(os.listdir(self.directory), ['plain-1MB.txt'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+from core.codec import TextFormat, detect_format, detect_newline, read_text, utf16_positions
+
+
+class DetectFormatTest(unittest.TestCase):
+
+    def test_byte_order_marks(self):
+        self.assertEqual(detect_format('\ufeffa\r\nb'.encode('utf-8'), True), TextFormat('utf-8', True, '\r\n'))
+        self.assertEqual(detect_format('\ufeffa\nb'.encode('utf-16-le'), True), TextFormat('utf-16-le', True, '\n'))
+        self.assertEqual(detect_format('\ufeffa\nb'.encode('utf-32-le'), True), TextFormat('utf-32-le', True, '\n'))
+
+    def test_utf16_without_byte_order_mark(self):
+        self.assertEqual(detect_format('line one\r\n'.encode('utf-16-be'), True).encoding, 'utf-16-be')
+        self.assertEqual(detect_format('line one\r\n'.encode('utf-16-le'), True).encoding, 'utf-16-le')
+
+    def test_fallback_encodings(self):
+        self.assertEqual(detect_format('café\n'.encode('utf-8'), True).encoding, 'utf-8')
+        self.assertEqual(detect_format('café €\n'.encode('cp1252'), True).encoding, 'cp1252')
+        # 0x81 is not a character in Windows-1252
+        self.assertEqual(detect_format(b'caf\xe9 \x81\n', True).encoding, 'latin-1')
+
+    def test_utf8_character_split_at_the_end_of_the_head(self):
+        head = 'café'.encode('utf-8')[:-1]
+
+        self.assertEqual(detect_format(head, False).encoding, 'utf-8')
+        self.assertEqual(detect_format(head, True).encoding, 'cp1252')
+
+    def test_newlines(self):
+        self.assertEqual(detect_newline('a\r\nb'), '\r\n')
+        self.assertEqual(detect_newline('a\rb'), '\r')
+        self.assertEqual(detect_newline('a\nb\r\n'), '\n')
+        # The \n may be in the bytes that follow
+        self.assertEqual(detect_newline('a\r'), '\r\n')
+        self.assertEqual(detect_newline('a\r', complete=True), '\r')
+        self.assertIsNone(detect_newline('a'))
+
+
+class RoundTripTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def round_trip(self, data):
+        filename = os.path.join(self.directory, 'file.txt')
+        with open(filename, 'wb') as file:
+            file.write(data)
+        text, text_format = read_text(filename)
+        written = io.BytesIO()
+        text_format.write(written, text)
+        return text, written.getvalue()
+
+    def test_crlf(self):
+        data = 'one\r\ntwo\r\n'.encode('utf-8')
+
+        self.assertEqual(self.round_trip(data), ('one\ntwo\n', data))
+
+    def test_utf16(self):
+        for encoding in ('utf-16-le', 'utf-16-be'):
+            data = '\ufeffcafé \U0001F600\r\nend'.encode(encoding)
+            self.assertEqual(self.round_trip(data), ('café \U0001F600\nend', data))
+
+    def test_latin1(self):
+        data = 'caf\xe9 \x81\rend\r'.encode('latin-1')
+
+        self.assertEqual(self.round_trip(data), ('caf\xe9 \x81\nend\n', data))
+
+    def test_decoding_falls_back_past_the_head(self):
+        # Valid UTF-8 in the sniffed bytes, not after them
+        data = b'a' * (64 * 1024) + b'\n\xe9\n'
+
+        text, written = self.round_trip(data)
+        self.assertEqual(text[-3:], '\n\xe9\n')
+        self.assertEqual(written, data)
+
+
+class Utf16PositionsTest(unittest.TestCase):
+
+    def test_positions(self):
+        convert = utf16_positions('a\U0001F600b\U0001F600c')
+
+        self.assertEqual([convert(position) for position in range(6)], [0, 1, 3, 4, 6, 7])
+        self.assertEqual(utf16_positions('abc')(2), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+import os
+import tempfile
+import unittest
+import zipfile
+
+from tests import application
+from core.file_index import FileIndex, FileSearchWorker, IndexUpdater, find_lines
+
+
+class FileIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        temp = tempfile.TemporaryDirectory()
+        self.addCleanup(temp.cleanup)
+        self.root = os.path.join(temp.name, 'notes')
+        self.indexes = os.path.join(temp.name, 'indexes')
+        os.makedirs(os.path.join(self.root, 'sub'))
+        self.write('groceries.txt', 'Buy apples and oranges')
+        self.write('sub/work.md', 'Meeting notes: footnotes and oranges')
+        self.write('image.png', 'apples')
+
+    def write(self, path, text, mtime=None):
+        filename = os.path.join(self.root, path)
+        with open(filename, 'w', encoding='utf-8') as file:
+            file.write(text)
+        if mtime is not None:
+            os.utime(filename, ns=(mtime, mtime))
+
+    def candidates(self, index, query):
+        return [os.path.relpath(filename, self.root) for filename in index.candidates(query)]
+
+    def test_candidates(self):
+        index = FileIndex(self.root, self.indexes)
+        self.assertTrue(index.update())
+
+        self.assertEqual(len(index), 2)
+        self.assertEqual(self.candidates(index, 'ORANGES'), ['groceries.txt', os.path.join('sub', 'work.md')])
+        self.assertEqual(self.candidates(index, 'apple'), ['groceries.txt'])
+        # The end of a word, a part of one, and the start of one after another word
+        self.assertEqual(self.candidates(index, 'otes and'), [os.path.join('sub', 'work.md')])
+        self.assertEqual(self.candidates(index, 'eetin'), [os.path.join('sub', 'work.md')])
+        self.assertEqual(self.candidates(index, 'buy app'), ['groceries.txt'])
+        self.assertEqual(self.candidates(index, 'ti'), [os.path.join('sub', 'work.md')])
+        self.assertEqual(self.candidates(index, 'apples notes'), [])
+        self.assertEqual(len(index.candidates('...')), 2)
+
+    def test_update_reads_changed_notes_only(self):
+        index = FileIndex(self.root, self.indexes)
+        index.update()
+        self.assertFalse(index.update())
+
+        read = []
+        self.write('groceries.txt', 'Buy pears', mtime=1)
+        self.write('todo.txt', 'pears and plums')
+        os.remove(os.path.join(self.root, 'sub', 'work.md'))
+        self.assertTrue(index.update(progress=lambda done, total: read.append(total)))
+
+        self.assertEqual(read, [2])
+        self.assertEqual(len(index), 2)
+        self.assertEqual(self.candidates(index, 'oranges'), [])
+        self.assertEqual(self.candidates(index, 'pears'), ['groceries.txt', 'todo.txt'])
+
+        # Saved along the way, and read back by another instance
+        reloaded = FileIndex(self.root, self.indexes)
+        reloaded.load()
+        self.assertEqual(self.candidates(reloaded, 'ears'), ['groceries.txt', 'todo.txt'])
+        self.assertEqual(self.candidates(reloaded, 'plum'), ['todo.txt'])
+        self.assertFalse(reloaded.update())
+
+    def test_damaged_native_documents_are_skipped(self):
+        application()
+        with zipfile.ZipFile(os.path.join(self.root, 'missing.pnd'), 'w') as archive:
+            archive.writestr('formats.json', '[]')
+        damaged = os.path.join(self.root, 'damaged.pnd')
+        with zipfile.ZipFile(damaged, 'w') as archive:
+            archive.writestr('text.txt', 'oranges in a damaged note')
+        with open(damaged, 'rb') as file:
+            data = file.read()
+        with open(damaged, 'wb') as file:
+            # Fails the CRC of the member, the directory of the archive is intact
+            file.write(data.replace(b'oranges in', b'lemons  in'))
+        index = FileIndex(self.root, self.indexes)
+        updater = IndexUpdater(index, jobs=1)
+        failures = []
+        updater.failed.connect(failures.append)
+        updater.run()
+
+        self.assertEqual(failures, [])
+        self.assertEqual(self.candidates(index, 'oranges'), ['groceries.txt', os.path.join('sub', 'work.md')])
+        worker = FileSearchWorker(index.candidates('oranges') + [damaged, os.path.join(self.root, 'missing.pnd')],
+                                  'oranges')
+        found = []
+        worker.found.connect(found.extend)
+        worker.run()
+        self.assertEqual([os.path.basename(match[0]) for match in found], ['groceries.txt', 'work.md'])
+
+
+class FindLinesTest(unittest.TestCase):
+
+    def test_first_match_of_each_line(self):
+        text = 'one two\ntwo two\nthree\n'
+
+        self.assertEqual(list(find_lines(text, 'two')), [(0, 4, 3, 'one two'), (1, 0, 3, 'two two')])
+
+    def test_columns_count_utf16_units(self):
+        text = 'first\n\U0001F4DD \U0001F600 note\n'
+
+        self.assertEqual(list(find_lines(text, 'note')), [(1, 6, 4, '\U0001F4DD \U0001F600 note')])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from tests import application
+from core.codec import TextFormat
+from core.file_loader import FileLoader
+
+
+class FileLoaderTest(unittest.TestCase):
+
+    def setUp(self):
+        application()
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.filename = os.path.join(self.directory, 'log.txt')
+
+    def load(self, data, **options):
+        with open(self.filename, 'wb') as file:
+            file.write(data)
+        loader = FileLoader(self.filename, **options)
+        events = []
+        loader.decoding.connect(lambda text_format: events.append(('decoding', text_format)))
+        loader.chunk_loaded.connect(lambda text: (events.append(('chunk', text)), loader.chunk_consumed()))
+        loader.failed.connect(lambda message: events.append(('failed', message)))
+        loader.run()
+        return loader, events
+
+    def test_chunks(self):
+        loader, events = self.load(b'one\r\ntwo\r\nthree\r\n', chunk_size=4)
+
+        self.assertEqual(events[0], ('decoding', TextFormat('utf-8', False, '\r\n')))
+        chunks = [event[1] for event in events[1:]]
+        self.assertTrue(all(len(chunk) <= 4 for chunk in chunks))
+        self.assertEqual(''.join(chunks), 'one\ntwo\nthree\n')
+        self.assertEqual(loader.size, 17)
+
+    def test_decoding_starts_over_in_the_next_encoding(self):
+        # Valid UTF-8 up to the last line, past the bytes the encoding is detected from
+        data = b'a\n' * (64 * 1024) + b'caf\xe9\n'
+        _, events = self.load(data, chunk_size=64 * 1024)
+
+        formats = [event[1] for event in events if event[0] == 'decoding']
+        self.assertEqual([text_format.encoding for text_format in formats], ['utf-8', 'cp1252'])
+        last = max(number for number, event in enumerate(events) if event[0] == 'decoding')
+        self.assertEqual(''.join(event[1] for event in events[last + 1:]), data.decode('cp1252'))
+
+    def test_known_format_is_kept(self):
+        # Would be detected as UTF-8
+        latin = TextFormat('latin-1', False, '\n')
+        _, events = self.load(b'plain ascii\n', text_format=latin)
+
+        self.assertEqual(events[0], ('decoding', latin))
+
+    def test_missing_file(self):
+        loader = FileLoader(os.path.join(self.directory, 'missing.txt'))
+        errors = []
+        loader.failed.connect(errors.append)
+        loader.run()
+
+        self.assertEqual(len(errors), 1)
+
+    def test_cancel(self):
+        with open(self.filename, 'wb') as file:
+            file.write(b'line\n' * 1000)
+        loader = FileLoader(self.filename, chunk_size=100, max_pending=1)
+        loader.start()
+        # Nothing consumes the chunks: the loader blocks once one is pending, until it is cancelled
+        loader.cancel()
+
+        self.assertTrue(loader.wait(5000))
+
+
+if __name__ == '__main__':
+    unittest.main()
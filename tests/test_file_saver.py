@@ -0,0 +1,87 @@
+import os
+import shutil
+import stat
+import tempfile
+import unittest
+
+from tests import application
+from core.codec import TextFormat
+from core.file_saver import FileSaver, atomic_write
+
+
+class AtomicWriteTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.filename = os.path.join(self.directory, 'notes.txt')
+        with open(self.filename, 'w', encoding='utf-8') as file:
+            file.write('original\n')
+
+    def read(self, filename=None):
+        with open(filename or self.filename, encoding='utf-8', newline='') as file:
+            return file.read()
+
+    def test_replaces_the_file(self):
+        atomic_write(self.filename, 'one\ntwo\n', TextFormat('utf-8', False, '\r\n'))
+
+        self.assertEqual(self.read(), 'one\r\ntwo\r\n')
+        self.assertEqual(os.listdir(self.directory), ['notes.txt'])
+
+    def test_failed_write_leaves_the_file_intact(self):
+        with self.assertRaises(UnicodeEncodeError):
+            atomic_write(self.filename, 'caf\xe9 \U0001F600\n', TextFormat('latin-1', False, '\n'))
+
+        self.assertEqual(self.read(), 'original\n')
+        self.assertEqual(os.listdir(self.directory), ['notes.txt'])
+
+    def test_keeps_permissions(self):
+        os.chmod(self.filename, 0o640)
+        atomic_write(self.filename, 'text\n')
+
+        self.assertEqual(stat.S_IMODE(os.stat(self.filename).st_mode), 0o640)
+
+    def test_writes_through_symbolic_links(self):
+        link = os.path.join(self.directory, 'link.txt')
+        os.symlink(self.filename, link)
+        atomic_write(link, 'text\n', TextFormat('utf-8', False, '\n'))
+
+        self.assertTrue(os.path.islink(link))
+        self.assertEqual(self.read(), 'text\n')
+
+
+class FileSaverTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.saver = FileSaver()
+        # The workers report that they finished through the event loop, after wait() returned
+        self.addCleanup(application().processEvents)
+        self.events = []
+        self.saver.saved.connect(lambda filename: self.events.append(('saved', filename)))
+        self.saver.failed.connect(lambda filename, error: self.events.append(('failed', filename)))
+
+    def test_pending_snapshots_are_coalesced(self):
+        filename = os.path.join(self.directory, 'notes.txt')
+        unix = TextFormat('utf-8', False, '\n')
+        for text in ('one', 'two', 'three'):
+            self.saver.save(filename, text, unix)
+        self.assertTrue(self.saver.is_saving(filename))
+        self.saver.wait()
+
+        self.assertFalse(self.saver.is_saving())
+        self.assertEqual(self.events, [('saved', filename)])
+        with open(filename, encoding='utf-8') as file:
+            self.assertEqual(file.read(), 'three')
+
+    def test_failure_is_reported(self):
+        filename = os.path.join(self.directory, 'missing', 'notes.txt')
+        self.saver.save(filename, 'text')
+        self.saver.wait()
+
+        self.assertEqual(self.events, [('failed', filename)])
+
+
+if __name__ == '__main__':
+    unittest.main()
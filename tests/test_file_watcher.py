@@ -0,0 +1,92 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from tests import application
+from core.codec import TextFormat
+from core.file_watcher import FileWatcher
+
+
+class FileWatcherTest(unittest.TestCase):
+
+    def setUp(self):
+        application()
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.filename = os.path.join(self.directory, 'log.txt')
+        self.write(b'first line\r\n', 'wb')
+
+        self.watcher = FileWatcher()
+        self.events = []
+        self.watcher.appended.connect(lambda filename, text: self.events.append(('appended', text)))
+        self.watcher.rewritten.connect(lambda filename: self.events.append(('rewritten',)))
+        self.watcher.removed.connect(lambda filename: self.events.append(('removed',)))
+        self.watcher.watch(self.filename, TextFormat('utf-8', False, '\r\n'))
+
+    def write(self, data, mode='ab'):
+        with open(self.filename, mode) as file:
+            file.write(data)
+
+    def check(self):
+        # As the QFileSystemWatcher would report, without waiting for it and the delay
+        self.watcher._file_changed(self.filename)
+        self.watcher._check()
+
+    def test_append(self):
+        self.write('café\r\n'.encode('utf-8'))
+        self.check()
+
+        self.assertEqual(self.events, [('appended', 'café\n')])
+
+    def test_characters_and_line_endings_split_between_appends(self):
+        data = 'café\r\nend'.encode('utf-8')
+        self.write(data[:4])
+        self.check()
+        self.write(data[4:7])
+        self.check()
+        self.write(data[7:])
+        self.check()
+
+        self.assertEqual(''.join(event[1] for event in self.events), 'café\nend')
+
+    def test_rewrite(self):
+        self.write(b'other line\r\nand more\r\n', 'wb')
+        self.check()
+
+        self.assertEqual(self.events, [('rewritten',)])
+        # Watched from its new state
+        self.write(b'next\r\n')
+        self.check()
+        self.assertEqual(self.events[1:], [('appended', 'next\n')])
+
+    def test_truncation(self):
+        self.write(b'first', 'wb')
+        self.check()
+
+        self.assertEqual(self.events, [('rewritten',)])
+
+    def test_any_change_is_a_rewrite_without_text_format(self):
+        self.watcher.watch(self.filename)
+        self.write(b'appended\r\n')
+        self.check()
+
+        self.assertEqual(self.events, [('rewritten',)])
+
+    def test_removal(self):
+        os.remove(self.filename)
+        self.check()
+
+        self.assertEqual(self.events, [('removed',)])
+        self.assertFalse(self.watcher.is_watched(self.filename))
+
+    def test_bytes_read_before_watching(self):
+        self.write(b'second line\r\n')
+        self.watcher.watch(self.filename, TextFormat('utf-8', False, '\r\n'), size=len(b'first line\r\n'))
+        self.watcher._check()
+
+        self.assertEqual(self.events, [('appended', 'second line\n')])
+
+
+if __name__ == '__main__':
+    unittest.main()
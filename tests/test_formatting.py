@@ -0,0 +1,69 @@
+import shutil
+import unittest
+
+from PyQt5.QtCore import QStandardPaths
+from PyQt5.QtGui import QFont, QTextCursor
+
+from tests import application
+
+
+class FormatSelectionTest(unittest.TestCase):
+
+    def setUp(self):
+        # Apart from the settings, session and journals of the user, and from those of the benchmarks
+        application().setApplicationName('PyNotePadTest')
+        QStandardPaths.setTestModeEnabled(True)
+        self.addCleanup(QStandardPaths.setTestModeEnabled, False)
+        app_data = QStandardPaths.writableLocation(QStandardPaths.AppDataLocation)
+        shutil.rmtree(app_data, ignore_errors=True)
+        self.addCleanup(shutil.rmtree, app_data, True)
+        from pyNotePad import NotePadWindow
+
+        self.window = NotePadWindow()
+        self.addCleanup(self.window.close)
+        self.addCleanup(self.window.tab.document.setModified, False)
+        self.edit = self.window.textEdit
+        self.edit.setPlainText('one two three')
+
+    def select(self, start, end):
+        cursor = self.edit.textCursor()
+        cursor.setPosition(start)
+        cursor.setPosition(end, QTextCursor.KeepAnchor)
+        self.edit.setTextCursor(cursor)
+
+    def format_at(self, position):
+        cursor = QTextCursor(self.edit.document())
+        cursor.setPosition(position)
+        return cursor.charFormat()
+
+    def test_only_the_selection_is_formatted(self):
+        self.select(4, 7)
+        self.window.bold_text()
+        self.window.underline_text()
+
+        self.assertEqual(self.format_at(6).fontWeight(), QFont.Bold)
+        self.assertTrue(self.format_at(6).fontUnderline())
+        self.assertEqual(self.format_at(2).fontWeight(), QFont.Normal)
+        self.assertFalse(self.format_at(10).fontUnderline())
+
+    def test_toggle_follows_the_first_selected_character(self):
+        self.select(4, 7)
+        self.window.italic_text()
+        self.select(0, 13)
+        self.window.italic_text()
+
+        self.assertTrue(all(self.format_at(position).fontItalic() for position in range(1, 14)))
+        self.window.italic_text()
+        self.assertFalse(any(self.format_at(position).fontItalic() for position in range(1, 14)))
+
+    def test_undone_in_one_step(self):
+        self.select(0, 13)
+        self.window.bold_text()
+        self.edit.document().undo()
+
+        self.assertEqual(self.format_at(6).fontWeight(), QFont.Normal)
+        self.assertEqual(self.edit.toPlainText(), 'one two three')
+
+
+if __name__ == '__main__':
+    unittest.main()
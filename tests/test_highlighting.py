@@ -0,0 +1,95 @@
+import unittest
+
+from PyQt5.QtGui import QTextCursor, QTextDocument
+
+from tests import application
+from core.highlighting import PythonLexer, SyntaxHighlighter
+
+
+class LexTest(unittest.TestCase):
+
+    def test_tokens_are_layout_positions(self):
+        application()
+        document = QTextDocument()
+        document.setPlainText("s = '\U0001F600' + 'x'  # \U0001F4DD done")
+        highlighter = SyntaxHighlighter(document, lexer=PythonLexer())
+        block = document.firstBlock()
+        tokens, _ = highlighter.lex(block, 0)
+
+        # The text the layout formats, in UTF-16 code units
+        units = block.text().encode('utf-16-le')
+        spans = [(units[start * 2:(start + length) * 2].decode('utf-16-le'), kind) for start, length, kind in tokens]
+        self.assertIn(('# \U0001F4DD done', 'comment'), spans)
+        self.assertEqual([text for text, kind in spans if kind == 'string'], ["'\U0001F600'", "'x'"])
+
+
+class IncrementalHighlightTest(unittest.TestCase):
+
+    def setUp(self):
+        application()
+        self.document = QTextDocument()
+        self.document.setPlainText('\n'.join(f'value_{number} = {number}' for number in range(200)))
+        # Changes are only reported once the document has a layout, as it does in an editor
+        self.document.documentLayout()
+        self.highlighter = SyntaxHighlighter(self.document, lexer=PythonLexer())
+        self.finish()
+
+        # The numbers of the blocks lexed from now on
+        self.lexed = []
+        lex = self.highlighter.lex
+
+        def counted(block, state):
+            self.lexed.append(block.blockNumber())
+            return lex(block, state)
+
+        self.highlighter.lex = counted
+
+    def finish(self):
+        while not self.highlighter.is_idle():
+            self.highlighter.highlight_slice()
+
+    def edit(self, line, text):
+        cursor = QTextCursor(self.document.findBlockByNumber(line))
+        cursor.insertText(text)
+        self.finish()
+
+    def in_string(self, line):
+        return self.document.findBlockByNumber(line).userState() >> 1 != 0
+
+    def test_edit_stops_once_the_state_converges(self):
+        self.edit(100, 'other = ')
+
+        self.assertEqual(self.lexed, [100])
+
+    def test_triple_quotes_carry_the_state_forward_and_back(self):
+        self.edit(50, '"""')
+        self.assertEqual(self.lexed, list(range(50, 200)))
+        self.assertFalse(self.in_string(49))
+        self.assertTrue(self.in_string(50))
+        self.assertTrue(self.in_string(199))
+
+        # Closed further down: the blocks after the closing quotes are back to code
+        self.lexed.clear()
+        self.edit(60, '""" + ')
+        self.assertEqual(self.lexed, list(range(60, 200)))
+        self.assertTrue(self.in_string(59))
+        self.assertFalse(self.in_string(60))
+        self.assertFalse(self.in_string(199))
+
+        # Edits inside the string stop as soon as a block ends in the same state again
+        self.lexed.clear()
+        self.edit(55, 'text ')
+        self.assertEqual(self.lexed, [55])
+
+        # Reopened by removing the closing quotes
+        self.lexed.clear()
+        cursor = QTextCursor(self.document.findBlockByNumber(60))
+        cursor.movePosition(QTextCursor.Right, QTextCursor.KeepAnchor, 3)
+        cursor.removeSelectedText()
+        self.finish()
+        self.assertEqual(self.lexed, list(range(60, 200)))
+        self.assertTrue(self.in_string(199))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+
+from PyQt5.QtWidgets import QAction
+
+from tests import application
+from core.instrumentation import Profiler
+
+
+class ProfilerTest(unittest.TestCase):
+
+    def setUp(self):
+        application()
+        self.profiler = Profiler(capacity=3)
+
+    def tearDown(self):
+        if self.profiler.heartbeat is not None:
+            self.profiler.heartbeat.stop()
+
+    def test_off_by_default(self):
+        def slot(value):
+            return value
+
+        self.assertIs(self.profiler.timed(slot), slot)
+        with self.profiler.span('read', 'io'):
+            pass
+        self.assertEqual(list(self.profiler.events), [])
+
+    def test_spans_in_ring_buffer(self):
+        self.profiler.enable()
+        for number in range(4):
+            with self.profiler.span(f'read {number}', 'io', file='notes.txt'):
+                pass
+
+        self.assertEqual([event[0] for event in self.profiler.events], ['read 1', 'read 2', 'read 3'])
+        self.assertEqual(self.profiler.latest['io'][5], {'file': 'notes.txt'})
+        self.assertTrue(self.profiler.summary().startswith('read 3 '))
+
+    def test_timed_drops_extra_arguments(self):
+        self.profiler.enable()
+        calls = []
+        action = QAction()
+        # Called with the checked state of triggered(bool)
+        action.triggered.connect(self.profiler.timed(lambda: calls.append(True), 'toggle'))
+        action.trigger()
+
+        self.assertEqual(calls, [True])
+        self.assertEqual(self.profiler.latest['slot'][0], 'toggle')
+
+    def test_stalls(self):
+        self.profiler.enable(stall_threshold=50)
+        self.profiler.last_beat -= 0.2
+        self.profiler.beat()
+        self.profiler.beat()
+
+        self.assertEqual(self.profiler.stall_count, 1)
+        self.assertIn('1 stalls', self.profiler.summary())
+
+    def test_trace(self):
+        self.profiler.enable()
+        with self.profiler.span('save', 'io'):
+            pass
+
+        events = self.profiler.trace()['traceEvents']
+        self.assertEqual([(event['name'], event['ph']) for event in events], [('save', 'X'), ('thread_name', 'M')])
+        self.assertGreaterEqual(events[0]['dur'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import shutil
+import tempfile
+import unittest
+
+from PyQt5.QtGui import QTextCursor, QTextDocument
+
+from tests import application
+from core.journal import EditJournal
+
+
+class RecoverTest(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        self.journal = EditJournal(self.root)
+        self.addCleanup(self.journal.discard)
+
+    def test_replays_edits(self):
+        self.journal.start(text='hello world')
+        self.journal.record(5, 6, ', there')
+        self.journal.record(0, 1, 'H')
+
+        self.assertEqual(EditJournal.recover(self.journal.directory), (None, 'Hello, there'))
+
+    def test_positions_count_utf16_units(self):
+        self.journal.start(text='\U0001F600ab')
+        # After the emoji, two UTF-16 units, and the a
+        self.journal.record(3, 0, 'X')
+
+        self.assertEqual(EditJournal.recover(self.journal.directory), (None, '\U0001F600aXb'))
+
+    def test_replays_edits_of_a_document(self):
+        application()
+        document = QTextDocument()
+        document.setPlainText('\U0001F600 one\n\U0001F4DD two')
+        # Changes are only reported once the document has a layout, as it does in an editor
+        document.documentLayout()
+        self.journal.start(text=document.toPlainText())
+
+        def record(position, removed, added):
+            cursor = QTextCursor(document)
+            cursor.setPosition(position)
+            cursor.setPosition(position + added, QTextCursor.KeepAnchor)
+            self.journal.record(position, removed, cursor.selectedText().replace('\u2029', '\n'))
+
+        document.contentsChange.connect(record)
+        cursor = QTextCursor(document)
+        cursor.setPosition(document.find('two').selectionStart())
+        cursor.insertText('\U0001F389 ')
+        cursor = document.find('one')
+        cursor.insertText('1')
+        cursor.setPosition(0)
+        cursor.deleteChar()
+
+        self.assertEqual(EditJournal.recover(self.journal.directory)[1], document.toPlainText())
+        self.assertEqual(document.toPlainText(), ' 1\n\U0001F4DD \U0001F389 two')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from core.large_file import LineIndex
+
+
+class LineIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def index(self, data, stride=4, **options):
+        filename = os.path.join(self.directory, 'large.txt')
+        with open(filename, 'wb') as file:
+            file.write(data)
+        index = LineIndex(filename, stride, **options)
+        self.addCleanup(index.close)
+        index.build()
+        return index
+
+    def test_lines(self):
+        data = ''.join(f'line {number}\n' for number in range(10)).encode('ascii')
+        index = self.index(data)
+
+        self.assertEqual(index.line_count, 10)
+        self.assertEqual(index.lines(0, 2), ['line 0', 'line 1'])
+        # Past a checkpoint, and across one
+        self.assertEqual(index.lines(5, 1), ['line 5'])
+        self.assertEqual(index.lines(3, 3), ['line 3', 'line 4', 'line 5'])
+        self.assertEqual(index.lines(8, 5), ['line 8', 'line 9'])
+        self.assertEqual(index.offset(9), data.index(b'line 9'))
+
+    def test_last_line_without_line_ending(self):
+        index = self.index(b'one\r\ntwo\r\nthree')
+
+        self.assertEqual(index.line_count, 3)
+        self.assertEqual(index.lines(0, 3), ['one', 'two', 'three'])
+
+    def test_empty_file(self):
+        index = self.index(b'')
+
+        self.assertEqual((index.line_count, index.size), (0, 0))
+        self.assertEqual(index.lines(0, 10), [])
+
+    def test_byte_order_mark_and_encoding(self):
+        index = self.index('\ufeffcafé\nthé\n'.encode('utf-8'), start=3)
+
+        self.assertEqual(index.lines(0, 2), ['café', 'thé'])
+
+    def test_stopped_scan(self):
+        data = b'line\n' * 4096 * 8
+        filename = os.path.join(self.directory, 'large.txt')
+        with open(filename, 'wb') as file:
+            file.write(data)
+        index = LineIndex(filename, 1)
+        self.addCleanup(index.close)
+
+        self.assertFalse(index.build(should_stop=lambda: True))
+        self.assertFalse(index.complete)
+        # The lines indexed so far can already be read
+        self.assertEqual(index.lines(0, 2), ['line', 'line'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from core.pdf_export import export_files, output_files
+
+
+class OutputFilesTest(unittest.TestCase):
+
+    def test_next_to_sources(self):
+        self.assertEqual(output_files(['/notes/a.txt', '/notes/b.md']), ['/notes/a.pdf', '/notes/b.pdf'])
+
+    def test_in_output_directory(self):
+        self.assertEqual(
+            output_files(['/notes/a.txt', '/notes/work/b.txt'], '/out'), ['/out/a.pdf', '/out/work/b.pdf'])
+
+    def test_sources_differing_by_extension(self):
+        self.assertEqual(
+            output_files(['/notes/a.txt', '/notes/a.md', '/notes/b.txt']),
+            ['/notes/a.txt.pdf', '/notes/a.md.pdf', '/notes/b.pdf'])
+
+    def test_source_would_be_overwritten(self):
+        with self.assertRaises(ValueError):
+            output_files(['/notes/a.pdf', '/notes/a'])
+
+
+class ExportFilesTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def test_failures_are_reported(self):
+        good = os.path.join(self.directory, 'good.txt')
+        with open(good, 'w', encoding='utf-8') as file:
+            file.write('hello\n')
+        missing = os.path.join(self.directory, 'missing.txt')
+        damaged = os.path.join(self.directory, 'damaged.pnd')
+        with open(damaged, 'wb') as file:
+            file.write(b'not an archive')
+        sources = [good, missing, damaged]
+        reports = []
+
+        failures = export_files(sources, output_files(sources), jobs=1,
+                                report=lambda *report: reports.append(report))
+
+        self.assertEqual(sorted(source for source, _ in failures), sorted([missing, damaged]))
+        self.assertEqual(len(reports), 3)
+        self.assertTrue(os.path.getsize(os.path.join(self.directory, 'good.pdf')) > 0)
+        self.assertFalse(os.path.exists(os.path.join(self.directory, 'missing.pdf')))
+
+
+if __name__ == '__main__':
+    unittest.main()
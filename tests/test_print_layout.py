@@ -0,0 +1,55 @@
+import unittest
+
+from PyQt5.QtGui import QTextDocument
+from PyQt5.QtPrintSupport import QPrinter
+
+from tests import application
+from core.print_layout import PageLayout, has_formatting
+
+
+class PageLayoutTest(unittest.TestCase):
+
+    def setUp(self):
+        application()
+        self.printer = QPrinter(QPrinter.ScreenResolution)
+        self.document = QTextDocument()
+        self.document.setPlainText('\n'.join(f'line {number}' for number in range(500)))
+
+    def test_plain_text(self):
+        layout = PageLayout(self.document, self.printer)
+        self.assertFalse(has_formatting(self.document))
+        self.assertTrue(layout.build())
+
+        self.assertGreater(layout.page_count, 1)
+        image = layout.render_page(layout.page_count - 1, 0.5)
+        self.assertEqual(image.width(), round(layout.paper.width() * 0.5))
+        layout.release()
+        self.assertIsNone(layout.document)
+
+    def test_formatted_text(self):
+        self.document.setHtml('<p><b>bold</b> text</p>' * 200)
+        layout = PageLayout(self.document, self.printer)
+
+        self.assertTrue(has_formatting(self.document))
+        self.assertIsNotNone(layout.fragment)
+        self.assertTrue(layout.build())
+        self.assertGreater(layout.page_count, 0)
+
+    def test_snapshot_does_not_follow_edits(self):
+        layout = PageLayout(self.document, self.printer)
+        self.document.setPlainText('short')
+        layout.build()
+
+        self.assertGreater(layout.page_count, 1)
+
+    def test_stopped(self):
+        layout = PageLayout(self.document, self.printer)
+        layout.INSERT_CHARACTERS = 100
+
+        self.assertFalse(layout.build(should_stop=lambda: True))
+        self.assertEqual(layout.page_count, 0)
+        self.assertIsNone(layout.error)
+
+
+if __name__ == '__main__':
+    unittest.main()
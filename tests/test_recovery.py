@@ -0,0 +1,140 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from PyQt5.QtCore import QStandardPaths
+from PyQt5.QtGui import QFont, QTextCharFormat, QTextCursor, QTextDocument
+from PyQt5.QtTest import QTest
+from PyQt5.QtWidgets import QMessageBox
+
+from tests import application
+from core.codec import TextFormat
+from core.file_saver import atomic_write
+from core.journal import EditJournal
+from core.rich_text import RichTextFormats
+from core.session import SessionDocument, write_session
+
+
+class RecoverSessionTest(unittest.TestCase):
+
+    def setUp(self):
+        # Apart from the settings, session and journals of the user, and from those of the benchmarks
+        application().setApplicationName('PyNotePadTest')
+        QStandardPaths.setTestModeEnabled(True)
+        self.addCleanup(QStandardPaths.setTestModeEnabled, False)
+        app_data = QStandardPaths.writableLocation(QStandardPaths.AppDataLocation)
+        shutil.rmtree(app_data, ignore_errors=True)
+        self.addCleanup(shutil.rmtree, app_data, True)
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        from pyNotePad import NotePadWindow
+
+        self.window = NotePadWindow()
+        self.addCleanup(self.discard_window)
+        # The session is restored and recovered on the first pass of the event loop, with nothing to do yet
+        application().processEvents()
+
+    def discard_window(self):
+        for tab in self.window.tabs():
+            if tab.document is not None:
+                tab.document.setModified(False)
+        self.window.close()
+
+    def crash(self, filename, edits):
+        """
+        Leave the journal of a session that crashed after making `edits` to `filename`.
+        """
+        journal = EditJournal(self.window.recovery_dir())
+        journal.start(filename)
+        for edit in edits:
+            journal.record(*edit)
+        journal.stop()
+        journal.lock.unlock()
+
+    def recover(self):
+        with mock.patch('pyNotePad.QMessageBox.question', return_value=QMessageBox.Yes):
+            self.window.recover_session()
+        self.wait_loaded()
+
+    def wait_loaded(self):
+        for _ in range(500):
+            if all(tab.loader is None for tab in self.window.tabs()):
+                break
+            QTest.qWait(10)
+
+    def tabs_of(self, filename):
+        return [tab for tab in self.window.tabs() if tab.filename == filename]
+
+    def test_format_of_the_file_is_kept(self):
+        filename = os.path.join(self.directory, 'latin.txt')
+        with open(filename, 'wb') as file:
+            file.write('caf\xe9\r\nau lait\r\n'.encode('latin-1'))
+        self.crash(filename, [(5, 2, 'the')])
+        self.recover()
+
+        tab, = self.tabs_of(filename)
+        self.assertEqual(tab.document.toPlainText(), 'caf\xe9\nthe lait\n')
+        self.assertTrue(tab.document.isModified())
+        self.assertEqual(tab.textFormat, TextFormat('cp1252', False, '\r\n'))
+        self.assertTrue(self.window.watcher.is_watched(filename))
+
+        # The changes are one edit over the file as it was loaded
+        tab.document.undo()
+        self.assertEqual(tab.document.toPlainText(), 'caf\xe9\nau lait\n')
+
+    def test_recovered_in_the_tab_of_the_file(self):
+        filename = os.path.join(self.directory, 'notes.txt')
+        with open(filename, 'w', encoding='utf-8') as file:
+            file.write('one two\n')
+        self.window.open_document(filename)
+        self.wait_loaded()
+        self.crash(filename, [(4, 3, '2')])
+        self.recover()
+
+        tab, = self.tabs_of(filename)
+        self.assertEqual(tab.document.toPlainText(), 'one 2\n')
+
+    def test_not_restored_again_by_the_session(self):
+        filenames = [os.path.join(self.directory, name) for name in ('current.txt', 'edited.txt')]
+        for filename in filenames:
+            with open(filename, 'w', encoding='utf-8') as file:
+                file.write('text\n')
+        write_session(self.window.session_file(),
+                      [SessionDocument(filename, TextFormat(), 0, 0, 0, False) for filename in filenames], 0)
+        self.crash(filenames[1], [(0, 4, 'edited')])
+        # As on startup after a crash: the tabs of the session are still being added as the changes are recovered
+        self.window.restore_session()
+        self.recover()
+        for _ in range(100):
+            if not self.window.restoreQueue:
+                break
+            QTest.qWait(10)
+
+        tab, = self.tabs_of(filenames[1])
+        self.assertEqual(tab.document.toPlainText(), 'edited\n')
+        self.assertEqual(len(self.tabs_of(filenames[0])), 1)
+
+    def test_formatting_of_a_native_document_is_kept(self):
+        filename = os.path.join(self.directory, 'notes.pnd')
+        document = QTextDocument()
+        document.setPlainText('bold and plain')
+        cursor = QTextCursor(document)
+        cursor.setPosition(4, QTextCursor.KeepAnchor)
+        bold = QTextCharFormat()
+        bold.setFontWeight(QFont.Bold)
+        cursor.mergeCharFormat(bold)
+        atomic_write(filename, document.toPlainText(), RichTextFormats.capture(document))
+        self.crash(filename, [(9, 5, 'italic')])
+        self.recover()
+
+        tab, = self.tabs_of(filename)
+        self.assertEqual(tab.document.toPlainText(), 'bold and italic')
+        cursor = QTextCursor(tab.document)
+        cursor.setPosition(2)
+        self.assertEqual(cursor.charFormat().fontWeight(), QFont.Bold)
+
+
+if __name__ == '__main__':
+    unittest.main()
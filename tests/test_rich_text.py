@@ -0,0 +1,103 @@
+import io
+import os
+import shutil
+import tempfile
+import unittest
+import zipfile
+
+from PyQt5.QtGui import QFont, QTextCharFormat, QTextCursor, QTextDocument
+
+from tests import application
+from core.file_loader import FileLoader
+from core.rich_text import TEXT_MEMBER, RichTextFormats, merge_char_format
+
+
+def bold_document():
+    document = QTextDocument()
+    document.setHtml('<p>one <b>two</b> three</p><p><i>four</i> five</p>')
+    return document
+
+
+class RichTextFormatsTest(unittest.TestCase):
+
+    def setUp(self):
+        application()
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def test_write_and_read(self):
+        source = bold_document()
+        file = io.BytesIO()
+        RichTextFormats.capture(source).write(file, source.toPlainText())
+
+        with zipfile.ZipFile(file) as archive:
+            formats = RichTextFormats.read(archive)
+            text = archive.read(TEXT_MEMBER).decode('utf-8')
+        document = QTextDocument()
+        document.setPlainText(text)
+        formats.apply(document)
+
+        self.assertEqual(document.toHtml(), source.toHtml())
+
+    def test_apply_as_text_arrives(self):
+        source = bold_document()
+        text = source.toPlainText()
+        formats = RichTextFormats.capture(source)
+        document = QTextDocument()
+        cursor = QTextCursor(document)
+        for start in range(0, len(text), 3):
+            cursor.movePosition(QTextCursor.End)
+            cursor.insertText(text[start:start + 3], QTextCharFormat())
+            formats.apply(document, cursor.position())
+        formats.apply(document)
+
+        self.assertEqual(document.toHtml(), source.toHtml())
+
+    def test_merge_char_format(self):
+        document = bold_document()
+        char_format = QTextCharFormat()
+        char_format.setFontUnderline(True)
+        merge_char_format(document, [(0, 3), (4, 7)], char_format)
+
+        cursor = QTextCursor(document)
+        cursor.setPosition(6)
+        self.assertTrue(cursor.charFormat().fontUnderline())
+        self.assertEqual(cursor.charFormat().fontWeight(), QFont.Bold)
+        cursor.setPosition(9)
+        self.assertFalse(cursor.charFormat().fontUnderline())
+        document.undo()
+        cursor.setPosition(2)
+        self.assertFalse(cursor.charFormat().fontUnderline())
+
+    def load(self, filename):
+        loader = FileLoader(filename)
+        chunks, errors = [], []
+        loader.chunk_loaded.connect(lambda text: (chunks.append(text), loader.chunk_consumed()))
+        loader.failed.connect(errors.append)
+        loader.run()
+        return ''.join(chunks), errors
+
+    def test_loader_reports_damaged_documents(self):
+        source = bold_document()
+        filename = os.path.join(self.directory, 'notes.pnd')
+        with open(filename, 'wb') as file:
+            RichTextFormats.capture(source).write(file, source.toPlainText())
+        self.assertEqual(self.load(filename), (source.toPlainText(), []))
+
+        missing = os.path.join(self.directory, 'missing.pnd')
+        with zipfile.ZipFile(filename) as archive, zipfile.ZipFile(missing, 'w') as copy:
+            for name in archive.namelist():
+                if name != TEXT_MEMBER:
+                    copy.writestr(name, archive.read(name))
+        truncated = os.path.join(self.directory, 'truncated.pnd')
+        with open(filename, 'rb') as file, open(truncated, 'wb') as copy:
+            copy.write(file.read()[:40])
+
+        for damaged in (missing, truncated):
+            text, errors = self.load(damaged)
+            self.assertEqual(text, '', damaged)
+            self.assertEqual(len(errors), 1, damaged)
+
+
+if __name__ == '__main__':
+    unittest.main()
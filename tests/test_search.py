@@ -0,0 +1,116 @@
+import unittest
+
+from PyQt5.QtGui import QTextCursor
+from PyQt5.QtTest import QTest
+from PyQt5.QtWidgets import QTextEdit
+
+from tests import application
+from core.search import SearchIndex, SearchWorker, find_all
+
+EMOJI = '\U0001F600'
+
+
+class SearchIndexTest(unittest.TestCase):
+
+    def test_document_positions(self):
+        index = SearchIndex(f'{EMOJI} a{EMOJI}b', 0)
+
+        self.assertEqual(index.document_span(2, 3), (3, 4))
+        self.assertEqual(index.document_span(4, 5), (6, 7))
+        self.assertEqual([index.text_position(position) for position in (0, 3, 4, 6, 7)], [0, 2, 3, 4, 5])
+
+    def test_text_without_astral_characters(self):
+        index = SearchIndex('café abc', 0)
+
+        self.assertEqual(index.document_span(5, 8), (5, 8))
+        self.assertEqual(index.text_position(5), 5)
+
+    def test_literal_results_are_kept(self):
+        index = SearchIndex('Abc abc ABC', 0)
+
+        self.assertIsNone(index.literal_results('abc', False))
+        spans = list(find_all(index, 'abc'))
+        self.assertEqual(spans, [(0, 3), (4, 7), (8, 11)])
+        self.assertEqual(index.literal_results('abc', False), spans)
+        self.assertIsNone(index.literal_results('abc', True))
+        self.assertEqual(list(find_all(index, 'abc')), spans)
+
+
+class SearchWorkerTest(unittest.TestCase):
+
+    def test_matches_are_document_positions(self):
+        application()
+        edit = QTextEdit()
+        edit.setPlainText(f'{EMOJI} abc abc')
+        worker = SearchWorker(SearchIndex(edit.toPlainText(), 0), 'abc')
+        batches = []
+        worker.found.connect(batches.append)
+        worker.run()
+
+        cursor = QTextCursor(edit.document())
+        for start, end in batches[0]:
+            cursor.setPosition(start)
+            cursor.setPosition(end, QTextCursor.KeepAnchor)
+            self.assertEqual(cursor.selectedText(), 'abc')
+        self.assertEqual(batches, [[(3, 6), (7, 10)]])
+
+
+class FindDialogTest(unittest.TestCase):
+
+    def setUp(self):
+        application()
+        from pyNotePad import FindDialog
+
+        self.edit = QTextEdit()
+        self.dialog = FindDialog(self.edit)
+
+    def test_replace_all_after_astral_characters(self):
+        self.edit.setPlainText(f'{EMOJI} abc {EMOJI}{EMOJI} abc')
+        self.dialog.findEdit.setText('abc')
+        self.dialog.replaceEdit.setText('x')
+        self.dialog.replace_all()
+
+        self.assertEqual(self.edit.toPlainText(), f'{EMOJI} x {EMOJI}{EMOJI} x')
+
+    def test_replace_all_with_groups(self):
+        self.edit.setPlainText(f'{EMOJI} a1 {EMOJI} b2')
+        self.dialog.findEdit.setText(r'(\w)(\d)')
+        self.dialog.replaceEdit.setText(r'\2\1')
+        self.dialog.regexCheckBox.setChecked(True)
+        self.dialog.replace_all()
+
+        self.assertEqual(self.edit.toPlainText(), f'{EMOJI} 1a {EMOJI} 2b')
+
+    def test_only_matches_in_view_are_highlighted(self):
+        self.edit.setPlainText('abc\n' * 5000)
+        self.edit.resize(300, 200)
+        self.edit.show()
+        self.addCleanup(self.edit.hide)
+        QTest.qWaitForWindowExposed(self.edit)
+        application().processEvents()
+        self.dialog.search_index()
+        self.dialog.starts = list(range(0, 20000, 4))
+        self.dialog.ends = [start + 3 for start in self.dialog.starts]
+        self.dialog.highlight_visible()
+
+        selections = self.edit.extraSelections()
+        self.assertTrue(0 < len(selections) < 100)
+        self.assertEqual(selections[0].cursor.selectionStart(), 0)
+
+        # Scrolls down to the end
+        self.edit.moveCursor(QTextCursor.End)
+        self.assertEqual(self.edit.extraSelections()[-1].cursor.selectionEnd(), 19999)
+
+    def test_select_match(self):
+        self.edit.setPlainText(f'{EMOJI}\n{EMOJI} abc')
+        index = self.dialog.search_index()
+        self.dialog.starts, self.dialog.ends = map(list, zip(*(
+            index.document_span(start, end) for start, end in find_all(index, 'abc'))))
+        self.dialog.select_match(backward=False)
+
+        self.assertEqual(self.edit.textCursor().selectedText(), 'abc')
+        self.assertEqual(self.dialog.statusLabel.text(), 'Match 1 of 1, line 2')
+
+
+if __name__ == '__main__':
+    unittest.main()
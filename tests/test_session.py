@@ -0,0 +1,61 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from core.codec import TextFormat
+from core.session import SESSION_VERSION, SessionDocument, read_session, write_session
+
+
+class SessionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.filename = os.path.join(self.directory, 'session.json')
+
+    def write(self, session):
+        with open(self.filename, 'w', encoding='utf-8') as file:
+            json.dump(session, file)
+
+    def test_round_trip(self):
+        documents = [
+            SessionDocument('/notes/a.txt', TextFormat('utf-16-le', True, '\r\n'), 120, 40, 3, True),
+            SessionDocument('/notes/b.txt', TextFormat('latin-1', False, '\n'), last_used=5),
+        ]
+        write_session(self.filename, documents, current=1)
+
+        restored, current = read_session(self.filename)
+        self.assertEqual(current, 1)
+        self.assertEqual([document.to_json() for document in restored], [document.to_json() for document in documents])
+        self.assertEqual(restored[0].text_format, TextFormat('utf-16-le', True, '\r\n'))
+
+    def test_missing_or_damaged_session(self):
+        self.assertEqual(read_session(self.filename), ([], None))
+        with open(self.filename, 'w', encoding='utf-8') as file:
+            file.write('{"version": 1, "documents": [')
+        self.assertEqual(read_session(self.filename), ([], None))
+
+    def test_unknown_encoding(self):
+        document = SessionDocument('/notes/a.txt').to_json()
+        document['encoding'] = 'no-such-encoding'
+        self.write({'version': SESSION_VERSION, 'current': 0, 'documents': [document]})
+
+        self.assertEqual(read_session(self.filename), ([], None))
+
+    def test_later_version_is_ignored(self):
+        self.write({'version': SESSION_VERSION + 1, 'current': None, 'documents': []})
+
+        self.assertEqual(read_session(self.filename), ([], None))
+
+    def test_current_out_of_range(self):
+        write_session(self.filename, [SessionDocument('/notes/a.txt')], current=3)
+
+        documents, current = read_session(self.filename)
+        self.assertEqual(len(documents), 1)
+        self.assertIsNone(current)
+
+
+if __name__ == '__main__':
+    unittest.main()
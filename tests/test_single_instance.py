@@ -0,0 +1,58 @@
+import os
+import subprocess
+import sys
+import unittest
+
+from PyQt5.QtTest import QTest
+
+from tests import application
+from core.single_instance import SingleInstance
+
+
+class LocalInstance(SingleInstance):
+    # Apart from the server of a PyNotePad the user may be running
+    SERVER_NAME = f'{SingleInstance.SERVER_NAME}-test-{os.getpid()}'
+    TIMEOUT = 500
+
+
+class SingleInstanceTest(unittest.TestCase):
+
+    def setUp(self):
+        application()
+        self.instance = LocalInstance()
+        self.addCleanup(self.instance.server.close)
+        self.received = []
+        self.instance.files_received.connect(self.received.append)
+
+    def test_no_running_instance(self):
+        self.assertFalse(LocalInstance.send(['notes.txt']))
+
+    def test_launch_without_running_instance_is_silent(self):
+        # As on launch, before the application exists
+        code = 'from tests.test_single_instance import LocalInstance; print(LocalInstance.send(["notes.txt"]))'
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True,
+                                cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+        self.assertEqual((result.stdout, result.stderr), ('False\n', ''))
+
+    def test_files_are_handed_to_the_running_instance(self):
+        self.assertTrue(self.instance.listen())
+        self.assertTrue(LocalInstance.send(['notes.txt', '/tmp/other.txt']))
+        for _ in range(200):
+            if self.received:
+                break
+            QTest.qWait(10)
+
+        self.assertEqual(self.received, [[os.path.abspath('notes.txt'), '/tmp/other.txt']])
+
+    def test_second_instance_does_not_take_over(self):
+        self.assertTrue(self.instance.listen())
+        # Owned by the first instance, so that it lives until the end of the test
+        other = LocalInstance(self.instance)
+        self.addCleanup(other.server.close)
+
+        self.assertFalse(other.listen())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import contextlib
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from PyQt5.QtCore import QFile
+
+from tests import application
+from core.startup import StartupTimer, parse_arguments
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class StartupTest(unittest.TestCase):
+
+    def test_qt_arguments_are_left_to_qt(self):
+        arguments, remaining = parse_arguments(['--startup-timing', 'notes.txt', '-style', 'fusion'])
+
+        self.assertTrue(arguments.startup_timing)
+        self.assertEqual(arguments.files, ['notes.txt'])
+        self.assertEqual(remaining, ['-style', 'fusion'])
+
+    def test_report(self):
+        timer = StartupTimer()
+        timer.mark('window')
+        output = io.StringIO()
+        with contextlib.redirect_stderr(output):
+            timer.report()
+
+        self.assertRegex(output.getvalue(), r'^startup: window [\d.]+ ms, first paint [\d.]+ ms, total [\d.]+ ms\n$')
+
+    def test_print_support_is_not_imported(self):
+        # In a process of its own, run from another directory
+        code = 'import sys, pyNotePad; print("PyQt5.QtPrintSupport" in sys.modules)'
+        output = subprocess.check_output([sys.executable, '-c', code], cwd=tempfile.gettempdir(),
+                                         env={**os.environ, 'PYTHONPATH': ROOT}, text=True)
+
+        self.assertEqual(output.strip(), 'False')
+
+    def test_icons_are_bundled(self):
+        application()
+        from pyNotePad import NotePadWindow
+
+        for icon in NotePadWindow.ICONS.values():
+            self.assertTrue(QFile.exists(f':/icon/pictures/icon/{icon}'), icon)
+
+
+if __name__ == '__main__':
+    unittest.main()
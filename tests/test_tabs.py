@@ -0,0 +1,107 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from PyQt5.QtCore import QSettings, QStandardPaths
+from PyQt5.QtGui import QTextCursor, QTextDocument
+from PyQt5.QtTest import QTest
+
+from tests import application
+from core.tabs import Tab
+
+
+class TabTest(unittest.TestCase):
+
+    def setUp(self):
+        application()
+        self.tab = Tab('notes.txt')
+        self.tab.document = QTextDocument()
+        self.tab.document.setPlainText('text')
+        self.tab.document.setModified(False)
+
+    def test_unmodified_document_is_evictable(self):
+        self.assertTrue(self.tab.is_evictable())
+        self.assertEqual(self.tab.memory_size(), 5 * Tab.BYTES_PER_CHARACTER)
+
+    def test_document_being_saved_is_not_evictable(self):
+        self.tab.saving = True
+
+        self.assertFalse(self.tab.is_evictable())
+
+    def test_modified_or_untitled_document_is_not_evictable(self):
+        self.tab.document.setModified(True)
+        self.assertFalse(self.tab.is_evictable())
+
+        self.tab.document.setModified(False)
+        self.tab.filename = None
+        self.assertFalse(self.tab.is_evictable())
+        self.assertFalse(self.tab.is_blank())
+
+
+class MemoryBudgetTest(unittest.TestCase):
+
+    def setUp(self):
+        # Apart from the settings, session and journals of the user, and from those of the benchmarks
+        application().setApplicationName('PyNotePadTest')
+        QStandardPaths.setTestModeEnabled(True)
+        self.addCleanup(QStandardPaths.setTestModeEnabled, False)
+        app_data = QStandardPaths.writableLocation(QStandardPaths.AppDataLocation)
+        shutil.rmtree(app_data, ignore_errors=True)
+        self.addCleanup(shutil.rmtree, app_data, True)
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        # Each document takes about 1.2 MB of it
+        QSettings().setValue('tabs/memoryBudget', 2)
+        self.addCleanup(QSettings().remove, 'tabs/memoryBudget')
+        from pyNotePad import NotePadWindow
+
+        self.window = NotePadWindow()
+        self.addCleanup(self.discard_window)
+
+    def discard_window(self):
+        for tab in self.window.tabs():
+            if tab.document is not None:
+                tab.document.setModified(False)
+        self.window.close()
+
+    def wait_loaded(self, tab):
+        for _ in range(500):
+            if tab.loader is None:
+                return
+            QTest.qWait(10)
+
+    def open(self, name):
+        filename = os.path.join(self.directory, name)
+        with open(filename, 'w', encoding='utf-8') as file:
+            file.write(f'{name}\n' * 30000)
+        tab = self.window.open_document(filename)
+        self.wait_loaded(tab)
+        return tab
+
+    def test_least_recently_used_documents_are_evicted(self):
+        first = self.open('first.txt')
+        modified = self.open('modified.txt')
+        QTextCursor(modified.document).insertText('changed ')
+        third = self.open('third.txt')
+        current = self.open('current.txt')
+
+        # Back to their metadata, the modified document and the current one are kept even over the budget
+        self.assertIsNone(first.document)
+        self.assertIsNone(third.document)
+        self.assertEqual([tab.filename for tab in self.window.tabs()], [first.filename, modified.filename,
+                                                                        third.filename, current.filename])
+        self.assertTrue(modified.document.isModified())
+        self.assertIs(self.window.tab, current)
+        self.assertIsNotNone(current.document)
+
+        # Reloaded when activated, the least recently used tab is evicted in turn
+        self.window.activate_tab(third)
+        self.wait_loaded(third)
+        self.assertEqual(third.document.toPlainText(), 'third.txt\n' * 30000)
+        self.assertIsNone(current.document)
+        self.assertIsNotNone(modified.document)
+
+
+if __name__ == '__main__':
+    unittest.main()